@@ -0,0 +1,90 @@
+# benchmarks/benchmark_compute_profiles.py
+#
+# Mide la latencia y el rendimiento de cada perfil de cómputo (fast, balanced, quality)
+# con los paquetes de argostranslate instalados.
+#
+# Uso (desde la raíz del repositorio):
+#   python benchmarks/benchmark_compute_profiles.py --source en --target es
+
+import argparse
+import os
+import statistics
+import sys
+import time
+
+# Permitir ejecutar el script directamente desde la raíz del repositorio
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.domain.models import Language, TranslationRequest, PERFORMANCE_PROFILES
+from src.infrastructure.argos_translator import ArgosTranslator
+
+SHORT_TEXT = "Where is the nearest train station?"
+PARAGRAPH = (
+    "The committee met on Tuesday to review the budget. "
+    "Several members raised concerns about the cost of the new building. "
+    "After a long discussion, they agreed to postpone the final vote until next month. "
+    "The chair thanked everyone for their patience and closed the meeting."
+)
+
+
+def benchmark_profile(translator: ArgosTranslator, profile: str, source: Language, target: Language,
+                      repetitions: int, batch_paragraphs: int):
+    """Mide la latencia de una frase corta (p50/p95) y el rendimiento de un lote de párrafos."""
+    # La primera llamada carga el modelo en la variante del perfil; no se incluye en la medición
+    load_start = time.perf_counter()
+    translator.warm_up(source.code, target.code, profile)
+    load_ms = (time.perf_counter() - load_start) * 1000
+
+    latencies = []
+    for index in range(repetitions):
+        # Un sufijo distinto en cada repetición evita medir la caché de oraciones
+        request = TranslationRequest(f"{SHORT_TEXT} ({index})", source, target, profile=profile)
+        start = time.perf_counter()
+        result = translator.translate(request)
+        latencies.append((time.perf_counter() - start) * 1000)
+        if not result.is_successful:
+            raise RuntimeError(result.error)
+
+    requests = [
+        TranslationRequest(f"{PARAGRAPH} ({index})", source, target, profile=profile)
+        for index in range(batch_paragraphs)
+    ]
+    translator.translate_batch(requests)
+    batch_stats = translator.get_last_batch_stats()
+
+    latencies.sort()
+    return {
+        "load_ms": load_ms,
+        "p50_ms": statistics.median(latencies),
+        "p95_ms": latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))],
+        "sentences_per_second": batch_stats.get("decoded_sentences_per_second", 0.0),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de perfiles de cómputo de CTranslate2.")
+    parser.add_argument("--source", default="en", help="Código del idioma de origen (por defecto: en)")
+    parser.add_argument("--target", default="es", help="Código del idioma de destino (por defecto: es)")
+    parser.add_argument("--repetitions", type=int, default=30, help="Traducciones cortas por perfil para la latencia")
+    parser.add_argument("--batch-paragraphs", type=int, default=50, help="Párrafos del lote para medir el rendimiento")
+    args = parser.parse_args()
+
+    # Sin caché de oraciones, para medir siempre el modelo
+    translator = ArgosTranslator(sentence_cache=None)
+    source = Language(args.source, args.source)
+    target = Language(args.target, args.target)
+
+    results = {}
+    for profile in PERFORMANCE_PROFILES:
+        print(f"\n=== Perfil '{profile}' ===")
+        results[profile] = benchmark_profile(translator, profile, source, target, args.repetitions, args.batch_paragraphs)
+
+    print(f"\nResultados {args.source} -> {args.target}:")
+    print(f"{'perfil':<10} {'carga (ms)':>11} {'p50 (ms)':>9} {'p95 (ms)':>9} {'oraciones/s':>12}")
+    for profile, values in results.items():
+        print(f"{profile:<10} {values['load_ms']:>11.0f} {values['p50_ms']:>9.1f} "
+              f"{values['p95_ms']:>9.1f} {values['sentences_per_second']:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+# benchmarks/benchmark_headless_import.py
+#
+# Mide el tiempo de importación y la memoria residente (RSS) del núcleo sin interfaz gráfica
+# (src.application.translator_service) frente al mismo núcleo con el puente de Qt
+# (src.ui.qt_service_bridge), que equivale a la importación anterior del servicio,
+# cuando TranslatorService heredaba de QObject y cargaba PySide6 al importarse.
+# Cada medición se hace en un proceso nuevo para no reutilizar módulos ya cargados.
+#
+# Uso (desde la raíz del repositorio):
+#   python benchmarks/benchmark_headless_import.py --repeat 5
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+MODULES = {
+    "núcleo sin Qt": "src.application.translator_service",
+    "núcleo + puente Qt": "src.ui.qt_service_bridge",
+}
+
+# Código que se ejecuta en el proceso hijo: importa el módulo y reporta tiempo, RSS y si se cargó Qt
+_CHILD_CODE = """
+import importlib, json, sys, time
+
+def rss_bytes():
+    try:
+        import psutil
+        return psutil.Process().memory_info().rss
+    except ImportError:
+        pass
+    try:
+        import resource
+        # ru_maxrss está en KB en Linux y en bytes en macOS (es el máximo, que aquí coincide con el actual)
+        factor = 1 if sys.platform == "darwin" else 1024
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * factor
+    except ImportError:
+        return None
+
+rss_before = rss_bytes()
+start = time.perf_counter()
+importlib.import_module(sys.argv[1])
+elapsed = time.perf_counter() - start
+rss_after = rss_bytes()
+print(json.dumps({
+    "seconds": elapsed,
+    "rss_bytes": rss_after,
+    "rss_delta_bytes": None if rss_before is None or rss_after is None else rss_after - rss_before,
+    "qt_loaded": any(name.startswith("PySide6") for name in sys.modules),
+}))
+"""
+
+
+def measure(module: str) -> dict:
+    """Importa el módulo en un proceso nuevo y retorna sus mediciones."""
+    # Se silencia la salida del módulo (prints de inicialización); solo interesa la última línea JSON
+    completed = subprocess.run(
+        [sys.executable, "-c", _CHILD_CODE, module],
+        cwd=REPO_ROOT, capture_output=True, text=True
+    )
+    if completed.returncode != 0:
+        raise RuntimeError(f"No se pudo importar {module}:\n{completed.stderr.strip()}")
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+def _format_mb(value) -> str:
+    return "n/d" if value is None else f"{value / (1024 * 1024):.1f}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de importación del núcleo con y sin Qt.")
+    parser.add_argument("--repeat", type=int, default=5, help="Procesos por módulo (se reporta la mediana)")
+    args = parser.parse_args()
+
+    print(f"{'configuración':<20} {'import (ms)':>12} {'RSS (MB)':>10} {'Δ RSS (MB)':>11} {'Qt cargado':>11}")
+    for name, module in MODULES.items():
+        try:
+            samples = [measure(module) for _ in range(args.repeat)]
+        except RuntimeError as e:
+            print(f"{name:<20} error: {e}")
+            continue
+        seconds = statistics.median(sample["seconds"] for sample in samples)
+        rss_values = [sample["rss_bytes"] for sample in samples if sample["rss_bytes"] is not None]
+        delta_values = [sample["rss_delta_bytes"] for sample in samples if sample["rss_delta_bytes"] is not None]
+        rss = statistics.median(rss_values) if rss_values else None
+        delta = statistics.median(delta_values) if delta_values else None
+        qt_loaded = "sí" if samples[0]["qt_loaded"] else "no"
+        print(f"{name:<20} {seconds * 1000:>12.1f} {_format_mb(rss):>10} {_format_mb(delta):>11} {qt_loaded:>11}")
+
+
+if __name__ == "__main__":
+    main()
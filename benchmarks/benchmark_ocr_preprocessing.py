@@ -0,0 +1,151 @@
+# benchmarks/benchmark_ocr_preprocessing.py
+#
+# Compara el OCR de capturas sin preprocesar y preprocesadas con ImagePreprocessor:
+# latencia total (preprocesado + OCR), tiempo medio de cada paso y precisión por carácter
+# (1 - distancia de edición / longitud del texto esperado).
+#
+# El corpus puede ser una carpeta con pares imagen + .txt del mismo nombre (texto esperado),
+# o, si no se indica, un conjunto sintético generado con PIL: tema claro, tema oscuro,
+# fuente diminuta, bajo contraste e imagen inclinada.
+#
+# Uso (desde la raíz del repositorio):
+#   python benchmarks/benchmark_ocr_preprocessing.py --repeat 3
+#   python benchmarks/benchmark_ocr_preprocessing.py --corpus capturas/ --engine tesserocr --deskew
+
+import argparse
+import os
+import statistics
+import sys
+import time
+from collections import defaultdict
+
+from PIL import Image, ImageDraw
+
+# Permitir ejecutar el script directamente desde la raíz del repositorio
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.infrastructure.image_preprocessing import ImagePreprocessor, PREPROCESSING_STEPS
+from src.infrastructure.pytesseract_ocr import PytesseractOCRService
+from src.infrastructure.tesserocr_ocr import TesserocrOCRService, TESSEROCR_AVAILABLE
+
+IMAGE_EXTENSIONS = (".png", ".jpg", ".jpeg", ".bmp", ".tif", ".tiff")
+
+SAMPLE_TEXTS = [
+    "Settings saved. Restart the application to apply changes.",
+    "The quick brown fox jumps over the lazy dog.",
+    "Error: unable to connect to the server.",
+]
+
+
+def _render(text: str, background, foreground, scale: int = 2, angle: float = 0.0) -> Image.Image:
+    image = Image.new("RGB", (8 + 6 * len(text), 24), background)
+    ImageDraw.Draw(image).text((4, 6), text, fill=foreground)
+    if scale != 1:
+        image = image.resize((image.width * scale, image.height * scale), Image.BICUBIC)
+    if angle:
+        image = image.rotate(angle, resample=Image.BICUBIC, expand=True, fillcolor=background)
+    return image
+
+
+def make_synthetic_corpus():
+    """Lista de (nombre, imagen, texto esperado) con los casos difíciles típicos de capturas de pantalla."""
+    corpus = []
+    for index, text in enumerate(SAMPLE_TEXTS):
+        corpus.append((f"claro-{index}", _render(text, "white", "black"), text))
+        corpus.append((f"oscuro-{index}", _render(text, (30, 30, 30), (210, 210, 210)), text))
+        corpus.append((f"diminuto-{index}", _render(text, "white", (40, 40, 40), scale=1), text))
+        corpus.append((f"contraste-{index}", _render(text, (200, 200, 200), (120, 120, 120)), text))
+        corpus.append((f"inclinado-{index}", _render(text, "white", "black", angle=3), text))
+    return corpus
+
+
+def load_corpus(directory: str):
+    """Lee los pares imagen + .txt de una carpeta."""
+    corpus = []
+    for filename in sorted(os.listdir(directory)):
+        stem, extension = os.path.splitext(filename)
+        text_path = os.path.join(directory, stem + ".txt")
+        if extension.lower() in IMAGE_EXTENSIONS and os.path.exists(text_path):
+            with open(text_path, "r", encoding="utf-8") as f:
+                expected = f.read().strip()
+            corpus.append((stem, Image.open(os.path.join(directory, filename)).convert("RGB"), expected))
+    return corpus
+
+
+def edit_distance(a: str, b: str) -> int:
+    """Distancia de Levenshtein (programación dinámica por filas)."""
+    previous = list(range(len(b) + 1))
+    for i, char_a in enumerate(a, start=1):
+        current = [i]
+        for j, char_b in enumerate(b, start=1):
+            current.append(min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (char_a != char_b)))
+        previous = current
+    return previous[-1]
+
+
+def char_accuracy(recognized: str, expected: str) -> float:
+    recognized = " ".join(recognized.split())
+    expected = " ".join(expected.split())
+    if not expected:
+        return 1.0 if not recognized else 0.0
+    return max(0.0, 1.0 - edit_distance(recognized, expected) / len(expected))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark del preprocesado de imágenes para el OCR.")
+    parser.add_argument("--corpus", default=None, help="Carpeta con pares imagen + .txt (por defecto, corpus sintético)")
+    parser.add_argument("--engine", choices=("pytesseract", "tesserocr"), default="pytesseract")
+    parser.add_argument("--lang", default="eng", help="Idioma de Tesseract")
+    parser.add_argument("--repeat", type=int, default=3, help="Repeticiones por imagen (se reporta la mediana)")
+    parser.add_argument("--x-height", type=int, default=20, help="Altura x objetivo del preprocesado (0 = no escalar)")
+    parser.add_argument("--deskew", action="store_true", help="Habilitar el enderezado")
+    args = parser.parse_args()
+
+    corpus = load_corpus(args.corpus) if args.corpus else make_synthetic_corpus()
+    if not corpus:
+        print("El corpus está vacío.")
+        return
+    if args.engine == "tesserocr":
+        if not TESSEROCR_AVAILABLE:
+            print("tesserocr no está instalada (`pip install tesserocr`).")
+            return
+        ocr_service = TesserocrOCRService(language=args.lang)
+    else:
+        ocr_service = PytesseractOCRService(language=args.lang)
+    preprocessor = ImagePreprocessor(target_x_height=args.x_height, deskew=args.deskew)
+
+    rows = []
+    step_samples = defaultdict(list)
+    for name, image, expected in corpus:
+        row = {"name": name}
+        for mode in ("raw", "pre"):
+            latencies = []
+            for _ in range(args.repeat):
+                start = time.perf_counter()
+                prepared = image
+                if mode == "pre":
+                    prepared, timings = preprocessor.process(image)
+                    for step, milliseconds in timings.items():
+                        step_samples[step].append(milliseconds)
+                text = ocr_service.extract_text_from_image_data(prepared)
+                latencies.append((time.perf_counter() - start) * 1000)
+            row[mode] = (statistics.median(latencies), char_accuracy(text, expected))
+        rows.append(row)
+    if hasattr(ocr_service, "close"):
+        ocr_service.close()
+
+    print(f"\n{'imagen':<16} {'sin prep. (ms)':>15} {'precisión':>10} {'con prep. (ms)':>15} {'precisión':>10}")
+    for row in rows:
+        print(f"{row['name']:<16} {row['raw'][0]:>15.1f} {row['raw'][1]:>10.1%} {row['pre'][0]:>15.1f} {row['pre'][1]:>10.1%}")
+    for mode, label in (("raw", "sin preprocesado"), ("pre", "con preprocesado")):
+        latency = statistics.median(row[mode][0] for row in rows)
+        accuracy = statistics.mean(row[mode][1] for row in rows)
+        print(f"{label:<18} latencia mediana {latency:.1f} ms, precisión media {accuracy:.1%}")
+    print("\nTiempo medio por paso del preprocesado (ms):")
+    for step in PREPROCESSING_STEPS:
+        if step_samples[step]:
+            print(f"  {step:<10} {statistics.mean(step_samples[step]):.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+# benchmarks/benchmark_process_pool.py
+#
+# Compara el rendimiento de la traducción de documentos largos en un solo proceso
+# (ArgosTranslator) y repartida entre varios procesos (ProcessPoolTranslator).
+#
+# Uso (desde la raíz del repositorio):
+#   python benchmarks/benchmark_process_pool.py --source en --target es --pages 300 --workers 2,4
+
+import argparse
+import os
+import sys
+import time
+
+# Permitir ejecutar el script directamente desde la raíz del repositorio
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.domain.models import Language, TranslationRequest
+from src.infrastructure.argos_translator import ArgosTranslator
+from src.infrastructure.process_pool_translator import ProcessPoolTranslator, get_default_worker_count
+
+# Párrafos de ejemplo, como listas de oraciones
+PARAGRAPHS = [
+    ["The committee met on Tuesday to review the budget.", "Several members raised concerns about the cost of the new building."],
+    ["After a long discussion, they agreed to postpone the final vote until next month."],
+    ["The chair thanked everyone for their patience and closed the meeting.", "Minutes will be published next week."],
+    ["Residents who wish to comment on the proposal may send a letter to the city office before the end of the month."],
+]
+# Párrafos por página de un documento típico
+PARAGRAPHS_PER_PAGE = 8
+
+
+def build_document(pages: int) -> list:
+    """
+    Genera los párrafos de un documento sintético. Cada oración lleva el número de párrafo y su posición,
+    así que no hay dos oraciones iguales: translate_batch() no puede agrupar duplicados (ni en un proceso
+    ni en cada fragmento de los procesos) y ambos lados decodifican todas las oraciones del documento.
+    """
+    paragraphs = []
+    for index in range(pages * PARAGRAPHS_PER_PAGE):
+        sentences = PARAGRAPHS[index % len(PARAGRAPHS)]
+        paragraphs.append(" ".join(
+            f"{sentence[:-1]} (item {index}-{position})." for position, sentence in enumerate(sentences)
+        ))
+    return paragraphs
+
+
+def run(translator, paragraphs: list, source: Language, target: Language, profile: str) -> float:
+    """Traduce el documento como lo hace la traducción de archivos (un lote de párrafos) y retorna los segundos."""
+    requests = [TranslationRequest(paragraph, source, target, profile=profile) for paragraph in paragraphs]
+    start = time.perf_counter()
+    results = translator.translate_batch(requests)
+    elapsed = time.perf_counter() - start
+    failed = [result.error for result in results if not result.is_successful]
+    if failed:
+        raise RuntimeError(failed[0])
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de traducción de documentos en uno y varios procesos.")
+    parser.add_argument("--source", default="en", help="Código del idioma de origen (por defecto: en)")
+    parser.add_argument("--target", default="es", help="Código del idioma de destino (por defecto: es)")
+    parser.add_argument("--pages", type=int, default=300, help="Páginas del documento sintético")
+    parser.add_argument("--workers", default="", help="Números de procesos a probar, separados por comas (por defecto: automático)")
+    parser.add_argument("--profile", default="balanced", help="Perfil de rendimiento (fast, balanced, quality)")
+    args = parser.parse_args()
+
+    source = Language(args.source, args.source)
+    target = Language(args.target, args.target)
+    paragraphs = build_document(args.pages)
+    total_chars = sum(len(paragraph) for paragraph in paragraphs)
+    print(f"Documento: {args.pages} páginas, {len(paragraphs)} párrafos, {total_chars} caracteres.")
+
+    worker_counts = [int(value) for value in args.workers.split(",") if value.strip()]
+    if not worker_counts:
+        worker_counts = [get_default_worker_count() or 2]
+
+    # Sin caché de oraciones, para medir siempre el modelo
+    local_translator = ArgosTranslator(sentence_cache=None)
+    local_translator.warm_up(args.source, args.target, args.profile)
+    results = {"1 (en proceso)": run(local_translator, paragraphs, source, target, args.profile)}
+
+    for worker_count in worker_counts:
+        pool_translator = ProcessPoolTranslator(local_translator, worker_count, min_parallel_chars=0)
+        try:
+            # El primer lote arranca los procesos y carga los modelos; no se incluye en la medición
+            run(pool_translator, paragraphs[:worker_count * 4], source, target, args.profile)
+            results[f"{worker_count} procesos"] = run(pool_translator, paragraphs, source, target, args.profile)
+        finally:
+            pool_translator.shutdown()
+
+    baseline = results["1 (en proceso)"]
+    print(f"\nResultados {args.source} -> {args.target} (perfil {args.profile}):")
+    print(f"{'configuración':<16} {'tiempo (s)':>11} {'car/s':>10} {'aceleración':>12}")
+    for name, elapsed in results.items():
+        print(f"{name:<16} {elapsed:>11.1f} {total_chars / elapsed:>10.0f} {baseline / elapsed:>11.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+# benchmarks/benchmark_region_ocr.py
+#
+# Compara el OCR de capturas grandes enteras con el OCR por bloques (RegionOCRService):
+# una captura 4K casi vacía (unas pocas ventanas con texto) y una página densa.
+# Reporta el tiempo de detección, el número de bloques y la mediana del tiempo total.
+#
+# Uso (desde la raíz del repositorio):
+#   python benchmarks/benchmark_region_ocr.py --repeat 3 --workers 4
+
+import argparse
+import os
+import statistics
+import sys
+import time
+
+from PIL import Image, ImageDraw
+
+# Permitir ejecutar el script directamente desde la raíz del repositorio
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.infrastructure.image_preprocessing import ImagePreprocessor, PreprocessingOCRService
+from src.infrastructure.pytesseract_ocr import PytesseractOCRService
+from src.infrastructure.region_ocr import RegionOCRService, TextRegionDetector
+from src.infrastructure.tesserocr_ocr import TesserocrOCRService, TESSEROCR_AVAILABLE
+
+LINES = [
+    "The update will be installed the next time you restart.",
+    "Your changes have been saved to the cloud.",
+    "Press Enter to continue or Escape to go back.",
+]
+
+
+def _draw_block(draw, left: int, top: int, line_count: int, fill):
+    for index in range(line_count):
+        draw.text((left, top + 16 * index), LINES[index % len(LINES)], fill=fill)
+
+
+def make_sparse_screenshot() -> Image.Image:
+    """Captura 4K de tema oscuro con tres ventanas pequeñas con texto."""
+    image = Image.new("RGB", (3840, 2160), (24, 24, 28))
+    draw = ImageDraw.Draw(image)
+    for left, top, lines in ((120, 140, 4), (2300, 400, 2), (1500, 1800, 3)):
+        _draw_block(draw, left, top, lines, (220, 220, 220))
+    return image
+
+
+def make_dense_page() -> Image.Image:
+    """Página clara de dos columnas llena de párrafos."""
+    image = Image.new("RGB", (2480, 3508), "white")
+    draw = ImageDraw.Draw(image)
+    for column_left in (150, 1300):
+        for paragraph_top in range(150, 3300, 160):
+            _draw_block(draw, column_left, paragraph_top, 6, "black")
+    return image
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark del OCR por bloques en imágenes grandes.")
+    parser.add_argument("--engine", choices=("pytesseract", "tesserocr"), default="pytesseract")
+    parser.add_argument("--workers", type=int, default=0, help="Bloques reconocidos a la vez (0 = según CPUs)")
+    parser.add_argument("--repeat", type=int, default=3, help="Repeticiones por imagen (se reporta la mediana)")
+    parser.add_argument("--no-preprocess", action="store_true", help="Reconocer sin ImagePreprocessor")
+    args = parser.parse_args()
+
+    if args.engine == "tesserocr":
+        if not TESSEROCR_AVAILABLE:
+            print("tesserocr no está instalada (`pip install tesserocr`).")
+            return
+        ocr_service = TesserocrOCRService(max_engines_per_language=max(2, args.workers))
+    else:
+        ocr_service = PytesseractOCRService()
+    if not args.no_preprocess:
+        ocr_service = PreprocessingOCRService(ocr_service, ImagePreprocessor())
+    detector = TextRegionDetector()
+    region_service = RegionOCRService(ocr_service, detector=detector, worker_count=args.workers)
+
+    print(f"\n{'imagen':<12} {'bloques':>8} {'detección (ms)':>15} {'completa (ms)':>14} {'por bloques (ms)':>17} {'aceleración':>12}")
+    for name, image in (("dispersa 4K", make_sparse_screenshot()), ("página densa", make_dense_page())):
+        start = time.perf_counter()
+        boxes = detector.detect(image)
+        detection_ms = (time.perf_counter() - start) * 1000
+        timings = {"completa": [], "bloques": []}
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            ocr_service.extract_text_from_image_data(image)
+            timings["completa"].append((time.perf_counter() - start) * 1000)
+            start = time.perf_counter()
+            region_service.extract_text_from_image_data(image)
+            timings["bloques"].append((time.perf_counter() - start) * 1000)
+        full_ms = statistics.median(timings["completa"])
+        region_ms = statistics.median(timings["bloques"])
+        print(f"{name:<12} {len(boxes):>8} {detection_ms:>15.1f} {full_ms:>14.1f} {region_ms:>17.1f} {full_ms / region_ms:>11.1f}x")
+    region_service.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,244 @@
+# src/application/batch_job.py
+
+import hashlib
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Callable, List, Optional, Tuple
+
+from src.application.translator_service import TranslatorService
+from src.domain.models import CancellationToken, TranslationProgress
+from src.infrastructure.batch_journal import JsonlBatchJournal
+from src.infrastructure.document_io import is_supported_document, read_paragraphs, write_paragraphs
+
+# Nombre del diario por defecto, guardado en la carpeta de salida
+DEFAULT_JOURNAL_NAME = ".polartranslate_journal.jsonl"
+# Tamaño de los bloques leídos al calcular el hash de un archivo
+_HASH_CHUNK_BYTES = 1024 * 1024
+
+
+class BatchJobReport:
+    """Resumen de una ejecución de BatchTranslationJob."""
+
+    def __init__(self):
+        self.files_total = 0
+        self.translated = 0
+        self.skipped = 0
+        self.failed = 0
+        self.cancelled = False
+        self.chars = 0
+        self.elapsed_seconds = 0.0
+        self.errors: List[Tuple[str, str]] = []  # (archivo relativo, mensaje)
+
+    @property
+    def chars_per_second(self) -> float:
+        return self.chars / self.elapsed_seconds if self.elapsed_seconds > 0 else 0.0
+
+    @property
+    def files_per_second(self) -> float:
+        return self.translated / self.elapsed_seconds if self.elapsed_seconds > 0 else 0.0
+
+    def summary(self) -> str:
+        """Texto de una línea con el resultado y el rendimiento total."""
+        text = (f"{self.translated} traducidos, {self.skipped} sin cambios, {self.failed} con error "
+                f"de {self.files_total} archivos en {self.elapsed_seconds:.1f} s "
+                f"({self.chars_per_second:.0f} car/s, {self.files_per_second:.2f} archivos/s)")
+        if self.cancelled:
+            text += " - cancelado; la próxima ejecución continuará donde se detuvo"
+        return text + "."
+
+
+class BatchTranslationJob:
+    """
+    Traduce todos los documentos (.txt, .docx) de una carpeta y sus subcarpetas.
+    Los archivos se reparten entre un grupo de hilos propio (no el planificador del servicio:
+    el trabajo completo ya puede estar ejecutándose en uno de sus hilos). Cada archivo terminado
+    se anota en un diario de solo anexado con el hash de su contenido, de modo que una ejecución
+    cancelada o interrumpida se reanuda donde se detuvo y los archivos sin cambios se omiten.
+    """
+
+    def __init__(self, translator_service: TranslatorService, input_dir: str,
+                 source_lang_code: str, target_lang_code: str,
+                 output_dir: Optional[str] = None, journal_path: Optional[str] = None,
+                 worker_count: int = 2, profile: Optional[str] = None):
+        """
+        Args:
+            translator_service: Servicio de aplicación.
+            input_dir: Carpeta con los documentos a traducir.
+            source_lang_code: Código del idioma de origen.
+            target_lang_code: Código del idioma de destino.
+            output_dir: Carpeta donde se replica la estructura de input_dir con los documentos traducidos.
+                        Si es None, cada traducción se escribe junto a su original como nombre.<destino>.ext.
+            journal_path: Ruta del diario. Por defecto, DEFAULT_JOURNAL_NAME dentro de la carpeta de salida.
+            worker_count: Archivos que se traducen a la vez.
+            profile: Perfil de rendimiento. Si es None se usa el perfil configurado para documentos.
+        """
+        self.translator_service = translator_service
+        self.input_dir = os.path.abspath(input_dir)
+        self.source_lang_code = source_lang_code
+        self.target_lang_code = target_lang_code
+        self.output_dir = os.path.abspath(output_dir) if output_dir else None
+        self.worker_count = max(1, worker_count)
+        self.profile = profile or translator_service.get_document_profile()
+        self.journal = JsonlBatchJournal(journal_path or os.path.join(self.output_dir or self.input_dir, DEFAULT_JOURNAL_NAME))
+
+    def get_output_path(self, relative_path: str) -> str:
+        """Ruta de salida de un archivo de entrada (relativa a input_dir)."""
+        if self.output_dir:
+            return os.path.join(self.output_dir, relative_path)
+        stem, extension = os.path.splitext(os.path.join(self.input_dir, relative_path))
+        return f"{stem}.{self.target_lang_code}{extension}"
+
+    def discover_files(self) -> List[str]:
+        """
+        Busca los documentos soportados en input_dir (rutas relativas, en orden estable).
+        Se omiten las carpetas ocultas, la carpeta de salida y las traducciones que el diario registra
+        como escritas por un trabajo anterior. Un original que solo parece una traducción por su nombre
+        (por ejemplo notas.es.txt) sí se traduce.
+        """
+        files = []
+        output_paths = {os.path.normcase(os.path.abspath(path)) for path in self.journal.load_output_paths()}
+        for directory, subdirectories, filenames in os.walk(self.input_dir):
+            subdirectories[:] = sorted(
+                name for name in subdirectories
+                if not name.startswith(".") and os.path.join(directory, name) != self.output_dir
+            )
+            for filename in sorted(filenames):
+                if filename.startswith(".") or not is_supported_document(filename):
+                    continue
+                path = os.path.join(directory, filename)
+                if os.path.normcase(path) in output_paths:
+                    continue
+                files.append(os.path.relpath(path, self.input_dir))
+        return files
+
+    @staticmethod
+    def hash_file(path: str) -> str:
+        digest = hashlib.sha256()
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(_HASH_CHUNK_BYTES), b""):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    def run(self, cancellation_token: Optional[CancellationToken] = None,
+            progress_callback: Optional[Callable[[TranslationProgress], None]] = None) -> BatchJobReport:
+        """
+        Ejecuta el trabajo. Es bloqueante.
+
+        Args:
+            cancellation_token: Token opcional. Al cancelarse no se empiezan más archivos y los que están
+                                en curso se detienen; ninguno de ellos se anota como terminado.
+            progress_callback: Recibe un TranslationProgress por archivo procesado, donde done y total
+                               son archivos y los caracteres se estiman con el tamaño de los archivos.
+
+        Returns:
+            Un BatchJobReport con los contadores y el rendimiento total.
+        """
+        # Con un token propio, una interrupción (Ctrl+C) también detiene los archivos en curso
+        cancellation_token = cancellation_token or CancellationToken()
+        report = BatchJobReport()
+        start = time.perf_counter()
+        files = self.discover_files()
+        report.files_total = len(files)
+        completed = self.journal.load_completed()
+        print(f"Application Layer (BatchTranslationJob): {len(files)} documentos en {self.input_dir} "
+              f"({len(completed)} terminados según el diario).")
+
+        pending: List[Tuple[str, str, int]] = []  # (ruta relativa, hash, tamaño)
+        for relative_path in files:
+            input_path = os.path.join(self.input_dir, relative_path)
+            try:
+                file_hash = self.hash_file(input_path)
+                size = os.path.getsize(input_path)
+            except OSError as e:
+                report.failed += 1
+                report.errors.append((relative_path, str(e)))
+                continue
+            entry = completed.get((relative_path, self.source_lang_code, self.target_lang_code))
+            if entry is not None and entry.get("sha256") == file_hash and os.path.exists(self.get_output_path(relative_path)):
+                report.skipped += 1
+                continue
+            pending.append((relative_path, file_hash, size))
+
+        self.journal.append("run_started", source=self.source_lang_code, target=self.target_lang_code,
+                            files=len(files), pending=len(pending))
+        chars_total = sum(size for _, _, size in pending)
+        chars_done = 0
+        done = report.skipped + report.failed
+
+        def notify_progress():
+            if progress_callback is not None:
+                progress_callback(TranslationProgress(done, report.files_total, chars_done, chars_total,
+                                                      time.perf_counter() - start))
+
+        notify_progress()
+        with ThreadPoolExecutor(max_workers=self.worker_count, thread_name_prefix="BatchJob") as executor:
+            futures = {
+                executor.submit(self._translate_file, relative_path, file_hash, cancellation_token): (relative_path, size)
+                for relative_path, file_hash, size in pending
+            }
+            try:
+                for future in as_completed(futures):
+                    relative_path, size = futures[future]
+                    chars, error = future.result()
+                    done += 1
+                    chars_done += size
+                    if error is None:
+                        report.translated += 1
+                        report.chars += chars
+                    elif cancellation_token.is_cancelled:
+                        report.cancelled = True
+                    else:
+                        report.failed += 1
+                        report.errors.append((relative_path, error))
+                    notify_progress()
+            except BaseException:
+                # Al salir del bloque with se espera a los hilos: que terminen cuanto antes
+                cancellation_token.cancel()
+                raise
+
+        report.elapsed_seconds = time.perf_counter() - start
+        self.journal.append("run_finished", source=self.source_lang_code, target=self.target_lang_code,
+                            translated=report.translated, skipped=report.skipped, failed=report.failed,
+                            cancelled=report.cancelled, chars=report.chars, seconds=round(report.elapsed_seconds, 3))
+        print(f"Application Layer (BatchTranslationJob): {report.summary()}")
+        return report
+
+    def _translate_file(self, relative_path: str, file_hash: str,
+                        cancellation_token: CancellationToken) -> Tuple[int, Optional[str]]:
+        """
+        Traduce un archivo y anota el resultado en el diario. Se ejecuta en el grupo de hilos del trabajo.
+
+        Returns:
+            (caracteres traducidos, None) si terminó, o (0, mensaje de error).
+        """
+        if cancellation_token.is_cancelled:
+            return 0, "Cancelado antes de empezar."
+        input_path = os.path.join(self.input_dir, relative_path)
+        output_path = self.get_output_path(relative_path)
+        file_start = time.perf_counter()
+        try:
+            paragraphs = read_paragraphs(input_path)
+            indexes = [index for index, paragraph in enumerate(paragraphs) if paragraph.strip()]
+            results = self.translator_service.perform_translation_batch(
+                [paragraphs[index] for index in indexes], self.source_lang_code, self.target_lang_code,
+                profile=self.profile, cancellation_token=cancellation_token
+            )
+            translated = list(paragraphs)
+            for index, result in zip(indexes, results):
+                if not result.is_successful:
+                    raise RuntimeError(result.error)
+                translated[index] = result.translated_text
+            write_paragraphs(input_path, output_path, translated)
+        except Exception as e:
+            if not cancellation_token.is_cancelled:
+                print(f"Application Layer (BatchTranslationJob) Error: {relative_path}: {e}")
+                self.journal.append("failed", file=relative_path, source=self.source_lang_code,
+                                    target=self.target_lang_code, sha256=file_hash, error=str(e))
+            return 0, str(e)
+
+        chars = sum(len(paragraphs[index]) for index in indexes)
+        self.journal.append("done", file=relative_path, source=self.source_lang_code, target=self.target_lang_code,
+                            sha256=file_hash, output=output_path, chars=chars,
+                            seconds=round(time.perf_counter() - file_start, 3))
+        return chars, None
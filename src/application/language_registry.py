@@ -0,0 +1,104 @@
+# src/application/language_registry.py
+
+import threading
+from typing import Dict, List, NamedTuple, Optional, Set
+
+# Importar las interfaces y modelos de la capa de Dominio
+from src.domain.interfaces import ITranslator
+from src.domain.models import Language
+
+
+class _RegistryIndex(NamedTuple):
+    """Instantánea inmutable del registro; se reemplaza completa al invalidar."""
+    languages: List[Language]
+    languages_by_code: Dict[str, Language]
+    reachable_targets: Dict[str, Set[str]]
+
+
+class LanguageRegistry:
+    """
+    Registro en memoria de los idiomas soportados por el traductor y de los pares alcanzables.
+    Se construye una vez bajo demanda y se reutiliza hasta que se llame a invalidate(),
+    de modo que validar un par en cada solicitud es una búsqueda O(1) en diccionarios.
+
+    Un par es alcanzable si existe un paquete directo o un pivote de un solo salto
+    (origen -> intermedio -> destino), que es lo que argostranslate sabe componer.
+    """
+
+    def __init__(self, translator: ITranslator):
+        """
+        Constructor del registro.
+
+        Args:
+            translator: La implementación de ITranslator de la que se obtienen idiomas y pares.
+        """
+        self._translator = translator
+        self._lock = threading.Lock()
+        self._index: Optional[_RegistryIndex] = None
+
+    def _ensure_loaded(self) -> _RegistryIndex:
+        """Construye (si no existe) y retorna el índice de idiomas y la matriz de pares alcanzables."""
+        index = self._index
+        if index is not None:
+            return index
+        with self._lock:
+            if self._index is not None:
+                return self._index
+
+            languages = self._translator.get_available_languages()
+            if not languages:
+                # No se memoriza un registro vacío (p. ej. por un error transitorio al listar idiomas)
+                return _RegistryIndex([], {}, {})
+            languages_by_code = {language.code: language for language in languages}
+
+            direct_targets: Dict[str, Set[str]] = {code: set() for code in languages_by_code}
+            for source_code, target_code in self._translator.get_translation_pairs():
+                if source_code in languages_by_code and target_code in languages_by_code:
+                    direct_targets[source_code].add(target_code)
+
+            reachable_targets: Dict[str, Set[str]] = {}
+            for source_code, targets in direct_targets.items():
+                reachable = set(targets)
+                for pivot_code in targets:
+                    reachable.update(direct_targets.get(pivot_code, ()))
+                reachable.discard(source_code)
+                reachable_targets[source_code] = reachable
+
+            self._index = _RegistryIndex(languages, languages_by_code, reachable_targets)
+            pair_count = sum(len(targets) for targets in reachable_targets.values())
+            print(f"Application Layer (LanguageRegistry): Registro construido con {len(languages)} idiomas y {pair_count} pares alcanzables.")
+            return self._index
+
+    def invalidate(self):
+        """
+        Descarta el registro. Debe llamarse después de instalar o desinstalar paquetes.
+        """
+        with self._lock:
+            self._index = None
+        print("Application Layer (LanguageRegistry): Registro invalidado.")
+
+    def get_languages(self) -> List[Language]:
+        """
+        Retorna todos los idiomas soportados, en el orden reportado por el traductor.
+        """
+        return list(self._ensure_loaded().languages)
+
+    def get_language(self, code: str) -> Optional[Language]:
+        """
+        Retorna el idioma con el código indicado, o None si no está soportado.
+        """
+        return self._ensure_loaded().languages_by_code.get(code)
+
+    def is_pair_reachable(self, source_code: str, target_code: str) -> bool:
+        """
+        Indica si se puede traducir de source_code a target_code (directo o por pivote).
+        """
+        return target_code in self._ensure_loaded().reachable_targets.get(source_code, ())
+
+    def get_reachable_targets(self, source_code: str) -> List[Language]:
+        """
+        Retorna los idiomas de destino alcanzables desde source_code, en el orden del traductor.
+        """
+        index = self._ensure_loaded()
+        reachable = index.reachable_targets.get(source_code, set())
+        return [language for language in index.languages if language.code in reachable]
@@ -0,0 +1,35 @@
+# src/application/progress.py
+
+import threading
+import time
+from typing import Callable
+
+from src.domain.models import TranslationProgress
+
+
+class ThrottledProgressCallback:
+    """
+    Envoltorio de un callback de progreso que limita la frecuencia de las notificaciones.
+    Se usa para que el progreso por oración no inunde el bucle de eventos de la UI:
+    solo se reenvía una actualización cada min_interval_seconds, más la final (done == total).
+    """
+
+    def __init__(self, callback: Callable[[TranslationProgress], None], min_interval_seconds: float = 0.2):
+        """
+        Args:
+            callback: Función que recibe el TranslationProgress (por ejemplo, el emit de una señal de Qt).
+            min_interval_seconds: Intervalo mínimo entre dos notificaciones.
+        """
+        self._callback = callback
+        self.min_interval_seconds = min_interval_seconds
+        self._last_emit = 0.0
+        self._lock = threading.Lock()
+
+    def __call__(self, progress: TranslationProgress):
+        now = time.monotonic()
+        with self._lock:
+            is_final = progress.done >= progress.total
+            if not is_final and now - self._last_emit < self.min_interval_seconds:
+                return
+            self._last_emit = now
+        self._callback(progress)
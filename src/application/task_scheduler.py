@@ -0,0 +1,361 @@
+# src/application/task_scheduler.py
+
+import heapq
+import itertools
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+from typing import Any, Callable, Deque, Dict, List, Optional
+
+# Clases de prioridad (menor valor = mayor prioridad)
+PRIORITY_INTERACTIVE = 0 # Hotkey, captura de pantalla y pop-ups: el usuario espera el resultado al instante
+PRIORITY_MANUAL = 1      # Traducción manual desde la ventana principal
+PRIORITY_BACKGROUND = 2  # Archivos, lotes y precarga de modelos
+
+PRIORITY_NAMES = {
+    PRIORITY_INTERACTIVE: "interactive",
+    PRIORITY_MANUAL: "manual",
+    PRIORITY_BACKGROUND: "background",
+}
+
+# Número de tiempos de espera recientes que se conservan por clase para las estadísticas
+_WAIT_SAMPLES_PER_CLASS = 200
+
+
+class QueueFullError(Exception):
+    """Se lanza al enviar una tarea cuando la cola de su clase de prioridad está llena."""
+    pass
+
+
+class ScheduledTask:
+    """
+    Tarea enviada al planificador. Permite consultar su estado, esperar su resultado y cancelarla.
+    """
+
+    def __init__(self, task_id: int, priority: int, func: Callable, args: tuple, kwargs: dict,
+                 on_done: Optional[Callable[["ScheduledTask"], None]]):
+        self.task_id = task_id
+        self.priority = priority
+        self._func = func
+        self._args = args
+        self._kwargs = kwargs
+        self._on_done = on_done
+        # Planificador que la tiene en cola (lo asigna submit), para retirarla al cancelarla
+        self._scheduler: Optional["TaskScheduler"] = None
+        self.submitted_at = time.monotonic()
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+        self._cancel_requested = threading.Event()
+        self._done = threading.Event()
+
+    @property
+    def wait_seconds(self) -> Optional[float]:
+        """Tiempo que la tarea pasó en cola, o None si aún no empezó."""
+        return None if self.started_at is None else self.started_at - self.submitted_at
+
+    def cancel(self) -> bool:
+        """
+        Solicita la cancelación. Una tarea en cola se retira en el acto (y se llama a su on_done
+        en el hilo que cancela); una tarea en curso solo se detiene si su función consulta is_cancelled().
+
+        Returns:
+            True si la tarea aún no había terminado.
+        """
+        if self._done.is_set():
+            return False
+        self._cancel_requested.set()
+        if self._scheduler is not None:
+            self._scheduler._discard_queued(self)
+        return True
+
+    def is_cancelled(self) -> bool:
+        """Indica si se solicitó la cancelación."""
+        return self._cancel_requested.is_set()
+
+    def is_done(self) -> bool:
+        """Indica si la tarea terminó (con resultado, error o cancelada)."""
+        return self._done.is_set()
+
+    def is_running(self) -> bool:
+        """Indica si la tarea se está ejecutando."""
+        return self.started_at is not None and not self._done.is_set()
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Espera a que la tarea termine. Retorna False si se agotó el timeout."""
+        return self._done.wait(timeout)
+
+
+class TaskScheduler:
+    """
+    Planificador central de tareas en segundo plano con clases de prioridad.
+    Esta clase reside en la capa de Aplicación.
+
+    - Un pool acotado de hilos trabajadores atiende siempre la tarea en cola de mayor prioridad.
+    - Algunos trabajadores se reservan para la clase interactiva, de modo que una traducción
+      larga de documentos nunca retrasa un pop-up de hotkey.
+    - Cada clase tiene un límite de tareas en cola; al superarlo submit() lanza QueueFullError.
+    - Se mide el tiempo de espera en cola de cada clase.
+    """
+
+    def __init__(self, max_workers: int = 3, reserved_interactive_workers: int = 1,
+                 max_queue_depth: Optional[Dict[int, int]] = None):
+        """
+        Constructor del planificador.
+
+        Args:
+            max_workers: Número total de hilos trabajadores.
+            reserved_interactive_workers: Cuántos de ellos solo ejecutan tareas interactivas.
+            max_queue_depth: Límite de tareas en cola por clase de prioridad (0 o ausente = sin límite).
+        """
+        max_workers = max(1, max_workers)
+        # Siempre debe quedar al menos un trabajador general
+        reserved_interactive_workers = min(max(0, reserved_interactive_workers), max_workers - 1)
+        self.max_queue_depth: Dict[int, int] = dict(max_queue_depth or {})
+
+        self._condition = threading.Condition()
+        self._queue: List[tuple] = [] # heap de (prioridad, secuencia, tarea)
+        self._sequence = itertools.count()
+        self._queued_per_class: Dict[int, int] = {priority: 0 for priority in PRIORITY_NAMES}
+        self._running: Dict[int, ScheduledTask] = {}
+        self._shutdown = False
+
+        # Estadísticas por clase
+        self._counters: Dict[int, Dict[str, int]] = {
+            priority: {"submitted": 0, "completed": 0, "failed": 0, "cancelled": 0, "rejected": 0}
+            for priority in PRIORITY_NAMES
+        }
+        self._wait_samples: Dict[int, Deque[float]] = {
+            priority: deque(maxlen=_WAIT_SAMPLES_PER_CLASS) for priority in PRIORITY_NAMES
+        }
+
+        self._workers: List[threading.Thread] = []
+        for index in range(max_workers):
+            interactive_only = index < reserved_interactive_workers
+            worker = threading.Thread(
+                target=self._worker_loop, args=(interactive_only,),
+                name=f"TaskScheduler-{'interactive' if interactive_only else 'general'}-{index}",
+                daemon=True
+            )
+            worker.start()
+            self._workers.append(worker)
+
+        print(f"Application Layer (TaskScheduler): Inicializado con {max_workers} trabajadores "
+              f"({reserved_interactive_workers} reservados para tareas interactivas).")
+
+    def submit(self, func: Callable, *args, priority: int = PRIORITY_MANUAL,
+               on_done: Optional[Callable[[ScheduledTask], None]] = None, **kwargs) -> ScheduledTask:
+        """
+        Encola una tarea.
+
+        Args:
+            func: Función a ejecutar en un hilo trabajador.
+            *args, **kwargs: Argumentos de func.
+            priority: Clase de prioridad (PRIORITY_INTERACTIVE, PRIORITY_MANUAL o PRIORITY_BACKGROUND).
+            on_done: Callback opcional llamado en el hilo trabajador cuando la tarea termina.
+
+        Returns:
+            La tarea encolada.
+
+        Raises:
+            QueueFullError: Si la cola de la clase de prioridad está llena.
+            RuntimeError: Si el planificador está detenido.
+        """
+        if priority not in PRIORITY_NAMES:
+            raise ValueError(f"Prioridad desconocida: {priority}")
+
+        with self._condition:
+            if self._shutdown:
+                raise RuntimeError("El planificador de tareas está detenido.")
+            depth_limit = self.max_queue_depth.get(priority, 0)
+            if depth_limit and self._queued_per_class[priority] >= depth_limit:
+                self._counters[priority]["rejected"] += 1
+                raise QueueFullError(
+                    f"Cola '{PRIORITY_NAMES[priority]}' llena ({depth_limit} tareas en espera)."
+                )
+            task = ScheduledTask(next(self._sequence), priority, func, args, kwargs, on_done)
+            task._scheduler = self
+            heapq.heappush(self._queue, (priority, task.task_id, task))
+            self._queued_per_class[priority] += 1
+            self._counters[priority]["submitted"] += 1
+            # notify_all: un trabajador reservado no puede tomar tareas no interactivas
+            self._condition.notify_all()
+        return task
+
+    def submit_future(self, func: Callable, *args, priority: int = PRIORITY_MANUAL, **kwargs) -> Future:
+        """
+        Encola una tarea y retorna un concurrent.futures.Future con su resultado, para usarlo
+        con as_completed/wait o con asyncio.wrap_future. Cancelar el Future antes de que la tarea
+        empiece la retira de la cola; si la tarea se cancela en el planificador, el Future queda cancelado.
+
+        Raises:
+            QueueFullError: Si la cola de la clase de prioridad está llena.
+            RuntimeError: Si el planificador está detenido.
+        """
+        future: Future = Future()
+
+        def run():
+            if not future.set_running_or_notify_cancel():
+                return None
+            try:
+                result = func(*args, **kwargs)
+            except BaseException as e:
+                future.set_exception(e)
+                raise
+            future.set_result(result)
+            return result
+
+        def on_done(task: ScheduledTask):
+            # Tarea descartada de la cola sin ejecutarse
+            if task.started_at is None and not future.done():
+                future.cancel()
+                future.set_running_or_notify_cancel()
+
+        task = self.submit(run, priority=priority, on_done=on_done)
+        future.add_done_callback(lambda done_future: task.cancel() if done_future.cancelled() else None)
+        return future
+
+    def _next_task(self, interactive_only: bool, dropped: List[ScheduledTask]) -> Optional[ScheduledTask]:
+        """
+        Extrae la siguiente tarea ejecutable para el trabajador. Requiere la condición adquirida.
+        Las tareas canceladas que se retiran de la cola se añaden a dropped.
+        """
+        while self._queue:
+            priority, _, task = self._queue[0]
+            if task.is_cancelled():
+                heapq.heappop(self._queue)
+                self._queued_per_class[priority] -= 1
+                self._counters[priority]["cancelled"] += 1
+                task._done.set()
+                dropped.append(task)
+                continue
+            if interactive_only and priority != PRIORITY_INTERACTIVE:
+                return None
+            heapq.heappop(self._queue)
+            self._queued_per_class[priority] -= 1
+            return task
+        return None
+
+    def _discard_queued(self, task: ScheduledTask):
+        """
+        Retira de la cola una tarea cancelada que aún no empezó, sin esperar a que un trabajador
+        llegue a ella (todos pueden estar ocupados), y llama a su on_done.
+        """
+        with self._condition:
+            if task.started_at is not None or task.is_done():
+                return
+            remaining = [item for item in self._queue if item[2] is not task]
+            if len(remaining) == len(self._queue):
+                return
+            self._queue = remaining
+            heapq.heapify(self._queue)
+            self._queued_per_class[task.priority] -= 1
+            self._counters[task.priority]["cancelled"] += 1
+            task._done.set()
+        self._notify_dropped([task])
+
+    def _worker_loop(self, interactive_only: bool):
+        """Bucle de un hilo trabajador."""
+        while True:
+            dropped: List[ScheduledTask] = []
+            with self._condition:
+                task = self._next_task(interactive_only, dropped)
+                while task is None and not dropped and not self._shutdown:
+                    self._condition.wait()
+                    task = self._next_task(interactive_only, dropped)
+                if task is not None:
+                    task.started_at = time.monotonic()
+                    self._running[task.task_id] = task
+                    self._wait_samples[task.priority].append(task.wait_seconds)
+                stop = task is None and self._shutdown
+
+            # Los callbacks de las tareas descartadas se llaman fuera de la condición
+            self._notify_dropped(dropped)
+            if task is not None:
+                self._run_task(task)
+            elif stop:
+                return
+
+    @staticmethod
+    def _notify_dropped(dropped: List[ScheduledTask]):
+        """Llama a on_done de las tareas canceladas que se retiraron de la cola sin ejecutarse."""
+        while dropped:
+            task = dropped.pop()
+            if task._on_done is not None:
+                try:
+                    task._on_done(task)
+                except Exception as e:
+                    print(f"Application Layer (TaskScheduler): Error en callback de tarea {task.task_id}: {e}")
+
+    def _run_task(self, task: ScheduledTask):
+        """
+        Ejecuta una tarea y registra su resultado. También se capturan KeyboardInterrupt y SystemExit
+        lanzados por la tarea (como ThreadPoolExecutor): se registran como fallo, se llama a on_done
+        y el trabajador sigue vivo en lugar de terminar con la tarea a medias en _running.
+        """
+        outcome = "completed"
+        try:
+            task.result = task._func(*task._args, **task._kwargs)
+        except BaseException as e:
+            task.error = e
+            outcome = "failed"
+            print(f"Application Layer (TaskScheduler): Error en tarea {task.task_id} "
+                  f"({PRIORITY_NAMES[task.priority]}): {e}")
+        if task.is_cancelled():
+            outcome = "cancelled"
+        task.finished_at = time.monotonic()
+
+        with self._condition:
+            self._running.pop(task.task_id, None)
+            self._counters[task.priority][outcome] += 1
+        task._done.set()
+
+        if task._on_done is not None:
+            try:
+                task._on_done(task)
+            except Exception as e:
+                print(f"Application Layer (TaskScheduler): Error en callback de tarea {task.task_id}: {e}")
+
+    def cancel_all(self, priority: Optional[int] = None):
+        """
+        Cancela las tareas en cola y en curso (de una clase, o de todas si priority es None).
+        """
+        with self._condition:
+            tasks = [task for _, _, task in self._queue] + list(self._running.values())
+        for task in tasks:
+            if priority is None or task.priority == priority:
+                task.cancel()
+
+    def shutdown(self, cancel_pending: bool = True):
+        """
+        Detiene los trabajadores cuando terminen su tarea actual.
+
+        Args:
+            cancel_pending: Si es True, las tareas en cola se cancelan en lugar de ejecutarse.
+        """
+        if cancel_pending:
+            self.cancel_all()
+        with self._condition:
+            self._shutdown = True
+            self._condition.notify_all()
+        print("Application Layer (TaskScheduler): Planificador detenido.")
+
+    def get_stats(self) -> Dict[str, Dict[str, float]]:
+        """
+        Obtiene, por clase de prioridad, las tareas en cola y en curso, los contadores
+        y el tiempo de espera en cola (media, p95 y máximo en milisegundos).
+        """
+        with self._condition:
+            stats: Dict[str, Dict[str, float]] = {}
+            for priority, name in PRIORITY_NAMES.items():
+                samples = sorted(self._wait_samples[priority])
+                class_stats: Dict[str, float] = dict(self._counters[priority])
+                class_stats["queued"] = self._queued_per_class[priority]
+                class_stats["running"] = sum(1 for task in self._running.values() if task.priority == priority)
+                class_stats["wait_ms_avg"] = (sum(samples) / len(samples) * 1000) if samples else 0.0
+                class_stats["wait_ms_p95"] = samples[min(len(samples) - 1, int(len(samples) * 0.95))] * 1000 if samples else 0.0
+                class_stats["wait_ms_max"] = samples[-1] * 1000 if samples else 0.0
+                stats[name] = class_stats
+            return stats
@@ -1,59 +1,41 @@
 # src/application/translator_service.py
 
-from typing import List, Any # Importamos Any para el tipo de datos de imagen
-from PySide6.QtCore import QObject, Signal, Slot, QCoreApplication, QEvent # <-- Importamos QEvent
+from typing import List, Any, Optional, Dict, Iterator, Tuple, Callable # Importamos Any para el tipo de datos de imagen
+import asyncio
 import sys
+import time
+import threading
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
 
 # Importar las interfaces y modelos de la capa de Dominio
-from src.domain.interfaces import ITranslator, IHotkeyManager, IOCRService # Importamos IOCRService
-from src.domain.models import TranslationRequest, TranslationResult, Language
-
-# Importar la utilidad de portapapeles de la capa de Infraestructura
-from src.infrastructure.system_utils import get_clipboard_text, set_clipboard_text
-
-# Creamos un QObject para emitir señales desde el hilo secundario al hilo principal (UI)
-class HotkeySignalEmitter(QObject):
-    """Emite señales para comunicar resultados de hotkey al hilo principal de la UI."""
-    # Señal que lleva el resultado de la traducción (TranslationResult)
-    translation_finished = Signal(TranslationResult)
-    # Señal para indicar un error (string)
-    error_occurred = Signal(str)
-
-# Ya no necesitamos este emisor en la capa de aplicación con el patrón de hilo estándar en la UI
-# class OCRTranslationSignalEmitter(QObject):
-#     """Emite señales para comunicar resultados de OCR/Traducción al hilo principal de la UI."""
-#     # Señal que lleva el resultado de la traducción (TranslationResult) después de OCR
-#     ocr_translation_finished = Signal(TranslationResult)
-#     # Señal para indicar un error (string) durante OCR o traducción
-#     ocr_error_occurred = Signal(str)
-#     # Señal para indicar progreso (opcional)
-#     # progress_updated = Signal(int)
-
-
-# --- Clases de evento personalizadas para postEvent (MOVIDAS FUERA DE LA CLASE) ---
-# Aseguramos que QEvent está importado arriba
-class _TranslationFinishedEvent(QEvent):
-    EventType = QEvent.Type(QEvent.registerEventType()) # Registrar un tipo de evento único
-    def __init__(self, result: TranslationResult):
-        super().__init__(self.EventType)
-        self.result = result # Almacenar el resultado de la traducción
-
-class _ErrorOccurredEvent(QEvent):
-    EventType = QEvent.Type(QEvent.registerEventType()) # Registrar otro tipo de evento único
-    def __init__(self, message: str):
-        super().__init__(self.EventType)
-        self.message = message # Almacenar el mensaje de error
-# --- FIN Clases de evento personalizadas ---
+from src.domain.interfaces import ITranslator, IHotkeyManager, IOCRService, ITranslationMemory, IUsageHistory, IPackageManager, IOCRResultCache # Importamos IOCRService
+from src.domain.models import TranslationRequest, TranslationResult, Language, CancellationToken, TranslationProgress, TranslationCancelledError
+from src.application.language_registry import LanguageRegistry
+from src.application.task_scheduler import TaskScheduler, ScheduledTask, QueueFullError, PRIORITY_INTERACTIVE, PRIORITY_MANUAL, PRIORITY_BACKGROUND
 
+# Mensaje de error de las traducciones canceladas por el usuario
+TRANSLATION_CANCELLED_MESSAGE = "Traducción cancelada."
+
+# Intervalo con el que una solicitud agrupada comprueba su propio token de cancelación mientras espera
+_IN_FLIGHT_POLL_SECONDS = 0.1
 
 # Modificamos TranslatorService para incluir la dependencia de IOCRService
-class TranslatorService(QObject): # <-- Aseguramos que hereda de QObject para customEvent
+class TranslatorService:
     """
     Servicio de aplicación para manejar las operaciones de traducción, hotkeys y OCR.
     Depende de las interfaces ITranslator, IHotkeyManager y IOCRService de la capa de Dominio.
+    No depende de Qt: los resultados de la hotkey se entregan mediante callbacks (ver
+    set_hotkey_listener) y la UI los lleva a su hilo principal con src/ui/qt_service_bridge.py.
+    Así el núcleo puede usarse desde procesos sin interfaz gráfica.
     """
 
-    def __init__(self, translator: ITranslator, hotkey_manager: IHotkeyManager, ocr_service: IOCRService):
+    def __init__(self, translator: ITranslator, hotkey_manager: IHotkeyManager, ocr_service: IOCRService,
+                 translation_memory: Optional[ITranslationMemory] = None,
+                 usage_history: Optional[IUsageHistory] = None,
+                 hotkey_profile: Optional[str] = None, document_profile: Optional[str] = None,
+                 task_scheduler: Optional[TaskScheduler] = None,
+                 package_manager: Optional[IPackageManager] = None,
+                 ocr_result_cache: Optional[IOCRResultCache] = None):
         """
         Constructor del servicio de traducción.
 
@@ -61,27 +43,61 @@ class TranslatorService(QObject): # <-- Aseguramos que hereda de QObject para cu
             translator: Una implementación de la interfaz ITranslator.
             hotkey_manager: Una implementación de la interfaz IHotkeyManager.
             ocr_service: Una implementación de la interfaz IOCRService. # Nueva dependencia
+            translation_memory: Implementación opcional de ITranslationMemory que se consulta
+                                antes de llamar al traductor.
+            usage_history: Implementación opcional de IUsageHistory donde se registran los pares
+                           usados, para precargar sus modelos en el siguiente arranque.
+            hotkey_profile: Perfil de rendimiento para la traducción por hotkey (None = por defecto del traductor).
+            document_profile: Perfil de rendimiento para la traducción de archivos (None = por defecto del traductor).
+            task_scheduler: Planificador de tareas en segundo plano. Si no se proporciona se crea uno
+                            con los valores por defecto. Es el ejecutor compartido de todas las
+                            variantes asíncronas (submit_* y *_async).
+            package_manager: Implementación opcional de IPackageManager para consultar, instalar
+                             y desinstalar paquetes de idiomas.
+            ocr_result_cache: Implementación opcional de IOCRResultCache. Una captura visualmente idéntica
+                              a otra reciente reutiliza su texto (y su traducción) sin repetir el OCR.
         """
-        super().__init__() # <-- Llamamos al constructor de QObject
-
         if not isinstance(translator, ITranslator):
              raise TypeError("translator must implement ITranslator interface")
         if not isinstance(hotkey_manager, IHotkeyManager):
              raise TypeError("hotkey_manager must implement IHotkeyManager interface")
         if not isinstance(ocr_service, IOCRService): # Verificar la nueva dependencia
              raise TypeError("ocr_service must implement IOCRService interface")
+        if translation_memory is not None and not isinstance(translation_memory, ITranslationMemory):
+             raise TypeError("translation_memory must implement ITranslationMemory interface")
+        if usage_history is not None and not isinstance(usage_history, IUsageHistory):
+             raise TypeError("usage_history must implement IUsageHistory interface")
+        if package_manager is not None and not isinstance(package_manager, IPackageManager):
+             raise TypeError("package_manager must implement IPackageManager interface")
+        if ocr_result_cache is not None and not isinstance(ocr_result_cache, IOCRResultCache):
+             raise TypeError("ocr_result_cache must implement IOCRResultCache interface")
 
 
         self.translator = translator
         self.hotkey_manager = hotkey_manager
         self.ocr_service = ocr_service # Almacenar la instancia del servicio OCR
+        self.translation_memory = translation_memory # Puede ser None si la caché está deshabilitada
+        self.usage_history = usage_history # Puede ser None si no se guarda historial de uso
+        self.package_manager = package_manager # Puede ser None si la gestión de paquetes no está disponible
+        self.ocr_result_cache = ocr_result_cache # Puede ser None si la caché de OCR está deshabilitada
+        # Perfiles de rendimiento por tipo de uso (ver src/domain/models.py, PROFILE_*)
+        self._hotkey_profile = hotkey_profile
+        self._document_profile = document_profile
+        # Todas las tareas en segundo plano (hotkey, UI, archivos) pasan por el planificador
+        self.task_scheduler = task_scheduler if task_scheduler is not None else TaskScheduler()
+        # Registro de idiomas y pares alcanzables, construido una vez y reutilizado por solicitud
+        self._language_registry = LanguageRegistry(translator)
+        # Traducciones en curso indexadas por (texto normalizado, origen, destino, perfil efectivo): una
+        # solicitud idéntica que llega mientras otra se traduce espera su resultado en lugar de decodificar
+        # de nuevo. Junto al future se guarda el token de quien traduce, para no esperar a una cancelada
+        self._in_flight: Dict[Tuple[str, str, str, Optional[str]], Tuple[Future, Optional[CancellationToken]]] = {}
+        self._in_flight_lock = threading.Lock()
+        self._coalescing_stats = {"leaders": 0, "coalesced": 0}
 
-        # Instancia de los emisores de señales para comunicación entre hilos
-        if QCoreApplication.instance() is None:
-             print("Advertencia: QApplication no inicializada. Las señales podrían no funcionar.")
-
-        self._hotkey_signal_emitter = HotkeySignalEmitter()
-        # self._ocr_translation_signal_emitter = OCRTranslationSignalEmitter() # Ya no necesario en el servicio
+        # Callbacks que reciben los resultados de la traducción por hotkey. Se invocan desde un hilo
+        # del planificador; quien los registra es responsable de pasar el resultado a su propio hilo
+        self._hotkey_result_callback: Optional[Callable[[TranslationResult], None]] = None
+        self._hotkey_error_callback: Optional[Callable[[str], None]] = None
 
 
         # Atributos para almacenar los idiomas por defecto (eventualmente desde la Configuración)
@@ -115,8 +131,8 @@ class TranslatorService(QObject): # <-- Aseguramos que hereda de QObject para cu
         """
         print("Application Layer: Getting supported languages...")
         try:
-            languages = self.translator.get_available_languages()
-            print(f"Application Layer: get_available_languages() returned {len(languages)} languages.")
+            languages = self._language_registry.get_languages()
+            print(f"Application Layer: LanguageRegistry returned {len(languages)} languages.")
             return languages
         except Exception as e:
             print(f"Application Layer Error: Error in get_supported_languages: {e}")
@@ -124,23 +140,35 @@ class TranslatorService(QObject): # <-- Aseguramos que hereda de QObject para cu
             return []
 
     # Método existente para realizar traducción manual
-    def perform_translation(self, text: str, source_lang_code: str, target_lang_code: str) -> TranslationResult:
+    def perform_translation(self, text: str, source_lang_code: str, target_lang_code: str,
+                            profile: Optional[str] = None,
+                            cancellation_token: Optional[CancellationToken] = None,
+                            progress_callback: Optional[Callable[[TranslationProgress], None]] = None) -> TranslationResult:
         """
         Realiza una traducción de texto utilizando el traductor configurado.
+        Si ya se está traduciendo el mismo texto para el mismo par (por ejemplo, la hotkey pulsada
+        dos veces), la solicitud espera ese resultado en lugar de decodificar otra vez.
 
         Args:
             text: El texto a traducir.
             source_lang_code: Código del idioma de origen (e.g., "en").
             target_lang_code: Código del idioma de destino (e.g., "es").
+            profile: Perfil de rendimiento opcional ("fast", "balanced", "quality").
+            cancellation_token: Token opcional para cancelar la traducción entre oraciones.
+            progress_callback: Función opcional que recibe el progreso (TranslationProgress).
 
         Returns:
             Un objeto TranslationResult con el texto traducido o un error.
         """
         print(f"Application Layer: Performing translation for text='{text[:50]}...' from {source_lang_code} to {target_lang_code}")
 
-        available_languages = self.get_supported_languages()
-        source_language = next((lang for lang in available_languages if lang.code == source_lang_code), None)
-        target_language = next((lang for lang in available_languages if lang.code == target_lang_code), None)
+        try:
+            source_language = self._language_registry.get_language(source_lang_code)
+            target_language = self._language_registry.get_language(target_lang_code)
+        except Exception as e:
+            error_msg = f"Error al consultar los idiomas soportados: {e}"
+            print(f"Application Layer Error: {error_msg}")
+            return TranslationResult(error=error_msg)
 
         if not source_language:
             error_msg = f"Idioma de origen no soportado: {source_lang_code}"
@@ -150,27 +178,543 @@ class TranslatorService(QObject): # <-- Aseguramos que hereda de QObject para cu
             error_msg = f"Idioma de destino no soportado: {target_lang_code}"
             print(f"Application Layer Error: {error_msg}")
             return TranslationResult(error=error_msg)
+        if not self._language_registry.is_pair_reachable(source_lang_code, target_lang_code):
+            error_msg = f"No hay paquetes instalados para traducir de {source_lang_code} a {target_lang_code}"
+            print(f"Application Layer Error: {error_msg}")
+            return TranslationResult(error=error_msg)
+
+        self._record_pair_usage(source_lang_code, target_lang_code)
+
+        # --- Consultar la memoria de traducción antes de llamar al modelo ---
+        model_version = ""
+        if self.translation_memory is not None:
+            try:
+                model_version = self._get_memory_model_version(source_lang_code, target_lang_code, profile)
+                cached_text = self.translation_memory.lookup(text, source_lang_code, target_lang_code, model_version)
+                if cached_text is not None:
+                    print("Application Layer: Traducción obtenida de la memoria de traducción.")
+                    return TranslationResult(translated_text=cached_text)
+            except Exception as e:
+                # La memoria es solo una optimización: ante cualquier error se traduce normalmente
+                print(f"Application Layer Error: Error al consultar la memoria de traducción: {e}")
+        # --- Fin consulta de memoria ---
+
+        # --- Agrupar con una traducción idéntica en curso ---
+        key = self._get_in_flight_key(text, source_lang_code, target_lang_code, profile)
+        future, leader_token, is_leader = self._join_in_flight(key, cancellation_token)
+        if not is_leader:
+            print("Application Layer: Traducción idéntica en curso. Se espera su resultado.")
+            try:
+                shared_result = self._wait_in_flight(future, leader_token, cancellation_token)
+            except TranslationCancelledError:
+                return TranslationResult(error=TRANSLATION_CANCELLED_MESSAGE)
+            if shared_result is not None:
+                return shared_result
+            # La traducción en curso se canceló: esta solicitud se traduce por su cuenta
+            print("Application Layer: La traducción agrupada se canceló. Traduciendo de nuevo.")
+            return self._translate_with_model(text, source_language, target_language, profile, model_version,
+                                              cancellation_token, progress_callback)
 
-        request = TranslationRequest(text, source_language, target_language)
+        translation_result: Optional[TranslationResult] = None
+        try:
+            translation_result = self._translate_with_model(text, source_language, target_language, profile, model_version,
+                                                            cancellation_token, progress_callback)
+            return translation_result
+        finally:
+            # Una cancelación no se comparte: las solicitudes que esperaban traducen por su cuenta
+            if translation_result is not None and translation_result.error == TRANSLATION_CANCELLED_MESSAGE:
+                translation_result = None
+            self._finish_in_flight(key, future, translation_result)
+
+
+    def _translate_with_model(self, text: str, source_language: Language, target_language: Language,
+                              profile: Optional[str], model_version: str,
+                              cancellation_token: Optional[CancellationToken],
+                              progress_callback: Optional[Callable[[TranslationProgress], None]]) -> TranslationResult:
+        """
+        Traduce un texto con el traductor y guarda el resultado en la memoria de traducción.
+        Retorna siempre un TranslationResult (con error si falla o se cancela).
+        """
+        source_lang_code = source_language.code
+        target_lang_code = target_language.code
+        request = TranslationRequest(text, source_language, target_language, profile=profile)
         print("Application Layer: Calling translator.translate()...")
         try:
-            translation_result = self.translator.translate(request)
+            translation_result = self.translator.translate(request, cancellation_token, progress_callback)
             print("Application Layer: translator.translate() returned.")
             print(f"Application Layer: Translation result: {translation_result}")
             # Asegurarse de que el resultado retornado es un TranslationResult
             if isinstance(translation_result, TranslationResult):
+                 if translation_result.is_successful and self.translation_memory is not None:
+                     self.translation_memory.store(text, source_lang_code, target_lang_code, model_version, translation_result.translated_text)
                  return translation_result
             else:
                  error_msg = f"Translator returned unexpected type: {type(translation_result).__name__}"
                  print(f"Application Layer Error: {error_msg}")
                  return TranslationResult(error=error_msg)
 
+        except TranslationCancelledError:
+            print("Application Layer: Traducción cancelada por el usuario.")
+            return TranslationResult(error=TRANSLATION_CANCELLED_MESSAGE)
         except Exception as e:
             error_msg = f"Error during translator.translate(): {e}"
             print(f"Application Layer Error: {error_msg}")
             return TranslationResult(error=error_msg)
 
 
+    def perform_translation_batch(self, texts: List[str], source_lang_code: str, target_lang_code: str,
+                                  profile: Optional[str] = None,
+                                  cancellation_token: Optional[CancellationToken] = None,
+                                  progress_callback: Optional[Callable[[TranslationProgress], None]] = None) -> List[TranslationResult]:
+        """
+        Traduce varios textos del mismo par de idiomas en una sola llamada al traductor.
+        Los textos presentes en la memoria de traducción no se envían al modelo.
+
+        Args:
+            texts: Los textos a traducir (por ejemplo, los párrafos de un archivo).
+            source_lang_code: Código del idioma de origen.
+            target_lang_code: Código del idioma de destino.
+            profile: Perfil de rendimiento opcional ("fast", "balanced", "quality").
+            cancellation_token: Token opcional para cancelar la traducción entre oraciones.
+            progress_callback: Función opcional que recibe el progreso de las oraciones enviadas al modelo.
+
+        Returns:
+            Una lista de TranslationResult en el mismo orden que texts. Si se cancela,
+            los textos no traducidos llevan el error TRANSLATION_CANCELLED_MESSAGE.
+        """
+        print(f"Application Layer: Performing batch translation of {len(texts)} texts from {source_lang_code} to {target_lang_code}")
+
+        source_language = self._language_registry.get_language(source_lang_code)
+        target_language = self._language_registry.get_language(target_lang_code)
+        if not source_language or not target_language or not self._language_registry.is_pair_reachable(source_lang_code, target_lang_code):
+            error_msg = f"Par de idiomas no soportado: {source_lang_code} -> {target_lang_code}"
+            print(f"Application Layer Error: {error_msg}")
+            return [TranslationResult(error=error_msg) for _ in texts]
+
+        self._record_pair_usage(source_lang_code, target_lang_code)
+        results: List[Optional[TranslationResult]] = [None] * len(texts)
+        model_version = ""
+        if self.translation_memory is not None:
+            try:
+                model_version = self._get_memory_model_version(source_lang_code, target_lang_code, profile)
+                for index, text in enumerate(texts):
+                    cached_text = self.translation_memory.lookup(text, source_lang_code, target_lang_code, model_version)
+                    if cached_text is not None:
+                        results[index] = TranslationResult(translated_text=cached_text)
+            except Exception as e:
+                print(f"Application Layer Error: Error al consultar la memoria de traducción: {e}")
+
+        pending_indexes = [index for index, result in enumerate(results) if result is None]
+        if pending_indexes:
+            requests = [TranslationRequest(texts[index], source_language, target_language, profile=profile) for index in pending_indexes]
+            try:
+                batch_results = self.translator.translate_batch(requests, cancellation_token, progress_callback)
+                if len(batch_results) != len(requests):
+                    raise ValueError(f"El traductor retornó {len(batch_results)} resultados para {len(requests)} solicitudes")
+            except TranslationCancelledError:
+                print("Application Layer: Traducción por lotes cancelada por el usuario.")
+                batch_results = [TranslationResult(error=TRANSLATION_CANCELLED_MESSAGE) for _ in requests]
+            except Exception as e:
+                error_msg = f"Error during translator.translate_batch(): {e}"
+                print(f"Application Layer Error: {error_msg}")
+                batch_results = [TranslationResult(error=error_msg) for _ in requests]
+
+            for index, result in zip(pending_indexes, batch_results):
+                results[index] = result
+                if result.is_successful and self.translation_memory is not None:
+                    self.translation_memory.store(texts[index], source_lang_code, target_lang_code, model_version, result.translated_text)
+
+        print(f"Application Layer: Batch translation finished ({len(texts) - len(pending_indexes)} from translation memory).")
+        return results
+
+
+    def get_document_profile(self) -> Optional[str]:
+        """Perfil de rendimiento configurado para documentos (None = por defecto del traductor)."""
+        return self._document_profile
+
+
+    def translate_stream(self, text: str, source_lang_code: str, target_lang_code: str,
+                         profile: Optional[str] = None, document: bool = False,
+                         cancellation_token: Optional[CancellationToken] = None,
+                         progress_callback: Optional[Callable[[TranslationProgress], None]] = None) -> Iterator[str]:
+        """
+        Traduce un texto entregando los fragmentos traducidos en cuanto se decodifican,
+        para que la UI pueda mostrar las primeras oraciones sin esperar al documento completo.
+        Si el texto está en la memoria de traducción se entrega en un solo fragmento, y
+        al terminar la traducción completa se guarda en la memoria.
+
+        Args:
+            text: El texto a traducir.
+            source_lang_code: Código del idioma de origen.
+            target_lang_code: Código del idioma de destino.
+            profile: Perfil de rendimiento opcional ("fast", "balanced", "quality").
+            document: Si es True y no se indica profile, se usa el perfil configurado para documentos.
+            cancellation_token: Token opcional para cancelar la traducción entre oraciones.
+            progress_callback: Función opcional que recibe el progreso (TranslationProgress).
+
+        Yields:
+            Fragmentos del texto traducido, en orden; concatenados forman la traducción completa.
+
+        Raises:
+            ValueError: Si el par de idiomas no está soportado o no tiene paquetes instalados.
+            TranslationCancelledError: Si se canceló cancellation_token.
+        """
+        print(f"Application Layer: Streaming translation for text='{text[:50]}...' from {source_lang_code} to {target_lang_code}")
+        if document and profile is None:
+            profile = self._document_profile
+
+        source_language = self._language_registry.get_language(source_lang_code)
+        target_language = self._language_registry.get_language(target_lang_code)
+        if not source_language or not target_language or not self._language_registry.is_pair_reachable(source_lang_code, target_lang_code):
+            raise ValueError(f"Par de idiomas no soportado: {source_lang_code} -> {target_lang_code}")
+
+        self._record_pair_usage(source_lang_code, target_lang_code)
+
+        model_version = ""
+        if self.translation_memory is not None:
+            try:
+                model_version = self._get_memory_model_version(source_lang_code, target_lang_code, profile)
+                cached_text = self.translation_memory.lookup(text, source_lang_code, target_lang_code, model_version)
+                if cached_text is not None:
+                    print("Application Layer: Traducción obtenida de la memoria de traducción.")
+                    yield cached_text
+                    return
+            except Exception as e:
+                print(f"Application Layer Error: Error al consultar la memoria de traducción: {e}")
+
+        # Si ya se está traduciendo el mismo texto (por ejemplo, por hotkey), se espera ese resultado
+        key = self._get_in_flight_key(text, source_lang_code, target_lang_code, profile)
+        future, leader_token, is_leader = self._join_in_flight(key, cancellation_token)
+        if not is_leader:
+            print("Application Layer: Traducción idéntica en curso. Se espera su resultado.")
+            shared_result = self._wait_in_flight(future, leader_token, cancellation_token)
+            if shared_result is not None:
+                if not shared_result.is_successful:
+                    raise RuntimeError(shared_result.error)
+                yield shared_result.translated_text
+                return
+            print("Application Layer: La traducción agrupada se canceló. Traduciendo de nuevo.")
+
+        request = TranslationRequest(text, source_language, target_language, profile=profile)
+        start_time = time.perf_counter()
+        translated_parts: List[str] = []
+        shared_result: Optional[TranslationResult] = None
+        try:
+            for part in self.translator.translate_stream(request, cancellation_token, progress_callback):
+                if not translated_parts:
+                    print(f"Application Layer: Primer fragmento traducido en {(time.perf_counter() - start_time) * 1000:.0f} ms.")
+                translated_parts.append(part)
+                yield part
+            shared_result = TranslationResult(translated_text="".join(translated_parts))
+        except TranslationCancelledError:
+            raise
+        except Exception as e:
+            shared_result = TranslationResult(error=str(e))
+            raise
+        finally:
+            # Si se cancela o se deja de consumir el generador, shared_result queda en None
+            # y las solicitudes que esperaban traducen por su cuenta
+            if is_leader:
+                self._finish_in_flight(key, future, shared_result)
+
+        print(f"Application Layer: Traducción en streaming completada en {(time.perf_counter() - start_time) * 1000:.0f} ms "
+              f"({len(translated_parts)} fragmentos).")
+        if self.translation_memory is not None:
+            try:
+                self.translation_memory.store(text, source_lang_code, target_lang_code, model_version, shared_result.translated_text)
+            except Exception as e:
+                print(f"Application Layer Error: Error al guardar en la memoria de traducción: {e}")
+
+
+    # --- Agrupación de solicitudes idénticas en curso ---
+
+    def _get_in_flight_key(self, text: str, source_lang_code: str, target_lang_code: str,
+                           profile: Optional[str]) -> Tuple[str, str, str, Optional[str]]:
+        """
+        Clave con la que se agrupan las solicitudes idénticas: el texto normalizado (fin de línea
+        y espacios de los extremos), el par de idiomas y el perfil efectivo. El perfil forma parte
+        de la clave porque perfiles distintos (otro beam) producen traducciones distintas, y una
+        solicitud "quality" no debe recibir el resultado de una "fast".
+        """
+        return (text.replace("\r\n", "\n").strip(), source_lang_code, target_lang_code,
+                self.translator.resolve_profile_name(profile))
+
+    def _join_in_flight(self, key: Tuple[str, str, str, Optional[str]],
+                        cancellation_token: Optional[CancellationToken]) -> Tuple[Future, Optional[CancellationToken], bool]:
+        """
+        Se une a la traducción en curso con la misma clave, o registra una nueva con cancellation_token
+        como token de quien traduce. Una traducción en curso cuyo token ya se canceló no se reutiliza.
+
+        Returns:
+            Una tupla (future con el TranslationResult, token de quien traduce,
+            True si esta solicitud debe hacer la traducción).
+        """
+        with self._in_flight_lock:
+            entry = self._in_flight.get(key)
+            if entry is not None:
+                future, leader_token = entry
+                if leader_token is None or not leader_token.is_cancelled:
+                    self._coalescing_stats["coalesced"] += 1
+                    return future, leader_token, False
+            future = Future()
+            self._in_flight[key] = (future, cancellation_token)
+            self._coalescing_stats["leaders"] += 1
+            return future, cancellation_token, True
+
+    def _finish_in_flight(self, key: Tuple[str, str, str, Optional[str]], future: Future, result: Optional[TranslationResult]):
+        """
+        Retira la traducción del registro y entrega su resultado a las solicitudes que esperaban.
+        result es None si la traducción se canceló o no terminó.
+        """
+        with self._in_flight_lock:
+            entry = self._in_flight.get(key)
+            if entry is not None and entry[0] is future:
+                del self._in_flight[key]
+        future.set_result(result)
+
+    @staticmethod
+    def _wait_in_flight(future: Future, leader_token: Optional[CancellationToken],
+                        cancellation_token: Optional[CancellationToken]) -> Optional[TranslationResult]:
+        """
+        Espera el resultado de una traducción en curso, atendiendo el token de la solicitud que espera
+        y el de quien traduce: un streaming cancelado puede quedar suspendido sin que nadie lo cierre,
+        así que en cuanto su token se cancela se deja de esperarlo.
+
+        Returns:
+            El TranslationResult compartido, o None si la traducción en curso se canceló.
+
+        Raises:
+            TranslationCancelledError: Si se canceló cancellation_token durante la espera.
+        """
+        while True:
+            if cancellation_token is not None:
+                cancellation_token.raise_if_cancelled()
+            try:
+                return future.result(timeout=_IN_FLIGHT_POLL_SECONDS)
+            except FutureTimeoutError:
+                if leader_token is not None and leader_token.is_cancelled:
+                    return None
+
+    def get_coalescing_stats(self) -> Dict[str, int]:
+        """
+        Retorna las estadísticas de agrupación: traducciones realizadas ("leaders"), solicitudes
+        que reutilizaron una traducción en curso ("coalesced") y traducciones en curso ("in_flight").
+        """
+        with self._in_flight_lock:
+            stats = dict(self._coalescing_stats)
+            stats["in_flight"] = len(self._in_flight)
+            return stats
+
+
+    def _get_memory_model_version(self, source_lang_code: str, target_lang_code: str, profile: Optional[str]) -> str:
+        """
+        Versión usada como parte de la clave de la memoria de traducción: la versión del modelo
+        más el perfil, porque perfiles distintos (por ejemplo, otro beam) producen textos distintos.
+        Sin perfil se usa el perfil por defecto configurado en el traductor, para que cambiar
+        ese valor no devuelva traducciones guardadas con el perfil anterior.
+        """
+        model_version = self.translator.get_model_version(source_lang_code, target_lang_code)
+        profile = self.translator.resolve_profile_name(profile)
+        return f"{model_version}|{profile}" if profile else model_version
+
+
+    # --- Métodos para la precarga de modelos ---
+
+    def _record_pair_usage(self, source_lang_code: str, target_lang_code: str):
+        """Registra el par en el historial de uso, si existe. Los errores no afectan a la traducción."""
+        if self.usage_history is None:
+            return
+        try:
+            self.usage_history.record_pair(source_lang_code, target_lang_code)
+        except Exception as e:
+            print(f"Application Layer Error: Error al registrar el uso del par: {e}")
+
+    def get_prewarm_pairs(self, configured_pairs: List[Tuple[str, str]], history_limit: int = 0) -> List[Tuple[str, str]]:
+        """
+        Determina qué pares precargar: primero los configurados y luego los más recientes
+        del historial de uso. Se descartan duplicados y pares que no se pueden traducir.
+
+        Args:
+            configured_pairs: Pares (origen, destino) indicados en la configuración.
+            history_limit: Número máximo de pares que se toman del historial (0 para ninguno).
+
+        Returns:
+            La lista de pares a precargar, en orden de prioridad.
+        """
+        candidates = list(configured_pairs)
+        if self.usage_history is not None and history_limit > 0:
+            try:
+                candidates.extend(self.usage_history.get_recent_pairs(history_limit))
+            except Exception as e:
+                print(f"Application Layer Error: Error al leer el historial de uso: {e}")
+
+        pairs: List[Tuple[str, str]] = []
+        for pair in candidates:
+            if pair in pairs:
+                continue
+            if not self._language_registry.is_pair_reachable(*pair):
+                print(f"Application Layer: Par {pair[0]} -> {pair[1]} no instalado. No se precargará.")
+                continue
+            pairs.append(pair)
+        return pairs
+
+    def prewarm_models(self, pairs: List[Tuple[str, str]],
+                       progress_callback: Optional[Callable[[int, int, str, str], None]] = None) -> int:
+        """
+        Carga y prepara los modelos de los pares indicados. Es bloqueante: la UI debe llamarlo
+        en un hilo secundario.
+
+        Args:
+            pairs: Pares (origen, destino) a precargar, en orden.
+            progress_callback: Función opcional llamada antes de cada par con
+                               (índice, total, código de origen, código de destino).
+
+        Returns:
+            El número de pares cuyo modelo quedó cargado.
+        """
+        print(f"Application Layer: Precargando modelos de {len(pairs)} pares...")
+        # Se precarga el perfil por defecto y, si es distinto, el de la hotkey (que necesita la menor latencia)
+        profiles = [None] if not self._hotkey_profile else [None, self._hotkey_profile]
+        warmed = 0
+        for index, (source_lang_code, target_lang_code) in enumerate(pairs):
+            if progress_callback is not None:
+                progress_callback(index, len(pairs), source_lang_code, target_lang_code)
+            try:
+                results = [self.translator.warm_up(source_lang_code, target_lang_code, profile) for profile in profiles]
+                if all(results):
+                    warmed += 1
+            except Exception as e:
+                print(f"Application Layer Error: Error al precargar {source_lang_code} -> {target_lang_code}: {e}")
+        print(f"Application Layer: Precarga finalizada ({warmed}/{len(pairs)} modelos cargados).")
+        return warmed
+
+
+    # --- Métodos para la memoria de traducción y cambios de paquetes ---
+
+    def notify_packages_changed(self, from_code: str, to_code: str):
+        """
+        Debe llamarse después de instalar o desinstalar un paquete de idioma.
+        Invalida las entradas de la memoria de traducción que involucran esos idiomas,
+        el registro de idiomas, y notifica al traductor para que descarte su estado derivado.
+
+        Args:
+            from_code: Código del idioma de origen del paquete.
+            to_code: Código del idioma de destino del paquete.
+        """
+        print(f"Application Layer: Paquete {from_code} -> {to_code} modificado. Invalidando cachés...")
+        try:
+            self.translator.on_packages_changed()
+        except Exception as e:
+            print(f"Application Layer Error: Error al notificar cambio de paquetes al traductor: {e}")
+        self._language_registry.invalidate()
+        if self.translation_memory is not None:
+            try:
+                self.translation_memory.invalidate_languages([from_code, to_code])
+            except Exception as e:
+                print(f"Application Layer Error: Error al invalidar la memoria de traducción: {e}")
+        if self.ocr_result_cache is not None:
+            try:
+                self.ocr_result_cache.invalidate_languages([from_code, to_code])
+            except Exception as e:
+                print(f"Application Layer Error: Error al invalidar la caché de OCR: {e}")
+
+    # --- Gestión de paquetes ---
+
+    def _require_package_manager(self) -> IPackageManager:
+        if self.package_manager is None:
+            raise RuntimeError("La gestión de paquetes no está disponible.")
+        return self.package_manager
+
+    def get_installed_packages(self) -> List[Any]:
+        """
+        Obtiene los paquetes de idiomas instalados. Es bloqueante (lee el disco).
+
+        Raises:
+            RuntimeError: Si no hay gestor de paquetes.
+        """
+        return self._require_package_manager().get_installed_packages()
+
+    def get_available_packages(self, force_refresh: bool = False) -> List[Any]:
+        """
+        Obtiene los paquetes disponibles para instalar. Es bloqueante: puede descargar el índice remoto.
+
+        Raises:
+            RuntimeError: Si no hay gestor de paquetes.
+        """
+        return self._require_package_manager().get_available_packages(force_refresh=force_refresh)
+
+    def install_package(self, package: Any):
+        """
+        Descarga e instala un paquete e invalida las cachés afectadas. Es bloqueante.
+
+        Raises:
+            RuntimeError: Si no hay gestor de paquetes.
+            Exception: Si la descarga o la instalación fallan.
+        """
+        self._require_package_manager().install_package(package)
+        self.notify_packages_changed(package.from_code, package.to_code)
+
+    def uninstall_package(self, package: Any):
+        """
+        Desinstala un paquete e invalida las cachés afectadas. Es bloqueante.
+
+        Raises:
+            RuntimeError: Si no hay gestor de paquetes.
+            FileNotFoundError: Si no se encuentra el paquete en disco.
+        """
+        self._require_package_manager().uninstall_package(package)
+        self.notify_packages_changed(package.from_code, package.to_code)
+
+    def get_reachable_target_languages(self, source_lang_code: str) -> List[Language]:
+        """
+        Retorna los idiomas de destino a los que se puede traducir desde source_lang_code
+        (directamente o mediante un idioma pivote).
+        """
+        try:
+            return self._language_registry.get_reachable_targets(source_lang_code)
+        except Exception as e:
+            print(f"Application Layer Error: Error al obtener destinos alcanzables: {e}")
+            return []
+
+    def get_translation_memory_stats(self) -> Dict[str, int]:
+        """
+        Retorna las estadísticas de la memoria de traducción (hits, misses, entries).
+        Retorna un diccionario vacío si la memoria está deshabilitada.
+        """
+        if self.translation_memory is None:
+            return {}
+        try:
+            return self.translation_memory.get_stats()
+        except Exception as e:
+            print(f"Application Layer Error: Error al obtener estadísticas de la memoria de traducción: {e}")
+            return {}
+
+
+    def get_ocr_cache_stats(self) -> Dict[str, int]:
+        """
+        Retorna las estadísticas de la caché de OCR (hits, near_hits, misses, translation_hits, entries).
+        Retorna un diccionario vacío si la caché está deshabilitada.
+        """
+        if self.ocr_result_cache is None:
+            return {}
+        try:
+            return self.ocr_result_cache.get_stats()
+        except Exception as e:
+            print(f"Application Layer Error: Error al obtener estadísticas de la caché de OCR: {e}")
+            return {}
+
+    def get_model_memory_stats(self) -> Dict[str, Dict[str, float]]:
+        """
+        Retorna el coste en memoria de cada modelo de traducción (por par) y el total cargado,
+        para dimensionar los equipos. Retorna un diccionario vacío si el traductor no lo informa.
+        """
+        try:
+            return self.translator.get_model_memory_stats()
+        except Exception as e:
+            print(f"Application Layer Error: Error al obtener estadísticas de memoria de modelos: {e}")
+            return {}
+
+
     # --- Métodos para Hotkeys y Portapapeles (existente) ---
 
     def register_clipboard_translation_hotkey(self, hotkey: str):
@@ -178,7 +722,7 @@ class TranslatorService(QObject): # <-- Aseguramos que hereda de QObject para cu
         Registra una hotkey global que, al ser presionada, traducirá el texto del portapapeles.
         """
         print(f"Application Layer: Registrando hotkey para traducción de portapapeles: {hotkey}")
-        self.hotkey_manager.register_hotkey(hotkey, self._on_hotkey_pressed)
+        self.hotkey_manager.register_hotkey(hotkey, self._schedule_clipboard_translation)
         self.hotkey_manager.start_listening()
 
     def unregister_clipboard_translation_hotkey(self, hotkey: str):
@@ -188,29 +732,67 @@ class TranslatorService(QObject): # <-- Aseguramos que hereda de QObject para cu
         print(f"Application Layer: Desregistrando hotkey de traducción de portapapeles: {hotkey}")
         self.hotkey_manager.unregister_hotkey(hotkey)
 
-    def get_hotkey_signal_emitter(self) -> HotkeySignalEmitter:
+    def set_hotkey_listener(self, on_translation_finished: Optional[Callable[[TranslationResult], None]],
+                            on_error: Optional[Callable[[str], None]]):
         """
-        Retorna el emisor de señales de hotkey para que la UI pueda conectarse a él.
+        Registra los callbacks que reciben los resultados de la traducción por hotkey.
+        Ambos se invocan desde un hilo del planificador de tareas, no desde el hilo principal.
+
+        Args:
+            on_translation_finished: Recibe el TranslationResult de cada traducción por hotkey (None para quitarlo).
+            on_error: Recibe el mensaje de los errores ocurridos fuera de la traducción (None para quitarlo).
         """
-        return self._hotkey_signal_emitter
+        self._hotkey_result_callback = on_translation_finished
+        self._hotkey_error_callback = on_error
 
-    def _on_hotkey_pressed(self):
+    def _notify_hotkey_result(self, result: TranslationResult):
+        """Entrega un resultado de la hotkey al callback registrado, si lo hay."""
+        callback = self._hotkey_result_callback
+        if callback is None:
+            print("Application Layer: Resultado de hotkey sin receptor registrado; se descarta.")
+            return
+        try:
+            callback(result)
+        except Exception as e:
+            print(f"Application Layer Error: El receptor de resultados de hotkey falló: {e}")
+
+    def _notify_hotkey_error(self, message: str):
+        """Entrega un error de la hotkey al callback registrado, si lo hay."""
+        callback = self._hotkey_error_callback
+        if callback is None:
+            print(f"Application Layer: Error de hotkey sin receptor registrado: {message}")
+            return
+        try:
+            callback(message)
+        except Exception as e:
+            print(f"Application Layer Error: El receptor de errores de hotkey falló: {e}")
+
+    def _schedule_clipboard_translation(self):
         """
         Método callback que se ejecuta en el hilo del hotkey manager cuando se presiona la hotkey.
-        Obtiene texto del portapapeles, realiza la traducción y emite una señal con el resultado.
+        Solo encola la traducción con prioridad interactiva, para liberar de inmediato el hilo del hook.
+        """
+        try:
+            self.task_scheduler.submit(self._on_hotkey_pressed, priority=PRIORITY_INTERACTIVE)
+        except (QueueFullError, RuntimeError) as e:
+            print(f"Application Layer Error: No se pudo encolar la traducción por hotkey: {e}")
+            self._notify_hotkey_error(f"Traducción por hotkey descartada: {e}")
+
+    def _on_hotkey_pressed(self):
+        """
+        Se ejecuta en un hilo del planificador de tareas cuando se presiona la hotkey.
+        Obtiene texto del portapapeles, realiza la traducción y entrega el resultado al receptor registrado.
         """
         print("Application Layer: Hotkey presionada. Iniciando traducción de portapapeles...")
         try:
+            # El portapapeles solo se usa con la hotkey de escritorio; se importa aquí para que
+            # los usos sin interfaz gráfica (servidor, línea de comandos) no dependan de pyperclip
+            from src.infrastructure.system_utils import get_clipboard_text
             clipboard_text = get_clipboard_text()
 
             if not clipboard_text:
                  print("Application Layer: Portapapeles vacío o error al obtener texto.")
-                 # Emitir TranslationResult con error al hilo principal de la UI via la señal
-                 # Usamos QCoreApplication.instance() para asegurar que la señal se emite en el hilo principal
-                 QCoreApplication.instance().postEvent(
-                     self, # <-- Emitimos el evento a sí mismo (TranslatorService)
-                     _TranslationFinishedEvent(TranslationResult(error="Portapapeles vacío o error al obtener texto."))
-                 )
+                 self._notify_hotkey_result(TranslationResult(error="Portapapeles vacío o error al obtener texto."))
                  return
 
             # --- Usar los idiomas por defecto almacenados (actualizados por la UI) ---
@@ -220,10 +802,7 @@ class TranslatorService(QObject): # <-- Aseguramos que hereda de QObject para cu
             if not source_lang_code or not target_lang_code:
                  error_msg = "Idiomas de origen/destino no seleccionados para la traducción por hotkey."
                  print(f"Application Layer Error: {error_msg}")
-                 QCoreApplication.instance().postEvent(
-                      self,
-                      _ErrorOccurredEvent(error_msg)
-                 )
+                 self._notify_hotkey_error(error_msg)
                  return
             # --- Fin Usar idiomas por defecto ---
 
@@ -232,42 +811,16 @@ class TranslatorService(QObject): # <-- Aseguramos que hereda de QObject para cu
             translation_result = self.perform_translation(
                 clipboard_text,
                 source_lang_code, # Usar idioma de origen por defecto (actualizado por UI)
-                target_lang_code # Usar idioma de destino por defecto (actualizado por UI)
+                target_lang_code, # Usar idioma de destino por defecto (actualizado por UI)
+                profile=self._hotkey_profile # Perfil de baja latencia para el pop-up
             )
 
-            # Emitir TranslationResult al hilo principal de la UI via la señal
-            # Usamos QCoreApplication.instance() para asegurar que la señal se emite en el hilo principal
-            QCoreApplication.instance().postEvent(
-                self, # <-- Emitimos el evento a sí mismo (TranslatorService)
-                _TranslationFinishedEvent(translation_result)
-            )
-            print("Application Layer: Señal de traducción de portapapeles emitida.")
+            self._notify_hotkey_result(translation_result)
+            print("Application Layer: Resultado de traducción de portapapeles entregado.")
 
         except Exception as e:
             print(f"Application Layer Error: Error inesperado en callback de hotkey: {e}")
-            # Emitir error al hilo principal de la UI via la señal
-            QCoreApplication.instance().postEvent(
-                 self, # <-- Emitimos el evento a sí mismo (TranslatorService)
-                 _ErrorOccurredEvent(f"Error inesperado durante la traducción por hotkey: {e}")
-            )
-
-    # Sobreescribir customEvent para manejar los eventos personalizados
-    # Este método se ejecuta en el hilo principal de la UI porque TranslatorService
-    # está instanciado en el hilo principal.
-    def customEvent(self, event: QEvent):
-        # Verificamos el tipo de evento usando los EventType registrados
-        if event.type() == _TranslationFinishedEvent.EventType: # <-- Ahora accesibles
-            print("Application Layer: customEvent received _TranslationFinishedEvent.")
-            # Emitimos la señal del emisor de hotkey para que la UI la reciba
-            self._hotkey_signal_emitter.translation_finished.emit(event.result)
-        elif event.type() == _ErrorOccurredEvent.EventType: # <-- Ahora accesibles
-            print("Application Layer: customEvent received _ErrorOccurredEvent.")
-             # Emitimos la señal de error del emisor de hotkey para que la UI la reciba
-            self._hotkey_signal_emitter.error_occurred.emit(event.message)
-        else:
-            # Si no es uno de nuestros eventos personalizados, llamar al método base
-            super().customEvent(event)
-
+            self._notify_hotkey_error(f"Error inesperado durante la traducción por hotkey: {e}")
 
     def stop_hotkey_listening(self):
          """
@@ -277,28 +830,183 @@ class TranslatorService(QObject): # <-- Aseguramos que hereda de QObject para cu
          print("Application Layer: Solicitando detener monitoreo de hotkeys.")
          self.hotkey_manager.stop_listening()
 
+    # --- Métodos para el planificador de tareas ---
+
+    def submit_task(self, func, *args, priority: int = PRIORITY_MANUAL, on_done=None, **kwargs) -> ScheduledTask:
+        """
+        Encola una tarea en el planificador central. Ver TaskScheduler.submit.
+
+        Raises:
+            QueueFullError: Si la cola de la clase de prioridad está llena.
+        """
+        return self.task_scheduler.submit(func, *args, priority=priority, on_done=on_done, **kwargs)
+
+    def submit_future(self, func: Callable, *args, priority: int = PRIORITY_MANUAL, **kwargs) -> Future:
+        """
+        Ejecuta func en el planificador compartido y retorna un concurrent.futures.Future.
+        Ver TaskScheduler.submit_future.
+
+        Raises:
+            QueueFullError: Si la cola de la clase de prioridad está llena.
+        """
+        return self.task_scheduler.submit_future(func, *args, priority=priority, **kwargs)
+
+    async def run_async(self, func: Callable, *args, priority: int = PRIORITY_MANUAL, **kwargs) -> Any:
+        """
+        Versión corrutina de submit_future: el bucle de asyncio no se bloquea y no se crea
+        un hilo por solicitud (la concurrencia la limitan los trabajadores del planificador).
+
+        Raises:
+            QueueFullError: Si la cola de la clase de prioridad está llena.
+        """
+        return await asyncio.wrap_future(self.submit_future(func, *args, priority=priority, **kwargs))
+
+    # Variantes asíncronas de las operaciones principales.
+    # submit_* retorna un concurrent.futures.Future; *_async es una corrutina para asyncio.
+
+    def submit_translation(self, text: str, source_lang_code: str, target_lang_code: str,
+                           profile: Optional[str] = None, priority: int = PRIORITY_MANUAL,
+                           cancellation_token: Optional[CancellationToken] = None) -> Future:
+        """Future con el TranslationResult de perform_translation."""
+        return self.submit_future(self.perform_translation, text, source_lang_code, target_lang_code,
+                                  profile=profile, cancellation_token=cancellation_token, priority=priority)
+
+    async def translate_async(self, text: str, source_lang_code: str, target_lang_code: str,
+                              profile: Optional[str] = None, priority: int = PRIORITY_MANUAL,
+                              cancellation_token: Optional[CancellationToken] = None) -> TranslationResult:
+        """Corrutina que retorna el TranslationResult de perform_translation."""
+        return await asyncio.wrap_future(self.submit_translation(
+            text, source_lang_code, target_lang_code, profile=profile, priority=priority,
+            cancellation_token=cancellation_token
+        ))
+
+    def submit_ocr_and_translate(self, image_data: Any, source_lang_code: str, target_lang_code: str,
+                                 profile: Optional[str] = None, priority: int = PRIORITY_INTERACTIVE) -> Future:
+        """Future con el TranslationResult de perform_ocr_and_translate."""
+        return self.submit_future(self.perform_ocr_and_translate, image_data, source_lang_code, target_lang_code,
+                                  profile, priority=priority)
+
+    async def ocr_and_translate_async(self, image_data: Any, source_lang_code: str, target_lang_code: str,
+                                      profile: Optional[str] = None, priority: int = PRIORITY_INTERACTIVE) -> TranslationResult:
+        """Corrutina que retorna el TranslationResult de perform_ocr_and_translate."""
+        return await asyncio.wrap_future(self.submit_ocr_and_translate(
+            image_data, source_lang_code, target_lang_code, profile=profile, priority=priority
+        ))
+
+    def submit_install_package(self, package: Any) -> Future:
+        """Future que termina cuando install_package termina."""
+        return self.submit_future(self.install_package, package, priority=PRIORITY_BACKGROUND)
+
+    async def install_package_async(self, package: Any):
+        """Corrutina que ejecuta install_package."""
+        await asyncio.wrap_future(self.submit_install_package(package))
+
+    def submit_uninstall_package(self, package: Any) -> Future:
+        """Future que termina cuando uninstall_package termina."""
+        return self.submit_future(self.uninstall_package, package, priority=PRIORITY_BACKGROUND)
+
+    async def uninstall_package_async(self, package: Any):
+        """Corrutina que ejecuta uninstall_package."""
+        await asyncio.wrap_future(self.submit_uninstall_package(package))
+
+    def submit_available_packages(self, force_refresh: bool = False) -> Future:
+        """Future con la lista de get_available_packages."""
+        return self.submit_future(self.get_available_packages, force_refresh=force_refresh, priority=PRIORITY_BACKGROUND)
+
+    async def get_available_packages_async(self, force_refresh: bool = False) -> List[Any]:
+        """Corrutina que retorna la lista de get_available_packages."""
+        return await asyncio.wrap_future(self.submit_available_packages(force_refresh=force_refresh))
+
+    def get_scheduler_stats(self) -> Dict[str, Dict[str, float]]:
+        """
+        Retorna las estadísticas del planificador por clase de prioridad (cola, tiempos de espera...).
+        """
+        return self.task_scheduler.get_stats()
+
+    def shutdown_tasks(self):
+        """
+        Cancela las tareas pendientes y detiene el planificador. Debería llamarse al cerrar la aplicación.
+        """
+        coalescing_stats = self.get_coalescing_stats()
+        if coalescing_stats["coalesced"]:
+            print(f"Application Layer: {coalescing_stats['coalesced']} solicitudes idénticas reutilizaron una traducción en curso.")
+        stats = self.task_scheduler.get_stats()
+        for name, class_stats in stats.items():
+            if class_stats["submitted"]:
+                print(f"Application Layer: Tareas '{name}': {class_stats['completed']:.0f} completadas, "
+                      f"espera media {class_stats['wait_ms_avg']:.1f} ms, p95 {class_stats['wait_ms_p95']:.1f} ms.")
+        self.task_scheduler.shutdown(cancel_pending=True)
+
     # --- Nuevos métodos para OCR y Traducción ---
 
-    def perform_ocr_and_translate(self, image_data: Any, source_lang_code: str, target_lang_code: str) -> TranslationResult:
+    def _lookup_ocr_cache(self, image_data: Any, source_lang_code: str, target_lang_code: str,
+                          profile: Optional[str]) -> Tuple[Optional[str], Optional[str], Optional[str]]:
+        """
+        Consulta la caché de OCR. La caché es solo una optimización: ante cualquier error se hace el OCR.
+
+        Returns:
+            (clave de la imagen o None, texto extraído o None, traducción al par o None).
+        """
+        if self.ocr_result_cache is None:
+            return None, None, None
+        try:
+            # El idioma de origen y el perfil eligen el modelo de OCR: forman parte de la clave
+            image_key = self.ocr_result_cache.get_image_key(image_data, f"{source_lang_code}:{profile or ''}")
+            if image_key is None:
+                return None, None, None
+            cached = self.ocr_result_cache.lookup(image_key, source_lang_code, target_lang_code)
+            if cached is None:
+                return image_key, None, None
+            return image_key, cached[0], cached[1]
+        except Exception as e:
+            print(f"Application Layer Error: Error al consultar la caché de OCR: {e}")
+            return None, None, None
+
+    def _store_ocr_cache(self, image_key: str, extracted_text: str, source_lang_code: str, target_lang_code: str,
+                         translation_result: TranslationResult):
+        """Guarda el texto extraído y, si la traducción tuvo éxito, también la traducción."""
+        translated_text = translation_result.translated_text if translation_result.is_successful else None
+        try:
+            self.ocr_result_cache.store(image_key, extracted_text, source_lang_code, target_lang_code, translated_text)
+        except Exception as e:
+            print(f"Application Layer Error: Error al guardar en la caché de OCR: {e}")
+
+    def perform_ocr_and_translate(self, image_data: Any, source_lang_code: str, target_lang_code: str,
+                                  profile: Optional[str] = None) -> TranslationResult:
         """
         Realiza OCR en datos de imagen, extrae el texto y luego lo traduce.
+        El OCR usa el idioma de origen (source_lang_code) y el perfil de rendimiento para elegir su modelo.
+        Si hay caché de OCR, una captura visualmente idéntica a otra reciente omite el OCR y,
+        si ya se tradujo al mismo par, también la traducción.
         Retorna un TranslationResult. Asegura que siempre retorna TranslationResult.
         """
         print("Application Layer: perform_ocr_and_translate() iniciado.")
         extracted_text = "" # Inicializar extracted_text
 
         try:
+            # 0. Consultar la caché de OCR: una captura visualmente idéntica reutiliza su texto y su traducción
+            image_key, cached_text, cached_translation = self._lookup_ocr_cache(image_data, source_lang_code, target_lang_code, profile)
+            if cached_translation is not None:
+                print("Application Layer: Texto y traducción obtenidos de la caché de OCR.")
+                self._record_pair_usage(source_lang_code, target_lang_code)
+                return TranslationResult(translated_text=cached_translation)
+            if cached_text:
+                print("Application Layer: Texto obtenido de la caché de OCR.")
+                extracted_text = cached_text
+
             # 1. Realizar OCR utilizando el servicio de OCR inyectado
-            print("Application Layer: Calling ocr_service.extract_text_from_image_data()...")
-            # Capturamos errores específicos de OCR aquí si es posible, o un error general
-            try:
-                extracted_text = self.ocr_service.extract_text_from_image_data(image_data)
-                print("Application Layer: ocr_service.extract_text_from_image_data() returned.")
-            except Exception as ocr_e:
-                error_msg = f"Error durante la extracción de texto por OCR: {ocr_e}"
-                print(f"Application Layer Error: {error_msg}")
-                # Si falla el OCR, retornamos un TranslationResult con el error de OCR
-                return TranslationResult(error=error_msg)
+            if not extracted_text:
+                print("Application Layer: Calling ocr_service.extract_text_from_image_data()...")
+                # Capturamos errores específicos de OCR aquí si es posible, o un error general
+                try:
+                    extracted_text = self.ocr_service.extract_text_from_image_data(image_data, language=source_lang_code,
+                                                                                   profile=profile)
+                    print("Application Layer: ocr_service.extract_text_from_image_data() returned.")
+                except Exception as ocr_e:
+                    error_msg = f"Error durante la extracción de texto por OCR: {ocr_e}"
+                    print(f"Application Layer Error: {error_msg}")
+                    # Si falla el OCR, retornamos un TranslationResult con el error de OCR
+                    return TranslationResult(error=error_msg)
 
 
             if not extracted_text:
@@ -314,11 +1022,16 @@ class TranslatorService(QObject): # <-- Aseguramos que hereda de QObject para cu
             translation_result = self.perform_translation(
                 extracted_text,
                 source_lang_code,
-                target_lang_code
+                target_lang_code,
+                profile=profile
             )
             print("Application Layer: perform_translation() after OCR returned.")
 
-            # 3. Retornar el resultado (que ya es un TranslationResult)
+            # 3. Guardar el texto (y la traducción, si tuvo éxito) en la caché de OCR
+            if image_key is not None:
+                self._store_ocr_cache(image_key, extracted_text, source_lang_code, target_lang_code, translation_result)
+
+            # 4. Retornar el resultado (que ya es un TranslationResult)
             print("Application Layer: Operación de OCR y Traducción finalizada.")
             return translation_result
 
@@ -0,0 +1,290 @@
+# src/bootstrap.py
+#
+# Composición del núcleo de la aplicación (traductor, OCR, cachés, planificador y servicio)
+# a partir de config/config.ini. No importa Qt: la usan tanto main.py (interfaz gráfica)
+# como los puntos de entrada sin interfaz (servidor HTTP, línea de comandos).
+
+import os
+from typing import Callable, List, Optional, Tuple
+
+from src.application.translator_service import TranslatorService
+from src.application.task_scheduler import TaskScheduler, PRIORITY_INTERACTIVE, PRIORITY_MANUAL, PRIORITY_BACKGROUND
+from src.domain.interfaces import IHotkeyManager, IOCRService
+from src.infrastructure.argos_translator import ArgosTranslator
+from src.infrastructure.pytesseract_ocr import PytesseractOCRService
+from src.infrastructure.tesserocr_ocr import TesserocrOCRService, TESSEROCR_AVAILABLE
+from src.infrastructure.image_preprocessing import ImagePreprocessor, PreprocessingOCRService
+from src.infrastructure.ocr_result_cache import PerceptualHashOCRCache
+from src.infrastructure.region_ocr import RegionOCRService, TextRegionDetector
+from src.infrastructure.tessdata_index import TessdataIndex, find_default_tessdata_dir, VARIANT_FAST, VARIANT_BEST, VARIANT_DEFAULT
+from src.infrastructure.sqlite_translation_memory import SQLiteTranslationMemory
+from src.infrastructure.app_config import AppConfig, get_user_data_dir
+from src.infrastructure.sentence_cache import SentenceLRUCache
+from src.infrastructure.package_index import PackageIndexRefresher
+from src.infrastructure.model_pool import ModelPool
+from src.infrastructure.usage_history import JsonUsageHistory
+from src.infrastructure.process_pool_translator import ProcessPoolTranslator, get_default_worker_count
+from src.infrastructure.argos_package_manager import ArgosPackageManager
+
+
+class ApplicationCore:
+    """
+    Componentes del núcleo creados por build_application_core.
+    Además del servicio guarda los componentes que deben detenerse al cerrar la aplicación.
+    """
+
+    def __init__(self, translator_service: TranslatorService, model_pool: ModelPool,
+                 usage_history: Optional[JsonUsageHistory] = None,
+                 process_pool_translator: Optional[ProcessPoolTranslator] = None,
+                 ocr_service: Optional[IOCRService] = None,
+                 ocr_result_cache: Optional[PerceptualHashOCRCache] = None):
+        self.translator_service = translator_service
+        self.model_pool = model_pool
+        self.usage_history = usage_history
+        self.process_pool_translator = process_pool_translator
+        self.ocr_service = ocr_service
+        self.ocr_result_cache = ocr_result_cache
+
+    def get_shutdown_callbacks(self) -> List[Callable[[], None]]:
+        """
+        Retorna, en orden, las funciones que liberan los recursos del núcleo al cerrar la aplicación
+        (la interfaz gráfica las conecta a aboutToQuit; los puntos de entrada sin interfaz las llaman con shutdown()).
+        """
+        callbacks: List[Callable[[], None]] = [self.translator_service.stop_hotkey_listening]
+        if self.usage_history is not None:
+            callbacks.append(self.usage_history.flush)
+        if self.ocr_result_cache is not None:
+            callbacks.append(self.ocr_result_cache.flush)
+        callbacks.append(self.model_pool.stop)
+        callbacks.append(self.translator_service.shutdown_tasks)
+        if self.process_pool_translator is not None:
+            callbacks.append(self.process_pool_translator.shutdown)
+        if isinstance(self.ocr_service, (TesserocrOCRService, PreprocessingOCRService, RegionOCRService)):
+            callbacks.append(self.ocr_service.close)
+        return callbacks
+
+    def shutdown(self):
+        """Ejecuta todas las funciones de cierre; un error en una no impide las siguientes."""
+        for callback in self.get_shutdown_callbacks():
+            try:
+                callback()
+            except Exception as e:
+                print(f"Bootstrap Error: Error al cerrar {getattr(callback, '__qualname__', callback)}: {e}")
+
+
+def build_application_core(app_config: AppConfig, hotkey_manager: IHotkeyManager,
+                           use_translation_memory: bool = True) -> ApplicationCore:
+    """
+    Crea las implementaciones de infraestructura según la configuración y las inyecta en TranslatorService.
+
+    Args:
+        app_config: Configuración de la aplicación (config/config.ini).
+        hotkey_manager: Implementación de IHotkeyManager (la del sistema en la interfaz gráfica,
+                        NullHotkeyManager en los procesos sin interfaz).
+        use_translation_memory: Si es False no se abre la memoria de traducción aunque esté habilitada
+                                en config.ini (por ejemplo, al filtrar registros enormes por la línea de comandos).
+
+    Returns:
+        Un ApplicationCore con el servicio y los componentes que deben cerrarse al salir.
+    """
+    # 1. Traductor (ArgosTranslator) con su caché de oraciones, índice de paquetes y pool de modelos
+    sentence_cache = None
+    if app_config.get_bool("Cache", "cache_oraciones_habilitada", True):
+        sentence_cache = SentenceLRUCache(
+            max_bytes=app_config.get_int("Cache", "cache_oraciones_max_mb", 64) * 1024 * 1024,
+            eviction_policy=app_config.get_str("Cache", "cache_oraciones_politica", "lru").lower()
+        )
+    # El índice remoto de paquetes se actualiza en segundo plano (con TTL) o nunca en modo sin conexión
+    package_index = PackageIndexRefresher(
+        ttl_seconds=app_config.get_float("Paquetes", "ttl_indice_horas", 24) * 60 * 60,
+        offline=app_config.get_bool("Paquetes", "modo_sin_conexion", False)
+    )
+    # Presupuesto de memoria para los modelos cargados y descarga de modelos inactivos
+    model_pool = ModelPool(
+        max_memory_bytes=app_config.get_int("Modelos", "memoria_maxima_mb", 0) * 1024 * 1024,
+        idle_timeout_seconds=app_config.get_float("Modelos", "minutos_inactividad", 30) * 60
+    )
+    infrastructure_translator = ArgosTranslator(
+        sentence_cache=sentence_cache,
+        max_batch_size=app_config.get_int("Rendimiento", "tamano_micro_lote", 32),
+        cancellable_batch_size=app_config.get_int("Rendimiento", "tamano_micro_lote_cancelable", 1),
+        package_index=package_index,
+        model_pool=model_pool,
+        default_profile=app_config.get_str("Rendimiento", "perfil_defecto", "balanced")
+    )
+    print("Bootstrap: Instancia de ArgosTranslator creada.")
+    # Consulta, instalación y desinstalación de paquetes (comparte el índice remoto con el traductor)
+    package_manager = ArgosPackageManager(package_index)
+
+    # 1b. Traducción multiproceso opcional para documentos largos (cada proceso con su copia del modelo)
+    process_pool_translator = None
+    worker_count = app_config.get_int("Rendimiento", "procesos_traduccion", 0)
+    if worker_count < 0:
+        worker_count = get_default_worker_count(max_memory_bytes=model_pool.max_memory_bytes)
+    if worker_count >= 2:
+        process_pool_translator = ProcessPoolTranslator(
+            local_translator=infrastructure_translator,
+            worker_count=worker_count,
+            max_batch_size=app_config.get_int("Rendimiento", "tamano_micro_lote", 32),
+            default_profile=app_config.get_str("Rendimiento", "perfil_defecto", "balanced"),
+            min_parallel_chars=app_config.get_int("Rendimiento", "min_caracteres_procesos", 20000)
+        )
+        infrastructure_translator = process_pool_translator
+        print("Bootstrap: Instancia de ProcessPoolTranslator creada.")
+
+    # 2. Servicio OCR, con el preprocesado de imágenes delante (opcional, según config.ini)
+    infrastructure_ocr_service = create_ocr_service(app_config)
+    # Descripción de la configuración del OCR: forma parte de la clave de la caché de OCR
+    # (el idioma y el perfil de cada captura se añaden en cada consulta)
+    ocr_settings = [type(infrastructure_ocr_service).__name__, app_config.get_str("OCR", "idioma", "eng")]
+    if app_config.get_bool("OCR", "preprocesado_habilitado", True):
+        preprocessor = ImagePreprocessor(
+            auto_invert=app_config.get_bool("OCR", "preprocesado_invertir_auto", True),
+            target_x_height=app_config.get_int("OCR", "preprocesado_altura_x", 20),
+            deskew=app_config.get_bool("OCR", "preprocesado_enderezar", False),
+            binarize=app_config.get_bool("OCR", "preprocesado_binarizar", True)
+        )
+        infrastructure_ocr_service = PreprocessingOCRService(infrastructure_ocr_service, preprocessor)
+        ocr_settings += ["prep", str(preprocessor.auto_invert), str(preprocessor.target_x_height),
+                         str(preprocessor.deskew), str(preprocessor.binarize)]
+        print("Bootstrap: Preprocesado de imágenes para el OCR habilitado.")
+    # Las imágenes grandes se dividen en bloques de texto que se reconocen en paralelo (cada uno preprocesado)
+    if app_config.get_bool("OCR", "regiones_habilitadas", True):
+        region_detector = TextRegionDetector(
+            row_gap=app_config.get_int("OCR", "regiones_separacion_filas", 24),
+            column_gap=app_config.get_int("OCR", "regiones_separacion_columnas", 48)
+        )
+        infrastructure_ocr_service = RegionOCRService(
+            infrastructure_ocr_service,
+            detector=region_detector,
+            min_pixels=int(app_config.get_float("OCR", "regiones_min_megapixeles", 1.0) * 1_000_000),
+            worker_count=app_config.get_int("OCR", "regiones_trabajadores", 0)
+        )
+        ocr_settings += ["regions", str(region_detector.row_gap), str(region_detector.column_gap),
+                         str(infrastructure_ocr_service.min_pixels)]
+        print("Bootstrap: OCR por bloques para imágenes grandes habilitado.")
+
+    # 2b. Caché de resultados de OCR por huella perceptual (opcional, según config.ini)
+    ocr_result_cache = None
+    if app_config.get_bool("OCR", "cache_habilitada", True):
+        ocr_cache_path = None
+        if app_config.get_bool("OCR", "cache_persistente", False):
+            ocr_cache_path = app_config.get_str("OCR", "ruta_cache", os.path.join(get_user_data_dir(), "ocr_cache.json"))
+        ocr_result_cache = PerceptualHashOCRCache(
+            settings_key=":".join(ocr_settings),
+            max_entries=app_config.get_int("OCR", "cache_max_entradas", 256),
+            max_distance=app_config.get_int("OCR", "cache_distancia_max_bits", 0),
+            file_path=ocr_cache_path
+        )
+
+    # 3. Memoria de traducción persistente (opcional, según config.ini)
+    translation_memory = None
+    if use_translation_memory and app_config.get_bool("Cache", "memoria_traduccion_habilitada", True):
+        memory_path = app_config.get_str(
+            "Cache", "ruta_memoria_traduccion",
+            os.path.join(get_user_data_dir(), "translation_memory.sqlite3")
+        )
+        try:
+            translation_memory = SQLiteTranslationMemory(memory_path)
+            print("Bootstrap: Instancia de SQLiteTranslationMemory creada.")
+        except Exception as e:
+            print(f"Bootstrap: Advertencia: No se pudo abrir la memoria de traducción ({e}). Se continuará sin ella.")
+
+    # 4. Historial de uso de pares (para precargar los modelos más usados)
+    usage_history = None
+    if app_config.get_bool("Precarga", "usar_historial", True):
+        usage_history = JsonUsageHistory(os.path.join(get_user_data_dir(), "usage_history.json"))
+        print("Bootstrap: Instancia de JsonUsageHistory creada.")
+
+    # 5. Planificador de tareas en segundo plano (hotkeys, traducciones de la UI, archivos)
+    task_scheduler = TaskScheduler(
+        max_workers=app_config.get_int("Planificador", "trabajadores", 3),
+        reserved_interactive_workers=app_config.get_int("Planificador", "trabajadores_reservados_interactivos", 1),
+        max_queue_depth={
+            PRIORITY_INTERACTIVE: app_config.get_int("Planificador", "max_cola_interactiva", 4),
+            PRIORITY_MANUAL: app_config.get_int("Planificador", "max_cola_manual", 8),
+            PRIORITY_BACKGROUND: app_config.get_int("Planificador", "max_cola_segundo_plano", 16),
+        }
+    )
+    print("Bootstrap: Instancia de TaskScheduler creada.")
+
+    # 6. Servicio de Aplicación con todas las dependencias inyectadas
+    translator_service = TranslatorService(
+        translator=infrastructure_translator,
+        hotkey_manager=hotkey_manager,
+        ocr_service=infrastructure_ocr_service,
+        translation_memory=translation_memory,
+        usage_history=usage_history,
+        hotkey_profile=app_config.get_str("Rendimiento", "perfil_hotkey", "fast") or None,
+        document_profile=app_config.get_str("Rendimiento", "perfil_archivos", "quality") or None,
+        task_scheduler=task_scheduler,
+        package_manager=package_manager,
+        ocr_result_cache=ocr_result_cache
+    )
+    print("Bootstrap: Instancia de TranslatorService creada con dependencias inyectadas.")
+
+    return ApplicationCore(translator_service, model_pool, usage_history, process_pool_translator,
+                           ocr_service=infrastructure_ocr_service, ocr_result_cache=ocr_result_cache)
+
+
+def create_ocr_service(app_config: AppConfig) -> IOCRService:
+    """
+    Crea el servicio OCR según [OCR] motor: "tesserocr" (motores de Tesseract cargados en el proceso),
+    "pytesseract" (un proceso tesseract por llamada) o "auto" (tesserocr si está instalada).
+    Si tesserocr no está disponible o no puede iniciarse, se usa pytesseract.
+    Con [OCR] idioma_segun_origen, ambos motores usan un TessdataIndex para reconocer cada captura
+    con el traineddata del idioma de origen y la variante (fast/best) de su perfil.
+    """
+    engine = app_config.get_str("OCR", "motor", "auto").lower()
+    language = app_config.get_str("OCR", "idioma", "eng")
+    tesseract_cmd_path = app_config.get_str("OCR", "ruta_tesseract") or None
+    tessdata_path = app_config.get_str("OCR", "ruta_tessdata") or None
+    # Índice de traineddata (una sola vez al arrancar): el idioma de origen de cada captura elige su modelo
+    tessdata_index = None
+    if app_config.get_bool("OCR", "idioma_segun_origen", True):
+        tessdata_index = TessdataIndex(
+            directories={
+                VARIANT_DEFAULT: tessdata_path or find_default_tessdata_dir(tesseract_cmd_path),
+                VARIANT_FAST: app_config.get_str("OCR", "ruta_tessdata_fast"),
+                VARIANT_BEST: app_config.get_str("OCR", "ruta_tessdata_best"),
+            },
+            default_language=language,
+            default_profile=app_config.get_str("Rendimiento", "perfil_defecto", "balanced")
+        )
+    if engine in ("auto", "tesserocr"):
+        if TESSEROCR_AVAILABLE:
+            try:
+                ocr_service = TesserocrOCRService(
+                    language=language,
+                    tessdata_path=tessdata_path,
+                    max_engines_per_language=app_config.get_int("OCR", "motores_por_idioma", 2),
+                    tessdata_index=tessdata_index
+                )
+                print("Bootstrap: Instancia de TesserocrOCRService creada.")
+                return ocr_service
+            except Exception as e:
+                print(f"Bootstrap: Advertencia: No se pudo iniciar tesserocr ({e}). Se usará pytesseract.")
+        elif engine == "tesserocr":
+            print("Bootstrap: Advertencia: [OCR] motor = tesserocr, pero la biblioteca no está instalada. Se usará pytesseract.")
+    ocr_service = PytesseractOCRService(
+        tesseract_cmd_path=tesseract_cmd_path,
+        language=language,
+        tessdata_index=tessdata_index
+    )
+    print("Bootstrap: Instancia de PytesseractOCRService creada.")
+    return ocr_service
+
+
+def get_configured_prewarm_pairs(app_config: AppConfig) -> List[Tuple[str, str]]:
+    """
+    Lee los pares a precargar de [Precarga] pares (formato origen-destino, separados por comas).
+    Los pares con formato inválido se ignoran con una advertencia.
+    """
+    configured_pairs = []
+    for pair_text in app_config.get_list("Precarga", "pares"):
+        source_code, separator, target_code = pair_text.partition("-")
+        if separator and source_code and target_code:
+            configured_pairs.append((source_code.strip(), target_code.strip()))
+        else:
+            print(f"Bootstrap: Advertencia: Par de precarga inválido en config.ini: '{pair_text}' (formato esperado: en-es).")
+    return configured_pairs
@@ -0,0 +1,352 @@
+# src/cli.py
+#
+# Línea de comandos sin interfaz gráfica (no importa Qt ni registra hotkeys).
+#
+# Uso (desde la raíz del repositorio):
+#   cat registro.log | python -m src.cli translate -s en -t es > registro.es.log
+#   python -m src.cli batch documentos/ -s en -t es [--output-dir traducidos/] [--workers 2]
+#
+# "batch" traduce los .txt/.docx de una carpeta y puede reanudarse (ver src/application/batch_job.py).
+# "translate" funciona como filtro: lee la entrada estándar línea a línea, agrupa las líneas en lotes
+# y escribe las traducciones en la salida estándar en el mismo orden, mientras la entrada sigue llegando.
+# La memoria usada está acotada sea cual sea el tamaño de la entrada. Los mensajes de registro de las
+# capas se envían a la salida de errores para no mezclarse con el resultado.
+# La memoria de traducción persistente solo se usa con --memory: una entrada de varios GB que no se
+# repite la llenaría de filas que nunca se vuelven a consultar.
+
+import argparse
+import io
+import os
+import queue
+import re
+import sys
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+from typing import Deque, List, Optional, TextIO, Tuple
+
+from src.application.translator_service import TranslatorService
+from src.application.task_scheduler import QueueFullError, PRIORITY_MANUAL
+
+# Valores por defecto del filtro de traducción
+DEFAULT_BATCH_LINES = 64
+DEFAULT_BATCH_CHARS = 16000
+DEFAULT_FLUSH_MS = 200
+DEFAULT_MAX_LINE_CHARS = 4000
+# Lotes enviados al planificador que pueden estar pendientes a la vez (el siguiente lote se
+# prepara mientras el anterior se traduce)
+DEFAULT_MAX_IN_FLIGHT = 2
+# Líneas leídas que pueden esperar a formar parte de un lote
+_READ_QUEUE_LINES = 1024
+# Marca de fin de la entrada en la cola de lectura
+_END_OF_INPUT = None
+# Final de oración seguido de espacio (con comillas o paréntesis de cierre opcionales)
+_SENTENCE_BREAK = re.compile(r"[.!?…。！？][\"'»”’)\]]*\s+")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def _find_split_point(text: str) -> int:
+    """
+    Posición donde cortar un fragmento demasiado largo: tras el último final de oración de la
+    segunda mitad, o si no hay, tras el último espacio. Sin espacios se corta al final.
+    """
+    sentence_ends = [match.end() for match in _SENTENCE_BREAK.finditer(text)]
+    if sentence_ends and sentence_ends[-1] >= len(text) // 2:
+        return sentence_ends[-1]
+    spaces = [match.end() for match in _WHITESPACE.finditer(text)]
+    if spaces and spaces[-1] < len(text):
+        return spaces[-1]
+    return len(text)
+
+
+class _Piece:
+    """
+    Un fragmento de la entrada: una línea (o parte de una línea demasiado larga) separada en la
+    sangría inicial, el contenido a traducir y el final de línea, que se conservan tal cual.
+    """
+
+    __slots__ = ("prefix", "content", "suffix")
+
+    def __init__(self, raw: str):
+        body = raw.rstrip("\r\n")
+        content = body.strip()
+        start = len(body) - len(body.lstrip())
+        self.prefix = body[:start]
+        self.content = content
+        self.suffix = body[start + len(content):] + raw[len(body):]
+
+    def render(self, translated: Optional[str]) -> str:
+        return self.prefix + (self.content if translated is None else translated) + self.suffix
+
+
+class StreamTranslator:
+    """
+    Traduce un flujo de texto línea a línea con memoria acotada.
+    Un hilo lee la entrada en una cola limitada; el hilo principal agrupa las líneas en lotes
+    (por número de líneas, caracteres o pausa de la entrada), los envía al planificador del
+    servicio y escribe los resultados en orden. Como máximo hay max_in_flight lotes pendientes.
+    """
+
+    def __init__(self, translator_service: TranslatorService, source_lang_code: str, target_lang_code: str,
+                 profile: Optional[str] = None, batch_lines: int = DEFAULT_BATCH_LINES,
+                 batch_chars: int = DEFAULT_BATCH_CHARS, flush_ms: float = DEFAULT_FLUSH_MS,
+                 max_line_chars: int = DEFAULT_MAX_LINE_CHARS, max_in_flight: int = DEFAULT_MAX_IN_FLIGHT):
+        self.translator_service = translator_service
+        self.source_lang_code = source_lang_code
+        self.target_lang_code = target_lang_code
+        self.profile = profile
+        self.batch_lines = max(1, batch_lines)
+        self.batch_chars = max(1, batch_chars)
+        self.flush_seconds = max(0.0, flush_ms / 1000)
+        self.max_line_chars = max(1, max_line_chars)
+        self.max_in_flight = max(1, max_in_flight)
+        self.stats = {"lines": 0, "translated": 0, "errors": 0, "batches": 0, "chars": 0}
+
+    def run(self, input_stream: TextIO, output_stream: TextIO):
+        """
+        Traduce input_stream en output_stream hasta el fin de la entrada.
+
+        Raises:
+            BrokenPipeError: Si la salida se cierra (por ejemplo, al encadenar con head).
+        """
+        lines: "queue.Queue[Optional[str]]" = queue.Queue(maxsize=_READ_QUEUE_LINES)
+        reader = threading.Thread(target=self._read_lines, args=(input_stream, lines), daemon=True)
+        reader.start()
+
+        in_flight: Deque[Tuple[List[_Piece], Optional[Future]]] = deque()
+        batch: List[_Piece] = []
+        batch_chars = 0
+        batch_started = 0.0
+        finished = False
+        while not finished or batch or in_flight:
+            if not finished:
+                # Sin trabajo pendiente se espera la entrada indefinidamente; si no, solo hasta el
+                # siguiente envío por pausa o hasta volver a revisar los lotes en curso
+                timeout = None
+                if batch:
+                    timeout = max(0.0, batch_started + self.flush_seconds - time.monotonic())
+                elif in_flight:
+                    timeout = self.flush_seconds or 0.05
+                try:
+                    raw = lines.get(timeout=timeout)
+                    if raw is _END_OF_INPUT:
+                        finished = True
+                    else:
+                        piece = _Piece(raw)
+                        if not batch:
+                            batch_started = time.monotonic()
+                        batch.append(piece)
+                        batch_chars += len(piece.content)
+                        self.stats["lines"] += 1
+                except queue.Empty:
+                    pass
+
+            flush_due = batch and (
+                finished or len(batch) >= self.batch_lines or batch_chars >= self.batch_chars
+                or time.monotonic() - batch_started >= self.flush_seconds
+            )
+            if flush_due:
+                # Con el máximo de lotes pendientes, se espera al más antiguo antes de enviar otro
+                while len(in_flight) >= self.max_in_flight:
+                    self._write_batch(*in_flight.popleft(), output_stream)
+                in_flight.append((batch, self._submit(batch)))
+                batch, batch_chars = [], 0
+
+            # Escribir los lotes ya terminados, siempre en el orden de la entrada
+            while in_flight and (in_flight[0][1] is None or in_flight[0][1].done() or (finished and not batch)):
+                self._write_batch(*in_flight.popleft(), output_stream)
+
+    def _read_lines(self, input_stream: TextIO, lines: "queue.Queue[Optional[str]]"):
+        """
+        Hilo lector: las líneas más largas que max_line_chars se entregan en varios fragmentos,
+        cortados en un final de oración o un espacio (ver _find_split_point) para no partir palabras.
+        Nunca se guardan más de max_line_chars caracteres de una línea a la vez.
+        """
+        try:
+            pending = ""
+            while True:
+                raw = input_stream.readline(self.max_line_chars - len(pending))
+                if not raw:
+                    if pending:
+                        lines.put(pending)
+                    break
+                pending += raw
+                if pending.endswith(("\n", "\r")):
+                    lines.put(pending)
+                    pending = ""
+                elif len(pending) >= self.max_line_chars:
+                    split_at = _find_split_point(pending)
+                    lines.put(pending[:split_at])
+                    pending = pending[split_at:]
+        except Exception as e:
+            print(f"CLI Error: Error al leer la entrada: {e}")
+        finally:
+            lines.put(_END_OF_INPUT)
+
+    def _submit(self, batch: List[_Piece]) -> Optional[Future]:
+        """Envía al planificador los fragmentos con texto. Retorna None si no hay nada que traducir."""
+        texts = [piece.content for piece in batch if piece.content]
+        if not texts:
+            return None
+        self.stats["batches"] += 1
+        self.stats["chars"] += sum(len(text) for text in texts)
+        while True:
+            try:
+                return self.translator_service.submit_future(
+                    self.translator_service.perform_translation_batch,
+                    texts, self.source_lang_code, self.target_lang_code, profile=self.profile,
+                    priority=PRIORITY_MANUAL
+                )
+            except QueueFullError:
+                # Otra tarea ocupa la cola; se reintenta en lugar de perder líneas
+                time.sleep(0.05)
+
+    def _write_batch(self, batch: List[_Piece], future: Optional[Future], output_stream: TextIO):
+        """Espera el resultado de un lote y escribe sus líneas. Las que fallan se escriben sin traducir."""
+        results = iter(future.result() if future is not None else [])
+        output = []
+        for piece in batch:
+            translated = None
+            if piece.content:
+                result = next(results)
+                if result.is_successful:
+                    translated = result.translated_text
+                    self.stats["translated"] += 1
+                else:
+                    self.stats["errors"] += 1
+                    print(f"CLI Error: Fragmento sin traducir ({piece.content[:50]}...): {result.error}")
+            output.append(piece.render(translated))
+        output_stream.write("".join(output))
+        output_stream.flush()
+
+
+def _run_translate(args, output_stream: TextIO) -> int:
+    from src.bootstrap import build_application_core
+    from src.infrastructure.app_config import AppConfig
+    from src.infrastructure.null_hotkey_manager import NullHotkeyManager
+
+    app_config = AppConfig(args.config)
+    application_core = build_application_core(app_config, NullHotkeyManager(), use_translation_memory=args.memory)
+    translator_service = application_core.translator_service
+    try:
+        reachable = {language.code for language in translator_service.get_reachable_target_languages(args.source)}
+        if args.target not in reachable:
+            print(f"CLI Error: Par de idiomas no soportado: {args.source} -> {args.target}", file=sys.stderr)
+            return 2
+
+        input_stream = io.TextIOWrapper(sys.stdin.buffer, encoding=args.encoding, errors="replace", newline="")
+        stream_translator = StreamTranslator(
+            translator_service, args.source, args.target, profile=args.profile,
+            batch_lines=args.batch_lines, batch_chars=args.batch_chars, flush_ms=args.flush_ms,
+            max_line_chars=args.max_line_chars
+        )
+        start = time.perf_counter()
+        try:
+            stream_translator.run(input_stream, output_stream)
+        except BrokenPipeError:
+            print("CLI: La salida se cerró antes de terminar la entrada.")
+        except KeyboardInterrupt:
+            print("CLI: Interrumpido por el usuario.")
+            return 130
+        elapsed = time.perf_counter() - start
+        stats = stream_translator.stats
+        print(f"CLI: {stats['lines']} líneas ({stats['translated']} traducidas, {stats['errors']} con error) "
+              f"en {stats['batches']} lotes, {elapsed:.1f} s, {stats['chars'] / elapsed if elapsed else 0:.0f} car/s.")
+        return 1 if stats["errors"] else 0
+    finally:
+        application_core.shutdown()
+
+
+def _run_batch(args) -> int:
+    from src.application.batch_job import BatchTranslationJob
+    from src.application.progress import ThrottledProgressCallback
+    from src.bootstrap import build_application_core
+    from src.domain.models import CancellationToken
+    from src.infrastructure.app_config import AppConfig
+    from src.infrastructure.null_hotkey_manager import NullHotkeyManager
+
+    if not os.path.isdir(args.input_dir):
+        print(f"CLI Error: No existe la carpeta: {args.input_dir}", file=sys.stderr)
+        return 2
+
+    app_config = AppConfig(args.config)
+    application_core = build_application_core(app_config, NullHotkeyManager())
+    translator_service = application_core.translator_service
+    cancellation_token = CancellationToken()
+    try:
+        job = BatchTranslationJob(
+            translator_service, args.input_dir, args.source, args.target,
+            output_dir=args.output_dir, journal_path=args.journal,
+            worker_count=args.workers, profile=args.profile
+        )
+
+        def print_progress(progress):
+            print(f"CLI: {progress.done}/{progress.total} archivos ({progress.fraction * 100:.0f}%), "
+                  f"{progress.chars_per_second:.0f} car/s", file=sys.stderr)
+
+        try:
+            report = job.run(cancellation_token, ThrottledProgressCallback(print_progress, min_interval_seconds=1.0))
+        except KeyboardInterrupt:
+            # Se detienen los archivos en curso; ninguno queda anotado como terminado
+            cancellation_token.cancel()
+            print("CLI: Interrumpido por el usuario. La próxima ejecución continuará donde se detuvo.", file=sys.stderr)
+            return 130
+        print(f"CLI: {report.summary()}", file=sys.stderr)
+        for relative_path, error in report.errors:
+            print(f"CLI Error: {relative_path}: {error}", file=sys.stderr)
+        return 1 if report.failed else 0
+    finally:
+        application_core.shutdown()
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m src.cli", description="PolarTranslate sin interfaz gráfica.")
+    parser.add_argument("--config", default=None, help="Ruta de config.ini (por defecto: config/config.ini)")
+    parser.add_argument("--quiet", action="store_true", help="No mostrar los mensajes de registro en la salida de errores")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    translate_parser = subparsers.add_parser("translate", help="Traduce la entrada estándar línea a línea hacia la salida estándar")
+    translate_parser.add_argument("-s", "--source", required=True, help="Código del idioma de origen (por ejemplo: en)")
+    translate_parser.add_argument("-t", "--target", required=True, help="Código del idioma de destino (por ejemplo: es)")
+    translate_parser.add_argument("--profile", default=None, help="Perfil de rendimiento (fast, balanced, quality)")
+    translate_parser.add_argument("--batch-lines", type=int, default=DEFAULT_BATCH_LINES, help="Máximo de líneas por lote")
+    translate_parser.add_argument("--batch-chars", type=int, default=DEFAULT_BATCH_CHARS, help="Máximo de caracteres por lote")
+    translate_parser.add_argument("--flush-ms", type=float, default=DEFAULT_FLUSH_MS,
+                                  help="Milisegundos sin nueva entrada tras los que se envía un lote incompleto")
+    translate_parser.add_argument("--max-line-chars", type=int, default=DEFAULT_MAX_LINE_CHARS,
+                                  help="Las líneas más largas se traducen en varios fragmentos, cortados entre oraciones o palabras")
+    translate_parser.add_argument("--encoding", default="utf-8", help="Codificación de la entrada y la salida")
+    translate_parser.add_argument("--memory", action="store_true",
+                                  help="Consultar y guardar en la memoria de traducción persistente "
+                                       "(útil si la entrada se repite; por defecto no se usa)")
+
+    batch_parser = subparsers.add_parser("batch", help="Traduce los documentos .txt/.docx de una carpeta (reanudable)")
+    batch_parser.add_argument("input_dir", help="Carpeta con los documentos a traducir (se recorren las subcarpetas)")
+    batch_parser.add_argument("-s", "--source", required=True, help="Código del idioma de origen (por ejemplo: en)")
+    batch_parser.add_argument("-t", "--target", required=True, help="Código del idioma de destino (por ejemplo: es)")
+    batch_parser.add_argument("--output-dir", default=None,
+                              help="Carpeta donde replicar la estructura con las traducciones "
+                                   "(por defecto, junto a cada original como nombre.<destino>.ext)")
+    batch_parser.add_argument("--journal", default=None, help="Ruta del diario (por defecto, dentro de la carpeta de salida)")
+    batch_parser.add_argument("--workers", type=int, default=2, help="Archivos que se traducen a la vez")
+    batch_parser.add_argument("--profile", default=None, help="Perfil de rendimiento (por defecto: perfil_archivos de config.ini)")
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+
+    # La salida estándar se reserva para el resultado: los print() de las capas van a stderr (o a ninguna parte)
+    output_stream = io.TextIOWrapper(sys.stdout.buffer, encoding=getattr(args, "encoding", "utf-8"), newline="")
+    sys.stdout = open(os.devnull, "w") if args.quiet else sys.stderr
+
+    if args.command == "translate":
+        return _run_translate(args, output_stream)
+    if args.command == "batch":
+        return _run_batch(args)
+    return 2
+
+
+if __name__ == "__main__":
+    sys.exit(main())
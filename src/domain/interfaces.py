@@ -1,9 +1,9 @@
 # src/domain/interfaces.py
 import abc
-from typing import List, Optional, Callable, Any # Importamos Any para tipo de imagen flexible
+from typing import List, Optional, Callable, Any, Dict, Iterator, Tuple # Importamos Any para tipo de imagen flexible
 
 # Importamos los modelos que definiremos en models.py
-from .models import TranslationRequest, TranslationResult, Language
+from .models import TranslationRequest, TranslationResult, Language, CancellationToken, TranslationProgress
 
 class ITranslator(abc.ABC):
     """Interfaz para el servicio de traducción."""
@@ -19,15 +19,249 @@ class ITranslator(abc.ABC):
         pass
 
     @abc.abstractmethod
-    def translate(self, request: TranslationRequest) -> TranslationResult:
+    def translate(self, request: TranslationRequest,
+                  cancellation_token: Optional[CancellationToken] = None,
+                  progress_callback: Optional[Callable[[TranslationProgress], None]] = None) -> TranslationResult:
         """
         Realiza una solicitud de traducción.
 
         Args:
             request: Un objeto TranslationRequest con el texto, idioma de origen y destino.
+            cancellation_token: Token opcional que se consulta entre oraciones.
+            progress_callback: Función opcional que recibe el progreso a medida que se traducen oraciones.
 
         Returns:
             Un objeto TranslationResult con el texto traducido y posibles errores.
+
+        Raises:
+            TranslationCancelledError: Si se canceló cancellation_token durante la traducción.
+        """
+        pass
+
+    @abc.abstractmethod
+    def translate_batch(self, requests: List[TranslationRequest],
+                        cancellation_token: Optional[CancellationToken] = None,
+                        progress_callback: Optional[Callable[[TranslationProgress], None]] = None) -> List[TranslationResult]:
+        """
+        Realiza varias solicitudes de traducción a la vez, permitiendo a la implementación
+        agrupar el trabajo (por ejemplo, decodificar oraciones en lotes).
+
+        Args:
+            requests: Una lista de objetos TranslationRequest.
+            cancellation_token: Token opcional que se consulta entre oraciones.
+            progress_callback: Función opcional que recibe el progreso del lote completo.
+
+        Returns:
+            Una lista de TranslationResult en el mismo orden que requests.
+            Un error en una solicitud no debe impedir devolver el resto.
+
+        Raises:
+            TranslationCancelledError: Si se canceló cancellation_token durante la traducción.
+        """
+        pass
+
+    def get_translation_pairs(self) -> List[Tuple[str, str]]:
+        """
+        Obtiene los pares de idiomas (origen, destino) con traducción directa.
+        Por defecto se asume que cualquier idioma disponible traduce a cualquier otro.
+
+        Returns:
+            Una lista de tuplas (código de origen, código de destino).
+        """
+        codes = [language.code for language in self.get_available_languages()]
+        return [(source, target) for source in codes for target in codes if source != target]
+
+    def get_model_version(self, source_code: str, target_code: str) -> str:
+        """
+        Obtiene un identificador de la versión del modelo usado para un par de idiomas.
+        Se usa para invalidar cachés cuando cambia el modelo instalado.
+        Por defecto no hay versión conocida (cadena vacía).
+
+        Args:
+            source_code: Código del idioma de origen.
+            target_code: Código del idioma de destino.
+
+        Returns:
+            Un string que cambia cuando cambia el modelo instalado para el par.
+        """
+        return ""
+
+    def resolve_profile_name(self, profile: Optional[str]) -> Optional[str]:
+        """
+        Obtiene el nombre del perfil de rendimiento que se usará realmente para una solicitud,
+        para que las claves de cachés y agrupaciones no confundan "por defecto" con un perfil concreto.
+        Por defecto se retorna el perfil tal cual (None = perfil por defecto desconocido).
+
+        Args:
+            profile: Perfil solicitado ("fast", "balanced", "quality") o None.
+
+        Returns:
+            El nombre del perfil efectivo, o None si la implementación no lo conoce.
+        """
+        return profile
+
+    def on_packages_changed(self):
+        """
+        Notifica al traductor que se instalaron o desinstalaron paquetes de idioma,
+        para que descarte cualquier estado derivado de ellos. Por defecto no hace nada.
+        """
+        pass
+
+    def translate_stream(self, request: TranslationRequest,
+                         cancellation_token: Optional[CancellationToken] = None,
+                         progress_callback: Optional[Callable[[TranslationProgress], None]] = None) -> Iterator[str]:
+        """
+        Traduce un texto entregando los fragmentos traducidos a medida que están listos.
+        Por defecto traduce todo con translate() y entrega un único fragmento.
+
+        Args:
+            request: Un objeto TranslationRequest con el texto, idioma de origen y destino.
+            cancellation_token: Token opcional que se consulta entre oraciones.
+            progress_callback: Función opcional que recibe el progreso a medida que se traducen oraciones.
+
+        Yields:
+            Fragmentos del texto traducido, en orden; concatenados forman la traducción completa.
+
+        Raises:
+            TranslationCancelledError: Si se canceló cancellation_token durante la traducción.
+            RuntimeError: Si la traducción falla.
+        """
+        result = self.translate(request, cancellation_token, progress_callback)
+        if not result.is_successful:
+            raise RuntimeError(result.error)
+        yield result.translated_text
+
+    def warm_up(self, source_code: str, target_code: str, profile: Optional[str] = None) -> bool:
+        """
+        Carga en memoria y prepara el modelo de un par de idiomas, para que la primera
+        traducción real no pague el coste de carga. Por defecto no hace nada.
+
+        Args:
+            source_code: Código del idioma de origen.
+            target_code: Código del idioma de destino.
+            profile: Perfil de rendimiento con el que se usará el modelo (None = por defecto).
+
+        Returns:
+            True si el modelo quedó cargado, False si no se pudo (o no aplica).
+        """
+        return False
+
+    def get_model_memory_stats(self) -> Dict[str, Dict[str, float]]:
+        """
+        Obtiene el coste en memoria de los modelos cargados, por par de idiomas.
+        Por defecto no hay información (diccionario vacío).
+
+        Returns:
+            Un diccionario "origen->destino" -> métricas (por ejemplo 'cost_bytes', 'loaded'),
+            más una clave "total" opcional.
+        """
+        return {}
+
+class IPackageManager(abc.ABC):
+    """Interfaz para consultar, instalar y desinstalar paquetes de idiomas."""
+
+    @abc.abstractmethod
+    def get_installed_packages(self) -> List[Any]:
+        """
+        Obtiene los paquetes instalados (objetos con al menos from_code y to_code).
+        """
+        pass
+
+    @abc.abstractmethod
+    def get_available_packages(self, force_refresh: bool = False) -> List[Any]:
+        """
+        Obtiene los paquetes disponibles para instalar.
+
+        Args:
+            force_refresh: Volver a descargar el índice remoto aunque no haya expirado.
+        """
+        pass
+
+    @abc.abstractmethod
+    def install_package(self, package: Any):
+        """
+        Descarga e instala un paquete disponible.
+
+        Raises:
+            Exception: Si la descarga o la instalación fallan.
+        """
+        pass
+
+    @abc.abstractmethod
+    def uninstall_package(self, package: Any):
+        """
+        Desinstala un paquete instalado.
+
+        Raises:
+            FileNotFoundError: Si no se encuentra el paquete en disco.
+        """
+        pass
+
+class IUsageHistory(abc.ABC):
+    """Interfaz para el historial de uso de pares de idiomas (usado para precargar modelos)."""
+
+    @abc.abstractmethod
+    def record_pair(self, source_code: str, target_code: str):
+        """
+        Registra que se tradujo con el par de idiomas indicado.
+        """
+        pass
+
+    @abc.abstractmethod
+    def get_recent_pairs(self, limit: int) -> List[Tuple[str, str]]:
+        """
+        Obtiene los pares usados más recientemente.
+
+        Args:
+            limit: Número máximo de pares a retornar.
+
+        Returns:
+            Una lista de tuplas (código de origen, código de destino), el más reciente primero.
+        """
+        pass
+
+class ITranslationMemory(abc.ABC):
+    """Interfaz para una memoria de traducción persistente (caché de traducciones completas)."""
+
+    @abc.abstractmethod
+    def lookup(self, text: str, source_code: str, target_code: str, model_version: str) -> Optional[str]:
+        """
+        Busca una traducción previa del mismo texto, par de idiomas y versión de modelo.
+
+        Returns:
+            El texto traducido almacenado, o None si no existe.
+        """
+        pass
+
+    @abc.abstractmethod
+    def store(self, text: str, source_code: str, target_code: str, model_version: str, translated_text: str):
+        """
+        Almacena una traducción para futuras consultas.
+        """
+        pass
+
+    @abc.abstractmethod
+    def invalidate_languages(self, language_codes: List[str]):
+        """
+        Elimina las entradas cuyo idioma de origen o destino esté en language_codes.
+        Se usa cuando se instala o desinstala un paquete que afecta a esos idiomas.
+        """
+        pass
+
+    @abc.abstractmethod
+    def clear(self):
+        """
+        Elimina todas las entradas de la memoria de traducción.
+        """
+        pass
+
+    @abc.abstractmethod
+    def get_stats(self) -> Dict[str, int]:
+        """
+        Obtiene estadísticas de uso de la memoria.
+
+        Returns:
+            Un diccionario con al menos las claves 'hits', 'misses' y 'entries'.
         """
         pass
 
@@ -35,13 +269,18 @@ class IOCRService(abc.ABC):
     """Interfaz para el servicio de reconocimiento óptico de caracteres (OCR)."""
 
     @abc.abstractmethod
-    def extract_text_from_image_data(self, image_data: Any) -> str:
+    def extract_text_from_image_data(self, image_data: Any, language: Optional[str] = None,
+                                     profile: Optional[str] = None) -> str:
         """
         Extrae texto de datos de imagen.
 
         Args:
             image_data: Los datos de la imagen (el tipo exacto dependerá de la implementación
                         de infraestructura, por ejemplo, un objeto PIL.Image.Image).
+            language: Código del idioma del texto, el mismo que el idioma de origen de la traducción
+                      (por ejemplo "es"). None = idioma por defecto del servicio.
+            profile: Perfil de rendimiento opcional ("fast", "balanced", "quality"); la implementación
+                     puede usarlo para elegir entre modelos de OCR más rápidos o más precisos.
 
         Returns:
             El texto extraído de la imagen.
@@ -53,6 +292,60 @@ class IOCRService(abc.ABC):
     # no del servicio de OCR en sí. El servicio de OCR solo procesa la imagen que recibe.
 
 
+class IOCRResultCache(abc.ABC):
+    """
+    Interfaz para una caché de resultados de OCR (y de su traducción) indexada por una huella
+    perceptual de la imagen, de modo que una captura visualmente idéntica no repita el OCR.
+    """
+
+    @abc.abstractmethod
+    def get_image_key(self, image_data: Any, context: str = "") -> Optional[str]:
+        """
+        Calcula la clave de una imagen: su huella perceptual junto con la configuración del OCR.
+        context distingue los ajustes del OCR que cambian en cada llamada (idioma, perfil).
+
+        Returns:
+            La clave, o None si la imagen no es de un tipo soportado.
+        """
+        pass
+
+    @abc.abstractmethod
+    def lookup(self, image_key: str, source_code: str, target_code: str) -> Optional[Tuple[str, Optional[str]]]:
+        """
+        Busca una imagen igual o casi igual (según el umbral de la implementación).
+
+        Returns:
+            (texto extraído, traducción al par indicado o None si aún no se tradujo), o None si no hay entrada.
+        """
+        pass
+
+    @abc.abstractmethod
+    def store(self, image_key: str, extracted_text: str, source_code: str = "", target_code: str = "",
+              translated_text: Optional[str] = None):
+        """
+        Almacena el texto extraído de una imagen y, opcionalmente, su traducción a un par de idiomas.
+        """
+        pass
+
+    @abc.abstractmethod
+    def invalidate_languages(self, language_codes: List[str]):
+        """
+        Elimina las traducciones cuyo idioma de origen o destino esté en language_codes
+        (el texto extraído se conserva).
+        """
+        pass
+
+    @abc.abstractmethod
+    def get_stats(self) -> Dict[str, int]:
+        """
+        Obtiene estadísticas de uso de la caché.
+
+        Returns:
+            Un diccionario con al menos las claves 'hits', 'misses' y 'entries'.
+        """
+        pass
+
+
 class ITTSService(abc.ABC):
     """Interfaz para el servicio de síntesis de voz (Text-to-Speech)."""
 
@@ -1,4 +1,5 @@
 # src/domain/models.py
+import threading
 from typing import Optional
 
 class Language:
@@ -19,17 +20,28 @@ class Language:
         return hash(self.code)
 
 
+# Perfiles de rendimiento de la traducción (velocidad frente a calidad).
+# La implementación del traductor decide qué parámetros concretos usa cada uno.
+PROFILE_FAST = "fast"
+PROFILE_BALANCED = "balanced"
+PROFILE_QUALITY = "quality"
+PERFORMANCE_PROFILES = (PROFILE_FAST, PROFILE_BALANCED, PROFILE_QUALITY)
+
+
 class TranslationRequest:
     """Representa una solicitud para traducir texto."""
-    def __init__(self, text: str, source_language: Language, target_language: Language):
+    def __init__(self, text: str, source_language: Language, target_language: Language,
+                 profile: Optional[str] = None):
         self.text = text
         self.source_language = source_language
         self.target_language = target_language
+        self.profile = profile # Perfil de rendimiento (PROFILE_*); None usa el perfil por defecto del traductor
 
     def __repr__(self):
         return (f"TranslationRequest(text='{self.text[:50]}...', "
                 f"source='{self.source_language.code}', "
-                f"target='{self.target_language.code}')")
+                f"target='{self.target_language.code}', "
+                f"profile='{self.profile}')")
 
 class TranslationResult:
     """Representa el resultado de una operación de traducción."""
@@ -44,4 +56,63 @@ class TranslationResult:
         else:
             return f"TranslationResult(error='{self.error}')"
 
+class TranslationCancelledError(Exception):
+    """Se lanza cuando una traducción se detiene porque se canceló su CancellationToken."""
+    pass
+
+
+class CancellationToken:
+    """
+    Señal de cancelación cooperativa. Quien inicia una tarea larga crea el token y lo pasa
+    hacia abajo; el bucle de traducción lo consulta entre oraciones y se detiene si está cancelado.
+    """
+    def __init__(self):
+        self._event = threading.Event()
+
+    def cancel(self):
+        """Solicita la cancelación."""
+        self._event.set()
+
+    @property
+    def is_cancelled(self) -> bool:
+        return self._event.is_set()
+
+    def raise_if_cancelled(self):
+        """Lanza TranslationCancelledError si se solicitó la cancelación."""
+        if self._event.is_set():
+            raise TranslationCancelledError("Traducción cancelada.")
+
+    def __repr__(self):
+        return f"CancellationToken(cancelled={self.is_cancelled})"
+
+
+class TranslationProgress:
+    """Progreso de una traducción larga, medido en oraciones y caracteres de origen."""
+    def __init__(self, done: int, total: int, chars_done: int, chars_total: int, elapsed_seconds: float):
+        self.done = done
+        self.total = total
+        self.chars_done = chars_done
+        self.chars_total = chars_total
+        self.elapsed_seconds = elapsed_seconds
+
+    @property
+    def fraction(self) -> float:
+        """Fracción completada entre 0 y 1."""
+        return self.done / self.total if self.total else 1.0
+
+    @property
+    def chars_per_second(self) -> float:
+        return self.chars_done / self.elapsed_seconds if self.elapsed_seconds > 0 else 0.0
+
+    @property
+    def eta_seconds(self) -> Optional[float]:
+        """Tiempo restante estimado según la velocidad actual, o None si aún no se puede estimar."""
+        rate = self.chars_per_second
+        if rate <= 0:
+            return None
+        return max(0.0, (self.chars_total - self.chars_done) / rate)
+
+    def __repr__(self):
+        return f"TranslationProgress(done={self.done}, total={self.total}, chars_per_second={self.chars_per_second:.1f})"
+
 # Podemos añadir modelos para la configuración, resultados de OCR, etc. más adelante
\ No newline at end of file
@@ -0,0 +1,94 @@
+# src/infrastructure/app_config.py
+
+import configparser # Biblioteca estándar para leer archivos .ini
+import os
+import sys
+from typing import List, Optional
+
+# Ruta por defecto del archivo de configuración relativa a la raíz del proyecto.
+# Cuando la aplicación se empaqueta con PyInstaller, los datos se extraen en sys._MEIPASS
+# (ver PolarTranslate.spec, que incluye config/config.ini en la carpeta 'config').
+_PROJECT_ROOT = getattr(sys, "_MEIPASS", os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+DEFAULT_CONFIG_PATH = os.path.join(_PROJECT_ROOT, "config", "config.ini")
+
+
+def get_user_data_dir() -> str:
+    """
+    Obtiene (y crea si no existe) el directorio de datos de usuario de la aplicación.
+    Sigue la misma convención que argostranslate (~/.local/share/...).
+
+    Returns:
+        La ruta absoluta del directorio de datos.
+    """
+    data_dir = os.path.join(os.path.expanduser("~"), ".local", "share", "polar-translate")
+    os.makedirs(data_dir, exist_ok=True)
+    return data_dir
+
+
+class AppConfig:
+    """
+    Acceso de solo lectura a config/config.ini.
+    Esta clase reside en la capa de Infraestructura.
+    Todos los getters aceptan un valor por defecto que se usa si la sección o la clave
+    no existen o están vacías, de modo que un config.ini antiguo sigue funcionando.
+    """
+
+    def __init__(self, config_path: Optional[str] = None):
+        """
+        Constructor de la configuración.
+
+        Args:
+            config_path: Ruta opcional al archivo .ini. Si no se indica se usa config/config.ini.
+        """
+        self.config_path = config_path or DEFAULT_CONFIG_PATH
+        self._parser = configparser.ConfigParser()
+        try:
+            read_files = self._parser.read(self.config_path, encoding="utf-8")
+            if read_files:
+                print(f"Infrastructure Layer (AppConfig): Configuración cargada desde: {self.config_path}")
+            else:
+                print(f"Infrastructure Layer (AppConfig): Advertencia: No se encontró {self.config_path}. Se usarán valores por defecto.")
+        except configparser.Error as e:
+            print(f"Infrastructure Layer (AppConfig): Error al leer {self.config_path}: {e}. Se usarán valores por defecto.")
+
+    def get_str(self, section: str, key: str, default: str = "") -> str:
+        """Obtiene un valor de texto. Los valores vacíos se consideran no definidos."""
+        value = self._parser.get(section, key, fallback="").strip()
+        return value if value else default
+
+    def get_int(self, section: str, key: str, default: int) -> int:
+        """Obtiene un valor entero, o el valor por defecto si no es válido."""
+        value = self.get_str(section, key)
+        try:
+            return int(value) if value else default
+        except ValueError:
+            print(f"Infrastructure Layer (AppConfig): Advertencia: Valor no entero para [{section}] {key}: '{value}'.")
+            return default
+
+    def get_float(self, section: str, key: str, default: float) -> float:
+        """Obtiene un valor decimal, o el valor por defecto si no es válido."""
+        value = self.get_str(section, key)
+        try:
+            return float(value) if value else default
+        except ValueError:
+            print(f"Infrastructure Layer (AppConfig): Advertencia: Valor no numérico para [{section}] {key}: '{value}'.")
+            return default
+
+    def get_bool(self, section: str, key: str, default: bool) -> bool:
+        """Obtiene un valor booleano (true/false, si/no, 1/0)."""
+        value = self.get_str(section, key).lower()
+        if not value:
+            return default
+        if value in ("1", "true", "yes", "si", "sí", "on"):
+            return True
+        if value in ("0", "false", "no", "off"):
+            return False
+        print(f"Infrastructure Layer (AppConfig): Advertencia: Valor booleano no reconocido para [{section}] {key}: '{value}'.")
+        return default
+
+    def get_list(self, section: str, key: str, default: Optional[List[str]] = None) -> List[str]:
+        """Obtiene una lista de valores separados por comas."""
+        value = self.get_str(section, key)
+        if not value:
+            return list(default) if default else []
+        return [item.strip() for item in value.split(",") if item.strip()]
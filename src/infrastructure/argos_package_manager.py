@@ -0,0 +1,96 @@
+# src/infrastructure/argos_package_manager.py
+
+import os
+import shutil
+from typing import Any, List, Optional
+
+import argostranslate.package
+
+from src.domain.interfaces import IPackageManager
+from src.infrastructure.package_index import PackageIndexRefresher
+
+
+class ArgosPackageManager(IPackageManager):
+    """
+    Implementación de IPackageManager sobre los paquetes de argostranslate.
+    Esta clase reside en la capa de Infraestructura. Todos sus métodos son bloqueantes:
+    la UI los ejecuta a través del planificador de tareas del servicio.
+    """
+
+    def __init__(self, package_index: Optional[PackageIndexRefresher] = None):
+        """
+        Constructor del gestor de paquetes.
+
+        Args:
+            package_index: Gestor del índice remoto (TTL y modo sin conexión). Si no se proporciona,
+                           se crea uno con los valores por defecto.
+        """
+        self._package_index = package_index or PackageIndexRefresher()
+
+    def get_installed_packages(self) -> List[Any]:
+        installed_packages = argostranslate.package.get_installed_packages()
+        print(f"Infrastructure Layer (ArgosPackageManager): {len(installed_packages)} paquetes instalados.")
+        return installed_packages
+
+    def get_available_packages(self, force_refresh: bool = False) -> List[Any]:
+        """
+        Obtiene los paquetes disponibles. El índice remoto solo se descarga si expiró
+        o si force_refresh es True (nunca en modo sin conexión).
+        """
+        self._package_index.refresh(force=force_refresh)
+        available_packages = argostranslate.package.get_available_packages()
+        print(f"Infrastructure Layer (ArgosPackageManager): {len(available_packages)} paquetes disponibles.")
+        return available_packages
+
+    def install_package(self, package: Any):
+        """
+        Descarga el paquete, lo instala y elimina el archivo descargado.
+        """
+        print(f"Infrastructure Layer (ArgosPackageManager): Descargando {package.from_code} -> {package.to_code}...")
+        download_path = package.download()
+        print(f"Infrastructure Layer (ArgosPackageManager): Descarga completa. Instalando desde {download_path}...")
+        argostranslate.package.install_from_path(download_path)
+        print(f"Infrastructure Layer (ArgosPackageManager): Instalación completa para {package.from_code} -> {package.to_code}.")
+
+        if os.path.exists(download_path):
+            try:
+                os.remove(download_path)
+                print(f"Infrastructure Layer (ArgosPackageManager): Archivo descargado temporal eliminado: {download_path}")
+            except Exception as cleanup_e:
+                print(f"Infrastructure Layer (ArgosPackageManager) Error: No se pudo eliminar el archivo descargado temporal {download_path}: {cleanup_e}")
+
+    def uninstall_package(self, package: Any):
+        """
+        Desinstala un paquete buscando su directorio por códigos de idioma.
+        """
+        home_dir = os.path.expanduser("~")
+        packages_dir = os.path.join(home_dir, ".local", "share", "argos-translate", "packages")
+        print(f"Infrastructure Layer (ArgosPackageManager): Buscando directorio del paquete en: {packages_dir}")
+
+        from_code = package.from_code
+        to_code = package.to_code
+        package_path_to_remove = None
+
+        # Buscar el directorio del paquete de forma flexible: nombres como "ar_en" o "translate-ar_en-1_9",
+        # sin distinguir mayúsculas/minúsculas
+        if os.path.exists(packages_dir):
+            from_to_lower = f"{from_code}_{to_code}".lower()
+            translate_from_to_lower = f"translate-{from_code}_{to_code}-".lower()
+            for item_name in os.listdir(packages_dir):
+                item_path = os.path.join(packages_dir, item_name)
+                if not os.path.isdir(item_path):
+                    continue
+                item_name_lower = item_name.lower()
+                if from_to_lower in item_name_lower or item_name_lower.startswith(translate_from_to_lower):
+                    package_path_to_remove = item_path
+                    print(f"Infrastructure Layer (ArgosPackageManager): Directorio encontrado: {package_path_to_remove}")
+                    break
+
+        if not package_path_to_remove or not os.path.exists(package_path_to_remove):
+            raise FileNotFoundError(
+                f"No se encontró el directorio del paquete en la ruta esperada ({packages_dir}) con códigos '{from_code}_{to_code}'."
+            )
+
+        print(f"Infrastructure Layer (ArgosPackageManager): Eliminando directorio: {package_path_to_remove}")
+        shutil.rmtree(package_path_to_remove)
+        print("Infrastructure Layer (ArgosPackageManager): Directorio del paquete eliminado correctamente.")
@@ -3,11 +3,44 @@
 import argostranslate.package
 import argostranslate.translate
 import argostranslate.settings # Mantenemos settings por si se necesita para configuración futura
-from typing import List, Optional
+import ctranslate2 # Motor de inferencia usado por argostranslate; se usa directamente para traducir por lotes
+import threading
+import time
+from collections import Counter
+from typing import Any, Callable, Iterator, List, Optional, Dict, Tuple
 
 # Importar la interfaz de la capa de Dominio y los modelos
 from src.domain.interfaces import ITranslator
-from src.domain.models import Language, TranslationRequest, TranslationResult
+from src.domain.models import Language, TranslationRequest, TranslationResult, CancellationToken, TranslationProgress, TranslationCancelledError
+from src.infrastructure.sentence_cache import SentenceLRUCache
+from src.infrastructure.package_index import PackageIndexRefresher
+from src.infrastructure.model_pool import ModelPool
+from src.infrastructure.compute_profiles import ComputeProfile, get_compute_profile, DEFAULT_PROFILE_NAME
+from src.infrastructure.text_segmentation import split_into_sentences, join_segments
+
+class SentenceProgressTracker:
+    """
+    Acumula el progreso de una traducción (oraciones y caracteres) y lo notifica a un callback.
+    Las oraciones vacías no cuentan en el total.
+    """
+
+    def __init__(self, sentences: List[str], callback: Optional[Callable[[TranslationProgress], None]]):
+        self._callback = callback
+        self.total = sum(1 for sentence in sentences if sentence.strip())
+        self.chars_total = sum(len(sentence) for sentence in sentences if sentence.strip())
+        self.done = 0
+        self.chars_done = 0
+        self._start_time = time.perf_counter()
+
+    def advance(self, sentences: int, chars: int):
+        """Suma oraciones terminadas y notifica el progreso."""
+        self.done += sentences
+        self.chars_done += chars
+        if self._callback is not None:
+            self._callback(TranslationProgress(
+                self.done, self.total, self.chars_done, self.chars_total, time.perf_counter() - self._start_time
+            ))
+
 
 class ArgosTranslator(ITranslator):
     """
@@ -15,30 +48,57 @@ class ArgosTranslator(ITranslator):
     Esta clase reside en la capa de Infraestructura.
     """
 
-    def __init__(self):
+    def __init__(self, sentence_cache: Optional[SentenceLRUCache] = None, max_batch_size: int = 32,
+                 package_index: Optional[PackageIndexRefresher] = None, model_pool: Optional[ModelPool] = None,
+                 default_profile: str = DEFAULT_PROFILE_NAME, intra_threads: int = 0, cancellable_batch_size: int = 1):
         """
         Constructor del traductor Argos.
-        Intenta actualizar y cargar los paquetes de idioma instalados.
+        No accede a la red: el traductor queda listo con los paquetes instalados localmente
+        y, si se proporciona package_index, el índice remoto se actualiza en segundo plano.
+
+        Args:
+            sentence_cache: Caché opcional de traducciones por oración. Si se proporciona,
+                            el texto se divide en oraciones y solo se traducen las que no
+                            están en caché.
+            max_batch_size: Número máximo de oraciones por micro-lote enviado a CTranslate2.
+            package_index: Gestor opcional del índice remoto de paquetes (con TTL y modo sin conexión).
+            model_pool: Pool de modelos con presupuesto de memoria. Si no se proporciona, se usa uno
+                        sin límite (solo para medir el coste de cada modelo).
+            default_profile: Perfil de rendimiento ("fast", "balanced" o "quality") usado cuando
+                             la solicitud no indica uno.
+            intra_threads: Si es mayor que 0, sustituye los hilos por lote (intra_threads) de todos los perfiles.
+                           Lo usan los procesos de ProcessPoolTranslator para repartirse los núcleos.
+            cancellable_batch_size: Oraciones por micro-lote cuando la traducción tiene token de cancelación.
+                                    La cancelación se consulta entre llamadas al modelo, así que un valor
+                                    pequeño la hace efectiva antes; las traducciones sin token usan max_batch_size.
         """
         print("Infrastructure Layer (ArgosTranslator): Inicializando...")
-        try:
-            # Intenta actualizar la base de datos de paquetes remotos
-            print("Infrastructure Layer (ArgosTranslator): Intentando actualizar paquetes remotos...")
-            argostranslate.package.update_package_index()
-            print("Infrastructure Layer (ArgosTranslator): Paquetes remotos actualizados.")
-        except Exception as e:
-            print(f"Infrastructure Layer (ArgosTranslator): Advertencia: No se pudo actualizar el índice de paquetes remotos: {e}")
-            print("Infrastructure Layer (ArgosTranslator): Continuará con los paquetes locales instalados.")
+        self._sentence_cache = sentence_cache
+        self._max_batch_size = max(1, max_batch_size)
+        self._cancellable_batch_size = max(1, min(cancellable_batch_size, self._max_batch_size))
+        self._intra_threads = max(0, intra_threads)
+        self._default_profile = self._apply_thread_limit(get_compute_profile(default_profile))
+        # Estadísticas de la última llamada a translate_batch() (oraciones/segundo, etc.)
+        self._last_batch_stats: Dict[str, float] = {}
+        # Versiones de los paquetes instalados por par (from_code, to_code).
+        # Se calcula bajo demanda y se descarta en on_packages_changed().
+        self._package_versions: Optional[Dict[Tuple[str, str], str]] = None
+        self._package_versions_lock = threading.Lock()
+        # Idiomas instalados de argostranslate y objetos de traducción ya resueltos por par.
+        # argostranslate.translate.translate() vuelve a escanear los paquetes en cada llamada;
+        # aquí se resuelven una sola vez y se reutilizan hasta que cambien los paquetes.
+        self._installed_argos_languages: Optional[list] = None
+        self._translations: Dict[Tuple[str, str], Any] = {}
+        self._translations_lock = threading.Lock()
+        # Todos los modelos CTranslate2 se cargan a través del pool, que aplica el presupuesto de memoria
+        self._model_pool = model_pool if model_pool is not None else ModelPool()
 
-        try:
-            # Carga los paquetes de idioma instalados localmente
-            print("Infrastructure Layer (ArgosTranslator): Cargando paquetes locales instalados...")
-            # Es importante cargar los paquetes disponibles para que get_installed_languages funcione correctamente
-            argostranslate.package.load_available_packages()
-            print("Infrastructure Layer (ArgosTranslator): Paquetes locales cargados.")
-        except Exception as e:
-            print(f"Infrastructure Layer (ArgosTranslator): Error al cargar paquetes locales: {e}")
-            print("Infrastructure Layer (ArgosTranslator): La traducción podría no funcionar si no hay paquetes instalados.")
+        # El índice remoto solo es necesario para instalar paquetes nuevos; los paquetes instalados
+        # se leen del disco bajo demanda. Por eso la actualización no bloquea el arranque.
+        if package_index is not None:
+            package_index.refresh_async()
+        else:
+            print("Infrastructure Layer (ArgosTranslator): Sin gestor de índice de paquetes. Se usarán solo los paquetes instalados.")
 
         print("Infrastructure Layer (ArgosTranslator): Inicialización completa.")
 
@@ -54,8 +114,9 @@ class ArgosTranslator(ITranslator):
         print("Infrastructure Layer (ArgosTranslator): Obteniendo idiomas disponibles (instalados)...")
         try:
             # CORREGIDO: Usar get_installed_languages() en lugar de get_available_languages()
-            argos_languages = argostranslate.translate.get_installed_languages()
-            print(f"Infrastructure Layer (ArgosTranslator): argostranslate.translate.get_installed_languages() retornó {len(argos_languages)} idiomas.")
+            with self._translations_lock:
+                argos_languages = self._get_installed_argos_languages()
+            print(f"Infrastructure Layer (ArgosTranslator): Idiomas instalados de argostranslate: {len(argos_languages)}.")
 
             # Convertir los objetos Language de argostranslate a nuestros objetos Language del Dominio
             domain_languages: List[Language] = [
@@ -69,34 +130,47 @@ class ArgosTranslator(ITranslator):
             return []
 
 
-    def translate(self, request: TranslationRequest) -> TranslationResult:
+    def translate(self, request: TranslationRequest,
+                  cancellation_token: Optional[CancellationToken] = None,
+                  progress_callback: Optional[Callable[[TranslationProgress], None]] = None) -> TranslationResult:
         """
         Realiza una solicitud de traducción utilizando argostranslate.
 
         Args:
             request: Un objeto TranslationRequest con el texto, idioma de origen y destino.
+            cancellation_token: Token opcional; se consulta antes de cada micro-lote de oraciones.
+            progress_callback: Función opcional que recibe el progreso tras cada micro-lote.
 
         Returns:
             Un objeto TranslationResult con el texto traducido o posibles errores.
+
+        Raises:
+            TranslationCancelledError: Si se canceló cancellation_token.
         """
         print(f"Infrastructure Layer (ArgosTranslator): translate() llamado para texto='{request.text[:50]}...' de {request.source_language.code} a {request.target_language.code}")
         translated_text = ""
         error_message: Optional[str] = None
 
         try:
-            # argostranslate.translate.translate() realiza la traducción.
-            # Requiere los códigos de idioma como strings.
-            print("Infrastructure Layer (ArgosTranslator): Llamando a argostranslate.translate.translate()...")
-            translated_text = argostranslate.translate.translate(
-                request.text,
-                request.source_language.code,
-                request.target_language.code
+            # El texto se segmenta en oraciones que se decodifican en lote con el modelo del pool;
+            # con caché de oraciones, solo se decodifican las que no están en caché
+            segments = split_into_sentences(request.text)
+            sentences = [sentence for sentence, _ in segments]
+            translated_sentences, _ = self._translate_sentences(
+                sentences, request.source_language.code, request.target_language.code,
+                self._resolve_profile(request.profile),
+                cancellation_token, SentenceProgressTracker(sentences, progress_callback)
+            )
+            translated_text = join_segments(
+                [(translated, separator) for translated, (_, separator) in zip(translated_sentences, segments)]
             )
-            print("Infrastructure Layer (ArgosTranslator): argostranslate.translate.translate() regresó.")
             print(f"Infrastructure Layer (ArgosTranslator): Texto traducido (primeros 50 chars): {translated_text[:50]}...")
 
+        except TranslationCancelledError:
+            print("Infrastructure Layer (ArgosTranslator): Traducción cancelada.")
+            raise
         except Exception as e:
-            error_message = f"Error en argostranslate.translate.translate(): {e}"
+            error_message = f"Error en la traducción de argostranslate: {e}"
             print(f"Infrastructure Layer (ArgosTranslator): {error_message}")
             # Si ocurre un error, argostranslate.translate.translate() puede lanzar una excepción.
             # Capturamos la excepción y la reportamos en el TranslationResult.
@@ -107,3 +181,457 @@ class ArgosTranslator(ITranslator):
         else:
             return TranslationResult(translated_text=translated_text)
 
+
+    def translate_stream(self, request: TranslationRequest,
+                         cancellation_token: Optional[CancellationToken] = None,
+                         progress_callback: Optional[Callable[[TranslationProgress], None]] = None) -> Iterator[str]:
+        """
+        Traduce un texto y entrega los fragmentos traducidos (con sus separadores originales)
+        a medida que se decodifican, en el orden del texto.
+        Las oraciones se decodifican en grupos consecutivos cuyo tamaño empieza en 1 y se duplica
+        hasta el tamaño de llamada del perfil: la primera oración llega tras decodificar solo esa,
+        y el resto del documento se sigue decodificando en lotes.
+
+        Args:
+            request: Un objeto TranslationRequest con el texto, idioma de origen y destino.
+            cancellation_token: Token opcional; se consulta antes de cada micro-lote de oraciones.
+            progress_callback: Función opcional que recibe el progreso del texto completo.
+
+        Yields:
+            Fragmentos del texto traducido; concatenados forman la traducción completa.
+
+        Raises:
+            TranslationCancelledError: Si se canceló cancellation_token.
+            ValueError: Si no hay paquetes instalados para el par.
+        """
+        print(f"Infrastructure Layer (ArgosTranslator): translate_stream() llamado para texto='{request.text[:50]}...' de {request.source_language.code} a {request.target_language.code}")
+        profile = self._resolve_profile(request.profile)
+        segments = split_into_sentences(request.text)
+        progress = SentenceProgressTracker([sentence for sentence, _ in segments], progress_callback)
+        max_chunk_size = self._max_batch_size * max(1, profile.inter_threads)
+
+        chunk_start = 0
+        chunk_size = 1
+        while chunk_start < len(segments):
+            chunk = segments[chunk_start:chunk_start + chunk_size]
+            translated_sentences, _ = self._translate_sentences(
+                [sentence for sentence, _ in chunk], request.source_language.code, request.target_language.code,
+                profile, cancellation_token, progress
+            )
+            yield join_segments(
+                [(translated, separator) for translated, (_, separator) in zip(translated_sentences, chunk)]
+            )
+            chunk_start += len(chunk)
+            chunk_size = min(chunk_size * 2, max_chunk_size)
+
+
+    def _get_installed_argos_languages(self) -> list:
+        """
+        Obtiene (y memoriza) los idiomas instalados de argostranslate.
+        Debe llamarse con self._translations_lock adquirido.
+        """
+        if self._installed_argos_languages is None:
+            print("Infrastructure Layer (ArgosTranslator): Escaneando idiomas instalados de argostranslate...")
+            self._installed_argos_languages = argostranslate.translate.get_installed_languages()
+        return self._installed_argos_languages
+
+
+    def _get_translation(self, source_code: str, target_code: str) -> Any:
+        """
+        Obtiene el objeto de traducción de argostranslate para un par de idiomas.
+        Se resuelve una vez (directo o por pivote, según argostranslate) y se reutiliza.
+
+        Raises:
+            ValueError: Si no hay paquetes instalados que permitan traducir el par.
+        """
+        pair = (source_code, target_code)
+        translation = self._translations.get(pair)
+        if translation is not None:
+            return translation
+
+        with self._translations_lock:
+            translation = self._translations.get(pair)
+            if translation is None:
+                languages = self._get_installed_argos_languages()
+                from_lang = next((lang for lang in languages if lang.code == source_code), None)
+                to_lang = next((lang for lang in languages if lang.code == target_code), None)
+                if from_lang is None or to_lang is None:
+                    raise ValueError(f"Idioma no instalado para el par {source_code} -> {target_code}")
+                translation = from_lang.get_translation(to_lang)
+                if translation is None:
+                    raise ValueError(f"No hay paquetes instalados para traducir {source_code} -> {target_code}")
+                self._translations[pair] = translation
+                print(f"Infrastructure Layer (ArgosTranslator): Traducción resuelta y memorizada para {source_code} -> {target_code}.")
+            return translation
+
+
+    def translate_batch(self, requests: List[TranslationRequest],
+                        cancellation_token: Optional[CancellationToken] = None,
+                        progress_callback: Optional[Callable[[TranslationProgress], None]] = None) -> List[TranslationResult]:
+        """
+        Traduce varias solicitudes a la vez.
+        Todas las oraciones de las solicitudes de un mismo par se segmentan, se deduplican,
+        se ordenan por longitud en tokens y se decodifican en micro-lotes con CTranslate2.
+
+        Args:
+            requests: Lista de objetos TranslationRequest.
+            cancellation_token: Token opcional; se consulta antes de cada micro-lote de oraciones.
+            progress_callback: Función opcional que recibe el progreso del lote completo.
+
+        Returns:
+            Una lista de TranslationResult en el mismo orden que requests.
+
+        Raises:
+            TranslationCancelledError: Si se canceló cancellation_token. Las oraciones ya
+                                       decodificadas quedan en la caché de oraciones.
+        """
+        print(f"Infrastructure Layer (ArgosTranslator): translate_batch() llamado con {len(requests)} solicitudes.")
+        results: List[Optional[TranslationResult]] = [None] * len(requests)
+        start_time = time.perf_counter()
+        total_sentences = 0
+        decoded_sentences = 0
+
+        # Agrupar las solicitudes por par de idiomas y perfil, conservando su posición original
+        groups: Dict[Tuple[str, str, ComputeProfile], List[int]] = {}
+        for index, request in enumerate(requests):
+            profile = self._resolve_profile(request.profile)
+            groups.setdefault((request.source_language.code, request.target_language.code, profile), []).append(index)
+
+        # Segmentar todo al principio para que el progreso conozca el total del lote
+        segmented_groups = {
+            group: [split_into_sentences(requests[index].text) for index in indexes]
+            for group, indexes in groups.items()
+        }
+        progress = SentenceProgressTracker(
+            [sentence for segmented in segmented_groups.values() for segments in segmented for sentence, _ in segments],
+            progress_callback
+        )
+
+        for (source_code, target_code, profile), indexes in groups.items():
+            try:
+                segmented = segmented_groups[(source_code, target_code, profile)]
+                all_sentences = [sentence for segments in segmented for sentence, _ in segments]
+                translated_sentences, decoded_count = self._translate_sentences(
+                    all_sentences, source_code, target_code, profile, cancellation_token, progress
+                )
+                total_sentences += len(all_sentences)
+                decoded_sentences += decoded_count
+
+                position = 0
+                for index, segments in zip(indexes, segmented):
+                    translated_segments = [
+                        (translated_sentences[position + offset], separator)
+                        for offset, (_, separator) in enumerate(segments)
+                    ]
+                    position += len(segments)
+                    results[index] = TranslationResult(translated_text=join_segments(translated_segments))
+
+            except TranslationCancelledError:
+                print(f"Infrastructure Layer (ArgosTranslator): Lote cancelado tras {progress.done}/{progress.total} oraciones.")
+                raise
+            except Exception as e:
+                error_message = f"Error en la traducción por lotes {source_code} -> {target_code}: {e}"
+                print(f"Infrastructure Layer (ArgosTranslator): {error_message}")
+                for index in indexes:
+                    results[index] = TranslationResult(error=error_message)
+
+        elapsed = time.perf_counter() - start_time
+        self._last_batch_stats = {
+            "requests": len(requests),
+            "sentences": total_sentences,
+            "decoded_sentences": decoded_sentences,
+            "seconds": elapsed,
+            "sentences_per_second": total_sentences / elapsed if elapsed > 0 else 0.0,
+            "decoded_sentences_per_second": decoded_sentences / elapsed if elapsed > 0 else 0.0,
+        }
+        print(f"Infrastructure Layer (ArgosTranslator): Lote completado: {total_sentences} oraciones "
+              f"({decoded_sentences} decodificadas) en {elapsed:.3f} s, "
+              f"{self._last_batch_stats['sentences_per_second']:.1f} oraciones/s.")
+        return results
+
+
+    def get_last_batch_stats(self) -> Dict[str, float]:
+        """
+        Obtiene las estadísticas de la última llamada a translate_batch() (oraciones/segundo, etc.).
+        """
+        return dict(self._last_batch_stats)
+
+
+    def _resolve_profile(self, profile_name: Optional[str]) -> ComputeProfile:
+        """Retorna el perfil de rendimiento solicitado, o el perfil por defecto si no se indica."""
+        if not profile_name:
+            return self._default_profile
+        return self._apply_thread_limit(get_compute_profile(profile_name, self._default_profile.name))
+
+    def resolve_profile_name(self, profile: Optional[str]) -> Optional[str]:
+        """Nombre del perfil efectivo: el por defecto si no se indica o si el nombre es desconocido."""
+        return self._resolve_profile(profile).name
+
+    def _apply_thread_limit(self, profile: ComputeProfile) -> ComputeProfile:
+        """Aplica el límite de hilos por lote del constructor (si lo hay) a un perfil."""
+        if not self._intra_threads:
+            return profile
+        return profile._replace(intra_threads=self._intra_threads)
+
+
+    def _translate_sentences(self, sentences: List[str], source_code: str, target_code: str,
+                             profile: ComputeProfile,
+                             cancellation_token: Optional[CancellationToken] = None,
+                             progress: Optional[SentenceProgressTracker] = None) -> Tuple[List[str], int]:
+        """
+        Traduce una lista de oraciones consultando la caché de oraciones (si existe)
+        y decodificando en lote solo las oraciones distintas que faltan.
+        Las oraciones vacías o de solo espacios se devuelven sin cambios.
+        Las entradas de la caché se separan por perfil, porque el beam cambia el resultado.
+        Cada micro-lote decodificado se guarda en la caché de inmediato, así que una traducción
+        cancelada y reiniciada no vuelve a decodificar lo ya hecho.
+
+        Returns:
+            Una tupla (traducciones en el mismo orden que sentences, número de oraciones decodificadas).
+        """
+        translations: Dict[str, str] = {}
+        pending: List[str] = []
+        pending_set = set()
+        for sentence in sentences:
+            if sentence in translations or sentence in pending_set:
+                continue
+            if not sentence.strip():
+                translations[sentence] = sentence
+                continue
+            cached = self._sentence_cache.get(source_code, target_code, sentence, profile.name) if self._sentence_cache is not None else None
+            if cached is not None:
+                translations[sentence] = cached
+            else:
+                pending.append(sentence)
+                pending_set.add(sentence)
+
+        # Las apariciones resueltas sin el modelo (caché) cuentan como hechas desde el principio
+        occurrences = Counter(sentence for sentence in sentences if sentence in pending_set)
+        if progress is not None:
+            resolved = [sentence for sentence in sentences if sentence.strip() and sentence not in pending_set]
+            progress.advance(len(resolved), sum(len(sentence) for sentence in resolved))
+
+        def on_decoded(batch_indexes: List[int], batch_translations: List[str]):
+            batch_sentences = [pending[i] for i in batch_indexes]
+            for sentence, translated in zip(batch_sentences, batch_translations):
+                translations[sentence] = translated
+                if self._sentence_cache is not None:
+                    self._sentence_cache.put(source_code, target_code, sentence, translated, profile.name)
+            if progress is not None:
+                progress.advance(
+                    sum(occurrences[sentence] for sentence in batch_sentences),
+                    sum(len(sentence) * occurrences[sentence] for sentence in batch_sentences)
+                )
+
+        if pending:
+            translation = self._get_translation(source_code, target_code)
+            self._decode_sentences(translation, pending, profile, cancellation_token, on_decoded)
+
+        return [translations[sentence] for sentence in sentences], len(pending)
+
+
+    @staticmethod
+    def _unwrap_translation(translation: Any) -> Any:
+        """
+        Retorna la traducción subyacente de los envoltorios de argostranslate (CachedTranslation
+        guarda la traducción real en .underlying), para acceder al paquete y a su modelo.
+        """
+        while getattr(translation, "underlying", None) is not None:
+            translation = translation.underlying
+        return translation
+
+    def _decode_sentences(self, translation: Any, sentences: List[str], profile: ComputeProfile,
+                          cancellation_token: Optional[CancellationToken] = None,
+                          on_decoded: Optional[Callable[[List[int], List[str]], None]] = None) -> List[str]:
+        """
+        Decodifica oraciones con el modelo del par, usando los parámetros del perfil indicado.
+        Antes de cada llamada al modelo se consulta cancellation_token (con token, los micro-lotes
+        son de self._cancellable_batch_size para que cancelar no espere a un micro-lote completo),
+        y después de cada llamada se llama a on_decoded(índices en sentences, traducciones) con las
+        oraciones terminadas.
+        Si la traducción es un paquete directo de argostranslate (con tokenizer y modelo CTranslate2),
+        las oraciones se tokenizan, se ordenan por número de tokens para minimizar el relleno
+        y se envían a CTranslate2 en micro-lotes de self._max_batch_size.
+        Las traducciones compuestas (pivote) se decodifican en dos etapas con el mismo método.
+        En cualquier otro caso se usa la API de argostranslate oración por oración.
+        """
+        translation = self._unwrap_translation(translation)
+        first_step = getattr(translation, "t1", None)
+        second_step = getattr(translation, "t2", None)
+        if first_step is not None and second_step is not None:
+            # CompositeTranslation: origen -> pivote -> destino
+            # El progreso se reporta al terminar la segunda etapa (los índices coinciden con los de origen)
+            intermediate = self._decode_sentences(first_step, sentences, profile, cancellation_token)
+            return self._decode_sentences(second_step, intermediate, profile, cancellation_token, on_decoded)
+
+        pkg = getattr(translation, "pkg", None)
+        tokenizer = getattr(pkg, "tokenizer", None) if pkg is not None else None
+        if tokenizer is None:
+            decoded_fallback = []
+            for sentence in sentences:
+                if cancellation_token is not None:
+                    cancellation_token.raise_if_cancelled()
+                translated = translation.translate(sentence)
+                decoded_fallback.append(translated)
+                if on_decoded is not None:
+                    on_decoded([len(decoded_fallback) - 1], [translated])
+            return decoded_fallback
+
+        translator = self._get_ctranslate2_translator(translation, profile)
+        target_prefix = getattr(pkg, "target_prefix", "") or ""
+
+        tokenized = [tokenizer.encode(sentence) for sentence in sentences]
+        # Ordenar por longitud en tokens: cada micro-lote contiene oraciones de longitud similar
+        order = sorted(range(len(sentences)), key=lambda i: len(tokenized[i]))
+        decoded: List[str] = [""] * len(sentences)
+
+        # Cada llamada incluye un micro-lote por hilo inter_threads del perfil: CTranslate2 divide
+        # la llamada en lotes de batch_size y los decodifica en paralelo
+        batch_size = self._cancellable_batch_size if cancellation_token is not None else self._max_batch_size
+        call_size = batch_size * max(1, profile.inter_threads)
+        for batch_start in range(0, len(order), call_size):
+            if cancellation_token is not None:
+                cancellation_token.raise_if_cancelled()
+            batch_indexes = order[batch_start:batch_start + call_size]
+            batch_tokens = [tokenized[i] for i in batch_indexes]
+            batch_results = translator.translate_batch(
+                batch_tokens,
+                target_prefix=[[target_prefix]] * len(batch_tokens) if target_prefix else None,
+                replace_unknowns=True,
+                max_batch_size=batch_size,
+                beam_size=profile.beam_size,
+                num_hypotheses=1,
+                length_penalty=0.2,
+            )
+            for i, batch_result in zip(batch_indexes, batch_results):
+                value = tokenizer.decode(batch_result.hypotheses[0])
+                if target_prefix and value.startswith(target_prefix):
+                    value = value[len(target_prefix):]
+                decoded[i] = value.lstrip()
+            if on_decoded is not None:
+                on_decoded(list(batch_indexes), [decoded[i] for i in batch_indexes])
+
+        return decoded
+
+
+    def _get_ctranslate2_translator(self, translation: Any, profile: ComputeProfile) -> "ctranslate2.Translator":
+        """
+        Obtiene el ctranslate2.Translator de una traducción directa de argostranslate a través del pool
+        de modelos, que lo carga si no está en memoria y aplica el presupuesto de RAM.
+        El tipo de cómputo y los hilos del perfil se fijan al cargar, así que cada combinación
+        distinta es un modelo distinto en el pool (los perfiles que coinciden lo comparten).
+        """
+        pkg = translation.pkg
+        model_path = str(pkg.package_path / "model")
+        pair_key = f"{pkg.from_code}->{pkg.to_code}"
+
+        def load_model():
+            print(f"Infrastructure Layer (ArgosTranslator): Cargando modelo CTranslate2 desde {model_path} "
+                  f"(perfil '{profile.name}', {profile.compute_type})...")
+            return ctranslate2.Translator(
+                model_path,
+                device=argostranslate.settings.device,
+                compute_type=profile.compute_type,
+                inter_threads=profile.inter_threads,
+                intra_threads=profile.intra_threads,
+            )
+
+        return self._model_pool.acquire(translation, profile.model_variant, pair_key, model_path, load_model)
+
+
+    def warm_up(self, source_code: str, target_code: str, profile: Optional[str] = None) -> bool:
+        """
+        Resuelve la traducción del par, carga su modelo (en la variante del perfil) y decodifica
+        una oración corta para que CTranslate2 reserve sus buffers. Ver ITranslator.warm_up.
+        El resultado no se guarda en la caché de oraciones.
+        """
+        try:
+            start_time = time.perf_counter()
+            translation = self._get_translation(source_code, target_code)
+            self._decode_sentences(translation, ["Hello."], self._resolve_profile(profile))
+            elapsed_ms = (time.perf_counter() - start_time) * 1000
+            print(f"Infrastructure Layer (ArgosTranslator): Modelo {source_code}->{target_code} precargado en {elapsed_ms:.0f} ms.")
+            return True
+        except Exception as e:
+            print(f"Infrastructure Layer (ArgosTranslator): No se pudo precargar el modelo {source_code}->{target_code}: {e}")
+            return False
+
+
+    def get_model_memory_stats(self) -> Dict[str, Dict[str, float]]:
+        """
+        Obtiene el coste en memoria de cada modelo cargado. Ver ITranslator.get_model_memory_stats.
+        """
+        return self._model_pool.get_stats()
+
+
+    def get_sentence_cache_stats(self) -> Dict[str, Dict[str, int]]:
+        """
+        Obtiene las estadísticas por par de la caché de oraciones (vacío si está deshabilitada).
+        """
+        if self._sentence_cache is None:
+            return {}
+        return self._sentence_cache.get_stats()
+
+
+    def _get_package_versions(self) -> Dict[Tuple[str, str], str]:
+        """
+        Obtiene (y memoriza) las versiones de los paquetes instalados indexadas por par de idiomas.
+        """
+        with self._package_versions_lock:
+            if self._package_versions is None:
+                versions: Dict[Tuple[str, str], str] = {}
+                try:
+                    for pkg in argostranslate.package.get_installed_packages():
+                        versions[(pkg.from_code, pkg.to_code)] = str(getattr(pkg, "package_version", "") or "")
+                except Exception as e:
+                    print(f"Infrastructure Layer (ArgosTranslator): Error al obtener versiones de paquetes instalados: {e}")
+                self._package_versions = versions
+            return self._package_versions
+
+
+    def get_translation_pairs(self) -> List[Tuple[str, str]]:
+        """
+        Obtiene los pares con paquete instalado (traducción directa).
+        Los pares por pivote los deduce la capa de Aplicación.
+        """
+        return list(self._get_package_versions().keys())
+
+
+    def get_model_version(self, source_code: str, target_code: str) -> str:
+        """
+        Obtiene un identificador de los paquetes usados para traducir el par indicado.
+        Para pares sin paquete directo se combina la versión de los dos paquetes del pivote,
+        igual que hace argostranslate al componer traducciones.
+
+        Returns:
+            Un string como "en_es-1.0", "es_en-1.9+en_de-1.0", o cadena vacía si no hay paquete.
+        """
+        versions = self._get_package_versions()
+        direct_version = versions.get((source_code, target_code))
+        if direct_version is not None:
+            return f"{source_code}_{target_code}-{direct_version}"
+
+        for (from_code, pivot_code), first_version in versions.items():
+            if from_code != source_code:
+                continue
+            second_version = versions.get((pivot_code, target_code))
+            if second_version is not None:
+                return f"{source_code}_{pivot_code}-{first_version}+{pivot_code}_{target_code}-{second_version}"
+        return ""
+
+
+    def on_packages_changed(self):
+        """
+        Descarta la información derivada de los paquetes instalados.
+        Ver ITranslator.on_packages_changed.
+        """
+        print("Infrastructure Layer (ArgosTranslator): Paquetes modificados. Descartando versiones memorizadas.")
+        with self._package_versions_lock:
+            self._package_versions = None
+        with self._translations_lock:
+            self._translations.clear()
+            self._installed_argos_languages = None
+        # Los objetos de traducción descartados ya no deben retener modelos en el pool
+        self._model_pool.clear()
+        if self._sentence_cache is not None:
+            self._sentence_cache.clear()
@@ -0,0 +1,67 @@
+# src/infrastructure/batch_journal.py
+
+import json
+import os
+import threading
+import time
+from typing import Any, Dict, Iterator, Set, Tuple
+
+
+class JsonlBatchJournal:
+    """
+    Diario de solo anexado (una línea JSON por evento) de un trabajo de traducción por lotes.
+    Esta clase reside en la capa de Infraestructura. Cada evento se escribe y se sincroniza
+    con el disco antes de continuar, de modo que tras un cierre inesperado el trabajo se
+    reanuda desde el último archivo terminado. Una última línea incompleta se ignora al leer.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+
+    def append(self, event: str, **fields: Any):
+        """Anexa un evento con la hora actual y los campos indicados."""
+        entry = {"time": time.time(), "event": event, **fields}
+        line = json.dumps(entry, ensure_ascii=False) + "\n"
+        with self._lock:
+            journal_dir = os.path.dirname(self.path)
+            if journal_dir:
+                os.makedirs(journal_dir, exist_ok=True)
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(line)
+                f.flush()
+                os.fsync(f.fileno())
+
+    def _read_entries(self) -> Iterator[Dict[str, Any]]:
+        """Lee los eventos del diario en orden, ignorando las líneas incompletas o inválidas."""
+        if not os.path.exists(self.path):
+            return
+        with self._lock, open(self.path, "r", encoding="utf-8") as f:
+            for line_number, line in enumerate(f, start=1):
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError:
+                    print(f"Infrastructure Layer (JsonlBatchJournal): Línea {line_number} del diario ignorada (incompleta o inválida).")
+
+    def load_completed(self) -> Dict[Tuple[str, str, str], Dict[str, Any]]:
+        """
+        Lee el diario y retorna el último evento "done" de cada (archivo, origen, destino).
+        Un evento "failed" posterior para el mismo archivo anula el "done" anterior.
+        """
+        completed: Dict[Tuple[str, str, str], Dict[str, Any]] = {}
+        for entry in self._read_entries():
+            if entry.get("event") not in ("done", "failed"):
+                continue
+            key = (entry.get("file", ""), entry.get("source", ""), entry.get("target", ""))
+            if entry["event"] == "done":
+                completed[key] = entry
+            else:
+                completed.pop(key, None)
+        return completed
+
+    def load_output_paths(self) -> Set[str]:
+        """
+        Retorna las rutas de salida de todos los eventos "done" del diario, de cualquier par de idiomas
+        y aunque un fallo posterior anulara el evento: el archivo escrito sigue siendo una traducción.
+        """
+        return {entry["output"] for entry in self._read_entries() if entry.get("event") == "done" and entry.get("output")}
@@ -0,0 +1,47 @@
+# src/infrastructure/compute_profiles.py
+
+from typing import Dict, NamedTuple, Optional
+
+from src.domain.models import PROFILE_FAST, PROFILE_BALANCED, PROFILE_QUALITY
+
+
+class ComputeProfile(NamedTuple):
+    """
+    Parámetros de CTranslate2 asociados a un perfil de rendimiento.
+    compute_type, inter_threads e intra_threads se fijan al cargar el modelo;
+    beam_size se aplica en cada llamada de decodificación.
+    """
+    name: str
+    compute_type: str   # "int8", "int8_float32", "float32", ... (ver ctranslate2.Translator)
+    inter_threads: int  # Lotes decodificados en paralelo
+    intra_threads: int  # Hilos por lote (0 = valor por defecto de CTranslate2)
+    beam_size: int      # 1 = decodificación voraz (greedy)
+
+    @property
+    def model_variant(self) -> str:
+        """Identifica la configuración de carga del modelo: perfiles con la misma variante comparten modelo."""
+        return f"{self.compute_type}/{self.inter_threads}/{self.intra_threads}"
+
+
+# Perfiles predefinidos:
+#  - fast: int8 y decodificación voraz, para ventanas emergentes de baja latencia (hotkey, OCR).
+#  - balanced: int8 con beam corto; valor por defecto.
+#  - quality: float32 y el beam que usa argostranslate por defecto, para traducir archivos.
+COMPUTE_PROFILES: Dict[str, ComputeProfile] = {
+    PROFILE_FAST: ComputeProfile(PROFILE_FAST, "int8", 1, 0, 1),
+    PROFILE_BALANCED: ComputeProfile(PROFILE_BALANCED, "int8", 1, 0, 2),
+    PROFILE_QUALITY: ComputeProfile(PROFILE_QUALITY, "float32", 2, 0, 4),
+}
+
+DEFAULT_PROFILE_NAME = PROFILE_BALANCED
+
+
+def get_compute_profile(name: Optional[str], default_name: str = DEFAULT_PROFILE_NAME) -> ComputeProfile:
+    """
+    Retorna el perfil con el nombre indicado. Si el nombre es None o desconocido se usa default_name.
+    """
+    if name and name in COMPUTE_PROFILES:
+        return COMPUTE_PROFILES[name]
+    if name:
+        print(f"Infrastructure Layer (ComputeProfiles): Advertencia: Perfil '{name}' desconocido. Se usará '{default_name}'.")
+    return COMPUTE_PROFILES.get(default_name, COMPUTE_PROFILES[DEFAULT_PROFILE_NAME])
@@ -0,0 +1,82 @@
+# src/infrastructure/document_io.py
+
+import os
+from typing import List
+
+# python-docx es opcional: sin ella solo se procesan archivos .txt
+try:
+    from docx import Document
+except ImportError:
+    Document = None
+
+# Extensiones de documento que se pueden leer y escribir
+SUPPORTED_EXTENSIONS = (".txt", ".docx")
+
+
+def is_supported_document(path: str) -> bool:
+    """Indica si la extensión del archivo es una de SUPPORTED_EXTENSIONS (y python-docx está disponible para .docx)."""
+    extension = os.path.splitext(path)[1].lower()
+    if extension == ".docx":
+        return Document is not None
+    return extension in SUPPORTED_EXTENSIONS
+
+
+def read_paragraphs(path: str) -> List[str]:
+    """
+    Lee los párrafos de un documento: las líneas de un .txt o los párrafos de un .docx.
+    Los párrafos vacíos se conservan para mantener la estructura al escribir la traducción.
+
+    Raises:
+        ValueError: Si la extensión no está soportada.
+        RuntimeError: Si el archivo es .docx y python-docx no está instalada.
+        OSError: Si no se puede leer el archivo.
+    """
+    extension = os.path.splitext(path)[1].lower()
+    if extension == ".txt":
+        with open(path, "r", encoding="utf-8") as f:
+            return f.read().split("\n")
+    if extension == ".docx":
+        if Document is None:
+            raise RuntimeError("Para leer archivos .docx, instala la biblioteca 'python-docx' (`pip install python-docx`).")
+        return [paragraph.text for paragraph in Document(path).paragraphs]
+    raise ValueError(f"Extensión de archivo no soportada: {extension}")
+
+
+def write_paragraphs(source_path: str, output_path: str, paragraphs: List[str]):
+    """
+    Escribe los párrafos traducidos en output_path con el formato de source_path.
+    En un .docx se parte del documento original y se reemplaza el texto de cada párrafo, de modo
+    que se conservan los estilos de párrafo (no el formato de cada fragmento). La escritura es
+    atómica: se escribe un archivo temporal que luego reemplaza al destino, para que una
+    interrupción nunca deje un resultado a medias.
+
+    Raises:
+        ValueError: Si la extensión no está soportada o el número de párrafos no coincide con el original (.docx).
+        RuntimeError: Si el archivo es .docx y python-docx no está instalada.
+        OSError: Si no se puede escribir el archivo.
+    """
+    extension = os.path.splitext(source_path)[1].lower()
+    output_dir = os.path.dirname(output_path)
+    if output_dir:
+        os.makedirs(output_dir, exist_ok=True)
+    temp_path = f"{output_path}.tmp"
+    try:
+        if extension == ".txt":
+            with open(temp_path, "w", encoding="utf-8") as f:
+                f.write("\n".join(paragraphs))
+        elif extension == ".docx":
+            if Document is None:
+                raise RuntimeError("Para escribir archivos .docx, instala la biblioteca 'python-docx' (`pip install python-docx`).")
+            document = Document(source_path)
+            if len(document.paragraphs) != len(paragraphs):
+                raise ValueError(f"Se esperaban {len(document.paragraphs)} párrafos y se recibieron {len(paragraphs)}.")
+            for paragraph, text in zip(document.paragraphs, paragraphs):
+                if paragraph.text != text:
+                    paragraph.text = text
+            document.save(temp_path)
+        else:
+            raise ValueError(f"Extensión de archivo no soportada: {extension}")
+        os.replace(temp_path, output_path)
+    finally:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
@@ -0,0 +1,253 @@
+# src/infrastructure/image_preprocessing.py
+
+import time
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+import numpy as np
+from PIL import Image
+
+# Importar la interfaz de la capa de Dominio
+from src.domain.interfaces import IOCRService
+
+# Pasos del preprocesado, en el orden en que se aplican
+PREPROCESSING_STEPS = ("grayscale", "invert", "scale", "deskew", "binarize")
+# Límites del factor de escala, para que una estimación errónea de la altura x no dispare el tamaño
+_MIN_SCALE = 0.5
+_MAX_SCALE = 4.0
+# Factores de escala cercanos a 1 no compensan el coste de redimensionar
+_SCALE_TOLERANCE = 0.15
+# Relación aproximada entre la altura de una línea con tinta (ascendentes + descendentes) y su altura x
+_X_HEIGHT_PER_LINE_HEIGHT = 0.5
+# Puntos de tinta muestreados para estimar la inclinación
+_DESKEW_MAX_POINTS = 20000
+# Muestras de tiempo guardadas por paso para las estadísticas
+_STATS_SAMPLES = 256
+
+
+class ImagePreprocessor:
+    """
+    Prepara capturas de pantalla para Tesseract con operaciones vectorizadas de NumPy:
+    escala de grises, inversión automática de temas oscuros, escalado a una altura x objetivo,
+    enderezado opcional y binarización adaptativa (media local con imagen integral).
+    Esta clase reside en la capa de Infraestructura y no guarda estado entre llamadas.
+    """
+
+    def __init__(self, auto_invert: bool = True, target_x_height: int = 20,
+                 deskew: bool = False, max_deskew_degrees: float = 5.0,
+                 binarize: bool = True, binarize_sensitivity: float = 0.15):
+        """
+        Args:
+            auto_invert: Invierte la imagen si el fondo es oscuro (Tesseract espera texto oscuro sobre fondo claro).
+            target_x_height: Altura x en píxeles a la que se escala el texto (0 = no escalar).
+            deskew: Corrige la inclinación del texto (útil en fotos o capturas giradas, no en la pantalla normal).
+            max_deskew_degrees: Ángulo máximo buscado al enderezar.
+            binarize: Aplica la binarización adaptativa.
+            binarize_sensitivity: Fracción por debajo de la media local a partir de la cual un píxel es tinta.
+        """
+        self.auto_invert = auto_invert
+        self.target_x_height = max(0, target_x_height)
+        self.deskew = deskew
+        self.max_deskew_degrees = max_deskew_degrees
+        self.binarize = binarize
+        self.binarize_sensitivity = binarize_sensitivity
+
+    def process(self, image: Image.Image) -> Tuple[Image.Image, Dict[str, float]]:
+        """
+        Aplica los pasos habilitados.
+
+        Args:
+            image: La captura (PIL.Image.Image en cualquier modo).
+
+        Returns:
+            (imagen en modo "L" lista para el OCR, milisegundos de cada paso ejecutado).
+        """
+        timings: Dict[str, float] = {}
+        start = time.perf_counter()
+
+        def lap(step: str):
+            nonlocal start
+            now = time.perf_counter()
+            timings[step] = (now - start) * 1000
+            start = now
+
+        pixels = np.asarray(image.convert("L"), dtype=np.uint8)
+        lap("grayscale")
+
+        if self.auto_invert and self._is_dark_background(pixels):
+            pixels = 255 - pixels
+            lap("invert")
+
+        if self.target_x_height:
+            scale = self._get_scale_factor(pixels)
+            if scale is not None:
+                size = (max(1, round(pixels.shape[1] * scale)), max(1, round(pixels.shape[0] * scale)))
+                resample = Image.LANCZOS if scale > 1 else Image.BOX
+                pixels = np.asarray(Image.fromarray(pixels).resize(size, resample), dtype=np.uint8)
+            lap("scale")
+
+        if self.deskew:
+            angle = self._estimate_skew_degrees(pixels)
+            if angle:
+                rotated = Image.fromarray(pixels).rotate(angle, resample=Image.BICUBIC, expand=True, fillcolor=255)
+                pixels = np.asarray(rotated, dtype=np.uint8)
+            lap("deskew")
+
+        if self.binarize:
+            pixels = self._binarize_adaptive(pixels)
+            lap("binarize")
+
+        return Image.fromarray(pixels), timings
+
+    @staticmethod
+    def _is_dark_background(pixels: np.ndarray) -> bool:
+        """El fondo es la mayoría de los píxeles: si la mediana (de una muestra) es oscura, el tema es oscuro."""
+        return float(np.median(pixels[::4, ::4])) < 128
+
+    @staticmethod
+    def _ink_mask(pixels: np.ndarray) -> np.ndarray:
+        """
+        Máscara aproximada de tinta (texto oscuro) con un umbral global a medio camino entre el fondo
+        (la mediana) y el píxel más oscuro; el texto suele ocupar muy pocos píxeles de la captura.
+        """
+        darkest = int(pixels.min())
+        background = float(np.median(pixels[::2, ::2]))
+        if background - darkest < 32:
+            # Imagen casi uniforme: no hay texto que medir
+            return np.zeros(pixels.shape, dtype=bool)
+        return pixels < (darkest + background) / 2
+
+    def _get_scale_factor(self, pixels: np.ndarray) -> Optional[float]:
+        """
+        Estima la altura x con el perfil horizontal de tinta: cada tramo de filas con tinta es una línea
+        de texto y la altura x es aproximadamente la mitad de la mediana de sus alturas.
+
+        Returns:
+            El factor de escala, o None si no hay texto medible o el factor está cerca de 1.
+        """
+        rows_with_ink = self._ink_mask(pixels).any(axis=1)
+        # Inicio y fin de cada tramo de filas consecutivas con tinta
+        edges = np.diff(np.concatenate(([0], rows_with_ink.astype(np.int8), [0])))
+        starts = np.flatnonzero(edges == 1)
+        ends = np.flatnonzero(edges == -1)
+        heights = ends - starts
+        heights = heights[heights >= 3]  # Ignorar ruido y líneas separadoras
+        if heights.size == 0:
+            return None
+        x_height = float(np.median(heights)) * _X_HEIGHT_PER_LINE_HEIGHT
+        scale = min(_MAX_SCALE, max(_MIN_SCALE, self.target_x_height / x_height))
+        if abs(scale - 1) < _SCALE_TOLERANCE:
+            return None
+        return scale
+
+    def _estimate_skew_degrees(self, pixels: np.ndarray) -> float:
+        """
+        Busca el ángulo cuyo perfil de proyección de la tinta es más pronunciado (líneas de texto
+        concentradas en pocas filas). Se proyecta una muestra de puntos de tinta para cada ángulo
+        candidato en vez de rotar la imagen completa.
+
+        Returns:
+            Grados a rotar en sentido antihorario (convención de PIL) para enderezar, o 0.
+        """
+        ys, xs = np.nonzero(self._ink_mask(pixels))
+        if ys.size < 50:
+            return 0.0
+        if ys.size > _DESKEW_MAX_POINTS:
+            picks = np.random.default_rng(0).choice(ys.size, _DESKEW_MAX_POINTS, replace=False)
+            ys, xs = ys[picks], xs[picks]
+        angles = np.arange(-self.max_deskew_degrees, self.max_deskew_degrees + 0.25, 0.25)
+        # Fila de cada punto al deshacer una inclinación de cada ángulo (matriz ángulos x puntos)
+        rows = ys[None, :] - xs[None, :] * np.tan(np.radians(angles))[:, None]
+        rows = np.round(rows - rows.min()).astype(np.int64)
+        width = int(rows.max()) + 1
+        offsets = np.arange(len(angles))[:, None] * width
+        counts = np.bincount((rows + offsets).ravel(), minlength=len(angles) * width).reshape(len(angles), width)
+        scores = (counts.astype(np.float64) ** 2).sum(axis=1)
+        best = float(angles[int(np.argmax(scores))])
+        # En coordenadas de imagen (y hacia abajo) el ángulo que aplana las líneas coincide con el que espera Image.rotate
+        return best if abs(best) >= 0.5 else 0.0
+
+    def _binarize_adaptive(self, pixels: np.ndarray) -> np.ndarray:
+        """
+        Binarización de Bradley: un píxel es tinta si es más oscuro que la media de su vecindario menos
+        una fracción. Las medias locales se obtienen en O(1) por píxel con una imagen integral.
+        La ventana es proporcional a la altura x objetivo, o a 1/8 del ancho si no se escala.
+        """
+        height, width = pixels.shape
+        window = 2 * self.target_x_height if self.target_x_height else width // 8
+        half = max(7, window) // 2
+        y0 = np.clip(np.arange(height) - half, 0, height)
+        y1 = np.clip(np.arange(height) + half + 1, 0, height)
+        x0 = np.clip(np.arange(width) - half, 0, width)
+        x1 = np.clip(np.arange(width) + half + 1, 0, width)
+        # Sumas de la ventana separadas por ejes: primero columnas y después filas de la imagen integral.
+        # int32 basta mientras la suma de toda la imagen quepa (hasta unos 8 megapíxeles)
+        dtype = np.int32 if height * width * 255 < 2 ** 31 else np.int64
+        integral = np.zeros((height + 1, width), dtype=dtype)
+        np.cumsum(pixels, axis=0, dtype=dtype, out=integral[1:])
+        column_sums = integral[y1] - integral[y0]
+        integral = np.zeros((height, width + 1), dtype=dtype)
+        np.cumsum(column_sums, axis=1, out=integral[:, 1:])
+        sums = integral[:, x1] - integral[:, x0]
+        areas = (y1 - y0)[:, None] * (x1 - x0)[None, :]
+        ink = pixels * areas < sums * (1.0 - self.binarize_sensitivity)
+        return np.where(ink, 0, 255).astype(np.uint8)
+
+
+class PreprocessingOCRService(IOCRService):
+    """
+    Decorador de IOCRService que preprocesa la imagen con ImagePreprocessor antes de pasarla
+    al servicio OCR real, y guarda el tiempo de cada paso (y del OCR) para get_stats().
+    Esta clase reside en la capa de Infraestructura.
+    """
+
+    def __init__(self, ocr_service: IOCRService, preprocessor: Optional[ImagePreprocessor] = None):
+        self.ocr_service = ocr_service
+        self.preprocessor = preprocessor or ImagePreprocessor()
+        self._samples: Dict[str, Deque[float]] = {
+            step: deque(maxlen=_STATS_SAMPLES) for step in PREPROCESSING_STEPS + ("ocr",)
+        }
+
+    def extract_text_from_image_data(self, image_data: Any, language: Optional[str] = None,
+                                     profile: Optional[str] = None) -> str:
+        """
+        Preprocesa la imagen y extrae su texto con el servicio OCR decorado.
+        Si el preprocesado falla se reconoce la imagen original.
+        """
+        if not isinstance(image_data, Image.Image):
+            return self.ocr_service.extract_text_from_image_data(image_data, language, profile)
+        try:
+            prepared, timings = self.preprocessor.process(image_data)
+        except Exception as e:
+            print(f"Infrastructure Layer (PreprocessingOCRService): Error en el preprocesado, se usa la imagen original: {e}")
+            prepared, timings = image_data, {}
+
+        start = time.perf_counter()
+        text = self.ocr_service.extract_text_from_image_data(prepared, language, profile)
+        timings["ocr"] = (time.perf_counter() - start) * 1000
+
+        for step, milliseconds in timings.items():
+            self._samples[step].append(milliseconds)
+        steps = ", ".join(f"{step} {milliseconds:.1f}" for step, milliseconds in timings.items())
+        print(f"Infrastructure Layer (PreprocessingOCRService): {image_data.size} -> {prepared.size}; ms: {steps}")
+        return text
+
+    def get_stats(self) -> Dict[str, Dict[str, float]]:
+        """Por paso (y "ocr"): número de muestras recientes, media y p95 en milisegundos."""
+        stats = {}
+        for step, samples in self._samples.items():
+            if not samples:
+                continue
+            ordered: List[float] = sorted(samples)
+            stats[step] = {
+                "count": len(ordered),
+                "mean_ms": sum(ordered) / len(ordered),
+                "p95_ms": ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))],
+            }
+        return stats
+
+    def close(self):
+        """Cierra el servicio decorado si tiene recursos que liberar."""
+        close = getattr(self.ocr_service, "close", None)
+        if close is not None:
+            close()
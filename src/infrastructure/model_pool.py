@@ -0,0 +1,236 @@
+# src/infrastructure/model_pool.py
+
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, Optional, Tuple
+
+# Intervalo máximo entre revisiones de modelos inactivos (segundos).
+_MAX_IDLE_CHECK_INTERVAL_SECONDS = 60.0
+
+
+def estimate_model_size_bytes(model_path: str) -> int:
+    """
+    Estima la memoria que ocupa un modelo CTranslate2 a partir del tamaño de sus archivos.
+    En CPU los pesos se cargan completos en RAM, así que el tamaño en disco es una buena aproximación.
+    """
+    total = 0
+    for root, _, files in os.walk(model_path):
+        for file_name in files:
+            try:
+                total += os.path.getsize(os.path.join(root, file_name))
+            except OSError:
+                pass
+    return total
+
+
+class _PoolEntry:
+    """Estado de un modelo registrado en el pool."""
+
+    def __init__(self, pair_key: str, owner: Any, cost_bytes: int):
+        self.pair_key = pair_key
+        self.owner = owner # Objeto de traducción de argostranslate al que pertenece el modelo
+        self.cost_bytes = cost_bytes
+        self.model: Any = None
+        self.loaded = False
+        self.last_used = 0.0
+        self.loads = 0
+        self.evictions = 0
+        self.idle_unloads = 0
+        self.last_load_ms = 0.0
+
+
+class ModelPool:
+    """
+    Pool de modelos CTranslate2 cargados en memoria, con un presupuesto de RAM.
+    Esta clase reside en la capa de Infraestructura y la usa ArgosTranslator internamente.
+
+    Cada modelo pertenece a un objeto de traducción de argostranslate y a una variante de carga
+    (tipo de cómputo e hilos, ver ComputeProfile.model_variant): un mismo paquete puede estar
+    cargado con varias variantes, y cada una cuenta por separado en el presupuesto.
+    Descargar un modelo consiste en soltar su referencia: si otro hilo lo está usando,
+    la memoria se libera cuando termina. La próxima solicitud lo vuelve a cargar.
+
+    - Si cargar un modelo supera el presupuesto, se descargan los menos usados recientemente.
+    - Los modelos sin uso durante idle_timeout_seconds se descargan en segundo plano.
+    """
+
+    def __init__(self, max_memory_bytes: int = 0, idle_timeout_seconds: float = 0):
+        """
+        Constructor del pool.
+
+        Args:
+            max_memory_bytes: Presupuesto de memoria para los modelos cargados. 0 = sin límite.
+            idle_timeout_seconds: Segundos sin uso tras los que se descarga un modelo. 0 = nunca.
+        """
+        self.max_memory_bytes = max(0, max_memory_bytes)
+        self.idle_timeout_seconds = max(0.0, idle_timeout_seconds)
+        self._entries: Dict[Tuple[int, str], _PoolEntry] = {} # Indexado por (id() del propietario, variante)
+        self._lock = threading.Lock()
+        self._load_lock = threading.Lock() # Serializa las cargas para no superar el presupuesto en paralelo
+        self._stop_event = threading.Event()
+        self._idle_thread: Optional[threading.Thread] = None
+
+        if self.idle_timeout_seconds > 0:
+            self._idle_thread = threading.Thread(target=self._idle_unload_loop, daemon=True)
+            self._idle_thread.start()
+
+        budget = f"{self.max_memory_bytes / (1024 * 1024):.0f} MB" if self.max_memory_bytes else "sin límite"
+        idle = f"{self.idle_timeout_seconds:.0f} s" if self.idle_timeout_seconds else "nunca"
+        print(f"Infrastructure Layer (ModelPool): Inicializado. Presupuesto: {budget}. Descarga por inactividad: {idle}.")
+
+    def acquire(self, owner: Any, variant: str, pair_key: str, model_path: str, loader: Callable[[], Any]) -> Any:
+        """
+        Obtiene el modelo de un objeto de traducción en la variante indicada,
+        cargándolo con loader() si no está en memoria.
+
+        Args:
+            owner: Objeto de traducción de argostranslate al que pertenece el modelo.
+            variant: Variante de carga (por ejemplo "int8/1/0"). Cadena vacía si no aplica.
+            pair_key: Identificador legible del par (por ejemplo "en->es") para estadísticas.
+            model_path: Carpeta del modelo, usada para estimar su coste en memoria.
+            loader: Función que carga y retorna el modelo.
+
+        Returns:
+            El modelo cargado.
+        """
+        key = (id(owner), variant)
+        entry = self._touch(key, owner)
+        if entry is not None:
+            return entry.model
+
+        with self._load_lock:
+            entry = self._touch(key, owner)
+            if entry is not None:
+                return entry.model
+
+            with self._lock:
+                entry = self._entries.get(key)
+            if entry is None or entry.owner is not owner:
+                label = f"{pair_key} [{variant}]" if variant else pair_key
+                entry = _PoolEntry(label, owner, estimate_model_size_bytes(model_path))
+            # Liberar espacio antes de cargar, para no tener el modelo nuevo y los desalojados a la vez
+            self._evict_for(entry)
+
+            start_time = time.perf_counter()
+            model = loader()
+            entry.last_load_ms = (time.perf_counter() - start_time) * 1000
+            entry.loads += 1
+
+            with self._lock:
+                entry.model = model
+                entry.loaded = True
+                entry.last_used = time.monotonic()
+                self._entries[key] = entry
+                total_bytes = self._loaded_bytes()
+            print(f"Infrastructure Layer (ModelPool): Modelo {entry.pair_key} cargado "
+                  f"({entry.cost_bytes / (1024 * 1024):.1f} MB, {entry.last_load_ms:.0f} ms). "
+                  f"Total en memoria: {total_bytes / (1024 * 1024):.1f} MB.")
+            return model
+
+    def _touch(self, key: Tuple[int, str], owner: Any) -> Optional[_PoolEntry]:
+        """Marca como usado un modelo. Retorna su entrada si está cargado."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry.owner is not owner or not entry.loaded:
+                return None
+            entry.last_used = time.monotonic()
+            return entry
+
+    def _loaded_bytes(self) -> int:
+        """Suma del coste de los modelos cargados. Requiere el lock."""
+        return sum(entry.cost_bytes for entry in self._entries.values() if entry.loaded)
+
+    def _evict_for(self, incoming: _PoolEntry):
+        """Descarga modelos (el menos usado primero) hasta que quepa incoming en el presupuesto."""
+        if not self.max_memory_bytes:
+            return
+        with self._lock:
+            loaded = sorted(
+                (entry for entry in self._entries.values() if entry.loaded and entry is not incoming),
+                key=lambda entry: entry.last_used
+            )
+            total_bytes = self._loaded_bytes()
+            for entry in loaded:
+                if total_bytes + incoming.cost_bytes <= self.max_memory_bytes:
+                    break
+                self._unload(entry)
+                entry.evictions += 1
+                total_bytes -= entry.cost_bytes
+                print(f"Infrastructure Layer (ModelPool): Modelo {entry.pair_key} desalojado por presupuesto de memoria.")
+        if total_bytes + incoming.cost_bytes > self.max_memory_bytes:
+            print(f"Infrastructure Layer (ModelPool): Advertencia: El modelo {incoming.pair_key} "
+                  f"({incoming.cost_bytes / (1024 * 1024):.1f} MB) no cabe en el presupuesto. Se carga igualmente.")
+
+    @staticmethod
+    def _unload(entry: _PoolEntry):
+        """Suelta la referencia al modelo. Requiere el lock."""
+        entry.loaded = False
+        entry.model = None
+
+    def _idle_unload_loop(self):
+        """Hilo daemon que descarga periódicamente los modelos inactivos."""
+        interval = min(_MAX_IDLE_CHECK_INTERVAL_SECONDS, max(1.0, self.idle_timeout_seconds / 2))
+        while not self._stop_event.wait(interval):
+            self.unload_idle()
+
+    def unload_idle(self) -> int:
+        """
+        Descarga los modelos que llevan más de idle_timeout_seconds sin usarse.
+
+        Returns:
+            El número de modelos descargados.
+        """
+        if not self.idle_timeout_seconds:
+            return 0
+        now = time.monotonic()
+        unloaded = 0
+        with self._lock:
+            for entry in self._entries.values():
+                if entry.loaded and now - entry.last_used > self.idle_timeout_seconds:
+                    self._unload(entry)
+                    entry.idle_unloads += 1
+                    unloaded += 1
+                    print(f"Infrastructure Layer (ModelPool): Modelo {entry.pair_key} descargado por inactividad.")
+        return unloaded
+
+    def clear(self):
+        """
+        Descarga todos los modelos y olvida sus entradas (por ejemplo, tras cambiar los paquetes instalados).
+        """
+        with self._lock:
+            for entry in self._entries.values():
+                if entry.loaded:
+                    self._unload(entry)
+            self._entries.clear()
+
+    def stop(self):
+        """
+        Detiene el hilo de descarga por inactividad.
+        """
+        self._stop_event.set()
+
+    def get_stats(self) -> Dict[str, Dict[str, float]]:
+        """
+        Obtiene el coste en memoria y el uso de cada modelo, más un total en la clave "total".
+        Los modelos de un pivote aparecen por separado (por ejemplo "es->en [int8/1/0]" y "en->de [int8/1/0]").
+        """
+        now = time.monotonic()
+        with self._lock:
+            stats: Dict[str, Dict[str, float]] = {}
+            for entry in self._entries.values():
+                stats[entry.pair_key] = {
+                    "loaded": entry.loaded,
+                    "cost_bytes": entry.cost_bytes,
+                    "idle_seconds": now - entry.last_used if entry.loaded else 0.0,
+                    "loads": entry.loads,
+                    "evictions": entry.evictions,
+                    "idle_unloads": entry.idle_unloads,
+                    "last_load_ms": entry.last_load_ms,
+                }
+            stats["total"] = {
+                "loaded_models": sum(1 for entry in self._entries.values() if entry.loaded),
+                "loaded_bytes": self._loaded_bytes(),
+                "max_memory_bytes": self.max_memory_bytes,
+            }
+            return stats
@@ -0,0 +1,26 @@
+# src/infrastructure/null_hotkey_manager.py
+
+from typing import Callable
+
+# Importar la interfaz de la capa de Dominio
+from src.domain.interfaces import IHotkeyManager
+
+
+class NullHotkeyManager(IHotkeyManager):
+    """
+    Implementación de IHotkeyManager que no registra ninguna hotkey.
+    Se usa en los procesos sin interfaz gráfica (servidor HTTP, línea de comandos), donde no hay
+    un escritorio que monitorear y no debe importarse la biblioteca keyboard.
+    """
+
+    def register_hotkey(self, hotkey: str, callback: Callable[[], None]):
+        print(f"Infrastructure Layer (NullHotkeyManager): Hotkey '{hotkey}' ignorada (modo sin interfaz gráfica).")
+
+    def unregister_hotkey(self, hotkey: str):
+        pass
+
+    def start_listening(self):
+        pass
+
+    def stop_listening(self):
+        pass
@@ -0,0 +1,184 @@
+# src/infrastructure/ocr_result_cache.py
+
+import json
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+from PIL import Image
+
+# Importar la interfaz de la capa de Dominio
+from src.domain.interfaces import IOCRResultCache
+
+# Tamaño de la cuadrícula de la huella (difference hash): HASH_WIDTH x HASH_HEIGHT bits.
+# Es mucho más fina que el dHash clásico de 8x8 porque dos capturas de texto distintas comparten casi
+# todo el diseño: con 32x16, "Level 3" y "Level 8" difieren en un solo bit; con 64x32, en tres
+HASH_WIDTH = 64
+HASH_HEIGHT = 32
+# Cada cuántas entradas nuevas se escribe el archivo de la caché persistente
+_SAVE_EVERY_STORES = 20
+_FILE_VERSION = 1
+
+
+class PerceptualHashOCRCache(IOCRResultCache):
+    """
+    Implementación de IOCRResultCache en memoria, con desalojo LRU y persistencia opcional en un archivo JSON.
+    Esta clase reside en la capa de Infraestructura.
+
+    La clave de cada imagen combina la configuración del OCR (motor y preprocesado), el idioma y perfil
+    de la llamada, el tamaño de la captura y un difference hash de su versión en escala de grises.
+    Una captura con la misma clave es un acierto directo; si max_distance > 0, también lo es una captura del mismo tamaño cuya huella
+    difiere en como mucho max_distance bits (parpadeo del cursor, ruido de compresión, animaciones).
+    """
+
+    def __init__(self, settings_key: str = "", max_entries: int = 256, max_distance: int = 0,
+                 file_path: Optional[str] = None):
+        """
+        Args:
+            settings_key: Descripción de la configuración del OCR. Un cambio de configuración invalida las entradas.
+            max_entries: Máximo de imágenes guardadas; al superarlo sale la menos usada.
+            max_distance: Distancia de Hamming máxima (en bits, de HASH_WIDTH * HASH_HEIGHT) para considerar
+                          dos capturas casi idénticas. 0 = solo capturas idénticas.
+            file_path: Archivo JSON donde se persiste la caché entre sesiones (None = solo en memoria).
+        """
+        self.settings_key = settings_key
+        self.max_entries = max(1, max_entries)
+        self.max_distance = max(0, max_distance)
+        self.file_path = file_path
+        # Clave de imagen -> {"text": str, "translations": {"origen->destino": str}}, en orden LRU
+        self._entries: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "near_hits": 0, "misses": 0, "translation_hits": 0}
+        self._unsaved_stores = 0
+        if file_path:
+            self._load()
+        print(f"Infrastructure Layer (PerceptualHashOCRCache): Inicializada con {len(self._entries)} entradas "
+              f"(máximo {self.max_entries}, distancia máxima {self.max_distance} bits).")
+
+    def get_image_key(self, image_data: Any, context: str = "") -> Optional[str]:
+        """
+        Clave "configuración|contexto|ancho x alto|huella". Ver IOCRResultCache.get_image_key.
+        """
+        if not isinstance(image_data, Image.Image):
+            return None
+        # Difference hash: cada bit indica si un píxel de la miniatura es más claro que su vecino derecho
+        thumbnail = image_data.convert("L").resize((HASH_WIDTH + 1, HASH_HEIGHT), Image.BOX)
+        pixels = list(thumbnail.getdata())
+        bits = 0
+        for row in range(HASH_HEIGHT):
+            offset = row * (HASH_WIDTH + 1)
+            for column in range(HASH_WIDTH):
+                bits = (bits << 1) | (pixels[offset + column] > pixels[offset + column + 1])
+        width, height = image_data.size
+        return f"{self.settings_key}|{context}|{width}x{height}|{bits:0{HASH_WIDTH * HASH_HEIGHT // 4}x}"
+
+    def _find_entry(self, image_key: str) -> Optional[Tuple[str, bool]]:
+        """Busca la entrada exacta o la más parecida dentro del umbral. Requiere el lock. Retorna (clave, es_exacta)."""
+        if image_key in self._entries:
+            return image_key, True
+        if not self.max_distance:
+            return None
+        prefix, _, hash_hex = image_key.rpartition("|")
+        bits = int(hash_hex, 16)
+        best_key, best_distance = None, self.max_distance + 1
+        for key in self._entries:
+            key_prefix, _, key_hash_hex = key.rpartition("|")
+            if key_prefix != prefix:
+                continue
+            distance = bin(bits ^ int(key_hash_hex, 16)).count("1")
+            if distance < best_distance:
+                best_key, best_distance = key, distance
+        return (best_key, False) if best_key is not None else None
+
+    def lookup(self, image_key: str, source_code: str, target_code: str) -> Optional[Tuple[str, Optional[str]]]:
+        """
+        Busca una captura idéntica o casi idéntica. Ver IOCRResultCache.lookup.
+        """
+        with self._lock:
+            found = self._find_entry(image_key)
+            if found is None:
+                self._stats["misses"] += 1
+                return None
+            key, is_exact = found
+            self._entries.move_to_end(key)
+            self._stats["hits" if is_exact else "near_hits"] += 1
+            entry = self._entries[key]
+            translated_text = entry["translations"].get(f"{source_code}->{target_code}")
+            if translated_text is not None:
+                self._stats["translation_hits"] += 1
+            return entry["text"], translated_text
+
+    def store(self, image_key: str, extracted_text: str, source_code: str = "", target_code: str = "",
+              translated_text: Optional[str] = None):
+        """
+        Almacena el texto de una captura y, opcionalmente, su traducción. Ver IOCRResultCache.store.
+        """
+        with self._lock:
+            entry = self._entries.get(image_key)
+            if entry is None or entry["text"] != extracted_text:
+                entry = {"text": extracted_text, "translations": {}}
+                self._entries[image_key] = entry
+            self._entries.move_to_end(image_key)
+            if translated_text is not None and source_code and target_code:
+                entry["translations"][f"{source_code}->{target_code}"] = translated_text
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+            self._unsaved_stores += 1
+            if self.file_path and self._unsaved_stores >= _SAVE_EVERY_STORES:
+                self._save()
+
+    def invalidate_languages(self, language_codes: List[str]):
+        """
+        Elimina las traducciones que involucran esos idiomas. Ver IOCRResultCache.invalidate_languages.
+        """
+        codes = set(language_codes)
+        with self._lock:
+            for entry in self._entries.values():
+                translations = entry["translations"]
+                for pair_key in [pair_key for pair_key in translations if set(pair_key.split("->", 1)) & codes]:
+                    del translations[pair_key]
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+        Retorna hits (exactos), near_hits (dentro del umbral), misses, translation_hits y entries.
+        """
+        with self._lock:
+            return {**self._stats, "entries": len(self._entries)}
+
+    def flush(self):
+        """Escribe la caché en disco si es persistente y tiene cambios sin guardar."""
+        with self._lock:
+            if self.file_path and self._unsaved_stores:
+                self._save()
+
+    def _load(self):
+        """Lee el archivo de la caché. Un archivo inexistente, corrupto o de otra versión equivale a una caché vacía."""
+        if not os.path.exists(self.file_path):
+            return
+        try:
+            with open(self.file_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("version") != _FILE_VERSION:
+                return
+            for item in data.get("entries", [])[-self.max_entries:]:
+                self._entries[item["key"]] = {"text": item["text"], "translations": dict(item.get("translations", {}))}
+        except (OSError, ValueError, AttributeError, KeyError, TypeError) as e:
+            print(f"Infrastructure Layer (PerceptualHashOCRCache): Advertencia: No se pudo leer la caché ({e}). Se empieza vacía.")
+            self._entries.clear()
+
+    def _save(self):
+        """Escribe la caché (en orden LRU) de forma atómica. Requiere el lock."""
+        try:
+            file_dir = os.path.dirname(self.file_path)
+            if file_dir:
+                os.makedirs(file_dir, exist_ok=True)
+            entries = [{"key": key, **entry} for key, entry in self._entries.items()]
+            temp_path = self.file_path + ".tmp"
+            with open(temp_path, "w", encoding="utf-8") as f:
+                json.dump({"version": _FILE_VERSION, "entries": entries}, f, ensure_ascii=False)
+            os.replace(temp_path, self.file_path)
+            self._unsaved_stores = 0
+        except OSError as e:
+            # Un fallo de la caché nunca debe afectar al OCR ni a la traducción
+            print(f"Infrastructure Layer (PerceptualHashOCRCache): Error al guardar la caché: {e}")
@@ -0,0 +1,111 @@
+# src/infrastructure/package_index.py
+
+import argostranslate.package
+import argostranslate.settings
+import os
+import threading
+import time
+from typing import Callable, Optional
+
+
+class PackageIndexRefresher:
+    """
+    Gestiona la actualización del índice remoto de paquetes de argostranslate.
+    Esta clase reside en la capa de Infraestructura.
+
+    argostranslate guarda el índice descargado en disco (settings.local_package_index);
+    ese archivo actúa como caché: solo se vuelve a descargar cuando es más antiguo que el TTL,
+    cuando se fuerza la actualización, y nunca en modo sin conexión.
+    """
+
+    def __init__(self, ttl_seconds: float = 24 * 60 * 60, offline: bool = False):
+        """
+        Constructor del gestor del índice.
+
+        Args:
+            ttl_seconds: Antigüedad máxima del índice en disco antes de considerarlo obsoleto.
+            offline: Si es True, nunca se accede a la red; solo se usa el índice en disco (si existe).
+        """
+        self.ttl_seconds = ttl_seconds
+        self.offline = offline
+        self._lock = threading.Lock() # Evita descargas simultáneas del índice
+        self._refresh_thread: Optional[threading.Thread] = None
+
+    @staticmethod
+    def _get_index_path() -> Optional[str]:
+        """Ruta del índice local de argostranslate, o None si la versión instalada no la expone."""
+        index_path = getattr(argostranslate.settings, "local_package_index", None)
+        return str(index_path) if index_path else None
+
+    def get_index_age_seconds(self) -> Optional[float]:
+        """
+        Retorna la antigüedad en segundos del índice en disco, o None si no existe.
+        """
+        index_path = self._get_index_path()
+        if not index_path or not os.path.exists(index_path):
+            return None
+        return max(0.0, time.time() - os.path.getmtime(index_path))
+
+    def is_stale(self) -> bool:
+        """
+        Indica si el índice en disco no existe o es más antiguo que el TTL.
+        """
+        age = self.get_index_age_seconds()
+        return age is None or age > self.ttl_seconds
+
+    def refresh(self, force: bool = False) -> bool:
+        """
+        Descarga el índice remoto si está obsoleto (o si force es True).
+        Es bloqueante: desde la UI debe llamarse en un hilo secundario o usar refresh_async().
+
+        Args:
+            force: Descargar aunque el índice en disco no haya expirado (se ignora en modo sin conexión).
+
+        Returns:
+            True si se descargó un índice nuevo, False en caso contrario.
+        """
+        if self.offline:
+            print("Infrastructure Layer (PackageIndexRefresher): Modo sin conexión. Se usa el índice en disco.")
+            return False
+
+        with self._lock:
+            if not force and not self.is_stale():
+                print("Infrastructure Layer (PackageIndexRefresher): El índice en disco está vigente. No se descarga.")
+                return False
+            try:
+                print("Infrastructure Layer (PackageIndexRefresher): Actualizando índice de paquetes remotos...")
+                argostranslate.package.update_package_index()
+                print("Infrastructure Layer (PackageIndexRefresher): Índice de paquetes remotos actualizado.")
+                return True
+            except Exception as e:
+                print(f"Infrastructure Layer (PackageIndexRefresher): Advertencia: No se pudo actualizar el índice de paquetes remotos: {e}")
+                return False
+
+    def refresh_async(self, on_finished: Optional[Callable[[bool], None]] = None) -> Optional[threading.Thread]:
+        """
+        Ejecuta refresh() en un hilo daemon. Si ya hay una actualización en curso no inicia otra.
+
+        Args:
+            on_finished: Callback opcional que recibe el resultado de refresh(). Se ejecuta en el hilo secundario.
+
+        Returns:
+            El hilo iniciado, o None si no se inició ninguno.
+        """
+        if self.offline:
+            return None
+        if self._refresh_thread is not None and self._refresh_thread.is_alive():
+            print("Infrastructure Layer (PackageIndexRefresher): Ya hay una actualización del índice en curso.")
+            return None
+
+        def _refresh_task():
+            refreshed = self.refresh()
+            if on_finished is not None:
+                try:
+                    on_finished(refreshed)
+                except Exception as e:
+                    print(f"Infrastructure Layer (PackageIndexRefresher): Error en callback de actualización: {e}")
+
+        self._refresh_thread = threading.Thread(target=_refresh_task, daemon=True)
+        self._refresh_thread.start()
+        print("Infrastructure Layer (PackageIndexRefresher): Actualización del índice iniciada en segundo plano.")
+        return self._refresh_thread
@@ -0,0 +1,392 @@
+# src/infrastructure/process_pool_translator.py
+
+import itertools
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import Future, ProcessPoolExecutor, TimeoutError as FutureTimeoutError
+from concurrent.futures.process import BrokenProcessPool
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+import argostranslate.package
+
+from src.domain.interfaces import ITranslator
+from src.domain.models import Language, TranslationRequest, TranslationResult, CancellationToken, TranslationProgress, TranslationCancelledError
+from src.infrastructure.argos_translator import ArgosTranslator, SentenceProgressTracker
+from src.infrastructure.compute_profiles import DEFAULT_PROFILE_NAME
+from src.infrastructure.model_pool import ModelPool, estimate_model_size_bytes
+from src.infrastructure.text_segmentation import split_into_sentences
+
+# Textos más cortos que esto se traducen en el proceso principal: arrancar procesos
+# y cargar un modelo en cada uno cuesta más que lo que se gana en paralelo
+DEFAULT_MIN_PARALLEL_CHARS = 20000
+
+# Fragmentos por proceso en que se reparte un documento: más de uno equilibra la carga
+# cuando unos párrafos son más lentos que otros, sin trocear tanto que se pierdan lotes
+_SHARDS_PER_WORKER = 2
+
+# Huecos del registro compartido de trabajos cancelados (un anillo: los ids más viejos se sobrescriben)
+_CANCELLED_JOB_SLOTS = 64
+
+# Traductor de cada proceso trabajador (creado en _init_worker)
+_worker_translator: Optional[ArgosTranslator] = None
+# Registro compartido de trabajos cancelados que ve cada proceso trabajador (creado en _init_worker)
+_worker_cancelled_jobs = None
+
+# Un elemento de trabajo: (texto, código de origen, código de destino, perfil)
+WorkItem = Tuple[str, str, str, Optional[str]]
+# Resultado de un elemento: (texto traducido, error)
+WorkResult = Tuple[Optional[str], Optional[str]]
+
+
+class _SharedJobCancellationToken(CancellationToken):
+    """
+    Token de cancelación de un proceso trabajador: está cancelado cuando el proceso principal
+    anota el id de su trabajo en el registro compartido de trabajos cancelados.
+    """
+    def __init__(self, job_id: int, cancelled_jobs):
+        super().__init__()
+        self._job_id = job_id
+        self._cancelled_jobs = cancelled_jobs
+
+    @property
+    def is_cancelled(self) -> bool:
+        if not self._event.is_set() and self._job_id in self._cancelled_jobs[:]:
+            self._event.set()
+        return self._event.is_set()
+
+    def raise_if_cancelled(self):
+        if self.is_cancelled:
+            raise TranslationCancelledError("Traducción cancelada.")
+
+
+def _init_worker(max_batch_size: int, default_profile: str, intra_threads: int, cancelled_jobs):
+    """Inicializador de cada proceso trabajador: crea su propio ArgosTranslator (y su copia del modelo)."""
+    global _worker_translator, _worker_cancelled_jobs
+    _worker_cancelled_jobs = cancelled_jobs
+    _worker_translator = ArgosTranslator(
+        sentence_cache=None,
+        max_batch_size=max_batch_size,
+        model_pool=ModelPool(),
+        default_profile=default_profile,
+        intra_threads=intra_threads,
+        # El token se consulta entre micro-lotes completos: un fragmento es trabajo por lotes
+        # y cancelar solo tiene que esperar a que termine el micro-lote en curso
+        cancellable_batch_size=max_batch_size
+    )
+
+
+def _translate_shard(job_id: int, items: List[WorkItem]) -> Optional[List[WorkResult]]:
+    """
+    Se ejecuta en un proceso trabajador. Traduce un fragmento completo en una sola llamada
+    por lotes y retorna todos los resultados juntos (una sola transferencia entre procesos).
+    Retorna None si el trabajo job_id se canceló mientras se traducía.
+    """
+    requests = [
+        TranslationRequest(text, Language(source_code, source_code), Language(target_code, target_code), profile=profile)
+        for text, source_code, target_code, profile in items
+    ]
+    try:
+        results = _worker_translator.translate_batch(
+            requests, cancellation_token=_SharedJobCancellationToken(job_id, _worker_cancelled_jobs)
+        )
+    except TranslationCancelledError:
+        return None
+    return [(result.translated_text, result.error) for result in results]
+
+
+def estimate_worker_memory_bytes() -> int:
+    """
+    Estima la memoria de modelos que necesita cada proceso trabajador: el doble del modelo
+    instalado más grande, porque un par por pivote carga dos modelos.
+    Retorna 0 si no hay paquetes instalados.
+    """
+    largest = 0
+    try:
+        for pkg in argostranslate.package.get_installed_packages():
+            largest = max(largest, estimate_model_size_bytes(str(pkg.package_path / "model")))
+    except Exception as e:
+        print(f"Infrastructure Layer (ProcessPoolTranslator): No se pudo estimar el tamaño de los modelos: {e}")
+    return largest * 2
+
+
+def get_default_worker_count(max_memory_bytes: int = 0, worker_memory_bytes: Optional[int] = None) -> int:
+    """
+    Calcula el número de procesos trabajadores por defecto: un núcleo queda libre para la UI
+    y el proceso principal, y todas las copias del modelo deben caber en el presupuesto de memoria.
+
+    Args:
+        max_memory_bytes: Presupuesto de memoria para modelos (0 = sin límite).
+        worker_memory_bytes: Memoria de modelos por proceso. Si es None se estima con los paquetes instalados.
+
+    Returns:
+        El número de procesos (0 si no compensa usar procesos).
+    """
+    workers = max(0, (os.cpu_count() or 1) - 1)
+    if max_memory_bytes > 0:
+        if worker_memory_bytes is None:
+            worker_memory_bytes = estimate_worker_memory_bytes()
+        if worker_memory_bytes > 0:
+            workers = min(workers, max_memory_bytes // worker_memory_bytes)
+    return workers if workers >= 2 else 0
+
+
+class ProcessPoolTranslator(ITranslator):
+    """
+    Implementación de ITranslator que reparte los párrafos de los textos largos entre varios
+    procesos, cada uno con su propia copia del modelo, para usar todos los núcleos.
+    Esta clase reside en la capa de Infraestructura.
+
+    - Los textos cortos, la información de idiomas y paquetes y la precarga se delegan
+      en el traductor local (el del proceso principal, con su caché y su pool).
+    - Los párrafos se agrupan en fragmentos consecutivos; cada fragmento viaja al proceso y
+      vuelve traducido en bloque, y los resultados se reensamblan en el orden original.
+    - Los procesos se crean con "spawn" al primer uso (no heredan el estado de Qt ni sus hilos)
+      y se reinician cuando cambian los paquetes instalados.
+    - Al cancelar, los fragmentos que aún no empezaron se descartan y los que se están
+      traduciendo se detienen al terminar su micro-lote en curso (el proceso principal anota
+      el trabajo en un registro compartido que los procesos consultan entre micro-lotes).
+    """
+
+    def __init__(self, local_translator: ArgosTranslator, worker_count: int, max_batch_size: int = 32,
+                 default_profile: str = DEFAULT_PROFILE_NAME, min_parallel_chars: int = DEFAULT_MIN_PARALLEL_CHARS):
+        """
+        Constructor del traductor multiproceso.
+
+        Args:
+            local_translator: Traductor del proceso principal.
+            worker_count: Número de procesos trabajadores (ver get_default_worker_count).
+            max_batch_size: Tamaño de micro-lote de los traductores de los procesos.
+            default_profile: Perfil de rendimiento por defecto de los procesos.
+            min_parallel_chars: Longitud mínima (en caracteres) para repartir un texto o lote entre procesos.
+        """
+        self._local = local_translator
+        self.worker_count = max(1, worker_count)
+        self._max_batch_size = max_batch_size
+        self._default_profile = default_profile
+        self.min_parallel_chars = max(0, min_parallel_chars)
+        # Hilos por lote de cada proceso, para que entre todos no superen los núcleos disponibles
+        self._intra_threads = max(1, (os.cpu_count() or 1) // self.worker_count)
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._cancelled_jobs = None
+        self._cancelled_job_slot = 0
+        self._job_ids = itertools.count(1)
+        self._executor_lock = threading.Lock()
+        print(f"Infrastructure Layer (ProcessPoolTranslator): Inicializado con {self.worker_count} procesos "
+              f"({self._intra_threads} hilos cada uno). Umbral: {self.min_parallel_chars} caracteres.")
+
+    # --- Gestión de los procesos ---
+
+    def _get_executor(self) -> Tuple[ProcessPoolExecutor, object]:
+        """Crea (al primer uso) y retorna el pool de procesos y su registro compartido de trabajos cancelados."""
+        with self._executor_lock:
+            if self._executor is None:
+                print(f"Infrastructure Layer (ProcessPoolTranslator): Arrancando {self.worker_count} procesos trabajadores...")
+                context = multiprocessing.get_context("spawn")
+                # Los ids de trabajo empiezan en 1, así que los huecos a cero no cancelan nada
+                self._cancelled_jobs = context.Array("q", _CANCELLED_JOB_SLOTS)
+                self._cancelled_job_slot = 0
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.worker_count,
+                    mp_context=context,
+                    initializer=_init_worker,
+                    initargs=(self._max_batch_size, self._default_profile, self._intra_threads, self._cancelled_jobs)
+                )
+            return self._executor, self._cancelled_jobs
+
+    def _cancel_job(self, cancelled_jobs, job_id: int):
+        """Anota job_id en el registro compartido para que los procesos detengan sus fragmentos en curso."""
+        with self._executor_lock:
+            if cancelled_jobs is not self._cancelled_jobs:
+                # El pool se reinició y los procesos de ese trabajo ya no existen
+                return
+            cancelled_jobs[self._cancelled_job_slot] = job_id
+            self._cancelled_job_slot = (self._cancelled_job_slot + 1) % _CANCELLED_JOB_SLOTS
+
+    def _reset_executor(self):
+        """Detiene los procesos actuales; se vuelven a crear en la próxima traducción."""
+        with self._executor_lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def shutdown(self):
+        """
+        Detiene los procesos trabajadores. Debería llamarse al cerrar la aplicación.
+        """
+        self._reset_executor()
+        print("Infrastructure Layer (ProcessPoolTranslator): Procesos trabajadores detenidos.")
+
+    def _make_shards(self, items: List[WorkItem]) -> List[List[WorkItem]]:
+        """Divide los elementos en fragmentos consecutivos de tamaño similar (en caracteres)."""
+        shard_count = min(len(items), self.worker_count * _SHARDS_PER_WORKER)
+        total_chars = sum(len(text) for text, _, _, _ in items)
+        target_chars = max(1, total_chars // max(1, shard_count))
+        shards: List[List[WorkItem]] = []
+        current: List[WorkItem] = []
+        current_chars = 0
+        for item in items:
+            current.append(item)
+            current_chars += len(item[0])
+            if current_chars >= target_chars and len(shards) < shard_count - 1:
+                shards.append(current)
+                current, current_chars = [], 0
+        if current:
+            shards.append(current)
+        return shards
+
+    def _translate_items(self, items: List[WorkItem],
+                         cancellation_token: Optional[CancellationToken] = None,
+                         progress_callback: Optional[Callable[[TranslationProgress], None]] = None) -> Iterator[List[WorkResult]]:
+        """
+        Envía los fragmentos a los procesos y entrega sus resultados en orden, fragmento a fragmento.
+
+        Raises:
+            TranslationCancelledError: Si se canceló cancellation_token.
+            BrokenProcessPool: Si un proceso trabajador terminó de forma inesperada.
+        """
+        shards = self._make_shards(items)
+        progress = SentenceProgressTracker(
+            [sentence for text, _, _, _ in items for sentence, _ in split_into_sentences(text)], progress_callback
+        )
+        executor, cancelled_jobs = self._get_executor()
+        job_id = next(self._job_ids)
+        futures: List[Future] = [executor.submit(_translate_shard, job_id, shard) for shard in shards]
+        try:
+            for shard, future in zip(shards, futures):
+                while True:
+                    if cancellation_token is not None:
+                        cancellation_token.raise_if_cancelled()
+                    try:
+                        shard_results = future.result(timeout=0.2)
+                        break
+                    except FutureTimeoutError:
+                        continue
+                shard_sentences = [
+                    sentence for text, _, _, _ in shard for sentence, _ in split_into_sentences(text) if sentence.strip()
+                ]
+                progress.advance(len(shard_sentences), sum(len(sentence) for sentence in shard_sentences))
+                yield shard_results
+        finally:
+            # Al cancelar (o si el consumidor deja de iterar) no se traducen los fragmentos pendientes
+            # y los que ya están en un proceso se detienen en el próximo micro-lote
+            for future in futures:
+                future.cancel()
+            if not all(future.done() for future in futures):
+                self._cancel_job(cancelled_jobs, job_id)
+
+    def _should_parallelize(self, total_chars: int, item_count: int) -> bool:
+        return self.worker_count > 1 and item_count > 1 and total_chars >= self.min_parallel_chars
+
+    # --- ITranslator ---
+
+    def get_available_languages(self) -> List[Language]:
+        return self._local.get_available_languages()
+
+    def translate(self, request: TranslationRequest,
+                  cancellation_token: Optional[CancellationToken] = None,
+                  progress_callback: Optional[Callable[[TranslationProgress], None]] = None) -> TranslationResult:
+        """
+        Traduce un texto. Los textos largos se dividen en párrafos y se reparten entre los procesos.
+        Ver ITranslator.translate.
+        """
+        paragraphs = request.text.split("\n")
+        if not self._should_parallelize(len(request.text), len(paragraphs)):
+            return self._local.translate(request, cancellation_token, progress_callback)
+        try:
+            translated_parts = list(self.translate_stream(request, cancellation_token, progress_callback))
+        except TranslationCancelledError:
+            raise
+        except Exception as e:
+            error_message = f"Error en la traducción multiproceso: {e}"
+            print(f"Infrastructure Layer (ProcessPoolTranslator): {error_message}")
+            return TranslationResult(error=error_message)
+        return TranslationResult(translated_text="".join(translated_parts))
+
+    def translate_stream(self, request: TranslationRequest,
+                         cancellation_token: Optional[CancellationToken] = None,
+                         progress_callback: Optional[Callable[[TranslationProgress], None]] = None) -> Iterator[str]:
+        """
+        Traduce un texto entregando los fragmentos traducidos en orden a medida que cada proceso
+        termina el suyo. Ver ITranslator.translate_stream.
+        """
+        paragraphs = request.text.split("\n")
+        if not self._should_parallelize(len(request.text), len(paragraphs)):
+            yield from self._local.translate_stream(request, cancellation_token, progress_callback)
+            return
+
+        items = [(paragraph, request.source_language.code, request.target_language.code, request.profile)
+                 for paragraph in paragraphs]
+        start_time = time.perf_counter()
+        translated_count = 0
+        try:
+            for shard_results in self._translate_items(items, cancellation_token, progress_callback):
+                shard_texts = []
+                for translated_text, error in shard_results:
+                    if error is not None:
+                        raise RuntimeError(error)
+                    shard_texts.append(translated_text)
+                # Cada fragmento termina con el salto de línea que lo separa del siguiente
+                is_last = translated_count + len(shard_texts) == len(paragraphs)
+                translated_count += len(shard_texts)
+                yield "\n".join(shard_texts) + ("" if is_last else "\n")
+        except BrokenProcessPool as e:
+            self._reset_executor()
+            raise RuntimeError(f"Un proceso de traducción terminó de forma inesperada: {e}")
+        print(f"Infrastructure Layer (ProcessPoolTranslator): {len(paragraphs)} párrafos traducidos en "
+              f"{time.perf_counter() - start_time:.2f} s con {self.worker_count} procesos.")
+
+    def translate_batch(self, requests: List[TranslationRequest],
+                        cancellation_token: Optional[CancellationToken] = None,
+                        progress_callback: Optional[Callable[[TranslationProgress], None]] = None) -> List[TranslationResult]:
+        """
+        Traduce varias solicitudes repartiéndolas entre los procesos, conservando el orden.
+        Ver ITranslator.translate_batch.
+        """
+        total_chars = sum(len(request.text) for request in requests)
+        if not self._should_parallelize(total_chars, len(requests)):
+            return self._local.translate_batch(requests, cancellation_token, progress_callback)
+
+        items = [(request.text, request.source_language.code, request.target_language.code, request.profile)
+                 for request in requests]
+        start_time = time.perf_counter()
+        results: List[TranslationResult] = []
+        try:
+            for shard_results in self._translate_items(items, cancellation_token, progress_callback):
+                results.extend(
+                    TranslationResult(translated_text=translated_text) if error is None else TranslationResult(error=error)
+                    for translated_text, error in shard_results
+                )
+        except BrokenProcessPool as e:
+            self._reset_executor()
+            error_message = f"Un proceso de traducción terminó de forma inesperada: {e}"
+            print(f"Infrastructure Layer (ProcessPoolTranslator): {error_message}")
+            return [TranslationResult(error=error_message) for _ in requests]
+        print(f"Infrastructure Layer (ProcessPoolTranslator): Lote de {len(requests)} solicitudes traducido en "
+              f"{time.perf_counter() - start_time:.2f} s con {self.worker_count} procesos.")
+        return results
+
+    def get_translation_pairs(self) -> List[Tuple[str, str]]:
+        return self._local.get_translation_pairs()
+
+    def get_model_version(self, source_code: str, target_code: str) -> str:
+        return self._local.get_model_version(source_code, target_code)
+
+    def resolve_profile_name(self, profile: Optional[str]) -> Optional[str]:
+        return self._local.resolve_profile_name(profile)
+
+    def on_packages_changed(self):
+        """
+        Propaga el cambio al traductor local y reinicia los procesos, que tienen
+        memorizados los paquetes y modelos anteriores.
+        """
+        self._local.on_packages_changed()
+        self._reset_executor()
+
+    def warm_up(self, source_code: str, target_code: str, profile: Optional[str] = None) -> bool:
+        # Solo se precarga el modelo local (textos cortos, hotkey); los procesos se arrancan con el primer documento largo
+        return self._local.warm_up(source_code, target_code, profile)
+
+    def get_model_memory_stats(self) -> Dict[str, Dict[str, float]]:
+        return self._local.get_model_memory_stats()
@@ -7,6 +7,7 @@ from typing import Any, Optional
 
 # Importar la interfaz de la capa de Dominio
 from src.domain.interfaces import IOCRService
+from src.infrastructure.tessdata_index import TessdataIndex
 
 class PytesseractOCRService(IOCRService):
     """
@@ -14,14 +15,20 @@ class PytesseractOCRService(IOCRService):
     Esta clase reside en la capa de Infraestructura.
     """
 
-    def __init__(self, tesseract_cmd_path: Optional[str] = None):
+    def __init__(self, tesseract_cmd_path: Optional[str] = None, language: str = "eng",
+                 tessdata_index: Optional[TessdataIndex] = None):
         """
         Constructor del servicio OCR.
 
         Args:
             tesseract_cmd_path: Ruta opcional al ejecutable de Tesseract OCR.
                                 Si no se proporciona, pytesseract intentará encontrarlo en el PATH.
+            language: Idioma(s) de Tesseract por defecto (por ejemplo "eng" o "eng+spa").
+            tessdata_index: Índice opcional de traineddata. Con él, el idioma de cada llamada (código de Argos)
+                            y el perfil eligen el traineddata y su variante; sin él se usa siempre language.
         """
+        self.language = language
+        self.tessdata_index = tessdata_index
         # Configurar la ruta al ejecutable de Tesseract si se proporciona
         if tesseract_cmd_path and os.path.exists(tesseract_cmd_path):
             pytesseract.pytesseract.tesseract_cmd = tesseract_cmd_path
@@ -43,12 +50,15 @@ class PytesseractOCRService(IOCRService):
             # raise EnvironmentError("Tesseract OCR executable not found.")
 
 
-    def extract_text_from_image_data(self, image_data: Any) -> str:
+    def extract_text_from_image_data(self, image_data: Any, language: Optional[str] = None,
+                                     profile: Optional[str] = None) -> str:
         """
         Extrae texto de datos de imagen utilizando pytesseract.
 
         Args:
             image_data: Los datos de la imagen. Se espera un objeto PIL.Image.Image.
+            language: Código de idioma de Argos del texto (None = idioma por defecto).
+            profile: Perfil de rendimiento; elige entre tessdata "fast" y "best" si hay índice.
 
         Returns:
             El texto extraído de la imagen.
@@ -60,7 +70,11 @@ class PytesseractOCRService(IOCRService):
 
         try:
             # pytesseract.image_to_string() realiza el OCR
-            text = pytesseract.image_to_string(image_data)
+            tesseract_language, tessdata_dir = self.language, None
+            if self.tessdata_index is not None:
+                tesseract_language, tessdata_dir = self.tessdata_index.resolve(language, profile)
+            config = f'--tessdata-dir "{tessdata_dir}"' if tessdata_dir else ""
+            text = pytesseract.image_to_string(image_data, lang=tesseract_language, config=config)
             print("Infrastructure Layer (PytesseractOCRService): Texto extraído de la imagen (primeros 50 chars):", text[:50])
             return text
         except Exception as e:
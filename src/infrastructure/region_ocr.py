@@ -0,0 +1,181 @@
+# src/infrastructure/region_ocr.py
+
+import math
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, List, Optional, Tuple
+
+import numpy as np
+from PIL import Image
+
+# Importar la interfaz de la capa de Dominio
+from src.domain.interfaces import IOCRService
+
+# Caja (izquierda, arriba, derecha, abajo) en píxeles de la imagen original, como en Image.crop
+Box = Tuple[int, int, int, int]
+
+# Diferencia mínima con el color de fondo para que un píxel cuente como tinta
+_INK_CONTRAST = 40
+# Niveles máximos de la división recursiva
+_MAX_CUT_DEPTH = 8
+
+
+def _find_runs(profile: np.ndarray, min_gap: int) -> List[Tuple[int, int]]:
+    """
+    Tramos [inicio, fin) de valores True de un perfil, uniendo los separados por menos de min_gap valores False.
+    """
+    edges = np.diff(np.concatenate(([0], profile.astype(np.int8), [0])))
+    starts = np.flatnonzero(edges == 1)
+    ends = np.flatnonzero(edges == -1)
+    if starts.size == 0:
+        return []
+    splits = np.flatnonzero(starts[1:] - ends[:-1] >= min_gap)
+    run_starts = np.concatenate((starts[:1], starts[splits + 1]))
+    run_ends = np.concatenate((ends[splits], ends[-1:]))
+    return list(zip(run_starts.tolist(), run_ends.tolist()))
+
+
+class TextRegionDetector:
+    """
+    Detecta bloques de texto en una imagen grande con cortes recursivos X-Y sobre los perfiles de tinta
+    (NumPy): la imagen se divide por su hueco vacío más ancho, horizontal o vertical, y cada parte de la
+    misma forma. Los bloques salen en orden de lectura (de arriba abajo y de izquierda a derecha).
+    La detección trabaja sobre una copia reducida de la imagen; la resolución completa solo se usa al
+    recortar cada bloque. Esta clase reside en la capa de Infraestructura.
+    """
+
+    def __init__(self, detection_max_side: int = 1600, row_gap: int = 24, column_gap: int = 48,
+                 margin: int = 8, min_region_side: int = 8):
+        """
+        Args:
+            detection_max_side: Lado mayor de la copia reducida usada para detectar.
+            row_gap: Filas vacías (en píxeles de la imagen original) que separan dos bloques.
+            column_gap: Columnas vacías (en píxeles de la imagen original) que separan dos bloques.
+            margin: Margen en píxeles que se añade alrededor de cada bloque (Tesseract necesita algo de borde).
+            min_region_side: Los bloques más bajos o estrechos que esto (en píxeles originales) se descartan como ruido.
+        """
+        self.detection_max_side = max(64, detection_max_side)
+        self.row_gap = max(1, row_gap)
+        self.column_gap = max(1, column_gap)
+        self.margin = max(0, margin)
+        self.min_region_side = max(1, min_region_side)
+
+    def detect(self, image: Image.Image) -> List[Box]:
+        """
+        Busca los bloques de texto de la imagen.
+
+        Returns:
+            Las cajas de los bloques en coordenadas de la imagen original y en orden de lectura.
+        """
+        width, height = image.size
+        factor = max(1, math.ceil(max(width, height) / self.detection_max_side))
+        small = image.reduce(factor) if factor > 1 else image
+        pixels = np.asarray(small.convert("L"), dtype=np.int16)
+        # El fondo es el color mayoritario; la tinta es lo que se aleja de él (sirve para temas claros y oscuros)
+        background = int(np.median(pixels[::4, ::4]))
+        mask = np.abs(pixels - background) > _INK_CONTRAST
+
+        row_gap = max(1, math.ceil(self.row_gap / factor))
+        column_gap = max(1, math.ceil(self.column_gap / factor))
+        boxes = []
+        for left, top, right, bottom in self._cut(mask, 0, 0, mask.shape[1], mask.shape[0], row_gap, column_gap, _MAX_CUT_DEPTH):
+            # De la copia reducida a la imagen original, con margen y recortado a los bordes
+            box = (max(0, left * factor - self.margin), max(0, top * factor - self.margin),
+                   min(width, right * factor + self.margin), min(height, bottom * factor + self.margin))
+            if (box[2] - box[0]) - 2 * self.margin >= self.min_region_side and (box[3] - box[1]) - 2 * self.margin >= self.min_region_side:
+                boxes.append(box)
+        return boxes
+
+    def _cut(self, mask: np.ndarray, left: int, top: int, right: int, bottom: int,
+             row_gap: int, column_gap: int, depth: int) -> List[Box]:
+        """
+        Divide la caja por su hueco más ancho (entre franjas de filas o entre columnas) y repite en cada parte;
+        así una página a dos columnas se lee columna por columna y no párrafo a párrafo entre columnas.
+        Una caja que ya no se puede dividir se ajusta a su contenido.
+        """
+        block = mask[top:bottom, left:right]
+        row_runs = _find_runs(block.any(axis=1), row_gap)
+        column_runs = _find_runs(block.any(axis=0), column_gap)
+        if not row_runs or not column_runs:
+            return []
+        if depth <= 0 or (len(row_runs) == 1 and len(column_runs) == 1):
+            return [(left + column_runs[0][0], top + row_runs[0][0], left + column_runs[-1][1], top + row_runs[-1][1])]
+        widest_row_gap = max((following[0] - previous[1] for previous, following in zip(row_runs, row_runs[1:])), default=0)
+        widest_column_gap = max((following[0] - previous[1] for previous, following in zip(column_runs, column_runs[1:])), default=0)
+        if widest_column_gap > widest_row_gap:
+            parts = [(left + start, top, left + end, bottom) for start, end in column_runs]
+        else:
+            parts = [(left, top + start, right, top + end) for start, end in row_runs]
+        boxes = []
+        for part in parts:
+            boxes.extend(self._cut(mask, *part, row_gap, column_gap, depth - 1))
+        return boxes
+
+
+class RegionOCRService(IOCRService):
+    """
+    Decorador de IOCRService para imágenes grandes (capturas 4K, páginas escaneadas): en lugar de pasar
+    la imagen completa al OCR, detecta los bloques de texto con TextRegionDetector, reconoce cada bloque
+    en paralelo con el servicio decorado y une los textos en orden de lectura. Una captura casi vacía
+    solo cuesta la detección. Las imágenes pequeñas se pasan directamente al servicio decorado.
+    Esta clase reside en la capa de Infraestructura.
+    """
+
+    def __init__(self, ocr_service: IOCRService, detector: Optional[TextRegionDetector] = None,
+                 min_pixels: int = 1_000_000, worker_count: int = 0):
+        """
+        Args:
+            ocr_service: Servicio OCR que reconoce cada bloque (debe poder usarse desde varios hilos).
+            detector: Detector de bloques. Por defecto, un TextRegionDetector con sus valores por defecto.
+            min_pixels: Las imágenes con menos píxeles se reconocen enteras.
+            worker_count: Bloques que se reconocen a la vez (0 = según el número de CPUs, hasta 4).
+        """
+        self.ocr_service = ocr_service
+        self.detector = detector or TextRegionDetector()
+        self.min_pixels = max(0, min_pixels)
+        self.worker_count = worker_count if worker_count > 0 else min(4, os.cpu_count() or 1)
+        # Los hilos se crean bajo demanda: si nunca llega una imagen grande, no hay hilos
+        self._executor = ThreadPoolExecutor(max_workers=self.worker_count, thread_name_prefix="RegionOCR")
+
+    def extract_text_from_image_data(self, image_data: Any, language: Optional[str] = None,
+                                     profile: Optional[str] = None) -> str:
+        """
+        Extrae el texto de los bloques detectados en la imagen. Ver IOCRService.extract_text_from_image_data.
+        """
+        if not isinstance(image_data, Image.Image) or image_data.width * image_data.height < self.min_pixels:
+            return self.ocr_service.extract_text_from_image_data(image_data, language, profile)
+
+        start = time.perf_counter()
+        try:
+            boxes = self.detector.detect(image_data)
+        except Exception as e:
+            print(f"Infrastructure Layer (RegionOCRService): Error al detectar bloques, se reconoce la imagen completa: {e}")
+            return self.ocr_service.extract_text_from_image_data(image_data, language, profile)
+        detection_ms = (time.perf_counter() - start) * 1000
+        if not boxes:
+            print(f"Infrastructure Layer (RegionOCRService): Sin bloques de texto en {image_data.size} ({detection_ms:.1f} ms).")
+            return ""
+
+        # Decodificar antes de repartir los recortes entre hilos (crop carga la imagen si aún no se cargó)
+        image_data.load()
+        texts = list(self._executor.map(lambda box: self._extract_region(image_data, box, language, profile), boxes))
+        covered = sum((right - left) * (bottom - top) for left, top, right, bottom in boxes) / (image_data.width * image_data.height)
+        print(f"Infrastructure Layer (RegionOCRService): {len(boxes)} bloques ({covered:.0%} de la imagen) en {image_data.size}; "
+              f"detección {detection_ms:.1f} ms, total {(time.perf_counter() - start) * 1000:.1f} ms.")
+        return "\n\n".join(text for text in texts if text)
+
+    def _extract_region(self, image: Image.Image, box: Box, language: Optional[str], profile: Optional[str]) -> str:
+        """Recorta un bloque a resolución completa y lo reconoce. Se ejecuta en un hilo del grupo."""
+        try:
+            return self.ocr_service.extract_text_from_image_data(image.crop(box), language, profile).strip()
+        except Exception as e:
+            print(f"Infrastructure Layer (RegionOCRService): Error en el bloque {box}: {e}")
+            return ""
+
+    def close(self):
+        """Detiene los hilos y cierra el servicio decorado si tiene recursos que liberar."""
+        self._executor.shutdown(wait=True)
+        close = getattr(self.ocr_service, "close", None)
+        if close is not None:
+            close()
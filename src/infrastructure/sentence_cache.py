@@ -0,0 +1,136 @@
+# src/infrastructure/sentence_cache.py
+
+import threading
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+# Sobrecoste aproximado (bytes) de cada entrada: tupla clave, OrderedDict y objetos str.
+_ENTRY_OVERHEAD_BYTES = 160
+
+EVICTION_POLICIES = ("lru", "fifo")
+
+
+class SentenceLRUCache:
+    """
+    Caché en memoria de traducciones por oración, acotada por tamaño en bytes.
+    Esta clase reside en la capa de Infraestructura y la usa el traductor internamente.
+
+    Políticas de desalojo:
+        - "lru": una consulta acertada mueve la entrada al final (la menos usada sale primero).
+        - "fifo": las consultas no alteran el orden (la más antigua sale primero).
+    """
+
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024, eviction_policy: str = "lru"):
+        """
+        Constructor de la caché.
+
+        Args:
+            max_bytes: Tamaño máximo aproximado de la caché en bytes.
+            eviction_policy: "lru" o "fifo".
+        """
+        if eviction_policy not in EVICTION_POLICIES:
+            print(f"Infrastructure Layer (SentenceLRUCache): Advertencia: Política '{eviction_policy}' no soportada. Se usará 'lru'.")
+            eviction_policy = "lru"
+
+        self.max_bytes = max(0, max_bytes)
+        self.eviction_policy = eviction_policy
+        # Clave: (origen, destino, variante, oración). La variante distingue traducciones del mismo par
+        # obtenidas con parámetros de decodificación distintos (por ejemplo, el perfil de rendimiento).
+        self._entries: "OrderedDict[Tuple[str, str, str, str], str]" = OrderedDict()
+        self._current_bytes = 0
+        self._lock = threading.Lock()
+        # Estadísticas por par "from->to": hits, misses, evictions, entries, bytes
+        self._pair_stats: Dict[str, Dict[str, int]] = {}
+        print(f"Infrastructure Layer (SentenceLRUCache): Inicializada con {self.max_bytes} bytes, política '{self.eviction_policy}'.")
+
+    @staticmethod
+    def _entry_size(sentence: str, translation: str) -> int:
+        """Estima el tamaño en bytes de una entrada."""
+        return len(sentence.encode("utf-8")) + len(translation.encode("utf-8")) + _ENTRY_OVERHEAD_BYTES
+
+    def _stats_for(self, source_code: str, target_code: str) -> Dict[str, int]:
+        """Obtiene (creando si no existe) el diccionario de estadísticas de un par. Requiere el lock."""
+        pair_key = f"{source_code}->{target_code}"
+        stats = self._pair_stats.get(pair_key)
+        if stats is None:
+            stats = {"hits": 0, "misses": 0, "evictions": 0, "entries": 0, "bytes": 0}
+            self._pair_stats[pair_key] = stats
+        return stats
+
+    def get(self, source_code: str, target_code: str, sentence: str, variant: str = "") -> Optional[str]:
+        """
+        Busca la traducción de una oración.
+
+        Returns:
+            La traducción almacenada o None si no está en caché.
+        """
+        key = (source_code, target_code, variant, sentence)
+        with self._lock:
+            stats = self._stats_for(source_code, target_code)
+            translation = self._entries.get(key)
+            if translation is None:
+                stats["misses"] += 1
+                return None
+            stats["hits"] += 1
+            if self.eviction_policy == "lru":
+                self._entries.move_to_end(key)
+            return translation
+
+    def put(self, source_code: str, target_code: str, sentence: str, translation: str, variant: str = ""):
+        """
+        Almacena la traducción de una oración, desalojando entradas si se supera el tamaño máximo.
+        """
+        size = self._entry_size(sentence, translation)
+        if size > self.max_bytes:
+            return # Una entrada mayor que la caché completa no se almacena
+
+        key = (source_code, target_code, variant, sentence)
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._forget_entry(key, previous)
+
+            self._entries[key] = translation
+            self._current_bytes += size
+            stats = self._stats_for(source_code, target_code)
+            stats["entries"] += 1
+            stats["bytes"] += size
+
+            while self._current_bytes > self.max_bytes and self._entries:
+                evicted_key, evicted_translation = self._entries.popitem(last=False)
+                self._forget_entry(evicted_key, evicted_translation)
+                self._stats_for(evicted_key[0], evicted_key[1])["evictions"] += 1
+
+    def _forget_entry(self, key: Tuple[str, str, str, str], translation: str):
+        """Actualiza los contadores de tamaño al retirar una entrada. Requiere el lock."""
+        size = self._entry_size(key[3], translation)
+        self._current_bytes -= size
+        stats = self._stats_for(key[0], key[1])
+        stats["entries"] -= 1
+        stats["bytes"] -= size
+
+    def clear(self):
+        """
+        Elimina todas las entradas (las estadísticas de hits/misses se conservan).
+        """
+        with self._lock:
+            self._entries.clear()
+            self._current_bytes = 0
+            for stats in self._pair_stats.values():
+                stats["entries"] = 0
+                stats["bytes"] = 0
+
+    def get_stats(self) -> Dict[str, Dict[str, int]]:
+        """
+        Obtiene una copia de las estadísticas por par de idiomas, más un total en la clave "total".
+        """
+        with self._lock:
+            stats = {pair: dict(values) for pair, values in self._pair_stats.items()}
+            stats["total"] = {
+                "entries": len(self._entries),
+                "bytes": self._current_bytes,
+                "max_bytes": self.max_bytes,
+                "hits": sum(values["hits"] for values in self._pair_stats.values()),
+                "misses": sum(values["misses"] for values in self._pair_stats.values()),
+            }
+            return stats
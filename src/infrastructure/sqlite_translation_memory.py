@@ -0,0 +1,163 @@
+# src/infrastructure/sqlite_translation_memory.py
+
+import sqlite3 # Biblioteca estándar: la memoria de traducción no necesita dependencias externas
+import hashlib
+import threading
+import time
+import unicodedata
+import os
+from typing import Dict, List, Optional
+
+# Importar la interfaz de la capa de Dominio
+from src.domain.interfaces import ITranslationMemory
+
+
+def normalize_source_text(text: str) -> str:
+    """
+    Normaliza el texto de origen para usarlo como clave de la memoria de traducción.
+    Unifica la forma Unicode y los saltos de línea, y elimina espacios en los extremos.
+    No colapsa los espacios internos, porque forman parte del formato del resultado.
+    """
+    text = unicodedata.normalize("NFC", text)
+    text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text.strip()
+
+
+class SQLiteTranslationMemory(ITranslationMemory):
+    """
+    Implementación de ITranslationMemory respaldada por un archivo SQLite.
+    Esta clase reside en la capa de Infraestructura.
+
+    Cada entrada se indexa por un hash SHA-256 del texto normalizado, el par de idiomas
+    y la versión del modelo, así que una consulta es una búsqueda por clave primaria.
+    """
+
+    def __init__(self, db_path: str):
+        """
+        Constructor de la memoria de traducción.
+
+        Args:
+            db_path: Ruta del archivo SQLite. Se crea si no existe.
+        """
+        self.db_path = db_path
+        db_dir = os.path.dirname(db_path)
+        if db_dir:
+            os.makedirs(db_dir, exist_ok=True)
+
+        # La conexión se comparte entre los hilos de traducción y el de la UI,
+        # por eso se protege con un lock en lugar de usar check_same_thread.
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(db_path, check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.execute(
+            """
+            CREATE TABLE IF NOT EXISTS translation_memory (
+                entry_key TEXT PRIMARY KEY,
+                source_code TEXT NOT NULL,
+                target_code TEXT NOT NULL,
+                model_version TEXT NOT NULL,
+                source_text TEXT NOT NULL,
+                translated_text TEXT NOT NULL,
+                created_at REAL NOT NULL
+            )
+            """
+        )
+        self._connection.execute(
+            "CREATE INDEX IF NOT EXISTS idx_translation_memory_pair ON translation_memory (source_code, target_code)"
+        )
+        self._connection.commit()
+
+        self._hits = 0
+        self._misses = 0
+        print(f"Infrastructure Layer (SQLiteTranslationMemory): Memoria de traducción abierta en: {db_path}")
+
+    @staticmethod
+    def _make_key(normalized_text: str, source_code: str, target_code: str, model_version: str) -> str:
+        """Construye la clave primaria de una entrada."""
+        raw_key = "\x1f".join((source_code, target_code, model_version, normalized_text))
+        return hashlib.sha256(raw_key.encode("utf-8")).hexdigest()
+
+    def lookup(self, text: str, source_code: str, target_code: str, model_version: str) -> Optional[str]:
+        """
+        Busca una traducción previa. Ver ITranslationMemory.lookup.
+        """
+        key = self._make_key(normalize_source_text(text), source_code, target_code, model_version)
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT translated_text FROM translation_memory WHERE entry_key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                self._misses += 1
+                return None
+            self._hits += 1
+            return row[0]
+
+    def store(self, text: str, source_code: str, target_code: str, model_version: str, translated_text: str):
+        """
+        Almacena una traducción. Ver ITranslationMemory.store.
+        """
+        normalized_text = normalize_source_text(text)
+        if not normalized_text:
+            return
+        key = self._make_key(normalized_text, source_code, target_code, model_version)
+        try:
+            with self._lock:
+                self._connection.execute(
+                    "INSERT OR REPLACE INTO translation_memory "
+                    "(entry_key, source_code, target_code, model_version, source_text, translated_text, created_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (key, source_code, target_code, model_version, normalized_text, translated_text, time.time())
+                )
+                self._connection.commit()
+        except sqlite3.Error as e:
+            # Un fallo de la caché nunca debe impedir devolver la traducción
+            print(f"Infrastructure Layer (SQLiteTranslationMemory): Error al almacenar entrada: {e}")
+
+    def invalidate_languages(self, language_codes: List[str]):
+        """
+        Elimina las entradas que involucran alguno de los idiomas indicados.
+        Ver ITranslationMemory.invalidate_languages.
+        """
+        codes = [code for code in language_codes if code]
+        if not codes:
+            return
+        placeholders = ", ".join("?" for _ in codes)
+        try:
+            with self._lock:
+                cursor = self._connection.execute(
+                    f"DELETE FROM translation_memory WHERE source_code IN ({placeholders}) OR target_code IN ({placeholders})",
+                    (*codes, *codes)
+                )
+                self._connection.commit()
+            print(f"Infrastructure Layer (SQLiteTranslationMemory): Invalidadas {cursor.rowcount} entradas para idiomas {codes}.")
+        except sqlite3.Error as e:
+            print(f"Infrastructure Layer (SQLiteTranslationMemory): Error al invalidar entradas: {e}")
+
+    def clear(self):
+        """
+        Elimina todas las entradas. Ver ITranslationMemory.clear.
+        """
+        try:
+            with self._lock:
+                self._connection.execute("DELETE FROM translation_memory")
+                self._connection.commit()
+            print("Infrastructure Layer (SQLiteTranslationMemory): Memoria de traducción vaciada.")
+        except sqlite3.Error as e:
+            print(f"Infrastructure Layer (SQLiteTranslationMemory): Error al vaciar la memoria: {e}")
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+        Obtiene las estadísticas de aciertos/fallos. Ver ITranslationMemory.get_stats.
+        """
+        with self._lock:
+            entries = self._connection.execute("SELECT COUNT(*) FROM translation_memory").fetchone()[0]
+            return {"hits": self._hits, "misses": self._misses, "entries": entries}
+
+    def close(self):
+        """
+        Cierra la conexión con la base de datos.
+        """
+        with self._lock:
+            self._connection.close()
+        print("Infrastructure Layer (SQLiteTranslationMemory): Memoria de traducción cerrada.")
@@ -0,0 +1,157 @@
+# src/infrastructure/tessdata_index.py
+
+import glob
+import os
+import subprocess
+import threading
+from typing import Dict, List, Optional, Set, Tuple
+
+# Códigos de idioma de Argos (ISO 639-1) -> nombre del traineddata de Tesseract
+ARGOS_TO_TESSERACT = {
+    "ar": "ara", "az": "aze", "bg": "bul", "bn": "ben", "ca": "cat", "cs": "ces", "da": "dan",
+    "de": "deu", "el": "ell", "en": "eng", "eo": "epo", "es": "spa", "et": "est", "fa": "fas",
+    "fi": "fin", "fr": "fra", "ga": "gle", "he": "heb", "hi": "hin", "hu": "hun", "id": "ind",
+    "it": "ita", "ja": "jpn", "ko": "kor", "lt": "lit", "lv": "lav", "ms": "msa", "nb": "nor",
+    "nl": "nld", "pl": "pol", "pt": "por", "ro": "ron", "ru": "rus", "sk": "slk", "sl": "slv",
+    "sq": "sqi", "sv": "swe", "th": "tha", "tl": "tgl", "tr": "tur", "uk": "ukr", "ur": "urd",
+    "vi": "vie", "zh": "chi_sim", "zt": "chi_tra",
+}
+
+# Variantes de tessdata: "fast" (modelos enteros, más rápidos) y "best" (más precisos y más lentos).
+# "default" es la carpeta de la instalación de Tesseract, de variante desconocida
+VARIANT_FAST = "fast"
+VARIANT_BEST = "best"
+VARIANT_DEFAULT = "default"
+
+# Variante preferida por perfil de rendimiento (ver src/domain/models.py, PROFILE_*)
+PROFILE_VARIANTS = {"fast": VARIANT_FAST, "balanced": VARIANT_BEST, "quality": VARIANT_BEST}
+
+# Carpetas habituales de tessdata si no se encuentra la de la instalación de otra forma
+_COMMON_TESSDATA_DIRS = (
+    "/usr/share/tesseract-ocr/*/tessdata", "/usr/share/tesseract-ocr/tessdata", "/usr/share/tessdata",
+    "/usr/local/share/tessdata", "/opt/homebrew/share/tessdata", r"C:\Program Files\Tesseract-OCR\tessdata",
+)
+
+
+def find_default_tessdata_dir(tesseract_cmd: Optional[str] = None) -> Optional[str]:
+    """
+    Busca la carpeta tessdata de la instalación de Tesseract: TESSDATA_PREFIX, la que informa
+    `tesseract --list-langs`, o una de las carpetas habituales.
+
+    Returns:
+        La ruta de la carpeta, o None si no se encontró.
+    """
+    prefix = os.environ.get("TESSDATA_PREFIX")
+    if prefix:
+        for candidate in (prefix, os.path.join(prefix, "tessdata")):
+            if glob.glob(os.path.join(candidate, "*.traineddata")):
+                return candidate
+    try:
+        # Primera línea: List of available languages in "/usr/share/tesseract-ocr/5/tessdata/" (3):
+        completed = subprocess.run([tesseract_cmd or "tesseract", "--list-langs"], capture_output=True, text=True, timeout=10)
+        output_lines = (completed.stdout or completed.stderr).splitlines()
+        if output_lines and output_lines[0].count('"') >= 2:
+            candidate = output_lines[0].split('"')[1]
+            if os.path.isdir(candidate):
+                return candidate
+    except (OSError, subprocess.SubprocessError):
+        pass
+    for pattern in _COMMON_TESSDATA_DIRS:
+        for candidate in sorted(glob.glob(pattern), reverse=True):
+            if glob.glob(os.path.join(candidate, "*.traineddata")):
+                return candidate
+    return None
+
+
+class TessdataIndex:
+    """
+    Índice de los traineddata instalados por variante ("fast", "best" y la carpeta de la instalación),
+    construido una vez al arrancar (refresh() lo reconstruye). Traduce el código de idioma de origen
+    de Argos y el perfil de rendimiento al idioma de Tesseract y a la carpeta tessdata que deben usarse.
+    Esta clase reside en la capa de Infraestructura.
+
+    Si falta el traineddata de un idioma en la variante preferida se usa otra variante; si no existe
+    en ninguna, se usa el idioma por defecto (con un aviso, una sola vez por idioma).
+    """
+
+    def __init__(self, directories: Dict[str, str], default_language: str = "eng",
+                 default_profile: Optional[str] = None):
+        """
+        Args:
+            directories: Carpeta tessdata de cada variante (VARIANT_FAST, VARIANT_BEST, VARIANT_DEFAULT).
+                         Las carpetas vacías o inexistentes se ignoran.
+            default_language: Idioma de Tesseract si no se indica uno o no hay datos para él (por ejemplo "eng").
+            default_profile: Perfil de rendimiento que se aplica cuando no se indica uno.
+        """
+        self.directories = {variant: path for variant, path in directories.items() if path and os.path.isdir(path)}
+        self.default_language = default_language
+        self.default_profile = default_profile
+        self._languages: Dict[str, Set[str]] = {}
+        self._warned: Set[Tuple[str, str]] = set()
+        self._lock = threading.Lock()
+        self.refresh()
+
+    def refresh(self):
+        """Vuelve a leer las carpetas (por ejemplo, después de instalar traineddata nuevos)."""
+        languages = {}
+        for variant, path in self.directories.items():
+            languages[variant] = {
+                os.path.basename(file_path)[:-len(".traineddata")]
+                for file_path in glob.glob(os.path.join(path, "*.traineddata"))
+            }
+        with self._lock:
+            self._languages = languages
+        summary = ", ".join(f"{variant}: {len(names)}" for variant, names in languages.items()) or "ninguna carpeta"
+        print(f"Infrastructure Layer (TessdataIndex): Índice de traineddata creado ({summary}).")
+
+    def get_languages(self, variant: Optional[str] = None) -> List[str]:
+        """Idiomas de Tesseract instalados en una variante, o en cualquiera si variant es None."""
+        with self._lock:
+            if variant is not None:
+                return sorted(self._languages.get(variant, ()))
+            return sorted(set().union(*self._languages.values())) if self._languages else []
+
+    def _find_directory(self, tesseract_language: str, preferred_variant: str) -> Optional[Tuple[str, str]]:
+        """Variante y carpeta que tienen todos los traineddata de tesseract_language (por ejemplo "eng+spa")."""
+        parts = set(tesseract_language.split("+"))
+        variants = [preferred_variant] + [variant for variant in (VARIANT_BEST, VARIANT_FAST, VARIANT_DEFAULT) if variant != preferred_variant]
+        with self._lock:
+            for variant in variants:
+                if variant in self._languages and parts <= self._languages[variant]:
+                    return variant, self.directories[variant]
+        return None
+
+    def resolve(self, language_code: Optional[str] = None, profile: Optional[str] = None) -> Tuple[str, Optional[str]]:
+        """
+        Elige el idioma de Tesseract y la carpeta tessdata para un OCR.
+
+        Args:
+            language_code: Código de idioma de Argos (por ejemplo "es"). Un código que ya es de Tesseract
+                           (por ejemplo "spa" o "eng+spa") se usa tal cual. None = idioma por defecto.
+            profile: Perfil de rendimiento ("fast", "balanced", "quality"). None = perfil por defecto.
+
+        Returns:
+            (idioma de Tesseract, carpeta tessdata o None para la carpeta de la instalación).
+        """
+        preferred_variant = PROFILE_VARIANTS.get(profile or self.default_profile or "", VARIANT_BEST)
+        tesseract_language = self.default_language
+        if language_code:
+            tesseract_language = ARGOS_TO_TESSERACT.get(language_code, language_code)
+        with self._lock:
+            index_is_empty = not any(self._languages.values())
+        if index_is_empty:
+            # No se encontró ninguna carpeta tessdata: Tesseract decide (y falla si no tiene el idioma)
+            return tesseract_language, None
+        found = self._find_directory(tesseract_language, preferred_variant)
+        if found is not None:
+            return tesseract_language, found[1]
+
+        warning_key = (tesseract_language, preferred_variant)
+        with self._lock:
+            should_warn = warning_key not in self._warned
+            self._warned.add(warning_key)
+        if should_warn:
+            print(f"Infrastructure Layer (TessdataIndex): Advertencia: No hay traineddata para '{tesseract_language}' "
+                  f"(idioma '{language_code}'). Se usará '{self.default_language}'.")
+        found = self._find_directory(self.default_language, preferred_variant)
+        return self.default_language, found[1] if found is not None else None
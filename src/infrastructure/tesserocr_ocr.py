@@ -0,0 +1,167 @@
+# src/infrastructure/tesserocr_ocr.py
+
+import os
+import queue
+import threading
+from typing import Any, Dict, Optional, Tuple
+
+from PIL import Image
+
+# tesserocr es opcional: enlaza la API C++ de Tesseract dentro del proceso.
+# Sin ella se usa PytesseractOCRService (un proceso tesseract por llamada).
+try:
+    import tesserocr
+except ImportError:
+    tesserocr = None
+
+# Importar la interfaz de la capa de Dominio
+from src.domain.interfaces import IOCRService
+from src.infrastructure.tessdata_index import TessdataIndex
+
+TESSEROCR_AVAILABLE = tesserocr is not None
+
+
+class TesserocrOCRService(IOCRService):
+    """
+    Implementación de IOCRService que mantiene motores de Tesseract cargados dentro del proceso
+    (tesserocr.PyTessBaseAPI), en lugar de escribir la imagen en un archivo temporal y lanzar un
+    proceso tesseract por llamada como hace pytesseract.
+    Esta clase reside en la capa de Infraestructura.
+
+    Los datos de cada idioma (traineddata) se cargan una sola vez por motor. Como un motor no
+    puede usarse desde dos hilos a la vez, hay un pequeño grupo de motores por idioma (y carpeta
+    tessdata): se crean bajo demanda hasta max_engines_per_language y después las llamadas esperan
+    a que uno se libere.
+    """
+
+    def __init__(self, language: str = "eng", tessdata_path: Optional[str] = None,
+                 max_engines_per_language: int = 2, tessdata_index: Optional[TessdataIndex] = None):
+        """
+        Constructor del servicio OCR.
+
+        Args:
+            language: Idioma(s) de Tesseract por defecto (por ejemplo "eng" o "eng+spa").
+            tessdata_path: Carpeta tessdata opcional. Si no se indica, Tesseract usa la suya por defecto.
+            max_engines_per_language: Máximo de motores cargados (y llamadas simultáneas) por idioma.
+            tessdata_index: Índice opcional de traineddata. Con él, el idioma de cada llamada (código de Argos)
+                            y el perfil eligen el traineddata y su variante; sin él se usa siempre language.
+
+        Raises:
+            RuntimeError: Si tesserocr no está instalada.
+        """
+        if tesserocr is None:
+            raise RuntimeError("La biblioteca 'tesserocr' no está instalada (`pip install tesserocr`).")
+        self.language = language
+        self.tessdata_path = tessdata_path
+        self.max_engines_per_language = max(1, max_engines_per_language)
+        self.tessdata_index = tessdata_index
+        # Motores libres por (idioma, carpeta tessdata) y número de motores creados (libres + en uso)
+        self._idle_engines: Dict[Tuple[str, Optional[str]], "queue.LifoQueue"] = {}
+        self._engine_counts: Dict[Tuple[str, Optional[str]], int] = {}
+        self._lock = threading.Lock()
+        self._closed = False
+        print(f"Infrastructure Layer (TesserocrOCRService): Tesseract {tesserocr.tesseract_version().splitlines()[0]} "
+              f"en proceso (idioma por defecto: {language}).")
+
+    def _create_engine(self, engine_key: Tuple[str, Optional[str]]):
+        language, tessdata_path = engine_key
+        kwargs = {"lang": language}
+        if tessdata_path:
+            # tesserocr espera la carpeta con el separador final
+            kwargs["path"] = os.path.join(tessdata_path, "")
+        engine = tesserocr.PyTessBaseAPI(**kwargs)
+        print(f"Infrastructure Layer (TesserocrOCRService): Motor cargado para '{language}' ({tessdata_path or 'tessdata por defecto'}).")
+        return engine
+
+    def _acquire_engine(self, engine_key: Tuple[str, Optional[str]]):
+        """Obtiene un motor libre de (idioma, carpeta), creándolo si aún no se llegó al máximo."""
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("El servicio OCR está cerrado.")
+            idle = self._idle_engines.setdefault(engine_key, queue.LifoQueue())
+            try:
+                return idle.get_nowait()
+            except queue.Empty:
+                pass
+            create = self._engine_counts.get(engine_key, 0) < self.max_engines_per_language
+            if create:
+                self._engine_counts[engine_key] = self._engine_counts.get(engine_key, 0) + 1
+        if create:
+            try:
+                return self._create_engine(engine_key)
+            except Exception:
+                with self._lock:
+                    self._engine_counts[engine_key] -= 1
+                raise
+        # Todos los motores del idioma están en uso: esperar a que se libere uno
+        while True:
+            try:
+                return idle.get(timeout=0.5)
+            except queue.Empty:
+                if self._closed:
+                    raise RuntimeError("El servicio OCR está cerrado.")
+
+    def _release_engine(self, engine_key: Tuple[str, Optional[str]], engine):
+        engine.Clear()
+        with self._lock:
+            if not self._closed:
+                self._idle_engines[engine_key].put(engine)
+                return
+        engine.End()
+
+    def extract_text_from_image_data(self, image_data: Any, language: Optional[str] = None,
+                                     profile: Optional[str] = None) -> str:
+        """
+        Extrae texto de datos de imagen con un motor de Tesseract ya cargado.
+
+        Args:
+            image_data: Los datos de la imagen. Se espera un objeto PIL.Image.Image.
+            language: Código de idioma de Argos del texto (None = idioma por defecto).
+            profile: Perfil de rendimiento; elige entre tessdata "fast" y "best" si hay índice.
+
+        Returns:
+            El texto extraído de la imagen.
+        """
+        if not isinstance(image_data, Image.Image):
+            print("Infrastructure Layer (TesserocrOCRService): Error: Se esperaba un objeto PIL.Image.Image.")
+            return ""
+
+        engine_key = (self.language, self.tessdata_path)
+        if self.tessdata_index is not None:
+            engine_key = self.tessdata_index.resolve(language, profile)
+        try:
+            engine = self._acquire_engine(engine_key)
+        except Exception as e:
+            print(f"Infrastructure Layer (TesserocrOCRService): Error al cargar el motor para '{engine_key[0]}': {e}")
+            return ""
+        try:
+            engine.SetImage(image_data)
+            text = engine.GetUTF8Text()
+            print("Infrastructure Layer (TesserocrOCRService): Texto extraído de la imagen (primeros 50 chars):", text[:50])
+            return text
+        except Exception as e:
+            print(f"Infrastructure Layer (TesserocrOCRService): Error durante el OCR: {e}")
+            return ""
+        finally:
+            self._release_engine(engine_key, engine)
+
+    def get_engine_counts(self) -> Dict[str, int]:
+        """Número de motores cargados por idioma (y carpeta tessdata, si no es la de por defecto)."""
+        with self._lock:
+            return {
+                f"{language} ({tessdata_path})" if tessdata_path else language: count
+                for (language, tessdata_path), count in self._engine_counts.items()
+            }
+
+    def close(self):
+        """Libera los motores libres; los que están en uso se liberan al terminar su llamada."""
+        with self._lock:
+            self._closed = True
+            idle_queues = list(self._idle_engines.values())
+        for idle in idle_queues:
+            while True:
+                try:
+                    idle.get_nowait().End()
+                except queue.Empty:
+                    break
+        print("Infrastructure Layer (TesserocrOCRService): Motores de Tesseract liberados.")
@@ -0,0 +1,62 @@
+# src/infrastructure/text_segmentation.py
+
+import re
+from typing import List, Tuple
+
+# Un segmento es una tupla (oración, separador). El separador contiene los espacios y saltos
+# de línea que siguen a la oración, de forma que "".join(o + s for o, s in segmentos) == texto.
+Segment = Tuple[str, str]
+
+# Fin de oración:
+#  - puntuación latina seguida de comillas/paréntesis opcionales y al menos un espacio,
+#  - puntuación CJK (no suele llevar espacio después),
+#  - un salto de línea (cada línea/párrafo es independiente).
+_SENTENCE_BOUNDARY = re.compile(
+    r"[.!?…]+[\"'”’»)\]]*(?P<ws>\s+)"
+    r"|[。！？]+(?P<cjk>\s*)"
+    r"|(?P<nl>[^\S\n]*\n\s*)"
+)
+_LEADING_WHITESPACE = re.compile(r"^\s+")
+
+
+def split_into_sentences(text: str) -> List[Segment]:
+    """
+    Divide un texto en oraciones conservando los separadores originales.
+    Es una segmentación por reglas, sin modelos, pensada para usarse como clave de caché
+    y para agrupar oraciones en lotes; no intenta resolver abreviaturas.
+
+    Args:
+        text: El texto a segmentar.
+
+    Returns:
+        Una lista de segmentos (oración, separador). Las oraciones vacías solo aparecen
+        para conservar espacios iniciales.
+    """
+    segments: List[Segment] = []
+    position = 0
+
+    leading = _LEADING_WHITESPACE.match(text)
+    if leading:
+        segments.append(("", leading.group(0)))
+        position = leading.end()
+
+    for match in _SENTENCE_BOUNDARY.finditer(text, position):
+        group_name = next(name for name in ("ws", "cjk", "nl") if match.group(name) is not None)
+        sentence_end = match.start(group_name)
+        separator_end = match.end(group_name)
+        if separator_end <= position:
+            continue
+        segments.append((text[position:sentence_end], text[sentence_end:separator_end]))
+        position = separator_end
+
+    if position < len(text):
+        segments.append((text[position:], ""))
+
+    return segments
+
+
+def join_segments(segments: List[Segment]) -> str:
+    """
+    Reconstruye un texto a partir de sus segmentos (oración, separador).
+    """
+    return "".join(sentence + separator for sentence, separator in segments)
@@ -0,0 +1,101 @@
+# src/infrastructure/usage_history.py
+
+import json
+import os
+import threading
+import time
+from typing import Dict, List, Tuple
+
+# Importar la interfaz de la capa de Dominio
+from src.domain.interfaces import IUsageHistory
+
+# Si el mismo par se registra de nuevo antes de este intervalo, no se reescribe el archivo.
+_MIN_SAVE_INTERVAL_SECONDS = 60.0
+
+
+class JsonUsageHistory(IUsageHistory):
+    """
+    Implementación de IUsageHistory que guarda en un archivo JSON la última vez
+    que se usó cada par de idiomas y cuántas veces se usó.
+    Esta clase reside en la capa de Infraestructura.
+    """
+
+    def __init__(self, file_path: str):
+        """
+        Constructor del historial.
+
+        Args:
+            file_path: Ruta del archivo JSON. Se crea al registrar el primer par.
+        """
+        self.file_path = file_path
+        self._lock = threading.Lock()
+        # Clave "origen->destino": {"count": int, "last_used": float}
+        self._pairs: Dict[str, Dict[str, float]] = self._load()
+        self._last_saved_pair = ""
+        self._last_saved_at = 0.0
+        print(f"Infrastructure Layer (JsonUsageHistory): Historial cargado con {len(self._pairs)} pares desde: {file_path}")
+
+    def _load(self) -> Dict[str, Dict[str, float]]:
+        """Lee el archivo de historial. Un archivo inexistente o corrupto equivale a un historial vacío."""
+        if not os.path.exists(self.file_path):
+            return {}
+        try:
+            with open(self.file_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            pairs = data.get("pairs", {})
+            return {key: value for key, value in pairs.items() if "->" in key and isinstance(value, dict)}
+        except (OSError, ValueError, AttributeError) as e:
+            print(f"Infrastructure Layer (JsonUsageHistory): Advertencia: No se pudo leer el historial ({e}). Se empieza vacío.")
+            return {}
+
+    def _save(self):
+        """Escribe el historial en disco de forma atómica. Requiere el lock."""
+        try:
+            file_dir = os.path.dirname(self.file_path)
+            if file_dir:
+                os.makedirs(file_dir, exist_ok=True)
+            temp_path = self.file_path + ".tmp"
+            with open(temp_path, "w", encoding="utf-8") as f:
+                json.dump({"pairs": self._pairs}, f)
+            os.replace(temp_path, self.file_path)
+        except OSError as e:
+            # Un fallo del historial nunca debe afectar a la traducción
+            print(f"Infrastructure Layer (JsonUsageHistory): Error al guardar el historial: {e}")
+
+    def record_pair(self, source_code: str, target_code: str):
+        """
+        Registra el uso de un par. Ver IUsageHistory.record_pair.
+        """
+        if not source_code or not target_code:
+            return
+        pair_key = f"{source_code}->{target_code}"
+        now = time.time()
+        with self._lock:
+            entry = self._pairs.setdefault(pair_key, {"count": 0, "last_used": 0.0})
+            entry["count"] += 1
+            entry["last_used"] = now
+            # Traducir varias veces seguidas con el mismo par no reescribe el archivo cada vez
+            if pair_key == self._last_saved_pair and now - self._last_saved_at < _MIN_SAVE_INTERVAL_SECONDS:
+                return
+            self._save()
+            self._last_saved_pair = pair_key
+            self._last_saved_at = now
+
+    def get_recent_pairs(self, limit: int) -> List[Tuple[str, str]]:
+        """
+        Obtiene los pares más recientes. Ver IUsageHistory.get_recent_pairs.
+        """
+        with self._lock:
+            ordered = sorted(self._pairs.items(), key=lambda item: item[1].get("last_used", 0.0), reverse=True)
+        pairs = []
+        for pair_key, _ in ordered[:max(0, limit)]:
+            source_code, target_code = pair_key.split("->", 1)
+            pairs.append((source_code, target_code))
+        return pairs
+
+    def flush(self):
+        """
+        Escribe en disco cualquier uso registrado que aún no se haya guardado.
+        """
+        with self._lock:
+            self._save()
@@ -0,0 +1,510 @@
+# src/server.py
+#
+# Servidor HTTP local (solo stdlib/asyncio) sobre TranslatorService, para que otras herramientas
+# del mismo equipo reutilicen los modelos ya cargados en lugar de cargar cada una los suyos.
+# Solo escucha en la interfaz de loopback y rechaza conexiones que no vengan de ella. Además, como
+# un navegador puede llegar al puerto local, se rechazan las peticiones cuya cabecera Host no es de
+# loopback (DNS rebinding) y los POST sin Content-Type: application/json (un formulario de otra web
+# puede enviar un POST "simple" entre orígenes, pero no con ese tipo sin una consulta previa CORS).
+#
+# Uso (desde la raíz del repositorio):
+#   python -m src.server [--port 8765] [--config config/config.ini]
+#
+# Endpoints (cuerpos y respuestas en JSON):
+#   GET  /health                                                    -> {"status": "ok"}
+#   GET  /languages                                                 -> {"languages": [{"code", "name"}]}
+#   POST /translate        {"text", "source", "target", "profile"?} -> {"translated_text"} o {"error"}
+#   POST /translate/batch  {"texts", "source", "target", "profile"?} -> {"results": [...]}
+#   POST /ocr-translate    {"image" (base64), "source", "target", "profile"?} -> {"translated_text"} o {"error"}
+#   GET  /stats                                                     -> latencias p50/p99, profundidad de cola, lotes
+
+import argparse
+import asyncio
+import base64
+import binascii
+import ipaddress
+import io
+import json
+import time
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+from src.application.translator_service import TranslatorService
+from src.application.task_scheduler import QueueFullError, PRIORITY_INTERACTIVE, PRIORITY_MANUAL
+from src.domain.models import TranslationResult
+
+# Valores por defecto de la sección [Servidor] de config.ini
+DEFAULT_PORT = 8765
+DEFAULT_MAX_WAIT_MS = 5.0
+DEFAULT_MAX_BATCH_SIZE = 32
+DEFAULT_MAX_BODY_MB = 20
+
+# Segundos que una conexión keep-alive puede permanecer inactiva antes de cerrarse
+_IDLE_TIMEOUT_SECONDS = 30.0
+# Número máximo de cabeceras por petición
+_MAX_HEADERS = 100
+# Latencias recientes que se conservan por endpoint para calcular los percentiles
+_LATENCY_WINDOW = 1000
+
+_STATUS_REASONS = {
+    200: "OK", 400: "Bad Request", 403: "Forbidden", 404: "Not Found", 405: "Method Not Allowed",
+    413: "Payload Too Large", 415: "Unsupported Media Type", 422: "Unprocessable Entity",
+    500: "Internal Server Error", 503: "Service Unavailable",
+}
+
+
+class HttpError(Exception):
+    """Error que se devuelve al cliente con el código HTTP indicado."""
+
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+def is_loopback_host(host: str) -> bool:
+    """Indica si host es una dirección (o el nombre localhost) de la interfaz de loopback."""
+    if host == "localhost":
+        return True
+    try:
+        return ipaddress.ip_address(host).is_loopback
+    except ValueError:
+        return False
+
+
+def is_loopback_host_header(value: str) -> bool:
+    """Indica si una cabecera Host ("127.0.0.1:8765", "[::1]:8765", "localhost") nombra la interfaz de loopback."""
+    value = value.strip().lower()
+    if value.startswith("["):
+        host = value[1:value.find("]")] if "]" in value else ""
+    elif value.count(":") == 1:
+        host = value.split(":", 1)[0]
+    else:
+        host = value
+    return is_loopback_host(host)
+
+
+def is_json_content_type(value: str) -> bool:
+    """Indica si una cabecera Content-Type es application/json (con parámetros opcionales como charset)."""
+    return value.split(";", 1)[0].strip().lower() == "application/json"
+
+
+class LatencyRecorder:
+    """
+    Guarda las latencias recientes de cada endpoint y calcula sus percentiles.
+    Solo se usa desde el bucle de eventos, por lo que no necesita bloqueo.
+    """
+
+    def __init__(self, window: int = _LATENCY_WINDOW):
+        self._window = window
+        self._samples: Dict[str, Deque[float]] = {}
+        self._counts: Dict[str, int] = {}
+
+    def record(self, endpoint: str, seconds: float):
+        self._samples.setdefault(endpoint, deque(maxlen=self._window)).append(seconds)
+        self._counts[endpoint] = self._counts.get(endpoint, 0) + 1
+
+    def get_stats(self) -> Dict[str, Dict[str, float]]:
+        """Retorna, por endpoint, el número de peticiones y la latencia p50/p99/máxima en milisegundos."""
+        stats: Dict[str, Dict[str, float]] = {}
+        for endpoint, samples in self._samples.items():
+            ordered = sorted(samples)
+            stats[endpoint] = {
+                "requests": self._counts[endpoint],
+                "p50_ms": ordered[min(len(ordered) - 1, int(len(ordered) * 0.50))] * 1000,
+                "p99_ms": ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))] * 1000,
+                "max_ms": ordered[-1] * 1000,
+            }
+        return stats
+
+
+class MicroBatcher:
+    """
+    Agrupa en micro-lotes las peticiones de traducción concurrentes del mismo par y perfil.
+    La primera petición de un grupo abre una ventana de max_wait_seconds; el lote se envía al
+    servicio (perform_translation_batch, en el planificador) cuando la ventana vence o cuando
+    reúne max_batch_size textos. Solo se usa desde el bucle de eventos.
+    """
+
+    def __init__(self, translator_service: TranslatorService, max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+                 max_wait_seconds: float = DEFAULT_MAX_WAIT_MS / 1000):
+        self.translator_service = translator_service
+        self.max_batch_size = max(1, max_batch_size)
+        self.max_wait_seconds = max(0.0, max_wait_seconds)
+        # Peticiones que esperan en la ventana de su grupo: (origen, destino, perfil) -> [(texto, future)]
+        self._pending: Dict[Tuple[str, str, Optional[str]], List[Tuple[str, asyncio.Future]]] = {}
+        self._timers: Dict[Tuple[str, str, Optional[str]], asyncio.TimerHandle] = {}
+        self._in_batch = 0
+        self._stats = {"batches": 0, "texts": 0, "max_batch": 0}
+
+    async def translate(self, text: str, source_lang_code: str, target_lang_code: str,
+                        profile: Optional[str] = None) -> TranslationResult:
+        """
+        Encola un texto en el micro-lote de su grupo y espera su resultado.
+
+        Raises:
+            QueueFullError: Si el planificador rechaza el lote.
+        """
+        loop = asyncio.get_running_loop()
+        key = (source_lang_code, target_lang_code, profile)
+        future = loop.create_future()
+        group = self._pending.setdefault(key, [])
+        group.append((text, future))
+        if len(group) >= self.max_batch_size:
+            self._flush(key)
+        elif len(group) == 1:
+            self._timers[key] = loop.call_later(self.max_wait_seconds, self._flush, key)
+        return await future
+
+    def _flush(self, key: Tuple[str, str, Optional[str]]):
+        """Cierra la ventana de un grupo y envía sus textos como un lote."""
+        timer = self._timers.pop(key, None)
+        if timer is not None:
+            timer.cancel()
+        items = self._pending.pop(key, [])
+        if items:
+            self._in_batch += len(items)
+            asyncio.get_running_loop().create_task(self._run_batch(key, items))
+
+    async def _run_batch(self, key: Tuple[str, str, Optional[str]], items: List[Tuple[str, asyncio.Future]]):
+        source_lang_code, target_lang_code, profile = key
+        texts = [text for text, _ in items]
+        self._stats["batches"] += 1
+        self._stats["texts"] += len(texts)
+        self._stats["max_batch"] = max(self._stats["max_batch"], len(texts))
+        try:
+            results = await self.translator_service.run_async(
+                self.translator_service.perform_translation_batch,
+                texts, source_lang_code, target_lang_code, profile=profile, priority=PRIORITY_MANUAL
+            )
+            for (_, future), result in zip(items, results):
+                if not future.done():
+                    future.set_result(result)
+        except Exception as e:
+            for _, future in items:
+                if not future.done():
+                    future.set_exception(e)
+        finally:
+            self._in_batch -= len(items)
+
+    def get_queue_depth(self) -> Dict[str, int]:
+        """Textos esperando en una ventana y textos de lotes enviados que aún no terminaron."""
+        return {
+            "waiting": sum(len(group) for group in self._pending.values()),
+            "in_batch": self._in_batch,
+        }
+
+    def get_stats(self) -> Dict[str, float]:
+        stats: Dict[str, float] = dict(self._stats)
+        stats["avg_batch"] = self._stats["texts"] / self._stats["batches"] if self._stats["batches"] else 0.0
+        return stats
+
+
+class TranslationServer:
+    """
+    Servidor HTTP/1.1 mínimo (con keep-alive) sobre TranslatorService.
+    Las operaciones bloqueantes se ejecutan en el planificador del servicio; el bucle de eventos
+    solo analiza peticiones y agrupa los textos en micro-lotes.
+    """
+
+    def __init__(self, translator_service: TranslatorService, host: str = "127.0.0.1", port: int = DEFAULT_PORT,
+                 max_batch_size: int = DEFAULT_MAX_BATCH_SIZE, max_wait_ms: float = DEFAULT_MAX_WAIT_MS,
+                 max_body_bytes: int = DEFAULT_MAX_BODY_MB * 1024 * 1024):
+        """
+        Args:
+            translator_service: Servicio de aplicación ya construido.
+            host: Dirección de escucha. Debe ser de loopback.
+            port: Puerto de escucha (0 = uno libre, útil en pruebas).
+            max_batch_size: Máximo de textos por micro-lote.
+            max_wait_ms: Ventana máxima (ms) que una petición espera a otras del mismo par.
+            max_body_bytes: Tamaño máximo del cuerpo de una petición.
+
+        Raises:
+            ValueError: Si host no es una dirección de loopback.
+        """
+        if not is_loopback_host(host):
+            raise ValueError(f"El servidor solo puede escuchar en loopback (127.0.0.1, ::1 o localhost), no en '{host}'.")
+        self.translator_service = translator_service
+        self.host = host
+        self.port = port
+        self.max_body_bytes = max_body_bytes
+        self._batcher = MicroBatcher(translator_service, max_batch_size, max_wait_ms / 1000)
+        self._latencies = LatencyRecorder()
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._active_requests = 0
+        self._routes = {
+            ("GET", "/health"): self._handle_health,
+            ("GET", "/languages"): self._handle_languages,
+            ("GET", "/stats"): self._handle_stats,
+            ("POST", "/translate"): self._handle_translate,
+            ("POST", "/translate/batch"): self._handle_translate_batch,
+            ("POST", "/ocr-translate"): self._handle_ocr_translate,
+        }
+
+    async def start(self):
+        """Empieza a aceptar conexiones. Si port era 0, self.port pasa a ser el puerto asignado."""
+        self._server = await asyncio.start_server(self._handle_connection, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+        print(f"Server: Escuchando en http://{self.host}:{self.port}")
+
+    async def serve_forever(self):
+        if self._server is None:
+            await self.start()
+        async with self._server:
+            await self._server.serve_forever()
+
+    async def stop(self):
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+            print("Server: Servidor detenido.")
+
+    # --- Conexiones y protocolo HTTP ---
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        peer = writer.get_extra_info("peername")
+        try:
+            if not peer or not is_loopback_host(peer[0]):
+                # No debería ocurrir escuchando en loopback, pero se comprueba por si acaso
+                await self._write_response(writer, 403, {"error": "Solo se aceptan conexiones locales."}, keep_alive=False)
+                return
+            keep_alive = True
+            while keep_alive:
+                try:
+                    request = await asyncio.wait_for(self._read_request(reader), _IDLE_TIMEOUT_SECONDS)
+                except HttpError as e:
+                    await self._write_response(writer, e.status, {"error": e.message}, keep_alive=False)
+                    return
+                if request is None:
+                    return
+                method, path, headers, body = request
+                keep_alive = headers.get("connection", "").lower() != "close"
+                status, payload = await self._dispatch(method, path, headers, body)
+                await self._write_response(writer, status, payload, keep_alive)
+        except (asyncio.TimeoutError, asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+
+    async def _read_request(self, reader: asyncio.StreamReader) -> Optional[Tuple[str, str, Dict[str, str], bytes]]:
+        """
+        Lee una petición completa. Retorna None si el cliente cerró la conexión.
+
+        Raises:
+            HttpError: Si la petición está mal formada o el cuerpo supera el máximo.
+        """
+        request_line = await reader.readline()
+        if not request_line:
+            return None
+        parts = request_line.decode("latin-1").strip().split()
+        if len(parts) != 3 or not parts[2].startswith("HTTP/1."):
+            raise HttpError(400, "Línea de petición inválida.")
+        method, target, version = parts
+        headers: Dict[str, str] = {}
+        while True:
+            line = await reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+            if len(headers) >= _MAX_HEADERS:
+                raise HttpError(400, "Demasiadas cabeceras.")
+            name, separator, value = line.decode("latin-1").partition(":")
+            if not separator:
+                raise HttpError(400, "Cabecera inválida.")
+            headers[name.strip().lower()] = value.strip()
+        if version == "HTTP/1.0" and headers.get("connection", "").lower() != "keep-alive":
+            headers["connection"] = "close"
+        try:
+            content_length = int(headers.get("content-length", "0"))
+        except ValueError:
+            raise HttpError(400, "Content-Length inválido.")
+        if content_length < 0:
+            raise HttpError(400, "Content-Length inválido.")
+        if content_length > self.max_body_bytes:
+            raise HttpError(413, f"El cuerpo supera el máximo de {self.max_body_bytes} bytes.")
+        body = await reader.readexactly(content_length) if content_length else b""
+        path = target.split("?", 1)[0]
+        return method.upper(), path, headers, body
+
+    async def _write_response(self, writer: asyncio.StreamWriter, status: int, payload: Dict[str, Any], keep_alive: bool):
+        body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        head = (
+            f"HTTP/1.1 {status} {_STATUS_REASONS.get(status, '')}\r\n"
+            "Content-Type: application/json; charset=utf-8\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n"
+            "\r\n"
+        )
+        writer.write(head.encode("latin-1") + body)
+        await writer.drain()
+
+    async def _dispatch(self, method: str, path: str, headers: Dict[str, str], body: bytes) -> Tuple[int, Dict[str, Any]]:
+        # Una página web que resuelve su dominio a 127.0.0.1 envía su propio nombre en Host
+        if not is_loopback_host_header(headers.get("host", "")):
+            return 403, {"error": "La cabecera Host debe ser una dirección de loopback."}
+        handler = self._routes.get((method, path))
+        if handler is None:
+            if any(route_path == path for _, route_path in self._routes):
+                return 405, {"error": f"Método {method} no permitido en {path}."}
+            return 404, {"error": f"Ruta no encontrada: {path}"}
+        if method == "POST" and not is_json_content_type(headers.get("content-type", "")):
+            return 415, {"error": "El cuerpo debe enviarse con Content-Type: application/json."}
+
+        start = time.perf_counter()
+        self._active_requests += 1
+        try:
+            data = self._parse_json(body) if method == "POST" else {}
+            return await handler(data)
+        except HttpError as e:
+            return e.status, {"error": e.message}
+        except QueueFullError as e:
+            return 503, {"error": str(e)}
+        except Exception as e:
+            print(f"Server Error: Error inesperado en {method} {path}: {e}")
+            return 500, {"error": f"Error inesperado: {e}"}
+        finally:
+            self._active_requests -= 1
+            self._latencies.record(f"{method} {path}", time.perf_counter() - start)
+
+    @staticmethod
+    def _parse_json(body: bytes) -> Dict[str, Any]:
+        try:
+            data = json.loads(body.decode("utf-8")) if body else {}
+        except (UnicodeDecodeError, json.JSONDecodeError) as e:
+            raise HttpError(400, f"JSON inválido: {e}")
+        if not isinstance(data, dict):
+            raise HttpError(400, "El cuerpo debe ser un objeto JSON.")
+        return data
+
+    @staticmethod
+    def _require_str(data: Dict[str, Any], field: str) -> str:
+        value = data.get(field)
+        if not isinstance(value, str) or not value:
+            raise HttpError(400, f"Falta el campo de texto '{field}'.")
+        return value
+
+    @staticmethod
+    def _optional_profile(data: Dict[str, Any]) -> Optional[str]:
+        profile = data.get("profile")
+        if profile is not None and not isinstance(profile, str):
+            raise HttpError(400, "El campo 'profile' debe ser texto.")
+        return profile or None
+
+    @staticmethod
+    def _result_to_payload(result: TranslationResult) -> Tuple[int, Dict[str, Any]]:
+        if result.is_successful:
+            return 200, {"translated_text": result.translated_text}
+        return 422, {"error": result.error}
+
+    # --- Endpoints ---
+
+    async def _handle_health(self, data: Dict[str, Any]) -> Tuple[int, Dict[str, Any]]:
+        return 200, {"status": "ok"}
+
+    async def _handle_languages(self, data: Dict[str, Any]) -> Tuple[int, Dict[str, Any]]:
+        languages = await self.translator_service.run_async(
+            self.translator_service.get_supported_languages, priority=PRIORITY_INTERACTIVE
+        )
+        return 200, {"languages": [{"code": language.code, "name": language.name} for language in languages]}
+
+    async def _handle_translate(self, data: Dict[str, Any]) -> Tuple[int, Dict[str, Any]]:
+        text = self._require_str(data, "text")
+        result = await self._batcher.translate(
+            text, self._require_str(data, "source"), self._require_str(data, "target"), self._optional_profile(data)
+        )
+        return self._result_to_payload(result)
+
+    async def _handle_translate_batch(self, data: Dict[str, Any]) -> Tuple[int, Dict[str, Any]]:
+        texts = data.get("texts")
+        if not isinstance(texts, list) or not all(isinstance(text, str) for text in texts):
+            raise HttpError(400, "El campo 'texts' debe ser una lista de textos.")
+        # El cliente ya envía un lote: va directo al servicio, sin pasar por la ventana de agrupación
+        results = await self.translator_service.run_async(
+            self.translator_service.perform_translation_batch,
+            texts, self._require_str(data, "source"), self._require_str(data, "target"),
+            profile=self._optional_profile(data), priority=PRIORITY_MANUAL
+        )
+        payload = [
+            {"translated_text": result.translated_text} if result.is_successful else {"error": result.error}
+            for result in results
+        ]
+        return 200, {"results": payload}
+
+    async def _handle_ocr_translate(self, data: Dict[str, Any]) -> Tuple[int, Dict[str, Any]]:
+        try:
+            image_bytes = base64.b64decode(self._require_str(data, "image"), validate=True)
+        except (binascii.Error, ValueError):
+            raise HttpError(400, "El campo 'image' debe ser una imagen codificada en base64.")
+        source_lang_code = self._require_str(data, "source")
+        target_lang_code = self._require_str(data, "target")
+        try:
+            from PIL import Image
+            image = Image.open(io.BytesIO(image_bytes))
+            image.load()
+        except Exception as e:
+            raise HttpError(400, f"No se pudo abrir la imagen: {e}")
+        result = await self.translator_service.ocr_and_translate_async(image, source_lang_code, target_lang_code,
+                                                                       profile=self._optional_profile(data))
+        return self._result_to_payload(result)
+
+    async def _handle_stats(self, data: Dict[str, Any]) -> Tuple[int, Dict[str, Any]]:
+        return 200, {
+            "latency": self._latencies.get_stats(),
+            "queue_depth": {
+                "active_requests": self._active_requests,
+                **self._batcher.get_queue_depth(),
+                "scheduler": {name: class_stats["queued"] for name, class_stats in self.translator_service.get_scheduler_stats().items()},
+            },
+            "micro_batching": self._batcher.get_stats(),
+            "coalescing": self.translator_service.get_coalescing_stats(),
+        }
+
+
+def main():
+    from src.bootstrap import build_application_core, get_configured_prewarm_pairs
+    from src.application.task_scheduler import PRIORITY_BACKGROUND
+    from src.infrastructure.app_config import AppConfig
+    from src.infrastructure.null_hotkey_manager import NullHotkeyManager
+
+    parser = argparse.ArgumentParser(description="Servidor HTTP local de traducción (solo loopback).")
+    parser.add_argument("--config", default=None, help="Ruta de config.ini (por defecto: config/config.ini)")
+    parser.add_argument("--host", default="127.0.0.1", help="Dirección de loopback donde escuchar (por defecto: 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=None, help=f"Puerto (por defecto: [Servidor] puerto, o {DEFAULT_PORT})")
+    args = parser.parse_args()
+
+    if not is_loopback_host(args.host):
+        parser.error("--host debe ser una dirección de loopback (127.0.0.1, ::1 o localhost).")
+
+    app_config = AppConfig(args.config)
+    application_core = build_application_core(app_config, NullHotkeyManager())
+    translator_service = application_core.translator_service
+
+    if app_config.get_bool("Precarga", "habilitada", True):
+        pairs = translator_service.get_prewarm_pairs(
+            get_configured_prewarm_pairs(app_config), app_config.get_int("Precarga", "max_pares_historial", 3)
+        )
+        if pairs:
+            translator_service.submit_task(translator_service.prewarm_models, pairs, priority=PRIORITY_BACKGROUND)
+
+    server = TranslationServer(
+        translator_service,
+        host=args.host,
+        port=args.port if args.port is not None else app_config.get_int("Servidor", "puerto", DEFAULT_PORT),
+        max_batch_size=app_config.get_int("Servidor", "tamano_max_lote", DEFAULT_MAX_BATCH_SIZE),
+        max_wait_ms=app_config.get_float("Servidor", "espera_max_lote_ms", DEFAULT_MAX_WAIT_MS),
+        max_body_bytes=app_config.get_int("Servidor", "max_cuerpo_mb", DEFAULT_MAX_BODY_MB) * 1024 * 1024,
+    )
+    try:
+        asyncio.run(server.serve_forever())
+    except KeyboardInterrupt:
+        print("Server: Interrupción recibida. Cerrando...")
+    finally:
+        application_core.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -6,16 +6,12 @@ from PySide6.QtWidgets import (
     QMessageBox, QListWidgetItem, QSizePolicy, QAbstractItemView,
     QApplication
 )
-from PySide6.QtCore import Qt, Signal, Slot, QObject, QThread, QTimer
-import threading
+from PySide6.QtCore import Qt, Signal, Slot, QObject
+from concurrent.futures import Future
 from typing import List, Any, Callable, Optional
-import os
-import shutil
 
 from src.application.translator_service import TranslatorService
-
-import argostranslate.package
-import argostranslate.translate
+from src.application.task_scheduler import QueueFullError, PRIORITY_BACKGROUND
 
 
 class PackageOperationEmitter(QObject):
@@ -32,6 +28,8 @@ class LanguagesConfigSection(QWidget):
     """Widget para la sección de configuración de Idiomas/Paquetes."""
     def __init__(self, translator_service: TranslatorService, parent: QWidget = None):
         super().__init__(parent)
+        # Las operaciones de paquetes (consulta, instalación, desinstalación) pasan por el servicio
+        # y se ejecutan en su planificador de tareas
         self.translator_service = translator_service
         self.layout = QVBoxLayout(self)
 
@@ -84,9 +82,9 @@ class LanguagesConfigSection(QWidget):
         self.installed_languages_list.itemSelectionChanged.connect(self._on_installed_selection_changed)
         self.available_packages_list.itemSelectionChanged.connect(self._on_available_selection_changed)
 
-        self._current_package_thread: Optional[threading.Thread] = None
-        self._installed_packages: List[argostranslate.package.Package] = []
-        self._available_packages: List[argostranslate.package.AvailablePackage] = []
+        self._current_package_future: Optional[Future] = None
+        self._installed_packages: List[Any] = []
+        self._available_packages: List[Any] = []
 
         self._load_installed_packages()
         self._load_available_packages()
@@ -107,148 +105,101 @@ class LanguagesConfigSection(QWidget):
             print(f"UI Layer (LanguagesConfigSection): Listo. {message}")
 
 
-    # --- Funciones que se ejecutarán en el hilo estándar ---
+    # --- Funciones que se ejecutarán en el planificador de tareas ---
 
     def _load_installed_packages_task(self):
-        """Tarea para cargar paquetes instalados en un hilo separado."""
+        """Tarea para cargar paquetes instalados en segundo plano."""
         print("Standard Thread (Packages): _load_installed_packages_task() iniciado.")
         try:
-            installed_packages = argostranslate.package.get_installed_packages()
-            print(f"Standard Thread (Packages): Cargados {len(installed_packages)} paquetes instalados.")
+            installed_packages = self.translator_service.get_installed_packages()
             self._package_operation_emitter.installed_packages_loaded.emit(installed_packages)
         except Exception as e:
             error_msg = f"Error al cargar paquetes instalados: {e}"
             print(f"Standard Thread (Packages) Error: {error_msg}")
             self._package_operation_emitter.operation_finished.emit(False, error_msg)
-        finally:
-            pass
 
 
-    def _load_available_packages_task(self):
-        """Tarea para cargar paquetes disponibles en un hilo separado."""
+    def _load_available_packages_task(self, force_refresh: bool = False):
+        """
+        Tarea para cargar paquetes disponibles en segundo plano.
+        El índice remoto solo se descarga si expiró o si force_refresh es True.
+        """
         print("Standard Thread (Packages): _load_available_packages_task() iniciado.")
         try:
-            print("Standard Thread (Packages): Actualizando índice de paquetes remotos...")
-            argostranslate.package.update_package_index()
-            print("Standard Thread (Packages): Índice remoto actualizado.")
-
-            print("Standard Thread (Packages): Obteniendo paquetes disponibles...")
-            available_packages = argostranslate.package.get_available_packages()
-            print(f"Standard Thread (Packages): Obtenidos {len(available_packages)} paquetes disponibles.")
-
-            installed_packages = argostranslate.package.get_installed_packages()
-            print(f"Standard Thread (Packages): Obtenidos {len(installed_packages)} paquetes instalados para comparación.")
-
+            available_packages = self.translator_service.get_available_packages(force_refresh=force_refresh)
+            installed_packages = self.translator_service.get_installed_packages()
             self._package_operation_emitter.available_packages_loaded.emit(available_packages, installed_packages)
-
         except Exception as e:
             error_msg = f"Error al cargar paquetes disponibles: {e}"
             print(f"Standard Thread (Packages) Error: {error_msg}")
             self._package_operation_emitter.operation_finished.emit(False, error_msg)
-        finally:
-            pass
 
 
-    def _install_package_task(self, package_to_install: argostranslate.package.AvailablePackage):
-        """Tarea para instalar un paquete en un hilo separado."""
-        print(f"Standard Thread (Packages): _install_package_task() iniciado para {package_to_install.from_code} -> {package_to_install.to_code}.")
-        try:
-            print(f"Standard Thread (Packages): Descargando {package_to_install.from_code} -> {package_to_install.to_code}...")
-            download_path = package_to_install.download()
-            print(f"Standard Thread (Packages): Descarga completa. Instalando desde {download_path}...")
+    def _install_packages_task(self, packages: List[Any]):
+        """Tarea para instalar uno o varios paquetes de forma secuencial."""
+        print(f"Standard Thread (Packages): Iniciando instalación secuencial de {len(packages)} paquete(s).")
+        success_count = 0
+        error_messages = []
+        for i, pkg in enumerate(packages):
+            try:
+                print(f"Standard Thread (Packages): Instalando paquete {i+1}/{len(packages)}: {pkg.from_code} -> {pkg.to_code}")
+                # Descarga, instalación e invalidación de cachés
+                self.translator_service.install_package(pkg)
+                success_count += 1
+                print(f"Standard Thread (Packages): Paquete {pkg.from_code} -> {pkg.to_code} instalado correctamente.")
+            except Exception as e:
+                error_msg = f"Error al instalar paquete {pkg.from_code} -> {pkg.to_code}: {e}"
+                print(f"Standard Thread (Packages) Error: {error_msg}")
+                error_messages.append(error_msg)
 
-            argostranslate.package.install_from_path(download_path)
-            print(f"Standard Thread (Packages): Instalación completa para {package_to_install.from_code} -> {package_to_install.to_code}.")
+        print("Standard Thread (Packages): Recargando listas después de instalación secuencial.")
+        self._load_installed_packages_task()
+        self._load_available_packages_task()
+
+        if not error_messages:
+            final_message = f"Se instalaron {success_count} paquete(s) correctamente."
+            self._package_operation_emitter.operation_finished.emit(True, final_message)
+        else:
+            final_message = f"Se instalaron {success_count} paquete(s) con errores en {len(error_messages)}: \n" + "\n".join(error_messages)
+            self._package_operation_emitter.operation_finished.emit(False, final_message)
 
-            if os.path.exists(download_path):
-                 try:
-                     os.remove(download_path)
-                     print(f"Standard Thread (Packages): Archivo descargado temporal eliminado: {download_path}")
-                 except Exception as cleanup_e:
-                     print(f"Standard Thread (Packages) Error: No se pudo eliminar el archivo descargado temporal {download_path}: {cleanup_e}")
 
+    def _uninstall_package_task(self, package_to_uninstall: Any):
+        """Tarea para desinstalar un paquete en segundo plano."""
+        print(f"Standard Thread (Packages): _uninstall_package_task() iniciado para {package_to_uninstall.from_code} -> {package_to_uninstall.to_code}.")
+        try:
+            self.translator_service.uninstall_package(package_to_uninstall)
+
+            # Recargar las listas después de la desinstalación exitosa
             self._load_installed_packages_task()
             self._load_available_packages_task()
 
-            self._package_operation_emitter.operation_finished.emit(True, f"Paquete {package_to_install.from_code} -> {package_to_install.to_code} instalado correctamente.")
-
-        except Exception as e:
-            error_msg = f"Error al instalar paquete {package_to_install.from_code} -> {package_to_install.to_code}: {e}"
+            self._package_operation_emitter.operation_finished.emit(True, f"Paquete {package_to_uninstall.from_code} -> {package_to_uninstall.to_code} desinstalado correctamente.")
+        except FileNotFoundError as e:
+            error_msg = f"Error al desinstalar paquete {package_to_uninstall.from_code} -> {package_to_uninstall.to_code}: {e}"
             print(f"Standard Thread (Packages) Error: {error_msg}")
             self._package_operation_emitter.operation_finished.emit(False, error_msg)
-        finally:
-            pass
-
-
-    def _uninstall_package_task(self, package_to_uninstall: argostranslate.package.Package):
-        """
-        Tarea para desinstalar un paquete buscando su directorio por códigos de idioma.
-        """
-        print(f"Standard Thread (Packages): _uninstall_package_task() iniciado para {package_to_uninstall.from_code} -> {package_to_uninstall.to_code}.")
-        try:
-            home_dir = os.path.expanduser("~")
-            packages_dir = os.path.join(home_dir, ".local", "share", "argos-translate", "packages")
-
-            print(f"Standard Thread (Packages): Buscando directorio del paquete en: {packages_dir}")
-
-            from_code = package_to_uninstall.from_code
-            to_code = package_to_uninstall.to_code
-
-            package_path_to_remove = None
-
-            # Buscar el directorio del paquete de forma más flexible
-            if os.path.exists(packages_dir):
-                for item_name in os.listdir(packages_dir):
-                    item_path = os.path.join(packages_dir, item_name)
-                    # Verificar si es un directorio
-                    if os.path.isdir(item_path):
-                        # Verificar si el nombre del directorio contiene ambos códigos de idioma
-                        # Consideramos nombres como "ar_en" o "translate-ar_en-1_9"
-                        # Hacemos una búsqueda insensible a mayúsculas/minúsculas para mayor robustez
-                        item_name_lower = item_name.lower()
-                        from_to_lower = f"{from_code}_{to_code}".lower()
-                        translate_from_to_lower = f"translate-{from_code}_{to_code}-".lower()
-
-
-                        if from_to_lower in item_name_lower or item_name_lower.startswith(translate_from_to_lower):
-                             # Encontramos un posible directorio del paquete.
-                             package_path_to_remove = item_path
-                             print(f"Standard Thread (Packages): Directorio encontrado: {package_path_to_remove}")
-                             break # Encontramos el directorio, podemos dejar de buscar
-
-            if package_path_to_remove and os.path.exists(package_path_to_remove):
-                print(f"Standard Thread (Packages): Eliminando directorio: {package_path_to_remove}")
-                shutil.rmtree(package_path_to_remove)
-                print("Standard Thread (Packages): Directorio del paquete eliminado correctamente.")
-
-                # Recargar las listas después de la desinstalación exitosa
-                self._load_installed_packages_task()
-                self._load_available_packages_task()
-
-                self._package_operation_emitter.operation_finished.emit(True, f"Paquete {package_to_uninstall.from_code} -> {package_to_uninstall.to_code} desinstalado correctamente.")
-            else:
-                error_msg = f"Error al desinstalar paquete {package_to_uninstall.from_code} -> {package_to_uninstall.to_code}: No se encontró el directorio del paquete en la ruta esperada ({packages_dir}) con códigos '{from_code}_{to_code}'."
-                print(f"Standard Thread (Packages) Error: {error_msg}")
-                self._package_operation_emitter.operation_finished.emit(False, error_msg)
-
         except Exception as e:
             error_msg = f"Error inesperado al desinstalar paquete {package_to_uninstall.from_code} -> {package_to_uninstall.to_code}: {e}"
             print(f"Standard Thread (Packages) Error: {error_msg}")
             self._package_operation_emitter.operation_finished.emit(False, error_msg)
-        finally:
-            pass
 
 
-    # --- Método genérico para iniciar tareas en el Hilo Estándar ---
+    # --- Método genérico para iniciar tareas de paquetes en el planificador del servicio ---
+    def _is_package_task_running(self) -> bool:
+        """Indica si hay una operación de paquetes en cola o en curso."""
+        return self._current_package_future is not None and not self._current_package_future.done()
+
     def _start_package_task(self, func: Callable, *args, message: str, **kwargs):
         """
-        Inicia una función dada (relacionada con operaciones de paquetes) en un hilo estándar.
+        Encola una función dada (relacionada con operaciones de paquetes) en el planificador de tareas
+        del servicio, con prioridad de segundo plano.
         """
-        if self._current_package_thread is not None and self._current_package_thread.is_alive():
-            print("UI Layer (LanguagesConfigSection): Hilo de paquetes ocupado. Espere a que termine la tarea actual.")
+        if self._is_package_task_running():
+            print("UI Layer (LanguagesConfigSection): Operación de paquetes en curso. Espere a que termine la tarea actual.")
             return
 
-        print(f"UI Layer (LanguagesConfigSection): Creando nuevo hilo estándar para tarea: {message}")
+        print(f"UI Layer (LanguagesConfigSection): Encolando tarea: {message}")
         self._package_operation_emitter.operation_started.emit(message)
 
         def task_wrapper():
@@ -258,19 +209,18 @@ class LanguagesConfigSection(QWidget):
                 self._package_operation_emitter.operation_completed.emit()
                 print("Standard Thread (Packages): Señal 'operation_completed' emitida.")
 
-        self._current_package_thread = threading.Thread(
-            target=task_wrapper,
-            daemon=True
-        )
-
-        self._current_package_thread.start()
-        print("UI Layer (LanguagesConfigSection): Hilo estándar iniciado.")
+        try:
+            self._current_package_future = self.translator_service.submit_future(task_wrapper, priority=PRIORITY_BACKGROUND)
+        except (QueueFullError, RuntimeError) as e:
+            print(f"UI Layer (LanguagesConfigSection) Error: No se pudo encolar la tarea: {e}")
+            self._package_operation_emitter.operation_finished.emit(False, str(e))
+            self._package_operation_emitter.operation_completed.emit()
 
 
     # --- Slots para manejar resultados/errores del Hilo Estándar ---
 
     @Slot(list)
-    def _on_installed_packages_loaded(self, packages: List[argostranslate.package.Package]):
+    def _on_installed_packages_loaded(self, packages: List[Any]):
         """Slot para actualizar la lista de paquetes instalados en la UI."""
         print(f"UI Layer (LanguagesConfigSection): Señal installed_packages_loaded recibida con {len(packages)} paquetes.")
         self._installed_packages = packages
@@ -284,7 +234,7 @@ class LanguagesConfigSection(QWidget):
 
 
     @Slot(list, list)
-    def _on_available_packages_loaded(self, available_packages: List[argostranslate.package.AvailablePackage], installed_packages: List[argostranslate.package.Package]):
+    def _on_available_packages_loaded(self, available_packages: List[Any], installed_packages: List[Any]):
         """Slot para actualizar la lista de paquetes disponibles en la UI."""
         print(f"UI Layer (LanguagesConfigSection): Señal available_packages_loaded recibida con {len(available_packages)} disponibles y {len(installed_packages)} instalados.")
         self._available_packages = available_packages
@@ -339,7 +289,7 @@ class LanguagesConfigSection(QWidget):
         """Slot para indicar la finalización de una operación."""
         print("UI Layer (LanguagesConfigSection): Señal operation_completed recibida.")
         self._set_ui_busy_state(False, "Listo.")
-        self._current_package_thread = None
+        self._current_package_future = None
 
 
     # --- Slots para acciones de botones ---
@@ -350,6 +300,7 @@ class LanguagesConfigSection(QWidget):
         print("UI Layer (LanguagesConfigSection): 'Actualizar Lista de Paquetes' clicked.")
         self._start_package_task(
             self._load_available_packages_task,
+            force_refresh=True, # El usuario pidió explícitamente actualizar
             message="Actualizando lista de paquetes disponibles..."
         )
 
@@ -362,52 +313,11 @@ class LanguagesConfigSection(QWidget):
             QMessageBox.information(self, "Nada Seleccionado", "Por favor, selecciona al menos un paquete para instalar.")
             return
 
-        packages_to_install: List[argostranslate.package.AvailablePackage] = [item.data(Qt.UserRole) for item in selected_items]
+        packages_to_install: List[Any] = [item.data(Qt.UserRole) for item in selected_items]
 
         if packages_to_install:
-            def install_multiple_task(packages: List[argostranslate.package.AvailablePackage]):
-                 print(f"Standard Thread (Packages): Iniciando instalación secuencial de {len(packages)} paquete(s).")
-                 success_count = 0
-                 error_messages = []
-                 for i, pkg in enumerate(packages):
-                     try:
-                         print(f"Standard Thread (Packages): Instalando paquete {i+1}/{len(packages)}: {pkg.from_code} -> {pkg.to_code}")
-                         download_path = pkg.download()
-                         argostranslate.package.install_from_path(download_path)
-                         if os.path.exists(download_path):
-                             try: os.remove(download_path)
-                             except Exception as cleanup_e: print(f"Standard Thread (Packages) Error: No se pudo eliminar el archivo descargado temporal {download_path}: {cleanup_e}")
-
-                         success_count += 1
-                         print(f"Standard Thread (Packages): Paquete {pkg.from_code} -> {pkg.to_code} instalado correctamente.")
-
-                     except Exception as e:
-                         error_msg = f"Error al instalar paquete {pkg.from_code} -> {pkg.to_code}: {e}"
-                         print(f"Standard Thread (Packages) Error: {error_msg}")
-                         error_messages.append(error_msg)
-
-                 try:
-                     print("Standard Thread (Packages): Recargando listas después de instalación secuencial.")
-                     installed_packages = argostranslate.package.get_installed_packages()
-                     self._package_operation_emitter.installed_packages_loaded.emit(installed_packages)
-
-                     argostranslate.package.load_available_packages()
-                     available_packages = argostranslate.package.get_available_packages()
-                     self._package_operation_emitter.available_packages_loaded.emit(available_packages, installed_packages)
-
-                 except Exception as e:
-                      error_messages.append(f"Error al recargar listas después de instalación: {e}")
-                      print(f"Standard Thread (Packages) Error: Error al recargar listas: {e}")
-
-                 if not error_messages:
-                     final_message = f"Se instalaron {success_count} paquete(s) correctamente."
-                     self._package_operation_emitter.operation_finished.emit(True, final_message)
-                 else:
-                     final_message = f"Se instalaron {success_count} paquete(s) con errores en {len(error_messages)}: \n" + "\n".join(error_messages)
-                     self._package_operation_emitter.operation_finished.emit(False, final_message)
-
             self._start_package_task(
-                install_multiple_task,
+                self._install_packages_task,
                 packages_to_install,
                 message=f"Instalando {len(packages_to_install)} paquete(s)..."
             )
@@ -422,7 +332,7 @@ class LanguagesConfigSection(QWidget):
             QMessageBox.information(self, "Nada Seleccionado", "Por favor, selecciona un paquete para desinstalar.")
             return
 
-        package_to_uninstall: argostranslate.package.Package = selected_item[0].data(Qt.UserRole)
+        package_to_uninstall: Any = selected_item[0].data(Qt.UserRole)
 
         reply = QMessageBox.question(self, 'Confirmar Desinstalación',
                                      f'¿Estás seguro de que deseas desinstalar el paquete de traducción {package_to_uninstall.from_code} -> {package_to_uninstall.to_code}?',
@@ -444,7 +354,7 @@ class LanguagesConfigSection(QWidget):
     def _on_installed_selection_changed(self):
         """Slot que se ejecuta cuando cambia la selección en la lista de instalados."""
         print("UI Layer (LanguagesConfigSection): Selección en lista de instalados cambiada.")
-        is_busy = self._current_package_thread is not None and self._current_package_thread.is_alive()
+        is_busy = self._is_package_task_running()
         self.uninstall_button.setEnabled(len(self.installed_languages_list.selectedItems()) == 1 and not is_busy)
 
 
@@ -452,7 +362,7 @@ class LanguagesConfigSection(QWidget):
     def _on_available_selection_changed(self):
         """Slot que se ejecuta cuando cambia la selección en la lista de disponibles."""
         print("UI Layer (LanguagesConfigSection): Selección en lista de disponibles cambiada.")
-        is_busy = self._current_package_thread is not None and self._current_package_thread.is_alive()
+        is_busy = self._is_package_task_running()
         self.install_button.setEnabled(len(self.available_packages_list.selectedItems()) > 0 and not is_busy)
 
 
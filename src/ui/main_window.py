@@ -34,8 +34,12 @@ from .pop_up_window import PopUpTranslationWindow
 from .config_window import ConfigWindow
 
 # Importar el servicio de la capa de Aplicación y los modelos del Dominio
-from src.application.translator_service import TranslatorService, HotkeySignalEmitter
-from src.domain.models import Language, TranslationRequest, TranslationResult
+from src.application.translator_service import TranslatorService, TRANSLATION_CANCELLED_MESSAGE
+from .qt_service_bridge import QtTranslatorServiceBridge, HotkeySignalEmitter
+from src.application.task_scheduler import ScheduledTask, QueueFullError, PRIORITY_INTERACTIVE, PRIORITY_MANUAL, PRIORITY_BACKGROUND
+from src.application.progress import ThrottledProgressCallback
+from src.application.batch_job import BatchTranslationJob
+from src.domain.models import Language, TranslationRequest, TranslationResult, CancellationToken, TranslationProgress, TranslationCancelledError
 
 # Bibliotecas para leer archivos de texto (no OCR)
 try:
@@ -282,6 +286,20 @@ class TranslationResultEmitter(QObject):
     task_started = Signal(str)
     # Señal para indicar que una tarea ha terminado
     task_finished = Signal()
+    # Señal que lleva el progreso de una traducción larga (TranslationProgress)
+    progress_updated = Signal(object)
+
+
+class ModelPrewarmEmitter(QObject):
+    """Emite señales para comunicar el progreso de la precarga de modelos al hilo principal de la UI."""
+    # Señal que lleva el mensaje de progreso a mostrar en la barra de estado
+    progress = Signal(str)
+    # Señal que lleva el mensaje final de la precarga
+    finished = Signal(str)
+
+
+# Intervalo con el que se vuelcan al área de salida los fragmentos de una traducción en streaming
+STREAM_FLUSH_INTERVAL_MS = 100
 
 
 # --- Resto de la clase MainWindow ---
@@ -295,6 +313,9 @@ class MainWindow(QMainWindow):
     def __init__(self, translator_service: TranslatorService):
         """
         Constructor de la ventana principal.
+
+        Args:
+            translator_service: Servicio de aplicación.
         """
         super().__init__()
 
@@ -334,6 +355,11 @@ class MainWindow(QMainWindow):
         self.translate_button = QPushButton("Traducir Texto Manual") # Cambiamos el texto del botón
         controls_layout.addWidget(self.translate_button)
 
+        # Botón para cancelar la traducción en curso (solo habilitado mientras hay una tarea)
+        self.cancel_button = QPushButton("Cancelar")
+        self.cancel_button.setEnabled(False)
+        controls_layout.addWidget(self.cancel_button)
+
         # --- Añadir botón de Configuración ---
         # Podemos usar un icono de engranaje más adelante, por ahora es texto
         self.settings_button = QPushButton("Configuración")
@@ -357,6 +383,9 @@ class MainWindow(QMainWindow):
         self.translate_file_button = QPushButton("Traducir Archivo de Texto")
         file_ocr_layout.addWidget(self.translate_file_button)
 
+        self.translate_folder_button = QPushButton("Traducir Carpeta")
+        file_ocr_layout.addWidget(self.translate_folder_button)
+
         main_layout.addLayout(file_ocr_layout)
         # --- Fin Nuevos botones ---
 
@@ -389,7 +418,9 @@ class MainWindow(QMainWindow):
 
         # Conectar señales (eventos) a slots (métodos que responden a eventos)
         self.translate_button.clicked.connect(self.on_translate_button_clicked)
+        self.cancel_button.clicked.connect(self.on_cancel_button_clicked)
         self.translate_file_button.clicked.connect(self.on_translate_file_button_clicked)
+        self.translate_folder_button.clicked.connect(self.on_translate_folder_button_clicked)
         # Conectar los nuevos botones de OCR
         self.ocr_file_button.clicked.connect(self.on_ocr_file_button_clicked)
         self.ocr_clipboard_button.clicked.connect(self.on_ocr_clipboard_button_clicked)
@@ -406,9 +437,10 @@ class MainWindow(QMainWindow):
 
 
         # --- Conexión para Hotkeys ---
-        # Asumimos que HotkeySignalEmitter es un QObject y vive en el hilo principal
-        # o maneja la comunicación de hilos internamente si el listener está en otro hilo.
-        self._hotkey_signal_emitter: HotkeySignalEmitter = self.translator_service.get_hotkey_signal_emitter()
+        # El servicio no depende de Qt: el puente recibe los resultados desde el hilo del planificador
+        # y los reenvía al hilo principal como señales del HotkeySignalEmitter.
+        self._service_bridge = QtTranslatorServiceBridge(self.translator_service, self)
+        self._hotkey_signal_emitter: HotkeySignalEmitter = self._service_bridge.get_hotkey_signal_emitter()
         self._hotkey_signal_emitter.translation_finished.connect(self.on_hotkey_translation_finished)
         self._hotkey_signal_emitter.error_occurred.connect(self.on_hotkey_error_occurred)
 
@@ -420,17 +452,29 @@ class MainWindow(QMainWindow):
         # Conectar las nuevas señales de inicio/fin de tarea
         self._translation_result_emitter.task_started.connect(self._on_translation_task_started)
         self._translation_result_emitter.task_finished.connect(self._on_translation_task_completed)
+        self._translation_result_emitter.progress_updated.connect(self._on_translation_progress)
 
 
         # --- Conexión para la señal de finalización del selector Tkinter ---
         # Usaremos el evento _tkinter_selection_complete y un timer para verificarlo periódicamente
         self._selector_completion_timer = None
 
-
-        self.load_languages()
-
-        # Atributo para mantener referencia al hilo estándar
-        self._current_translation_thread: Optional[threading.Thread] = None
+        # Tarea de traducción/OCR de la ventana en curso (ejecutada por el planificador del servicio)
+        self._current_task: Optional[ScheduledTask] = None
+        # Token de cancelación de la tarea en curso (solo en traducciones de texto y archivos)
+        self._current_cancellation_token: Optional[CancellationToken] = None
+        # Unidad del progreso mostrado en la barra de estado ("archivos" en la traducción de carpetas)
+        self._progress_unit = "oraciones"
+
+        # Salida progresiva de las traducciones en streaming: el hilo trabajador deja los fragmentos
+        # en un búfer y un temporizador los vuelca al área de salida (una actualización por intervalo,
+        # no una señal por oración)
+        self._stream_buffer: List[str] = []
+        self._stream_buffer_lock = threading.Lock()
+        self._streaming_output = False
+        self._stream_flush_timer = QTimer(self)
+        self._stream_flush_timer.setInterval(STREAM_FLUSH_INTERVAL_MS)
+        self._stream_flush_timer.timeout.connect(self._flush_stream_buffer)
 
         # Atributo para la ventana selectora (no necesitamos una referencia directa a la ventana Tkinter)
         # self._selector_window: Optional[ScreenSelectorWindow] = None # Ya no usamos ScreenSelectorWindow
@@ -438,6 +482,15 @@ class MainWindow(QMainWindow):
         # Atributo para la ventana de configuración # <-- Añadir esta línea
         self._config_window: Optional[ConfigWindow] = None
 
+        # Precarga de modelos en segundo plano (ver start_model_prewarm)
+        self._prewarm_task: Optional[ScheduledTask] = None
+        self._model_prewarm_emitter = ModelPrewarmEmitter()
+        self._model_prewarm_emitter.progress.connect(self._on_model_prewarm_message)
+        self._model_prewarm_emitter.finished.connect(self._on_model_prewarm_message)
+
+        # Cargar los idiomas después de crear el estado de tareas que usa _set_ui_busy_state
+        self.load_languages()
+
         # --- Actualizar el servicio con los idiomas seleccionados inicialmente ---
         # Llamamos a los slots de cambio de idioma una vez al inicio para establecer los idiomas por defecto
         self._on_source_lang_changed(self.source_lang_combo.currentIndex())
@@ -445,6 +498,61 @@ class MainWindow(QMainWindow):
         # --- Fin Actualización inicial ---
 
 
+    def start_model_prewarm(self, configured_pairs: List[tuple], history_limit: int = 0):
+        """
+        Inicia la precarga de modelos como tarea de baja prioridad del planificador, una vez que
+        el bucle de eventos ya mostró la ventana. El progreso se muestra en la barra de estado.
+
+        Args:
+            configured_pairs: Pares (origen, destino) indicados en la configuración.
+            history_limit: Número máximo de pares recientes que se toman del historial de uso.
+        """
+        if self._prewarm_task is not None and not self._prewarm_task.is_done():
+            print("UI Layer: La precarga de modelos ya está en curso.")
+            return
+        # singleShot(0) difiere el inicio hasta que el bucle de eventos procesa el show() de la ventana
+        QTimer.singleShot(0, lambda: self._submit_model_prewarm(list(configured_pairs), history_limit))
+
+    def _submit_model_prewarm(self, configured_pairs: List[tuple], history_limit: int):
+        """Encola la tarea de precarga en el planificador."""
+        try:
+            self._prewarm_task = self.translator_service.submit_task(
+                self._model_prewarm_task, configured_pairs, history_limit, priority=PRIORITY_BACKGROUND
+            )
+            print("UI Layer: Tarea de precarga de modelos encolada.")
+        except (QueueFullError, RuntimeError) as e:
+            print(f"UI Layer Error: No se pudo encolar la precarga de modelos: {e}")
+
+    def _model_prewarm_task(self, configured_pairs: List[tuple], history_limit: int):
+        """Tarea de precarga. Se ejecuta en un hilo del planificador y solo se comunica con la UI mediante señales."""
+        try:
+            pairs = self.translator_service.get_prewarm_pairs(configured_pairs, history_limit)
+            if not pairs:
+                print("UI Layer: No hay modelos para precargar.")
+                return
+
+            def on_progress(index: int, total: int, source_code: str, target_code: str):
+                self._model_prewarm_emitter.progress.emit(
+                    f"Cargando modelo {source_code} → {target_code} ({index + 1}/{total})..."
+                )
+
+            warmed = self.translator_service.prewarm_models(pairs, progress_callback=on_progress)
+            self._model_prewarm_emitter.finished.emit(f"Modelos cargados: {warmed}/{len(pairs)}.")
+        except Exception as e:
+            print(f"UI Layer Error: Error inesperado en la precarga de modelos: {e}")
+            self._model_prewarm_emitter.finished.emit("No se pudieron precargar los modelos.")
+
+    @Slot(str)
+    def _on_model_prewarm_message(self, message: str):
+        """
+        Slot que muestra el progreso de la precarga en la barra de estado,
+        salvo que haya una tarea de traducción en curso (su mensaje tiene prioridad).
+        """
+        if self._is_task_running():
+            return
+        self.statusBar.showMessage(message, 3000)
+
+
     def _set_ui_busy_state(self, is_busy: bool, message: str = ""):
         """
         Establece el estado de ocupado de la UI, deshabilitando/habilitando botones
@@ -454,9 +562,11 @@ class MainWindow(QMainWindow):
         self.ocr_file_button.setEnabled(not is_busy)
         self.ocr_clipboard_button.setEnabled(not is_busy)
         self.translate_file_button.setEnabled(not is_busy)
+        self.translate_folder_button.setEnabled(not is_busy)
         self.capture_screen_button.setEnabled(not is_busy)
         self.source_lang_combo.setEnabled(not is_busy)
         self.target_lang_combo.setEnabled(not is_busy)
+        self.cancel_button.setEnabled(is_busy and self._current_cancellation_token is not None)
 
         if is_busy:
             # Mostrar mensaje de tarea en curso
@@ -510,15 +620,11 @@ class MainWindow(QMainWindow):
                 self.target_lang_combo.addItem(lang.name, lang)
 
             if len(languages) >= 2:
-                 es_index = self.target_lang_combo.findData(Language(code="es", name="Spanish")) # Nota: El nombre exacto puede variar según argostranslate
-                 if es_index == -1: # Fallback por si el nombre no es "Spanish"
-                     es_index = self.target_lang_combo.findData(Language(code="es", name="Español"))
+                 es_index = self._find_language_index(self.target_lang_combo, "es")
                  if es_index != -1:
                      self.target_lang_combo.setCurrentIndex(es_index)
 
-                 en_index = self.source_lang_combo.findData(Language(code="en", name="English")) # Nota: El nombre exacto puede variar según argostranslate
-                 if en_index == -1: # Fallback por si el nombre no es "English"
-                      en_index = self.source_lang_combo.findData(Language(code="en", name="Inglés"))
+                 en_index = self._find_language_index(self.source_lang_combo, "en")
                  if en_index != -1:
                       self.source_lang_combo.setCurrentIndex(en_index)
 
@@ -541,10 +647,46 @@ class MainWindow(QMainWindow):
                 print(f"UI Layer: Idioma de origen seleccionado: {selected_lang.name} ({selected_lang.code})")
                 # Notificar al servicio de aplicación sobre el cambio
                 self.translator_service.set_default_source_language_code(selected_lang.code)
+                # Mostrar en destino solo los idiomas alcanzables desde el nuevo origen
+                self._update_target_languages(selected_lang.code)
             else:
                  print("UI Layer: Advertencia: No se pudo obtener el objeto Language para el idioma de origen seleccionado.")
 
 
+    def _update_target_languages(self, source_code: str):
+        """
+        Rellena el ComboBox de destino con los idiomas alcanzables desde source_code,
+        conservando la selección actual si sigue siendo alcanzable.
+        """
+        current_target: Optional[Language] = self.target_lang_combo.currentData()
+        reachable_targets = self.translator_service.get_reachable_target_languages(source_code)
+
+        # Bloquear señales mientras se reconstruye la lista para no notificar índices intermedios
+        self.target_lang_combo.blockSignals(True)
+        self.target_lang_combo.clear()
+        for lang in reachable_targets:
+            self.target_lang_combo.addItem(lang.name, lang)
+        target_index = self._find_language_index(self.target_lang_combo, current_target.code) if current_target else -1
+        self.target_lang_combo.setCurrentIndex(target_index if target_index != -1 else 0)
+        self.target_lang_combo.blockSignals(False)
+
+        print(f"UI Layer: {len(reachable_targets)} idiomas de destino alcanzables desde {source_code}.")
+        self._on_target_lang_changed(self.target_lang_combo.currentIndex())
+
+    @staticmethod
+    def _find_language_index(combo: QComboBox, code: str) -> int:
+        """
+        Índice del idioma con el código indicado en un ComboBox de idiomas, o -1.
+        findData() no sirve: compara la identidad del objeto Language guardado, y el registro
+        de idiomas puede devolver instancias nuevas para el mismo código.
+        """
+        for index in range(combo.count()):
+            language = combo.itemData(index)
+            if language is not None and language.code == code:
+                return index
+        return -1
+
+
     @Slot(int) # Slot que recibe el índice del item seleccionado
     def _on_target_lang_changed(self, index: int):
         """Slot llamado cuando cambia la selección del idioma de destino."""
@@ -597,13 +739,8 @@ class MainWindow(QMainWindow):
         # Indicar inicio de tarea
         self._translation_result_emitter.task_started.emit("Traduciendo texto manual...")
 
-        # Iniciar la tarea de traducción en un hilo estándar
-        self._start_translation_task(
-            self.translator_service.perform_translation,
-            input_text,
-            source_language.code,
-            target_language.code
-        )
+        # Iniciar la traducción en streaming: las oraciones aparecen a medida que se traducen
+        self._start_streaming_translation(input_text, source_language.code, target_language.code)
 
 
     # --- Slots para Hotkeys (existente, modificado para usar pop-up) ---
@@ -830,13 +967,14 @@ class MainWindow(QMainWindow):
                          self._translation_result_emitter.task_finished.emit()
                          return
 
-                    # Iniciar la tarea de traducción en un hilo estándar
-                    self._start_translation_task( # Usamos el método genérico del hilo estándar
-                         self.translator_service.perform_translation, # Usamos perform_translation
+                    # Iniciar la traducción en streaming: las primeras oraciones se muestran
+                    # sin esperar a que se traduzca el documento completo
+                    self._start_streaming_translation(
                          file_content,
                          source_language.code,
-                         target_language.code
-                         # Los slots de resultado/error ya están conectados a _translation_result_emitter
+                         target_language.code,
+                         priority=PRIORITY_BACKGROUND, # Un documento largo no debe retrasar hotkeys ni capturas
+                         document=True # Usa el perfil configurado para documentos
                     )
 
                 except FileNotFoundError:
@@ -855,6 +993,46 @@ class MainWindow(QMainWindow):
                     self._translation_result_emitter.task_finished.emit()
 
 
+    @Slot()
+    def on_translate_folder_button_clicked(self):
+        """
+        Slot para el botón 'Traducir Carpeta'.
+        Traduce todos los .txt/.docx de una carpeta (y subcarpetas) junto a sus originales
+        (nombre.<destino>.ext). El trabajo es cancelable y se reanuda donde se detuvo.
+        """
+        print("UI Layer: 'Traducir Carpeta' button clicked.")
+        folder = QFileDialog.getExistingDirectory(self, "Seleccionar carpeta de documentos para traducir", os.path.expanduser("~"))
+        if not folder:
+            return
+
+        source_language: Language = self.source_lang_combo.currentData()
+        target_language: Language = self.target_lang_combo.currentData()
+        if not source_language or not target_language:
+            self.statusBar.showMessage("Por favor, selecciona idiomas de origen y destino.", 3000)
+            return
+
+        self._translation_result_emitter.task_started.emit(f"Traduciendo carpeta {folder}...")
+        self._progress_unit = "archivos"
+        self._start_translation_task(
+            self._translate_folder_task,
+            folder,
+            source_language.code,
+            target_language.code,
+            priority=PRIORITY_BACKGROUND, # Un trabajo por lotes no debe retrasar hotkeys ni capturas
+            cancellable=True
+        )
+
+    def _translate_folder_task(self, folder: str, source_lang_code: str, target_lang_code: str,
+                               cancellation_token: Optional[CancellationToken] = None,
+                               progress_callback: Optional[Callable[[TranslationProgress], None]] = None) -> TranslationResult:
+        """Tarea del planificador: ejecuta el trabajo por lotes y retorna su resumen como texto de salida."""
+        job = BatchTranslationJob(self.translator_service, folder, source_lang_code, target_lang_code)
+        report = job.run(cancellation_token, progress_callback)
+        lines = [report.summary()]
+        lines.extend(f"{relative_path}: {error}" for relative_path, error in report.errors)
+        return TranslationResult(translated_text="\n".join(lines))
+
+
     def _read_file_content(self, file_path: str) -> str:
         """
         Lee el contenido de un archivo de texto (.txt, .doc, .docx).
@@ -902,6 +1080,7 @@ class MainWindow(QMainWindow):
 
 
     # --- Función que se ejecutará en el hilo estándar (Tareas de Traducción/OCR) ---
+    # Mantenemos esta función para manejar la limpieza del archivo temporal
     def _translation_task_function(self, func: Callable, *args, **kwargs):
         """
         Esta función se ejecuta en un hilo estándar.
@@ -948,381 +1127,171 @@ class MainWindow(QMainWindow):
              self._translation_result_emitter.task_finished.emit()
 
 
-    # --- Método genérico para iniciar tareas en el Hilo Estándar ---
-    def _start_translation_task(self, func: Callable, *args, **kwargs):
+    def _is_task_running(self) -> bool:
+        """Indica si hay una tarea de traducción/OCR de la ventana en cola o en curso."""
+        return self._current_task is not None and not self._current_task.is_done()
+
+    # --- Método genérico para iniciar tareas en el planificador ---
+    def _start_translation_task(self, func: Callable, *args, priority: int = PRIORITY_MANUAL,
+                                cancellable: bool = False, **kwargs):
         """
-        Inicia una función dada (relacionada con traducción/OCR) en un hilo estándar.
+        Encola una función dada (relacionada con traducción/OCR) en el planificador de tareas del servicio.
+
+        Args:
+            func: Función a ejecutar; debe retornar un TranslationResult.
+            priority: Clase de prioridad de la tarea (PRIORITY_INTERACTIVE, PRIORITY_MANUAL o PRIORITY_BACKGROUND).
+            cancellable: Si es True, func debe aceptar cancellation_token y progress_callback;
+                         se habilita el botón Cancelar y se muestra el progreso en la barra de estado.
         """
-        # Si ya hay un hilo activo, no iniciar uno nuevo
-        if self._current_translation_thread is not None and self._current_translation_thread.is_alive():
-            print("UI Layer: Hilo de traducción ocupado. Espere a que termine la tarea actual.")
+        # Si ya hay una tarea de la ventana activa, no iniciar otra (el área de salida es única)
+        if self._is_task_running():
+            print("UI Layer: Tarea de traducción en curso. Espere a que termine la tarea actual.")
             self.statusBar.showMessage("Tarea anterior aún en proceso. Espere.", 3000)
             return
 
-        print("UI Layer: Creando nuevo hilo estándar para tarea de traducción.")
-        # Crear un nuevo hilo estándar
-        # Pasamos la función _translation_task_function y sus argumentos
-        self._current_translation_thread = threading.Thread(
-            target=self._translation_task_function,
-            args=(func, *args),
-            kwargs=kwargs,
-            daemon=True # Permite que el hilo se cierre automáticamente si la aplicación principal termina
-        )
+        if cancellable:
+            self._current_cancellation_token = CancellationToken()
+            kwargs["cancellation_token"] = self._current_cancellation_token
+            # El progreso llega por oración desde el hilo trabajador; se limita para no saturar la UI
+            kwargs["progress_callback"] = ThrottledProgressCallback(self._translation_result_emitter.progress_updated.emit)
+            self.cancel_button.setEnabled(True)
 
-        # Iniciar el hilo
-        self._current_translation_thread.start()
-        print("UI Layer: Hilo estándar iniciado.")
+        try:
+            self._current_task = self.translator_service.submit_task(
+                self._translation_task_function, func, *args, priority=priority,
+                on_done=self._on_scheduled_task_done, **kwargs
+            )
+            print(f"UI Layer: Tarea {self._current_task.task_id} encolada en el planificador.")
+        except (QueueFullError, RuntimeError) as e:
+            print(f"UI Layer Error: No se pudo encolar la tarea: {e}")
+            self._translation_result_emitter.error_occurred.emit(str(e))
+            self._translation_result_emitter.task_finished.emit()
         # La señal task_started se emite en los slots de los botones antes de llamar a este método
 
 
-    # --- Slots para manejar resultados/errores del Hilo Estándar ---
-    @Slot(TranslationResult)
-    def _on_translation_task_finished(self, result: TranslationResult):
-        """
-        Slot que se ejecuta cuando se recibe la señal de traducción/OCR finalizada desde el hilo estándar.
-        Muestra el resultado en el área de texto de salida.
-        """
-        print("UI Layer: Señal de traducción/OCR finalizada recibida desde hilo estándar.")
-        # Ya verificamos que el resultado es TranslationResult en _translation_task_function
-        if result.is_successful:
-            self.output_text_edit.setText(result.translated_text)
-            # El estado de "Listo" se establecerá en _on_translation_task_completed
-        else:
-            # Si hubo un error, el mensaje ya se estableció en _on_translation_task_error
-            pass # No hacemos nada aquí si hubo error, el otro slot ya manejó la UI
-
-
-        # Limpiar la referencia al hilo actual después de que la tarea termine
-        self._current_translation_thread = None
-
-
-    @Slot(str)
-    def _on_translation_task_error(self, error_message: str):
-        """
-        Slot que se ejecuta cuando se recibe una señal de error desde el hilo estándar.
-        Muestra el error en el área de texto de salida y la barra de estado.
-        """
-        print(f"UI Layer: Señal de error de tarea de traducción/OCR recibida desde hilo estándar: {error_message}")
-        self.output_text_edit.setText(f"Error en tarea de traducción/OCR: {error_message}")
-        # El estado de "Listo" con el mensaje de error se establecerá en _on_translation_task_completed
-        # self.statusBar.showMessage(f"Error en tarea: {error_message}", 5000) # Ya se maneja en _on_translation_task_completed
-
-
-        # Limpiar la referencia al hilo actual después de que la tarea termine
-        self._current_translation_thread = None
-
-    @Slot()
-    def _on_translation_task_completed(self):
+    def _on_scheduled_task_done(self, task: ScheduledTask):
         """
-        Slot que se ejecuta cuando se recibe la señal de fin de tarea desde el hilo estándar.
-        Actualiza la UI para indicar que no hay tareas en curso y restaura el cursor.
+        Callback del planificador (en el hilo que termina o cancela la tarea). Si la tarea se canceló
+        mientras estaba en cola, _translation_task_function no llegó a ejecutarse y nadie más emite
+        task_finished: se emite aquí para que la ventana deje de estar ocupada.
         """
-        print("UI Layer: Señal de fin de tarea recibida desde hilo estándar.")
-        # Restaurar el estado de la UI a no ocupado
-        # El mensaje de la barra de estado se establecerá a "Listo." por defecto
-        # Si hubo un error, el mensaje ya se mostró en _on_translation_task_error
-        # Si la tarea fue exitosa, el mensaje de "Completada" se mostró en _on_translation_task_finished
-        # Si no hubo errores y la tarea fue exitosa, mostramos "Tarea completada."
-        if self.output_text_edit.toPlainText().startswith("Error en tarea:"):
-             # Si el texto de salida es un error, mantenemos ese mensaje en la barra de estado por un tiempo
-             current_error_msg = self.output_text_edit.toPlainText()
-             self._set_ui_busy_state(False, current_error_msg) # Mostrar el error en la barra de estado
-        else:
-             # Si no hubo error, la tarea fue exitosa
-             self._set_ui_busy_state(False, "Tarea completada.")
-
-        # Restaurar el cursor
-        QApplication.restoreOverrideCursor()
+        if task.started_at is None:
+            print(f"UI Layer: Tarea {task.task_id} cancelada antes de empezar.")
+            self._translation_result_emitter.task_finished.emit()
 
 
-    def closeEvent(self, event):
+    # --- Traducción en streaming ---
+    def _start_streaming_translation(self, text: str, source_lang_code: str, target_lang_code: str,
+                                     priority: int = PRIORITY_MANUAL, document: bool = False):
         """
-        Maneja el evento de cierre de la ventana.
-        Asegura que el listener de hotkeys y el hilo de traducción estándar se detengan limpiamente.
+        Inicia una traducción cancelable cuyo resultado se va añadiendo al área de salida
+        a medida que se traducen las oraciones.
         """
-        print("UI Layer: Evento de cierre de ventana detectado.")
-        self.statusBar.showMessage("Cerrando aplicación...", 0)
-        QApplication.processEvents()
-
-        # Detener el listener de hotkeys (ya conectado a aboutToQuit en main.py)
-        # self.translator_service.stop_hotkey_listening() # Ya está conectado en main.py
-        print("Application Layer: Solicitando detener monitoreo de hotkeys.")
-
-        # No necesitamos detener explícitamente el hilo estándar aquí si es daemon=True.
-        # Se cerrará automáticamente cuando el hilo principal (UI) termine.
-        # Si no fuera daemon, necesitaríamos un mecanismo para solicitarle que termine.
-        if self._current_translation_thread is not None and self._current_translation_thread.is_alive():
-             print("UI Layer: Hilo de traducción estándar aún activo (daemon). Se cerrará con la aplicación principal.")
-             # Opcional: Intentar un join() con timeout si no fuera daemon o si queremos esperar
-             # self._current_translation_thread.join(1.0) # Esperar 1 segundo
-
-        print("UI Layer: Aceptando evento de cierre.")
-        event.accept()
-
-    # --- Slot para Captura de Pantalla y OCR (Lanza el selector Tkinter en hilo) ---
-    @Slot()
-    def on_capture_screen_button_clicked(self):
-        """
-        Slot para el botón 'Capturar Pantalla y Traducir'.
-        Oculta la ventana principal, obtiene la geometría del escritorio virtual,
-        y lanza el selector de región de Tkinter en un hilo separado.
-        Inicia un timer para verificar la finalización del selector.
-        """
-        print("UI Layer: 'Capturar Pantalla y Traducir' button clicked.")
-
-        # Obtener los idiomas seleccionados para la traducción antes de ocultar la ventana
-        source_language: Language = self.source_lang_combo.currentData()
-        target_language: Language = self.target_lang_combo.currentData()
-
-        if not source_language or not target_language:
-            self.statusBar.showMessage("Por favor, selecciona idiomas de origen y destino.", 3000)
-            return
-
-        # Verificar si hay un hilo de traducción/OCR activo
-        if self._current_translation_thread is not None and self._current_translation_thread.is_alive():
-            print("UI Layer: Hilo de traducción/OCR ocupado. Espere a que termine la tarea actual.")
+        if self._is_task_running():
+            print("UI Layer: Tarea de traducción en curso. Espere a que termine la tarea actual.")
             self.statusBar.showMessage("Tarea anterior aún en proceso. Espere.", 3000)
             return
+        self.output_text_edit.clear()
+        with self._stream_buffer_lock:
+            self._stream_buffer = []
+        self._streaming_output = True
+        self._stream_flush_timer.start()
+        self._start_translation_task(
+            self._stream_translation_task,
+            text,
+            source_lang_code,
+            target_lang_code,
+            priority=priority,
+            cancellable=True,
+            document=document
+        )
 
-        # Verificar si el selector ya está activo (prevenir múltiples instancias)
-        if self._selector_completion_timer is not None and self._selector_completion_timer.isActive():
-             print("UI Layer: Selector de región ya activo. Espere a que termine.")
-             self.statusBar.showMessage("Selector de región ya activo.", 3000)
-             return
-
-        # Indicar inicio de tarea (solo para el selector)
-        self.statusBar.showMessage("Preparando selector de región...", 0)
-        QApplication.processEvents() # Procesar eventos para actualizar la UI inmediatamente
-
+    def _stream_translation_task(self, text: str, source_lang_code: str, target_lang_code: str,
+                                 document: bool = False,
+                                 cancellation_token: Optional[CancellationToken] = None,
+                                 progress_callback: Optional[Callable[[TranslationProgress], None]] = None) -> TranslationResult:
+        """
+        Se ejecuta en un hilo del planificador. Consume el generador de traducción en streaming
+        del servicio y deja cada fragmento en el búfer que vacía _flush_stream_buffer.
 
+        Returns:
+            Un TranslationResult con la traducción completa, o con el error (incluida la cancelación).
+        """
+        translated_parts: List[str] = []
         try:
-            # Obtener la geometría física del escritorio virtual usando PySide
-            desktop_geometry = _get_virtual_desktop_physical_geometry()
-
-            if desktop_geometry is None:
-                error_msg = "No se pudo obtener la geometría del escritorio virtual para el selector."
-                print(f"UI Layer Error: {error_msg}")
-                self.output_text_edit.setText(error_msg)
-                self.statusBar.showMessage(error_msg, 5000)
-                return
-
-            # Ocultar la ventana principal antes de mostrar el selector
-            self.hide()
-
-            # Lanzar el selector de Tkinter en un hilo separado
-            print("UI Layer: Lanzando selector Tkinter en hilo separado.")
-            selector_thread = threading.Thread(
-                target=_run_tkinter_selector,
-                args=(desktop_geometry,),
-                daemon=True # Permite que el hilo se cierre con la aplicación principal
-            )
-            selector_thread.start()
-
-            # Iniciar un QTimer para verificar periódicamente si el selector Tkinter ha terminado
-            # Usamos un timer porque no podemos hacer join() en el hilo de la UI
-            self._selector_completion_timer = QTimer(self)
-            self._selector_completion_timer.timeout.connect(self._check_selector_completion)
-            self._selector_completion_timer.start(100) # Verificar cada 100 ms
-            print("UI Layer: QTimer iniciado para verificar finalización del selector.")
-
-
+            for part in self.translator_service.translate_stream(
+                text, source_lang_code, target_lang_code, document=document,
+                cancellation_token=cancellation_token, progress_callback=progress_callback
+            ):
+                translated_parts.append(part)
+                with self._stream_buffer_lock:
+                    self._stream_buffer.append(part)
+        except TranslationCancelledError:
+            print(f"Standard Thread: Traducción en streaming cancelada tras {len(translated_parts)} fragmentos.")
+            return TranslationResult(error=TRANSLATION_CANCELLED_MESSAGE)
         except Exception as e:
-            error_msg = f"Error inesperado al lanzar el selector de región: {e}"
-            print(f"UI Layer: {error_msg}")
-            self.output_text_edit.setText(error_msg)
-            self.statusBar.showMessage(error_msg, 5000)
-            # Asegurarse de mostrar la ventana principal de nuevo si algo falla antes de mostrar el selector
-            if not self.isVisible():
-                self.show()
+            print(f"Standard Thread: Error en la traducción en streaming: {e}")
+            return TranslationResult(error=str(e))
+        return TranslationResult(translated_text="".join(translated_parts))
 
     @Slot()
-    def _check_selector_completion(self):
+    def _flush_stream_buffer(self):
         """
-        Slot llamado por el QTimer para verificar si el selector Tkinter ha terminado.
-        Si terminó, detiene el timer y procesa la captura.
+        Slot del temporizador de streaming: añade al final del área de salida
+        todos los fragmentos acumulados desde la última actualización.
         """
-        global _tkinter_start_x, _tkinter_start_y, _tkinter_end_x, _tkinter_end_y
-        global _tkinter_selection_complete, _tkinter_capture_error, _tkinter_captured_image_path
-
-        # Verificar si el evento de finalización está seteado
-        if _tkinter_selection_complete.is_set():
-            # Detener el timer
-            self._selector_completion_timer.stop()
-            print("UI Layer: Selector Tkinter finalizado. QTimer detenido.")
-
-            # Mostrar la ventana principal de nuevo
-            self.show()
-            self.activateWindow() # Asegurarse de que la ventana principal tenga el foco
-
-            # Verificar si hubo un error en el hilo del selector Tkinter
-            if _tkinter_capture_error:
-                 error_msg = f"Error durante la selección/captura: {_tkinter_capture_error}"
-                 print(f"UI Layer Error: {error_msg}")
-                 self.output_text_edit.setText(error_msg)
-                 self.statusBar.showMessage(error_msg, 5000)
-                 # Limpiar coordenadas globales después de usarlas
-                 _tkinter_start_x = _tkinter_start_y = _tkinter_end_x = _tkinter_end_y = None
-                 return # Salir si hubo error
-
-            # Verificar si la selección fue válida (start_x NO es None)
-            if _tkinter_start_x is None or _tkinter_end_x is None or _tkinter_start_y is None or _tkinter_end_y is None:
-                 print("UI Layer: Selección de región cancelada o inválida.")
-                 self.statusBar.showMessage("Selección de región cancelada o inválida.", 3000)
-                 # Limpiar coordenadas globales después de usarlas
-                 _tkinter_start_x = _tkinter_start_y = _tkinter_end_x = _tkinter_end_y = None
-                 return # Salir si se canceló o fue inválida
-
-
-            # Verificar que el archivo de captura existe.
-            image_path = _tkinter_captured_image_path
-            if not os.path.exists(image_path):
-                 error_msg = f"Error: No se encontró el archivo de imagen capturada: {image_path}"
-                 print(f"UI Layer Error: {error_msg}")
-                 self.output_text_edit.setText(error_msg)
-                 self.statusBar.showMessage(error_msg, 5000)
-                 # Limpiar coordenadas globales después de usarlas
-                 _tkinter_start_x = _tkinter_start_y = _tkinter_end_x = _tkinter_end_y = None
-                 # Intentar limpiar el archivo si existe (aunque no debería si no se creó)
-                 if os.path.exists(image_path):
-                     try: os.remove(image_path)
-                     except Exception as e: print(f"UI Layer Error: Failed to clean up {image_path}: {e}")
-                 return # Salir si no se encontró el archivo
-
-
-            # --- Procesar la captura ---
-            # Las coordenadas (_tkinter_start_x, _tkinter_start_y, _tkinter_end_x, _tkinter_end_y)
-            # son las coordenadas de píxeles físicos obtenidas del hilo Tkinter.
-            # mss ya guardó la imagen en "captura_pil.png".
-
-
-            # Obtener los idiomas seleccionados para la traducción
-            source_language: Language = self.source_lang_combo.currentData()
-            target_language: Language = self.target_lang_combo.currentData()
-
-            if not source_language or not target_language:
-                self.statusBar.showMessage("Por favor, selecciona idiomas de origen y destino.", 3000)
-                # Limpiar coordenadas globales después de usarlas
-                _tkinter_start_x = _tkinter_start_y = _tkinter_end_x = _tkinter_end_y = None
-                # Opcional: Eliminar el archivo de captura si no se va a procesar
-                if os.path.exists(image_path):
-                    try: os.remove(image_path)
-                    except Exception as e: print(f"UI Layer Error: Failed to clean up {image_path}: {e}")
+        with self._stream_buffer_lock:
+            if not self._stream_buffer:
                 return
+            text = "".join(self._stream_buffer)
+            self._stream_buffer = []
+        cursor = self.output_text_edit.textCursor()
+        cursor.movePosition(cursor.MoveOperation.End)
+        cursor.insertText(text)
+
+    def _stop_streaming_output(self):
+        """Detiene el temporizador de streaming y vuelca lo que quede en el búfer."""
+        if not self._streaming_output:
+            return
+        self._stream_flush_timer.stop()
+        self._flush_stream_buffer()
+        self._streaming_output = False
 
 
-            # Indicar inicio de tarea de OCR y traducción
-            self._translation_result_emitter.task_started.emit("Cargando imagen capturada, realizando OCR y Traduciendo...")
-
-            pil_image = None
-            try:
-                # Cargar la imagen capturada desde el archivo temporal (_tkinter_captured_image_path)
-                pil_image = Image.open(image_path)
-                print(f"UI Layer: Imagen capturada cargada con PIL desde {image_path}.")
-
-            except Exception as e:
-                error_msg = f"Error al cargar la imagen capturada con PIL: {e}"
-                print(f"UI Layer Error: {error_msg}")
-                # Emitir error
-                self._translation_result_emitter.error_occurred.emit(error_msg)
-                # Asegurar que el estado de ocupado se desactive
-                self._translation_result_emitter.task_finished.emit()
-                # Limpiar coordenadas globales después de usarlas
-                _tkinter_start_x = _tkinter_start_y = _tkinter_end_x = _tkinter_end_y = None
-                # Asegurarse de eliminar el archivo si no se pudo cargar
-                if os.path.exists(image_path):
-                    try: os.remove(image_path)
-                    except Exception as e: print(f"UI Layer Error: Failed to clean up {image_path}: {e}")
-                return # Salir si no se pudo cargar la imagen
-
-
-            # Limpiar coordenadas globales después de usarlas
-            _tkinter_start_x = _tkinter_start_y = _tkinter_end_x = _tkinter_end_y = None
-
-            # Llamar al servicio de aplicación para realizar OCR y traducción
-            # Ejecutamos en un hilo estándar para no bloquear la UI
-            self._start_translation_task( # Usamos el método genérico del hilo estándar
-                self.translator_service.perform_ocr_and_translate,
-                pil_image, # Pasamos el objeto PIL Image
-                source_language.code,
-                target_language.code,
-                # Pasar la ruta del archivo temporal para limpieza en el hilo de traducción
-                temp_file_path=image_path
-            )
-
-
-    # --- Función que se ejecutará en el hilo estándar (Tareas de Traducción/OCR) ---
-    # Mantenemos esta función para manejar la limpieza del archivo temporal
-    def _translation_task_function(self, func: Callable, *args, **kwargs):
+    @Slot()
+    def on_cancel_button_clicked(self):
         """
-        Esta función se ejecuta en un hilo estándar.
-        Llama a la función de traducción/OCR y emite señales al hilo principal.
-        También maneja la limpieza del archivo temporal si se usó.
+        Slot para el botón 'Cancelar'. Solicita la cancelación de la tarea en curso:
+        si aún está en cola no llega a ejecutarse, y si se está traduciendo se detiene
+        antes del siguiente grupo de oraciones.
         """
-        print(f"Standard Thread: _translation_task_function() iniciado. Llamando a {func.__name__}...")
-        # Obtener la ruta del archivo temporal si existe (ahora puede ser "captura_pil.png")
-        temp_file_path = kwargs.pop('temp_file_path', None)
-
-        try:
-            # Ejecutar la función (perform_translation o perform_ocr_and_translate)
-            # Esperamos que la función retorne un TranslationResult
-            translation_result: TranslationResult = func(*args, **kwargs)
-            print("Standard Thread: La función de traducción/OCR ha regresado.")
-            # Emitir el resultado al hilo principal usando la señal
-            # Aseguramos que emitimos un TranslationResult válido
-            if isinstance(translation_result, TranslationResult):
-                 self._translation_result_emitter.translation_finished.emit(translation_result)
-                 print("Standard Thread: Señal 'translation_finished' emitida.")
-            else:
-                 # Si la función no retornó un TranslationResult, emitimos un error
-                 error_msg = f"La función {func.__name__} retornó un tipo inesperado: {type(translation_result).__name__}"
-                 print(f"Standard Thread: {error_msg}")
-                 self._translation_result_emitter.error_occurred.emit(error_msg)
-                 print("Standard Thread: Señal 'error_occurred' emitida debido a tipo de retorno inesperado.")
-
-        except Exception as e:
-            # Capturar excepciones y emitir la señal de error al hilo principal
-            print(f"Standard Thread: Error capturado: {e}")
-            self._translation_result_emitter.error_occurred.emit(str(e))
-            print("Standard Thread: Señal 'error_occurred' emitida.")
-        finally:
-             print("Standard Thread: _translation_task_function() finalizando.")
-             # --- Limpieza del archivo temporal ---
-             if temp_file_path and os.path.exists(temp_file_path):
-                 try:
-                     os.remove(temp_file_path)
-                     print(f"Standard Thread: Archivo temporal eliminado: {temp_file_path}")
-                 except Exception as cleanup_e:
-                     print(f"Standard Thread Error: No se pudo eliminar el archivo temporal {temp_file_path}: {cleanup_e}")
-             # --- Fin Limpieza ---
-             # Indicar que la tarea ha terminado, independientemente del resultado
-             self._translation_result_emitter.task_finished.emit()
+        if not self._is_task_running():
+            return
+        print("UI Layer: Cancelación solicitada por el usuario.")
+        if self._current_cancellation_token is not None:
+            self._current_cancellation_token.cancel()
+        self._current_task.cancel()
+        self.cancel_button.setEnabled(False)
+        self.statusBar.showMessage("Cancelando...", 0)
 
 
-    # --- Método genérico para iniciar tareas en el Hilo Estándar ---
-    def _start_translation_task(self, func: Callable, *args, **kwargs):
+    @Slot(object)
+    def _on_translation_progress(self, progress: TranslationProgress):
         """
-        Inicia una función dada (relacionada con traducción/OCR) en un hilo estándar.
+        Slot que muestra en la barra de estado el progreso de la traducción en curso
+        (oraciones, porcentaje, velocidad y tiempo restante estimado).
         """
-        # Si ya hay un hilo activo, no iniciar uno nuevo
-        if self._current_translation_thread is not None and self._current_translation_thread.is_alive():
-            print("UI Layer: Hilo de traducción ocupado. Espere a que termine la tarea actual.")
-            self.statusBar.showMessage("Tarea anterior aún en proceso. Espere.", 3000)
+        if not self._is_task_running() or (self._current_cancellation_token is not None
+                                           and self._current_cancellation_token.is_cancelled):
             return
-
-        print("UI Layer: Creando nuevo hilo estándar para tarea de traducción.")
-        # Crear un nuevo hilo estándar
-        # Pasamos la función _translation_task_function y sus argumentos
-        self._current_translation_thread = threading.Thread(
-            target=self._translation_task_function,
-            args=(func, *args),
-            kwargs=kwargs,
-            daemon=True # Permite que el hilo se cierre automáticamente si la aplicación principal termina
-        )
-
-        # Iniciar el hilo
-        self._current_translation_thread.start()
-        print("UI Layer: Hilo estándar iniciado.")
-        # La señal task_started se emite en los slots de los botones antes de llamar a este método
+        message = f"Traduciendo: {progress.done}/{progress.total} {self._progress_unit} ({progress.fraction * 100:.0f}%)"
+        if progress.chars_per_second > 0:
+            message += f", {progress.chars_per_second:.0f} car/s"
+        eta_seconds = progress.eta_seconds
+        if eta_seconds is not None and progress.done < progress.total:
+            minutes, seconds = divmod(int(round(eta_seconds)), 60)
+            message += f", restante ~{minutes:02d}:{seconds:02d}"
+        self.statusBar.showMessage(message, 0)
 
 
     # --- Slots para manejar resultados/errores del Hilo Estándar ---
@@ -1334,7 +1303,18 @@ class MainWindow(QMainWindow):
         """
         print("UI Layer: Señal de traducción/OCR finalizada recibida desde hilo estándar.")
         # Ya verificamos que el resultado es TranslationResult en _translation_task_function
-        if result.is_successful:
+        if self._streaming_output:
+            # El texto ya se fue mostrando por fragmentos; solo se completa lo pendiente
+            self._stop_streaming_output()
+            if result.is_successful:
+                if self.output_text_edit.toPlainText() != result.translated_text:
+                    self.output_text_edit.setPlainText(result.translated_text)
+            elif self.output_text_edit.toPlainText():
+                # Se conserva la traducción parcial (por ejemplo, al cancelar) y se indica el motivo
+                self.output_text_edit.append(f"\n[{result.error}]")
+            else:
+                self.output_text_edit.setText(f"Error en tarea: {result.error}")
+        elif result.is_successful:
             self.output_text_edit.setText(result.translated_text)
             # El estado de "Listo" se establecerá en _on_translation_task_completed
         else:
@@ -1342,8 +1322,8 @@ class MainWindow(QMainWindow):
             pass # No hacemos nada aquí si hubo error, el otro slot ya manejó la UI
 
 
-        # Limpiar la referencia al hilo actual después de que la tarea termine
-        self._current_translation_thread = None
+        # Limpiar la referencia a la tarea actual después de que termine
+        self._current_task = None
 
 
     @Slot(str)
@@ -1358,8 +1338,8 @@ class MainWindow(QMainWindow):
         # self.statusBar.showMessage(f"Error en tarea: {error_message}", 5000) # Ya se maneja en _on_translation_task_completed
 
 
-        # Limpiar la referencia al hilo actual después de que la tarea termine
-        self._current_translation_thread = None
+        # Limpiar la referencia a la tarea actual después de que termine
+        self._current_task = None
 
     @Slot()
     def _on_translation_task_completed(self):
@@ -1368,6 +1348,7 @@ class MainWindow(QMainWindow):
         Actualiza la UI para indicar que no hay tareas en curso y restaura el cursor.
         """
         print("UI Layer: Señal de fin de tarea recibida desde hilo estándar.")
+        self._stop_streaming_output()
         # Restaurar el estado de la UI a no ocupado
         # El mensaje de la barra de estado se establecerá a "Listo." por defecto
         # Si hubo un error, el mensaje ya se mostró en _on_translation_task_error
@@ -1381,6 +1362,10 @@ class MainWindow(QMainWindow):
              # Si no hubo error, la tarea fue exitosa
              self._set_ui_busy_state(False, "Tarea completada.")
 
+        self._current_cancellation_token = None
+        self.cancel_button.setEnabled(False)
+        self._progress_unit = "oraciones"
+
         # Restaurar el cursor
         QApplication.restoreOverrideCursor()
 
@@ -1398,13 +1383,13 @@ class MainWindow(QMainWindow):
         # self.translator_service.stop_hotkey_listening() # Ya está conectado en main.py
         print("Application Layer: Solicitando detener monitoreo de hotkeys.")
 
-        # No necesitamos detener explícitamente el hilo estándar aquí si es daemon=True.
-        # Se cerrará automáticamente cuando el hilo principal (UI) termine.
-        # Si no fuera daemon, necesitaríamos un mecanismo para solicitarle que termine.
-        if self._current_translation_thread is not None and self._current_translation_thread.is_alive():
-             print("UI Layer: Hilo de traducción estándar aún activo (daemon). Se cerrará con la aplicación principal.")
-             # Opcional: Intentar un join() con timeout si no fuera daemon o si queremos esperar
-             # self._current_translation_thread.join(1.0) # Esperar 1 segundo
+        # Los hilos del planificador son daemon; las tareas pendientes se cancelan
+        # en TranslatorService.shutdown_tasks() (conectado a aboutToQuit en main.py).
+        if self._is_task_running():
+             print("UI Layer: Tarea de traducción aún activa. Se cancelará al cerrar la aplicación.")
+             if self._current_cancellation_token is not None:
+                 self._current_cancellation_token.cancel()
+             self._current_task.cancel()
 
         print("UI Layer: Aceptando evento de cierre.")
         event.accept()
@@ -1428,8 +1413,8 @@ class MainWindow(QMainWindow):
             self.statusBar.showMessage("Por favor, selecciona idiomas de origen y destino.", 3000)
             return
 
-        # Verificar si hay un hilo de traducción/OCR activo
-        if self._current_translation_thread is not None and self._current_translation_thread.is_alive():
+        # Verificar si hay una tarea de traducción/OCR activa
+        if self._is_task_running():
             print("UI Layer: Hilo de traducción/OCR ocupado. Espere a que termine la tarea actual.")
             self.statusBar.showMessage("Tarea anterior aún en proceso. Espere.", 3000)
             return
@@ -1596,7 +1581,8 @@ class MainWindow(QMainWindow):
                 source_language.code,
                 target_language.code,
                 # Pasar la ruta del archivo temporal para limpieza en el hilo de traducción
-                temp_file_path=image_path
+                temp_file_path=image_path,
+                priority=PRIORITY_INTERACTIVE # La captura de región espera el resultado de inmediato
             )
     
     @Slot()
@@ -0,0 +1,79 @@
+# src/ui/qt_service_bridge.py
+
+from PySide6.QtCore import QObject, Signal, QCoreApplication, QEvent
+
+from src.application.translator_service import TranslatorService
+from src.domain.models import TranslationResult
+
+
+# Creamos un QObject para emitir señales desde el hilo secundario al hilo principal (UI)
+class HotkeySignalEmitter(QObject):
+    """Emite señales para comunicar resultados de hotkey al hilo principal de la UI."""
+    # Señal que lleva el resultado de la traducción (TranslationResult)
+    translation_finished = Signal(TranslationResult)
+    # Señal para indicar un error (string)
+    error_occurred = Signal(str)
+
+
+# --- Clases de evento personalizadas para postEvent ---
+class _TranslationFinishedEvent(QEvent):
+    EventType = QEvent.Type(QEvent.registerEventType()) # Registrar un tipo de evento único
+    def __init__(self, result: TranslationResult):
+        super().__init__(self.EventType)
+        self.result = result # Almacenar el resultado de la traducción
+
+class _ErrorOccurredEvent(QEvent):
+    EventType = QEvent.Type(QEvent.registerEventType()) # Registrar otro tipo de evento único
+    def __init__(self, message: str):
+        super().__init__(self.EventType)
+        self.message = message # Almacenar el mensaje de error
+# --- FIN Clases de evento personalizadas ---
+
+
+class QtTranslatorServiceBridge(QObject):
+    """
+    Adaptador entre el TranslatorService (sin Qt) y la interfaz gráfica.
+    Esta clase reside en la capa de Presentación: se registra como receptor de los resultados
+    de la hotkey, que llegan desde un hilo del planificador, y los reenvía al hilo principal
+    con postEvent. Allí customEvent los emite como señales del HotkeySignalEmitter.
+    Debe crearse en el hilo principal, después de la QApplication.
+    """
+
+    def __init__(self, translator_service: TranslatorService, parent: QObject = None):
+        super().__init__(parent)
+        if QCoreApplication.instance() is None:
+             print("Advertencia: QApplication no inicializada. Las señales podrían no funcionar.")
+
+        self.translator_service = translator_service
+        self._hotkey_signal_emitter = HotkeySignalEmitter()
+        self.translator_service.set_hotkey_listener(self._post_translation_finished, self._post_error_occurred)
+        print("UI Layer (QtTranslatorServiceBridge): Receptor de resultados de hotkey registrado.")
+
+    def get_hotkey_signal_emitter(self) -> HotkeySignalEmitter:
+        """
+        Retorna el emisor de señales de hotkey para que la UI pueda conectarse a él.
+        """
+        return self._hotkey_signal_emitter
+
+    # Estos dos métodos se ejecutan en el hilo del planificador de tareas
+    def _post_translation_finished(self, result: TranslationResult):
+        QCoreApplication.postEvent(self, _TranslationFinishedEvent(result))
+
+    def _post_error_occurred(self, message: str):
+        QCoreApplication.postEvent(self, _ErrorOccurredEvent(message))
+
+    # Sobreescribir customEvent para manejar los eventos personalizados
+    # Este método se ejecuta en el hilo principal de la UI porque el puente
+    # está instanciado en el hilo principal.
+    def customEvent(self, event: QEvent):
+        if event.type() == _TranslationFinishedEvent.EventType:
+            print("UI Layer (QtTranslatorServiceBridge): customEvent received _TranslationFinishedEvent.")
+            # Emitimos la señal del emisor de hotkey para que la UI la reciba
+            self._hotkey_signal_emitter.translation_finished.emit(event.result)
+        elif event.type() == _ErrorOccurredEvent.EventType:
+            print("UI Layer (QtTranslatorServiceBridge): customEvent received _ErrorOccurredEvent.")
+            # Emitimos la señal de error del emisor de hotkey para que la UI la reciba
+            self._hotkey_signal_emitter.error_occurred.emit(event.message)
+        else:
+            # Si no es uno de nuestros eventos personalizados, llamar al método base
+            super().customEvent(event)
@@ -0,0 +1,48 @@
+# tests/test_batch_job.py
+#
+# Pruebas de la búsqueda de documentos de BatchTranslationJob (src/application/batch_job.py).
+#
+# Uso (desde la raíz del repositorio):
+#   python -m pytest tests
+
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from src.application.batch_job import BatchTranslationJob
+
+
+class DiscoverFilesTest(unittest.TestCase):
+
+    def setUp(self):
+        self._temp_dir = tempfile.TemporaryDirectory()
+        self.input_dir = self._temp_dir.name
+        for name in ("informe.txt", "notas.es.txt"):
+            with open(os.path.join(self.input_dir, name), "w", encoding="utf-8") as f:
+                f.write("Hello.\n")
+        self.service = mock.Mock()
+        self.service.get_document_profile.return_value = None
+
+    def tearDown(self):
+        self._temp_dir.cleanup()
+
+    def _make_job(self) -> BatchTranslationJob:
+        return BatchTranslationJob(self.service, self.input_dir, "en", "es")
+
+    def test_file_named_like_a_translation_is_an_input(self):
+        self.assertEqual(self._make_job().discover_files(), ["informe.txt", "notas.es.txt"])
+
+    def test_outputs_recorded_in_journal_are_skipped(self):
+        job = self._make_job()
+        output_path = job.get_output_path("informe.txt")
+        with open(output_path, "w", encoding="utf-8") as f:
+            f.write("Hola.\n")
+        job.journal.append("done", file="informe.txt", source="en", target="es", sha256="", output=output_path)
+        # Un fallo posterior del mismo original no convierte su traducción en un documento de entrada
+        job.journal.append("failed", file="informe.txt", source="en", target="es", sha256="", error="")
+        self.assertEqual(self._make_job().discover_files(), ["informe.txt", "notas.es.txt"])
+
+
+if __name__ == "__main__":
+    unittest.main()
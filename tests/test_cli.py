@@ -0,0 +1,57 @@
+# tests/test_cli.py
+#
+# Pruebas del lector de líneas del filtro de traducción (src/cli.py).
+#
+# Uso (desde la raíz del repositorio):
+#   python -m pytest tests
+
+import io
+import queue
+import unittest
+from unittest import mock
+
+from src.cli import StreamTranslator, build_parser
+
+
+class ReadLinesTest(unittest.TestCase):
+
+    def _read(self, text: str, max_line_chars: int):
+        stream_translator = StreamTranslator(mock.Mock(), "en", "es", max_line_chars=max_line_chars)
+        lines = queue.Queue()
+        stream_translator._read_lines(io.StringIO(text, newline=""), lines)
+        pieces = []
+        while True:
+            piece = lines.get_nowait()
+            if piece is None:
+                return pieces
+            pieces.append(piece)
+
+    def test_short_lines_are_kept_whole(self):
+        self.assertEqual(self._read("uno\ndos\r\ntres", 100), ["uno\n", "dos\r\n", "tres"])
+
+    def test_long_line_is_split_between_words(self):
+        pieces = self._read("alpha beta gamma delta epsilon\n", 12)
+        self.assertEqual("".join(pieces), "alpha beta gamma delta epsilon\n")
+        for piece in pieces:
+            self.assertLessEqual(len(piece), 12)
+        self.assertEqual([piece.strip() for piece in pieces], ["alpha beta", "gamma delta", "epsilon"])
+
+    def test_long_line_prefers_sentence_boundary(self):
+        pieces = self._read("One two three. Four five six", 20)
+        self.assertEqual(pieces[0], "One two three. ")
+        self.assertEqual("".join(pieces), "One two three. Four five six")
+
+    def test_word_longer_than_limit_is_cut(self):
+        self.assertEqual(self._read("abcdefghij\n", 4), ["abcd", "efgh", "ij\n"])
+
+
+class ParserTest(unittest.TestCase):
+
+    def test_translation_memory_is_opt_in(self):
+        parser = build_parser()
+        self.assertFalse(parser.parse_args(["translate", "-s", "en", "-t", "es"]).memory)
+        self.assertTrue(parser.parse_args(["translate", "-s", "en", "-t", "es", "--memory"]).memory)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,117 @@
+# tests/test_main_window.py
+#
+# Prueba de humo de la ventana principal: se construye MainWindow sin pantalla (Qt "offscreen")
+# con un TranslatorService simulado, para detectar errores de inicialización como atributos
+# usados antes de ser asignados.
+#
+# Uso (desde la raíz del repositorio):
+#   python -m pytest tests
+
+import os
+import threading
+import unittest
+from unittest import mock
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+try:
+    from PySide6.QtWidgets import QApplication
+    PYSIDE6_AVAILABLE = True
+except ImportError:
+    PYSIDE6_AVAILABLE = False
+
+
+@unittest.skipUnless(PYSIDE6_AVAILABLE, "PySide6 no está instalado")
+class MainWindowSmokeTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication([])
+
+    def _make_service(self):
+        from src.application.translator_service import TranslatorService
+        from src.domain.models import Language
+
+        service = mock.create_autospec(TranslatorService, instance=True)
+        languages = [Language(code="en", name="English"), Language(code="es", name="Spanish")]
+        service.get_supported_languages.return_value = languages
+        service.get_reachable_target_languages.return_value = languages
+        return service
+
+    def test_window_builds_with_stub_service(self):
+        from src.ui.main_window import MainWindow
+
+        service = self._make_service()
+        # El TTS real necesita un motor de voz del sistema
+        with mock.patch("src.ui.main_window.Pyttsx3TTSService"):
+            window = MainWindow(service)
+        try:
+            self.assertEqual(window.source_lang_combo.count(), 2)
+            self.assertGreater(window.target_lang_combo.count(), 0)
+            self.assertFalse(window.cancel_button.isEnabled())
+            self.assertIsNone(window._current_task)
+            service.set_default_source_language_code.assert_called_with("en")
+        finally:
+            window.close()
+            window.deleteLater()
+
+    def test_source_change_keeps_target_with_new_language_instances(self):
+        from src.domain.models import Language
+        from src.ui.main_window import MainWindow
+
+        service = self._make_service()
+        service.get_supported_languages.return_value = [
+            Language(code="en", name="English"), Language(code="fr", name="French"), Language(code="es", name="Spanish")
+        ]
+        # El registro devuelve instancias nuevas en cada consulta, como tras recargar los paquetes
+        service.get_reachable_target_languages.side_effect = lambda source_code: [
+            Language(code=code, name=code) for code in ("de", "en", "es", "fr") if code != source_code
+        ]
+        with mock.patch("src.ui.main_window.Pyttsx3TTSService"):
+            window = MainWindow(service)
+        try:
+            window.target_lang_combo.setCurrentIndex(window._find_language_index(window.target_lang_combo, "es"))
+            window.source_lang_combo.setCurrentIndex(window._find_language_index(window.source_lang_combo, "fr"))
+            self.assertEqual(window.target_lang_combo.currentData().code, "es")
+            service.set_default_target_language_code.assert_called_with("es")
+        finally:
+            window.close()
+            window.deleteLater()
+
+    def test_cancel_queued_task_leaves_window_idle(self):
+        from src.application.task_scheduler import TaskScheduler
+        from src.ui.main_window import MainWindow
+
+        scheduler = TaskScheduler(max_workers=1, reserved_interactive_workers=0)
+        release = threading.Event()
+        started = threading.Event()
+        scheduler.submit(lambda: (started.set(), release.wait(5)))
+        self.assertTrue(started.wait(5))
+
+        service = self._make_service()
+        service.submit_task.side_effect = lambda func, *args, priority, on_done=None, **kwargs: \
+            scheduler.submit(func, *args, priority=priority, on_done=on_done, **kwargs)
+        with mock.patch("src.ui.main_window.Pyttsx3TTSService"):
+            window = MainWindow(service)
+        try:
+            window._translation_result_emitter.task_started.emit("Traduciendo...")
+            # El único trabajador está ocupado: la tarea queda en cola
+            window._start_translation_task(lambda **kwargs: None, cancellable=True)
+            self.assertFalse(window.translate_button.isEnabled())
+            self.assertTrue(window.cancel_button.isEnabled())
+
+            window.on_cancel_button_clicked()
+            QApplication.processEvents()
+
+            self.assertTrue(window.translate_button.isEnabled())
+            self.assertFalse(window.cancel_button.isEnabled())
+            self.assertIsNone(QApplication.overrideCursor())
+        finally:
+            release.set()
+            scheduler.shutdown()
+            window.close()
+            window.deleteLater()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,130 @@
+# tests/test_server.py
+#
+# Pruebas del servidor HTTP local (src/server.py): validación de Host y Content-Type,
+# endpoint /translate y agrupación en micro-lotes, con un servicio falso que no carga modelos.
+#
+# Uso (desde la raíz del repositorio):
+#   python -m pytest tests
+
+import asyncio
+import json
+import unittest
+from typing import Any, Dict, Optional, Tuple
+
+from src.domain.models import TranslationResult
+from src.server import MicroBatcher, TranslationServer, is_loopback_host_header
+
+
+class FakeTranslatorService:
+    """Lo mínimo de TranslatorService que usa el servidor: traduce pasando el texto a mayúsculas."""
+
+    def __init__(self):
+        self.batches = []
+
+    def perform_translation_batch(self, texts, source_lang_code, target_lang_code, profile=None):
+        self.batches.append(list(texts))
+        return [TranslationResult(translated_text=text.upper()) for text in texts]
+
+    async def run_async(self, func, *args, priority=None, **kwargs):
+        return func(*args, **kwargs)
+
+    def get_scheduler_stats(self):
+        return {}
+
+    def get_coalescing_stats(self):
+        return {}
+
+
+class HostHeaderTest(unittest.TestCase):
+
+    def test_loopback_hosts(self):
+        for value in ("127.0.0.1:8765", "localhost", "LOCALHOST:80", "[::1]:8765", "::1"):
+            self.assertTrue(is_loopback_host_header(value), value)
+
+    def test_other_hosts(self):
+        for value in ("", "evil.example", "evil.example:8765", "192.168.1.10:8765", "[fe80::1]:80"):
+            self.assertFalse(is_loopback_host_header(value), value)
+
+
+class TranslationServerTest(unittest.IsolatedAsyncioTestCase):
+
+    async def asyncSetUp(self):
+        self.service = FakeTranslatorService()
+        self.server = TranslationServer(self.service, port=0, max_batch_size=8, max_wait_ms=50)
+        await self.server.start()
+
+    async def asyncTearDown(self):
+        await self.server.stop()
+
+    async def _request(self, method: str, path: str, payload: Optional[Dict[str, Any]] = None,
+                       host: Optional[str] = None, content_type: Optional[str] = "application/json") -> Tuple[int, Dict[str, Any]]:
+        reader, writer = await asyncio.open_connection("127.0.0.1", self.server.port)
+        body = json.dumps(payload).encode("utf-8") if payload is not None else b""
+        headers = [f"{method} {path} HTTP/1.1", f"Host: {host or f'127.0.0.1:{self.server.port}'}",
+                   f"Content-Length: {len(body)}", "Connection: close"]
+        if content_type is not None and payload is not None:
+            headers.append(f"Content-Type: {content_type}")
+        writer.write(("\r\n".join(headers) + "\r\n\r\n").encode("latin-1") + body)
+        await writer.drain()
+        response = await reader.read()
+        writer.close()
+        await writer.wait_closed()
+        head, _, response_body = response.partition(b"\r\n\r\n")
+        return int(head.split()[1]), json.loads(response_body)
+
+    async def test_health(self):
+        self.assertEqual(await self._request("GET", "/health"), (200, {"status": "ok"}))
+
+    async def test_rejects_non_loopback_host(self):
+        status, _ = await self._request("GET", "/health", host="evil.example:8765")
+        self.assertEqual(status, 403)
+        status, _ = await self._request("POST", "/translate", {"text": "hi", "source": "en", "target": "es"},
+                                        host="evil.example")
+        self.assertEqual(status, 403)
+        self.assertEqual(self.service.batches, [])
+
+    async def test_rejects_post_without_json_content_type(self):
+        payload = {"text": "hi", "source": "en", "target": "es"}
+        for content_type in (None, "text/plain", "application/x-www-form-urlencoded"):
+            status, _ = await self._request("POST", "/translate", payload, content_type=content_type)
+            self.assertEqual(status, 415, content_type)
+        self.assertEqual(self.service.batches, [])
+
+    async def test_translate(self):
+        status, payload = await self._request("POST", "/translate", {"text": "hi", "source": "en", "target": "es"},
+                                              content_type="application/json; charset=utf-8")
+        self.assertEqual((status, payload), (200, {"translated_text": "HI"}))
+
+    async def test_concurrent_translations_share_a_micro_batch(self):
+        responses = await asyncio.gather(*(
+            self._request("POST", "/translate", {"text": text, "source": "en", "target": "es"})
+            for text in ("uno", "dos", "tres")
+        ))
+        self.assertEqual([payload["translated_text"] for _, payload in responses], ["UNO", "DOS", "TRES"])
+        self.assertEqual(len(self.service.batches), 1)
+        self.assertEqual(sorted(self.service.batches[0]), ["dos", "tres", "uno"])
+
+
+class MicroBatcherTest(unittest.IsolatedAsyncioTestCase):
+
+    async def test_full_batch_is_sent_without_waiting_for_the_window(self):
+        service = FakeTranslatorService()
+        batcher = MicroBatcher(service, max_batch_size=2, max_wait_seconds=60)
+        results = await asyncio.wait_for(asyncio.gather(
+            batcher.translate("a", "en", "es"), batcher.translate("b", "en", "es")
+        ), timeout=5)
+        self.assertEqual([result.translated_text for result in results], ["A", "B"])
+        self.assertEqual(service.batches, [["a", "b"]])
+
+    async def test_groups_by_pair_and_profile(self):
+        service = FakeTranslatorService()
+        batcher = MicroBatcher(service, max_batch_size=8, max_wait_seconds=0.01)
+        await asyncio.gather(
+            batcher.translate("a", "en", "es"), batcher.translate("b", "en", "de"),
+            batcher.translate("c", "en", "es", profile="quality")
+        )
+        self.assertEqual(sorted(service.batches), [["a"], ["b"], ["c"]])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,89 @@
+# tests/test_task_scheduler.py
+#
+# Pruebas del planificador de tareas (src/application/task_scheduler.py).
+#
+# Uso (desde la raíz del repositorio):
+#   python -m pytest tests
+
+import sys
+import threading
+import unittest
+
+from src.application.task_scheduler import TaskScheduler, PRIORITY_MANUAL
+
+
+class TaskSchedulerTest(unittest.TestCase):
+
+    def setUp(self):
+        self.scheduler = TaskScheduler(max_workers=1, reserved_interactive_workers=0)
+        self.release = threading.Event()
+
+    def tearDown(self):
+        self.release.set()
+        self.scheduler.shutdown()
+
+    def _occupy_worker(self):
+        """Encola una tarea que ocupa el único trabajador hasta que se libera self.release."""
+        started = threading.Event()
+
+        def block():
+            started.set()
+            self.release.wait(5)
+
+        self.scheduler.submit(block, priority=PRIORITY_MANUAL)
+        self.assertTrue(started.wait(5))
+
+    def test_cancel_queued_task_calls_on_done_without_running(self):
+        self._occupy_worker()
+        done_tasks = []
+        ran = threading.Event()
+        task = self.scheduler.submit(ran.set, priority=PRIORITY_MANUAL, on_done=done_tasks.append)
+
+        self.assertTrue(task.cancel())
+        # Con el trabajador ocupado, la tarea se retira y se notifica en el acto
+        self.assertTrue(task.is_done())
+        self.assertEqual(done_tasks, [task])
+        self.assertIsNone(task.started_at)
+
+        self.release.set()
+        self.assertFalse(ran.wait(0.2))
+        self.assertEqual(self.scheduler.get_stats()["manual"]["cancelled"], 1)
+
+    def test_cancelled_future_is_resolved_while_queued(self):
+        self._occupy_worker()
+        future = self.scheduler.submit_future(lambda: "resultado", priority=PRIORITY_MANUAL)
+        self.assertTrue(future.cancel())
+        self.assertTrue(future.cancelled())
+
+    def test_future_result(self):
+        future = self.scheduler.submit_future(lambda value: value * 2, 21)
+        self.assertEqual(future.result(timeout=5), 42)
+
+    def test_base_exception_resolves_future_and_keeps_worker(self):
+        def interrupt():
+            raise KeyboardInterrupt()
+
+        future = self.scheduler.submit_future(interrupt)
+        with self.assertRaises(KeyboardInterrupt):
+            future.result(timeout=5)
+        # El único trabajador sigue atendiendo la cola
+        self.assertEqual(self.scheduler.submit_future(lambda: "sigue").result(timeout=5), "sigue")
+        self.assertEqual(self.scheduler.get_stats()["manual"]["failed"], 1)
+
+    def test_base_exception_calls_on_done(self):
+        done = threading.Event()
+        done_tasks = []
+
+        def on_done(task):
+            done_tasks.append(task)
+            done.set()
+
+        task = self.scheduler.submit(sys.exit, 1, on_done=on_done)
+        self.assertTrue(done.wait(5))
+        self.assertEqual(done_tasks, [task])
+        self.assertIsInstance(task.error, SystemExit)
+        self.assertTrue(task.is_done())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,121 @@
+# tests/test_translator_service.py
+#
+# Pruebas de TranslatorService (src/application/translator_service.py): agrupación de
+# traducciones idénticas en curso y claves de la memoria de traducción, con un traductor
+# falso que no carga modelos.
+#
+# Uso (desde la raíz del repositorio):
+#   python -m pytest tests
+
+import threading
+import unittest
+from unittest import mock
+
+from src.application.task_scheduler import TaskScheduler
+from src.application.translator_service import TranslatorService
+from src.domain.interfaces import ITranslator, IHotkeyManager, IOCRService
+from src.domain.models import Language, TranslationResult, CancellationToken, TranslationCancelledError
+
+
+class FakeTranslator(ITranslator):
+    """Traductor en+es que marca el perfil efectivo y puede bloquearse hasta que se libere release."""
+
+    def __init__(self):
+        self.calls = []
+        self.started = threading.Event()
+        self.release = threading.Event()
+        self.block = False
+
+    def get_available_languages(self):
+        return [Language("en", "English"), Language("es", "Español")]
+
+    def resolve_profile_name(self, profile):
+        return profile or "balanced"
+
+    def translate(self, request, cancellation_token=None, progress_callback=None):
+        profile = self.resolve_profile_name(request.profile)
+        self.calls.append(profile)
+        self.started.set()
+        if self.block:
+            self.release.wait(5)
+        return TranslationResult(translated_text=f"{request.text} [{profile}]")
+
+    def translate_batch(self, requests, cancellation_token=None, progress_callback=None):
+        return [self.translate(request) for request in requests]
+
+    def translate_stream(self, request, cancellation_token=None, progress_callback=None):
+        self.calls.append(self.resolve_profile_name(request.profile))
+        yield "primera parte. "
+        yield "segunda parte."
+
+
+class TranslatorServiceTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.translator = FakeTranslator()
+        self.scheduler = TaskScheduler(max_workers=2, reserved_interactive_workers=0)
+        self.service = TranslatorService(
+            self.translator,
+            mock.create_autospec(IHotkeyManager, instance=True),
+            mock.create_autospec(IOCRService, instance=True),
+            task_scheduler=self.scheduler
+        )
+
+    def tearDown(self):
+        self.translator.release.set()
+        self.scheduler.shutdown()
+
+
+class InFlightCoalescingTest(TranslatorServiceTestCase):
+
+    def test_different_profiles_are_not_coalesced(self):
+        self.translator.block = True
+        leader = threading.Thread(target=self.service.perform_translation, args=("Hello.", "en", "es", "fast"))
+        leader.start()
+        self.assertTrue(self.translator.started.wait(5))
+        follower_results = []
+        follower = threading.Thread(
+            target=lambda: follower_results.append(self.service.perform_translation("Hello.", "en", "es", "quality"))
+        )
+        follower.start()
+        self.translator.release.set()
+        leader.join(5)
+        follower.join(5)
+        self.assertEqual(follower_results[0].translated_text, "Hello. [quality]")
+        self.assertEqual(sorted(self.translator.calls), ["fast", "quality"])
+
+    def test_default_profile_coalesces_with_its_explicit_name(self):
+        self.assertEqual(self.service._get_in_flight_key("Hello.", "en", "es", None),
+                         self.service._get_in_flight_key("Hello.", "en", "es", "balanced"))
+
+    def test_waiter_is_released_when_streaming_leader_is_cancelled(self):
+        leader_token = CancellationToken()
+        stream = self.service.translate_stream("Hello.", "en", "es", cancellation_token=leader_token)
+        self.assertEqual(next(stream), "primera parte. ")
+        # El streaming queda suspendido sin que nadie lo cierre, y luego se cancela
+        leader_token.cancel()
+        result = self.service.perform_translation("Hello.", "en", "es")
+        self.assertEqual(result.translated_text, "Hello. [balanced]")
+        stream.close()
+
+    def test_waiter_token_still_cancels_the_wait(self):
+        stream = self.service.translate_stream("Hello.", "en", "es", cancellation_token=CancellationToken())
+        next(stream)
+        follower_token = CancellationToken()
+        follower_token.cancel()
+        with self.assertRaises(TranslationCancelledError):
+            list(self.service.translate_stream("Hello.", "en", "es", cancellation_token=follower_token))
+        stream.close()
+
+
+class TranslationMemoryKeyTest(TranslatorServiceTestCase):
+
+    def test_default_profile_resolves_to_configured_default(self):
+        self.assertEqual(self.service._get_memory_model_version("en", "es", None),
+                         self.service._get_memory_model_version("en", "es", "balanced"))
+        self.assertNotEqual(self.service._get_memory_model_version("en", "es", None),
+                            self.service._get_memory_model_version("en", "es", "quality"))
+
+
+if __name__ == "__main__":
+    unittest.main()